@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import re
 from datetime import datetime
 
 import voluptuous as vol
@@ -11,23 +12,36 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
 from homeassistant.exceptions import ConfigEntryError, HomeAssistantError, ServiceValidationError
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.util import slugify
 
 from .const import (
+    CONF_ADAPTIVE_CADENCE,
     CONF_BAUDRATE,
     CONF_BYTESIZE,
     CONF_CONNECTION_TYPE,
     CONF_INVERTER_SERIAL,
+    CONF_MAX_READ_GAP,
     CONF_PARITY,
+    CONF_PIPELINE_WINDOW,
     CONF_POLL_PROFILE,
     CONF_SERIAL_PORT,
     CONF_SLAVE,
     CONF_STOPBITS,
+    CONF_TIMEOUT_CEILING,
+    CONF_TIMEOUT_FLOOR,
+    CONF_VERIFY_WRITES,
     CONN_TYPE_SERIAL,
     CONN_TYPE_TCP,
+    DEFAULT_ADAPTIVE_CADENCE,
     DEFAULT_BAUDRATE,
     DEFAULT_BYTESIZE,
+    DEFAULT_MAX_READ_GAP,
     DEFAULT_PARITY,
+    DEFAULT_PIPELINE_WINDOW,
     DEFAULT_STOPBITS,
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
+    DEFAULT_VERIFY_WRITES,
     DOMAIN,
     MODBUS_ILLEGAL_DATA_ADDRESS,
     POLL_PROFILE_ESSENTIAL,
@@ -36,6 +50,8 @@ from .const import (
 )
 from .data.solis_config import SOLIS_INVERTERS, InverterConfig, InverterType, inverter_options_from_config
 from .data_retrieval import DataRetrieval
+from .definition_registry import async_get_definitions
+from .derived_engine import remove_derived_engine
 from .helpers import (
     combine_u32,
     combine_u32_le,
@@ -43,7 +59,6 @@ from .helpers import (
     extreme_includes_battery,
     get_controller,
     get_poll_profile,
-    group_in_poll_profile,
     iter_controllers,
     iter_platform_entities,
     registers_declared_by,
@@ -51,7 +66,9 @@ from .helpers import (
     split_s32,
     unique_id_generator,
 )
+from .learned_register_map import LearnedRegisterMap
 from .modbus_controller import ModbusController
+from .register_snapshot import RegisterSnapshot
 from .sensors.solis_base_sensor import SolisBaseSensor, SolisSensorGroup
 
 _LOGGER = logging.getLogger(__name__)
@@ -94,6 +111,20 @@ SCHEME_STOP_FORCE = vol.Schema(
         vol.Optional("slave", default=1): vol.Coerce(int),
     }
 )
+SCHEME_REFRESH = vol.Schema(
+    {
+        vol.Optional("host"): vol.Coerce(str),
+        vol.Optional("slave", default=1): vol.Coerce(int),
+    }
+)
+SCHEME_CAPTURE_FRAMES = vol.Schema(
+    {
+        vol.Required("enabled"): vol.Coerce(bool),
+        vol.Optional("max_megabytes", default=5): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+        vol.Optional("host"): vol.Coerce(str),
+        vol.Optional("slave", default=1): vol.Coerce(int),
+    }
+)
 
 # RC (remote control) force charge/discharge registers — the #352 latch combo:
 # Solis firmware requires 43135 to be enabled BEFORE the setpoints and timeout
@@ -311,12 +342,16 @@ async def async_setup(hass: HomeAssistant, entry: ConfigEntry):
         _require_hybrid(controller)
 
         await controller.async_write_holding_register(RC_FORCE_MODE_REG, mode)
+        # 43135 must land on its own before the setpoint (43136 is adjacent and
+        # would otherwise be merged into the same FC16 frame).
+        controller.queue_write_barrier()
 
         power_watts = call.data.get("power_watts")
         if power_watts is not None:
             max_watts = getattr(controller.inverter_config, "wattage_chosen", 60000) or 60000
             watts = min(int(power_watts), int(max_watts))
             await controller.async_write_holding_register(power_register, round(watts / RC_POWER_MULTIPLIER))
+            controller.queue_write_barrier()
 
         duration = call.data.get("duration_minutes")
         if duration is not None:
@@ -362,7 +397,9 @@ async def async_setup(hass: HomeAssistant, entry: ConfigEntry):
         #   realtime 44105-44112 = mode, power(S32), function, SOC window
         # Global first so dispatch is active before the realtime block lands
         # (the function field is re-initialized unless the master is already on).
+        # The blocks are adjacent, so keep the write queue from merging them.
         await controller.async_write_holding_registers(DISPATCH_MASTER_REG, [1, int(call.data.get("failsafe_minutes", 30)), 0, 0xFFFF, 0xFFFF])
+        controller.queue_write_barrier()
         await controller.async_write_holding_registers(DISPATCH_MODE_REG, [mode_value, *_s32_words(power_raw), function_value, soc_low, soc_high, 0, 0])
 
     async def service_dispatch_stop(call: ServiceCall) -> None:
@@ -370,7 +407,9 @@ async def async_setup(hass: HomeAssistant, entry: ConfigEntry):
         controller = _resolve_controller(call)
         _require_hybrid(controller)
         await controller.async_write_holding_register(DISPATCH_MODE_REG, 1)
+        controller.queue_write_barrier()
         await controller.async_write_holding_register(DISPATCH_FUNCTION_REG, 1)
+        controller.queue_write_barrier()
         await controller.async_write_holding_register(DISPATCH_MASTER_REG, 0)
 
     async def service_dispatch_schedule(call: ServiceCall) -> None:
@@ -411,13 +450,31 @@ async def async_setup(hass: HomeAssistant, entry: ConfigEntry):
             0,  # PV power-limit percentage (unused here)
         ]
         await controller.async_write_holding_registers(base, block)
+        controller.queue_write_barrier()
 
         if call.data["enabled"]:
             # Schedules need the dispatch master on; long failsafe by default so
             # the plan survives HA restarts (re-push daily to keep it alive).
             await controller.async_write_holding_register(DISPATCH_FAILSAFE_REG, int(call.data.get("failsafe_minutes", 1440)))
+            controller.queue_write_barrier()
             await controller.async_write_holding_register(DISPATCH_MASTER_REG, 1)
 
+    async def service_capture_frames(call: ServiceCall) -> dict:
+        """Start or stop recording raw Modbus frames to an NDJSON file in the config directory (replay with tests/replay_capture.py)."""
+        controller = _resolve_controller(call)
+        if call.data["enabled"]:
+            path = hass.config.path(f"solis_modbus_capture_{slugify(controller.host)}_{controller.device_id}.ndjson")
+            capture = controller.start_frame_capture(path, max_bytes=int(call.data.get("max_megabytes", 5)) * 1024 * 1024)
+        else:
+            capture = await controller.async_stop_frame_capture()
+            if capture is None:
+                return {"capturing": False}
+        return {"capturing": controller.capture is not None, "path": str(capture.path), "frames": capture.frames}
+
+    async def service_refresh(call: ServiceCall) -> None:
+        """Read every register group now; with adaptive cadence, quiet groups return to their base interval."""
+        _resolve_controller(call).request_refresh()
+
     hass.services.async_register(DOMAIN, "solis_write_holding_register", service_write_holding_register, schema=SCHEME_HOLDING_REGISTER)
     hass.services.async_register(DOMAIN, "solis_write_time", service_set_time, schema=SCHEME_TIME_SET)
     hass.services.async_register(DOMAIN, "solis_read_register", service_read_register, schema=SCHEME_READ_REGISTER, supports_response=SupportsResponse.ONLY)
@@ -427,6 +484,10 @@ async def async_setup(hass: HomeAssistant, entry: ConfigEntry):
     hass.services.async_register(DOMAIN, "solis_dispatch", service_dispatch, schema=SCHEME_DISPATCH)
     hass.services.async_register(DOMAIN, "solis_dispatch_stop", service_dispatch_stop, schema=SCHEME_STOP_FORCE)
     hass.services.async_register(DOMAIN, "solis_dispatch_schedule", service_dispatch_schedule, schema=SCHEME_DISPATCH_SCHEDULE)
+    hass.services.async_register(DOMAIN, "solis_refresh", service_refresh, schema=SCHEME_REFRESH)
+    hass.services.async_register(
+        DOMAIN, "solis_capture_frames", service_capture_frames, schema=SCHEME_CAPTURE_FRAMES, supports_response=SupportsResponse.OPTIONAL
+    )
 
     return True
 
@@ -485,17 +546,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     # entry.runtime_data (see runtime.SolisRuntimeData).
     hass.data.setdefault(DOMAIN, {})
 
-    # Stagger additional config entries on the same Modbus link so two inverters do not hammer the logger at once.
-    existing_same_link = sum(1 for c in iter_controllers(hass) if getattr(c, "connection_id", None) == connection_id)
-    if existing_same_link:
-        delay_s = min(1.5 * existing_same_link, 5.0)
-        _LOGGER.debug(
-            "Staggering startup: %s existing controller(s) on %s, waiting %.1fs",
-            existing_same_link,
-            connection_id,
-            delay_s,
-        )
-        await asyncio.sleep(delay_s)
+    # Config entries on the same Modbus link need no startup stagger: their polls
+    # are interleaved by the link's LinkPollCoordinator (see ModbusClientManager).
 
     _LOGGER.info(f"Loaded Solis Modbus Integration ({connection_type}) with Model: {config.get('model')}")
 
@@ -526,12 +578,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     inverter_config = inverter_template.clone_with_options(user_options, config.get("connection", "S2_WL_ST"))
 
     # Load correct sensor data based on inverter type
-    if inverter_config.type in [InverterType.STRING, InverterType.GRID]:
-        from .sensor_data.string_sensors import string_sensors as sensors
-        from .sensor_data.string_sensors import string_sensors_derived as sensors_derived
-    else:
-        from .sensor_data.hybrid_sensors import hybrid_sensors as sensors
-        from .sensor_data.hybrid_sensors import hybrid_sensors_derived as sensors_derived
+    definitions = await async_get_definitions(hass, inverter_config.type)
+    sensors_derived = definitions.derived
 
     # Create the Modbus controller and assign sensor groups
     controller_params = {
@@ -544,11 +592,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         "inverter_config": inverter_config,
         "connection_type": connection_type,
         "serial_number": inverter_serial,
+        "verify_writes": config.get(CONF_VERIFY_WRITES, DEFAULT_VERIFY_WRITES),
+        "timeout_floor": config.get(CONF_TIMEOUT_FLOOR, DEFAULT_TIMEOUT_FLOOR),
+        "timeout_ceiling": config.get(CONF_TIMEOUT_CEILING, DEFAULT_TIMEOUT_CEILING),
     }
 
     if connection_type == CONN_TYPE_TCP:
         controller_params["host"] = host
         controller_params["port"] = port
+        controller_params["pipeline_window"] = config.get(CONF_PIPELINE_WINDOW, DEFAULT_PIPELINE_WINDOW)
     else:  # Serial
         controller_params["serial_port"] = config.get(CONF_SERIAL_PORT, "/dev/ttyUSB0")
         controller_params["baudrate"] = config.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)
@@ -562,34 +614,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     # if setup fails so a failed entry doesn't pin the connection open (HA won't
     # call async_unload_entry when async_setup_entry raises).
     try:
-        controller._sensor_groups = []
         poll_profile = get_poll_profile(entry)
         include_battery = extreme_includes_battery(entry)
 
         # A profile that matches nothing would set the entry up with no sensors at
         # all, which reads as a broken integration. Extreme currently only maps the
         # hybrid groups, so fall back rather than silently produce an empty entry.
-        if poll_profile == POLL_PROFILE_EXTREME and not any(group.get("extreme") for group in sensors):
+        if poll_profile == POLL_PROFILE_EXTREME and not definitions.maps_profile(POLL_PROFILE_EXTREME):
             _LOGGER.warning(
                 "Extreme poll profile is not mapped for this inverter type yet; falling back to essential-only polling",
             )
             poll_profile = POLL_PROFILE_ESSENTIAL
 
-        skipped_by_profile = 0
-        selected_groups = []
-        for group in sensors:
-            feature_requirement = group.get("feature_requirement", [])
-            if feature_requirement and not any(feature in inverter_config.features for feature in feature_requirement):
-                group_name = group.get("name", group.get("register_start", "Unnamed"))
-                _LOGGER.warning(f"Skipping sensor group '{group_name}' due to missing required features: {feature_requirement}")
-                continue
-
-            if not group_in_poll_profile(group, poll_profile, include_battery):
-                skipped_by_profile += 1
-                continue
+        for group in definitions.groups_missing_features(inverter_config.features):
+            group_name = group.get("name", group.get("register_start", "Unnamed"))
+            _LOGGER.warning(f"Skipping sensor group '{group_name}' due to missing required features: {group.get('feature_requirement', [])}")
 
-            selected_groups.append(group)
-            controller._sensor_groups.append(SolisSensorGroup(hass=hass, definition=group, controller=controller, identification=identification))
+        supported_groups = definitions.groups_for(inverter_config.features)
+        selected_groups = definitions.groups_for(inverter_config.features, poll_profile, include_battery)
+        skipped_by_profile = len(supported_groups) - len(selected_groups)
+        controller._sensor_groups = [
+            SolisSensorGroup(hass=hass, definition=group, controller=controller, identification=identification) for group in selected_groups
+        ]
 
         if poll_profile != POLL_PROFILE_FULL:
             _LOGGER.info(
@@ -603,7 +649,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         # reduced profile has to filter them too — otherwise e.g. Power Factor
         # (33079-33082) survives into extreme mode and never receives a value.
         polled_registers = registers_declared_by(selected_groups)
-        known_registers = registers_declared_by(sensors)
+        known_registers = definitions.known_registers
         supported_derived = [entity for entity in sensors_derived if derived_sensor_is_supported(entity, polled_registers, known_registers)]
 
         if poll_profile != POLL_PROFILE_FULL and len(supported_derived) != len(sensors_derived):
@@ -634,13 +680,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
         set_controller(hass, controller, entry)
 
+        # Seed the register cache from the last run before the entities are added,
+        # so selects/switches/numbers have values before the first Modbus frame.
+        snapshot = RegisterSnapshot(hass, controller, inverter_serial)
+        await snapshot.async_restore()
+
         _LOGGER.debug(f"Config entry setup for {connection_type} connection: {connection_id}, slave {slave}")
 
         # Set up all platforms in one call (concurrent) — matches the unload side,
         # which already unloads [Platform.SENSOR, *PLATFORMS] together.
         await hass.config_entries.async_forward_entry_setups(entry, [Platform.SENSOR, *PLATFORMS])
 
-        entry.runtime_data.data_retrieval = DataRetrieval(hass, controller, entry.entry_id)
+        # Firmware holes found by register recovery survive restarts, per inverter serial.
+        learned_map = LearnedRegisterMap(hass, inverter_serial, inverter_config.model) if inverter_serial else None
+        entry.runtime_data.data_retrieval = DataRetrieval(
+            hass,
+            controller,
+            entry.entry_id,
+            max_read_gap=config.get(CONF_MAX_READ_GAP, DEFAULT_MAX_READ_GAP),
+            learned_map=learned_map,
+            snapshot=snapshot,
+            adaptive_cadence=config.get(CONF_ADAPTIVE_CADENCE, DEFAULT_ADAPTIVE_CADENCE),
+        )
     except Exception:
         controller.close_connection()
         entry.runtime_data = None
@@ -731,16 +792,7 @@ async def async_migrate_to_serial_ids(hass: HomeAssistant, entry: ConfigEntry) -
     if inverter_template:
         user_options = inverter_options_from_config(config, inverter_template)
         inverter_config = inverter_template.clone_with_options(user_options, config.get("connection", "S2_WL_ST"))
-        if inverter_config.type in [InverterType.STRING, InverterType.GRID]:
-            from .sensor_data.string_sensors import string_sensors, string_sensors_derived
-
-            sensors = string_sensors
-            sensors_derived = string_sensors_derived
-        else:
-            from .sensor_data.hybrid_sensors import hybrid_sensors, hybrid_sensors_derived
-
-            sensors = hybrid_sensors
-            sensors_derived = hybrid_sensors_derived
+        definitions = await async_get_definitions(hass, inverter_config.type)
 
         from .helpers import unique_id_generator
         from .sensor_data.time_sensors import get_time_sensors
@@ -751,10 +803,7 @@ async def async_migrate_to_serial_ids(hass: HomeAssistant, entry: ConfigEntry) -
             return f"{DOMAIN}_{ctrl.host}_{uid}"
 
         # A. Standard Sensors
-        for group in sensors:
-            feature_requirement = group.get("feature_requirement", [])
-            if feature_requirement and not any(feature in inverter_config.features for feature in feature_requirement):
-                continue
+        for group in definitions.groups_for(inverter_config.features):
             for entity in group.get("entities", []):
                 if entity.get("type") == "reserve":
                     continue
@@ -765,7 +814,7 @@ async def async_migrate_to_serial_ids(hass: HomeAssistant, entry: ConfigEntry) -
                     safe_migrate_entity(Platform.SENSOR, old_uid, new_uid)
 
         # B. Derived Sensors
-        for entity in sensors_derived:
+        for entity in definitions.derived:
             uid_key = entity.get("unique", "reserve")
             new_uid = unique_id_generator(controller, uid_key)
             if identification:
@@ -791,9 +840,13 @@ async def async_migrate_to_serial_ids(hass: HomeAssistant, entry: ConfigEntry) -
     return True
 
 
-def _broken_dict_unique_id_matches(unique_id: str, unique_key: str) -> bool:
-    """True when unique_id is a dict-stringified form for this unique key (#452)."""
-    return f"'unique': '{unique_key}'" in unique_id
+_BROKEN_DICT_UNIQUE_KEY = re.compile(r"'unique': '([^']*)'")
+
+
+def _broken_dict_unique_key(unique_id: str) -> str | None:
+    """The unique key embedded in a dict-stringified unique_id (#452), if it is one."""
+    match = _BROKEN_DICT_UNIQUE_KEY.search(unique_id)
+    return match.group(1) if match else None
 
 
 def _entity_sort_key(entry):
@@ -804,18 +857,6 @@ def _entity_sort_key(entry):
     return (created is None, created, has_data_type, entry.entity_id)
 
 
-def _iter_sensor_unique_keys(sensors) -> list[str]:
-    keys: list[str] = []
-    for group in sensors:
-        for entity in group.get("entities", []):
-            if entity.get("type") == "reserve":
-                continue
-            uid_key = entity.get("unique")
-            if uid_key:
-                keys.append(uid_key)
-    return keys
-
-
 async def async_migrate_dict_unique_ids(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Rewrite dict-stringified unique_ids to stable keys; restore original entity_ids.
 
@@ -851,26 +892,27 @@ async def async_migrate_dict_unique_ids(hass: HomeAssistant, entry: ConfigEntry)
 
     user_options = inverter_options_from_config(config, inverter_template)
     inverter_config = inverter_template.clone_with_options(user_options, config.get("connection", "S2_WL_ST"))
-    if inverter_config.type in [InverterType.STRING, InverterType.GRID]:
-        from .sensor_data.string_sensors import string_sensors as sensors
-    else:
-        from .sensor_data.hybrid_sensors import hybrid_sensors as sensors
-
-    unique_keys = _iter_sensor_unique_keys(sensors)
+    definitions = await async_get_definitions(hass, inverter_config.type)
+    key_by_uid = {unique_id_generator(controller, unique_key): unique_key for unique_key in definitions.unique_keys}
     ent_reg = er.async_get(hass)
     platforms = (Platform.SENSOR, Platform.NUMBER)
 
-    # Index this config entry's entities once per platform.
-    by_platform: dict[str, list] = {p: [] for p in platforms}
+    # Bucket this config entry's entities by platform and the unique key they
+    # belong to (stable or dict-stringified), in one pass over the registry.
+    by_platform: dict[str, dict[str, list]] = {p: {} for p in platforms}
     for ent in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
-        if ent.domain in by_platform:
-            by_platform[ent.domain].append(ent)
+        if ent.domain not in by_platform:
+            continue
+        unique_id = ent.unique_id or ""
+        unique_key = key_by_uid.get(unique_id) or _broken_dict_unique_key(unique_id)
+        if unique_key is not None:
+            by_platform[ent.domain].setdefault(unique_key, []).append(ent)
 
     for platform in platforms:
-        entries = by_platform[platform]
-        for unique_key in unique_keys:
+        by_key = by_platform[platform]
+        for unique_key in definitions.unique_keys:
             correct_uid = unique_id_generator(controller, unique_key)
-            matches = [e for e in entries if e.unique_id == correct_uid or _broken_dict_unique_id_matches(e.unique_id or "", unique_key)]
+            matches = by_key.get(unique_key)
             if not matches:
                 continue
 
@@ -1001,6 +1043,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         if runtime is not None:
             if runtime.data_retrieval is not None:
                 await runtime.data_retrieval.async_stop()
+            await runtime.controller.async_stop_frame_capture()
+            remove_derived_engine(hass, runtime.controller)
             _LOGGER.debug("Closing Modbus connection for entry %s", entry.entry_id)
             runtime.controller.close_connection()
 
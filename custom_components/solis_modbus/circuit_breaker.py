@@ -0,0 +1,160 @@
+"""Stop re-reading groups that keep failing.
+
+A group whose read times out, or is rejected with an exception the split
+recovery cannot handle, is otherwise retried on every cycle; each try costs a
+full client timeout on the shared link and delays every other group behind it.
+
+Each group (keyed by its register range, so the state survives regrouping) has
+its own breaker. After ``BREAKER_FAILURE_THRESHOLD`` failed reads in a row it
+opens and the group is left out of the poll cycles for ``BREAKER_BASE_BACKOFF``
+seconds. Then it is half-open: the next cycle reads it once, in a frame of its
+own. A good read closes the breaker; a failed one opens it again for twice as
+long, up to ``BREAKER_MAX_BACKOFF``.
+
+Only the group's own failures count. A poll cycle holds back the failures
+without an answer from the inverter (timeouts, dropped sockets) and charges them
+when it ends, and only if some read in that cycle got an answer: when the whole
+link drops, no group is to blame.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .sensors.solis_base_sensor import SolisSensorGroup
+
+_LOGGER = logging.getLogger(__name__)
+
+# Failed reads in a row before a group is skipped, and how long it is skipped
+# for the first time / at most (seconds).
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_BACKOFF = 30.0
+BREAKER_MAX_BACKOFF = 600.0
+
+
+class BreakerState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Breaker:
+    state: BreakerState = BreakerState.CLOSED
+    failures: int = 0
+    backoff: float = 0.0
+    retry_at: float = 0.0
+
+
+def _key(group: SolisSensorGroup) -> tuple[int, int]:
+    return group.start_register, group.registrar_count
+
+
+def _span(key: tuple[int, int]) -> str:
+    start, count = key
+    return f"{start}-{start + count - 1}"
+
+
+class CircuitBreakers:
+    """The breakers of one controller's sensor groups."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, label: str = ""):
+        self._clock = clock
+        self._label = label
+        self._breakers: dict[tuple[int, int], _Breaker] = {}
+        self._held: list[SolisSensorGroup] | None = None
+        self._link_answered = False
+        self.skipped_reads = 0
+
+    def begin_cycle(self) -> None:
+        """Hold back unanswered failures until ``end_cycle``."""
+        self._held = []
+        self._link_answered = False
+
+    def end_cycle(self) -> None:
+        """Charge the held-back failures, unless nothing in the cycle got an answer."""
+        held, self._held = self._held or [], None
+        if not held:
+            return
+        if not self._link_answered:
+            _LOGGER.debug("%s No read answered this cycle; not counting %d failed read(s) against their groups.", self._label, len(held))
+            return
+        now = self._clock()
+        for group in held:
+            self._charge(group, now)
+
+    def state(self, group: SolisSensorGroup, now: float | None = None) -> BreakerState:
+        breaker = self._breakers.get(_key(group))
+        if breaker is None:
+            return BreakerState.CLOSED
+        if breaker.state == BreakerState.OPEN and (self._clock() if now is None else now) >= breaker.retry_at:
+            breaker.state = BreakerState.HALF_OPEN
+        return breaker.state
+
+    def partition(self, groups: Iterable[SolisSensorGroup], now: float | None = None) -> tuple[list[SolisSensorGroup], list[SolisSensorGroup]]:
+        """Split ``groups`` into (closed, half-open trials); groups with an open breaker are left out."""
+        now = self._clock() if now is None else now
+        closed, trials = [], []
+        for group in groups:
+            state = self.state(group, now)
+            if state == BreakerState.CLOSED:
+                closed.append(group)
+            elif state == BreakerState.HALF_OPEN:
+                trials.append(group)
+            else:
+                self.skipped_reads += 1
+        return closed, trials
+
+    def record_success(self, group: SolisSensorGroup) -> None:
+        self._link_answered = True
+        breaker = self._breakers.pop(_key(group), None)
+        if breaker is not None and breaker.state != BreakerState.CLOSED:
+            _LOGGER.info("%s Group %s reads again; polling it normally.", self._label, _span(_key(group)))
+
+    def record_failure(self, group: SolisSensorGroup, now: float | None = None, *, answered: bool = False) -> None:
+        """Count a failed read; ``answered`` when the inverter replied (with an exception), else held back during a cycle."""
+        if answered:
+            self._link_answered = True
+        elif self._held is not None:
+            self._held.append(group)
+            return
+        self._charge(group, self._clock() if now is None else now)
+
+    def _charge(self, group: SolisSensorGroup, now: float) -> None:
+        breaker = self._breakers.setdefault(_key(group), _Breaker())
+        breaker.failures += 1
+        if breaker.state == BreakerState.HALF_OPEN:
+            breaker.backoff = min(breaker.backoff * 2, BREAKER_MAX_BACKOFF)
+        elif breaker.state == BreakerState.CLOSED and breaker.failures >= BREAKER_FAILURE_THRESHOLD:
+            breaker.backoff = BREAKER_BASE_BACKOFF
+        else:
+            return
+        breaker.state = BreakerState.OPEN
+        breaker.retry_at = now + breaker.backoff
+        _LOGGER.warning(
+            "%s Group %s failed %d read(s) in a row; skipping it for %.0fs.",
+            self._label,
+            _span(_key(group)),
+            breaker.failures,
+            breaker.backoff,
+        )
+
+    def as_dict(self, now: float | None = None) -> dict:
+        now = self._clock() if now is None else now
+        return {
+            "skipped_reads": self.skipped_reads,
+            "groups": {
+                _span(key): {
+                    "state": breaker.state.value,
+                    "failures": breaker.failures,
+                    "retry_in_s": round(max(breaker.retry_at - now, 0.0), 2) if breaker.state == BreakerState.OPEN else None,
+                }
+                for key, breaker in sorted(self._breakers.items())
+            },
+        }
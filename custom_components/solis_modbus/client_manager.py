@@ -1,13 +1,272 @@
 import asyncio
+import heapq
+import itertools
 import logging
+import statistics
 import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
 from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
 
-from custom_components.solis_modbus.const import CONN_TYPE_SERIAL, CONN_TYPE_TCP
+from custom_components.solis_modbus.const import CONN_TYPE_SERIAL, CONN_TYPE_TCP, DEFAULT_TIMEOUT_CEILING, DEFAULT_TIMEOUT_FLOOR
+from custom_components.solis_modbus.data.enums import LinkPriority
+from custom_components.solis_modbus.link_coordinator import LinkPollCoordinator
+from custom_components.solis_modbus.modbus_pipeline import ModbusTcpPipeline
 
 _LOGGER = logging.getLogger(__name__)
 
+# Adaptive inter-frame pacing (per link). Reads start at the historical 50 ms;
+# writes always wait twice the read gap (the old fixed 100 ms at the start).
+INTER_FRAME_INITIAL_MS = 50.0
+INTER_FRAME_MIN_MS = 10.0
+INTER_FRAME_MAX_MS = 1000.0
+# Clean reads needed before the gap is shrunk one step, and the step size.
+_PACING_STABLE_STREAK = 20
+_PACING_SHRINK = 0.85
+# Latency counts as stable when its spread over the window stays within this
+# fraction of the median (plus a small absolute allowance for fast links).
+_PACING_JITTER_RATIO = 0.5
+_PACING_JITTER_ALLOWANCE_S = 0.02
+# A failure raises the learned floor to this multiple of the gap that failed;
+# a long clean run lets the floor decay again (conditions change, e.g. WiFi).
+_PACING_FLOOR_RAISE = 1.5
+_PACING_FLOOR_DECAY_STREAK = 500
+_PACING_FLOOR_DECAY = 0.8
+
+# Read response timeout (per link), estimated like TCP's retransmission timeout
+# (RFC 6298): smoothed round trip plus four times its mean deviation. Until the
+# first answer the historical fixed 5 s is used.
+REQUEST_TIMEOUT_INITIAL_S = 5.0
+_RTT_ALPHA = 1 / 8
+_RTT_BETA = 1 / 4
+_RTT_DEVIATIONS = 4
+
+
+class LinkPacer:
+    """Learns how tightly frames can be packed on one Modbus link.
+
+    Wired RS485-to-TCP gateways happily take a frame every few milliseconds,
+    while S2-WL sticks desync transaction IDs when hurried. The gap shrinks
+    slowly while reads succeed with stable latency and doubles on a timeout,
+    transaction-ID mismatch or exception response. Every failure also raises a
+    learned floor so the pacer does not keep rediscovering the same limit.
+    """
+
+    def __init__(
+        self,
+        initial_ms: float = INTER_FRAME_INITIAL_MS,
+        min_ms: float = INTER_FRAME_MIN_MS,
+        max_ms: float = INTER_FRAME_MAX_MS,
+    ):
+        self.min_ms = float(min_ms)
+        self.ceiling_ms = float(max_ms)
+        self.floor_ms = self.min_ms
+        self.delay_ms = min(max(float(initial_ms), self.floor_ms), self.ceiling_ms)
+        self.successes = 0
+        self.failures = 0
+        self.last_failure: str | None = None
+        self._streak = 0
+        self._clean_since_floor_change = 0
+        self._latencies: deque[float] = deque(maxlen=_PACING_STABLE_STREAK)
+
+    @property
+    def read_delay_ms(self) -> float:
+        return self.delay_ms
+
+    @property
+    def write_delay_ms(self) -> float:
+        return min(self.delay_ms * 2, self.ceiling_ms)
+
+    def _latency_is_stable(self) -> bool:
+        if len(self._latencies) < self._latencies.maxlen:
+            return False
+        median = statistics.median(self._latencies)
+        spread = max(self._latencies) - min(self._latencies)
+        return spread <= median * _PACING_JITTER_RATIO + _PACING_JITTER_ALLOWANCE_S
+
+    def record_success(self, latency_s: float | None = None) -> None:
+        self.successes += 1
+        self._streak += 1
+        self._clean_since_floor_change += 1
+        if latency_s is not None:
+            self._latencies.append(latency_s)
+
+        if self._clean_since_floor_change >= _PACING_FLOOR_DECAY_STREAK and self.floor_ms > self.min_ms:
+            self.floor_ms = max(self.min_ms, self.floor_ms * _PACING_FLOOR_DECAY)
+            self._clean_since_floor_change = 0
+
+        if self._streak >= _PACING_STABLE_STREAK and self._latency_is_stable():
+            self.delay_ms = max(self.floor_ms, self.delay_ms * _PACING_SHRINK)
+            self._streak = 0
+
+    def record_failure(self, reason: str) -> None:
+        self.failures += 1
+        self.last_failure = reason
+        self._streak = 0
+        self._clean_since_floor_change = 0
+        self._latencies.clear()
+        self.floor_ms = min(self.ceiling_ms, max(self.floor_ms, self.delay_ms * _PACING_FLOOR_RAISE))
+        self.delay_ms = min(self.ceiling_ms, max(self.floor_ms, self.delay_ms * 2))
+
+    def as_dict(self) -> dict:
+        return {
+            "read_delay_ms": round(self.read_delay_ms, 1),
+            "write_delay_ms": round(self.write_delay_ms, 1),
+            "floor_ms": round(self.floor_ms, 1),
+            "ceiling_ms": round(self.ceiling_ms, 1),
+            "successes": self.successes,
+            "failures": self.failures,
+            "last_failure": self.last_failure,
+            "latency_median_ms": round(statistics.median(self._latencies) * 1000, 1) if self._latencies else None,
+        }
+
+
+class LinkTimeout:
+    """Learns how long to wait for a read response on one Modbus link.
+
+    A fixed 5 s turns every lost frame on a wired gateway answering in 20 ms
+    into 5 s of dead link, yet is sometimes too short for a congested WiFi
+    logger. The timeout follows the observed round trips instead and doubles
+    on every lost frame until an answer brings a fresh estimate, always within
+    the configured floor and ceiling.
+    """
+
+    def __init__(self, floor_s: float = DEFAULT_TIMEOUT_FLOOR, ceiling_s: float = DEFAULT_TIMEOUT_CEILING):
+        self.floor_s = self.ceiling_s = 0.0
+        self.srtt_s: float | None = None
+        self.rttvar_s: float | None = None
+        self.samples = 0
+        self.losses = 0
+        self.configure(floor_s, ceiling_s)
+        self.timeout_s = self._bounded(REQUEST_TIMEOUT_INITIAL_S)
+
+    def configure(self, floor_s: float, ceiling_s: float) -> None:
+        self.floor_s = float(floor_s)
+        self.ceiling_s = max(self.floor_s, float(ceiling_s))
+        if self.srtt_s is not None:
+            self.timeout_s = self._bounded(self.srtt_s + _RTT_DEVIATIONS * self.rttvar_s)
+
+    def _bounded(self, timeout_s: float) -> float:
+        return min(max(timeout_s, self.floor_s), self.ceiling_s)
+
+    def record_rtt(self, rtt_s: float) -> None:
+        self.samples += 1
+        if self.srtt_s is None:
+            self.srtt_s, self.rttvar_s = rtt_s, rtt_s / 2
+        else:
+            self.rttvar_s = (1 - _RTT_BETA) * self.rttvar_s + _RTT_BETA * abs(self.srtt_s - rtt_s)
+            self.srtt_s = (1 - _RTT_ALPHA) * self.srtt_s + _RTT_ALPHA * rtt_s
+        self.timeout_s = self._bounded(self.srtt_s + _RTT_DEVIATIONS * self.rttvar_s)
+
+    def record_loss(self) -> None:
+        self.losses += 1
+        self.timeout_s = self._bounded(self.timeout_s * 2)
+
+    def as_dict(self) -> dict:
+        return {
+            "timeout_ms": round(self.timeout_s * 1000, 1),
+            "floor_ms": round(self.floor_s * 1000, 1),
+            "ceiling_ms": round(self.ceiling_s * 1000, 1),
+            "srtt_ms": round(self.srtt_s * 1000, 1) if self.srtt_s is not None else None,
+            "rttvar_ms": round(self.rttvar_s * 1000, 1) if self.rttvar_s is not None else None,
+            "samples": self.samples,
+            "losses": self.losses,
+        }
+
+
+# Priority used by `async with lock` when none is given. Each poll cycle runs in its
+# own task and sets this for the duration of the cycle (see DataRetrieval), so
+# every frame it sends queues at the cycle's priority without threading it through.
+current_link_priority: ContextVar[LinkPriority] = ContextVar("solis_modbus_link_priority", default=LinkPriority.NORMAL)
+
+
+class PriorityLinkLock:
+    """Drop-in replacement for asyncio.Lock that hands the link to the most urgent waiter.
+
+    Each frame takes the lock on its own, so a control write (or a FAST read)
+    queued while a SLOW cycle is running goes out between that cycle's frames
+    instead of after all of them. Equal priorities are served first come,
+    first served. Time spent queueing is recorded per priority.
+    """
+
+    def __init__(self):
+        self._locked = False
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._wait_stats: dict[LinkPriority, dict] = {priority: {"count": 0, "total_ms": 0.0, "max_ms": 0.0} for priority in LinkPriority}
+
+    def locked(self) -> bool:
+        return self._locked
+
+    async def acquire(self, priority: LinkPriority | None = None) -> bool:
+        if priority is None:
+            priority = current_link_priority.get()
+        started = time.perf_counter()
+
+        if not self._locked and not self._waiters:
+            self._locked = True
+            self._record_wait(priority, started)
+            return True
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted the link just as we were cancelled: pass it on.
+                self.release()
+            raise
+        self._record_wait(priority, started)
+        return True
+
+    def release(self) -> None:
+        if not self._locked:
+            raise RuntimeError("Lock is not acquired.")
+        while self._waiters:
+            _priority, _seq, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # Ownership passes straight to the waiter; the lock stays held.
+                future.set_result(True)
+                return
+        self._locked = False
+
+    async def __aenter__(self):
+        await self.acquire()
+        return None
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+
+    @asynccontextmanager
+    async def priority(self, priority: LinkPriority):
+        """`async with lock.priority(LinkPriority.WRITE):` — hold the link at an explicit priority."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _record_wait(self, priority: LinkPriority, started: float) -> None:
+        waited_ms = (time.perf_counter() - started) * 1000
+        stats = self._wait_stats[LinkPriority(priority)]
+        stats["count"] += 1
+        stats["total_ms"] += waited_ms
+        stats["max_ms"] = max(stats["max_ms"], waited_ms)
+
+    def wait_stats(self) -> dict:
+        """Queue wait per priority, for diagnostics."""
+        return {
+            priority.name: {
+                "count": stats["count"],
+                "mean_ms": round(stats["total_ms"] / stats["count"], 1) if stats["count"] else None,
+                "max_ms": round(stats["max_ms"], 1),
+            }
+            for priority, stats in self._wait_stats.items()
+        }
+
 
 class ModbusClientManager:
     _instance = None
@@ -35,9 +294,15 @@ class ModbusClientManager:
             self._clients[key] = {
                 "client": client,
                 "ref_count": 0,
-                "lock": asyncio.Lock(),
+                "lock": PriorityLinkLock(),
                 "type": CONN_TYPE_TCP,
+                "host": host,
+                "port": port,
                 "last_modbus_request": 0.0,
+                "pacer": LinkPacer(),
+                "timeout": LinkTimeout(),
+                "coordinator": LinkPollCoordinator(key),
+                "pipeline": None,
             }
 
         self._clients[key]["ref_count"] += 1
@@ -56,9 +321,13 @@ class ModbusClientManager:
             self._clients[key] = {
                 "client": client,
                 "ref_count": 0,
-                "lock": asyncio.Lock(),
+                "lock": PriorityLinkLock(),
                 "type": CONN_TYPE_SERIAL,
                 "last_modbus_request": 0.0,
+                "pacer": LinkPacer(),
+                "timeout": LinkTimeout(),
+                "coordinator": LinkPollCoordinator(key),
+                "pipeline": None,
             }
 
         self._clients[key]["ref_count"] += 1
@@ -86,30 +355,117 @@ class ModbusClientManager:
         else:
             raise ValueError("Either host (for TCP) or serial_port (for Serial) must be provided")
 
-    def get_client_lock(self, connection_id: str) -> asyncio.Lock:
+    def get_client_lock(self, connection_id: str) -> PriorityLinkLock:
         """Get the lock for a specific client connection."""
         if connection_id in self._clients:
             return self._clients[connection_id]["lock"]
         return None
 
+    def get_link_coordinator(self, connection_id: str) -> LinkPollCoordinator | None:
+        """Get the poll coordinator shared by all slaves on a connection."""
+        if connection_id in self._clients:
+            return self._clients[connection_id]["coordinator"]
+        return None
+
+    def enable_pipeline(self, connection_id: str, window: int) -> ModbusTcpPipeline | None:
+        """Opt a TCP link into pipelined reads with ``window`` requests in flight (see modbus_pipeline).
+
+        The first entry to enable it on a link sets the window; a window of 1 leaves the link strictly serial.
+        """
+        entry = self._clients.get(connection_id)
+        if entry is None or entry["type"] != CONN_TYPE_TCP or int(window) <= 1:
+            return None
+        if entry["pipeline"] is None:
+            entry["pipeline"] = ModbusTcpPipeline(entry["host"], entry["port"], window)
+            _LOGGER.debug(f"Pipelined reads enabled for {connection_id} (window {int(window)})")
+        return entry["pipeline"]
+
+    def configure_request_timeout(self, connection_id: str, floor_s: float, ceiling_s: float) -> None:
+        """Bound the link's learned read timeout; the entry set up last on a shared link sets the bounds."""
+        if connection_id in self._clients:
+            self._clients[connection_id]["timeout"].configure(floor_s, ceiling_s)
+
+    def apply_connect_timeout(self, connection_id: str) -> None:
+        """Connect with the ceiling: the learned timeout is for answers, not TCP handshakes or a waking logger."""
+        if connection_id in self._clients:
+            entry = self._clients[connection_id]
+            self._set_client_timeout(entry, entry["timeout"].ceiling_s)
+
+    @staticmethod
+    def _set_client_timeout(entry: dict, timeout_s: float) -> None:
+        # pymodbus waits timeout_connect for each response (and each connect), read from
+        # the transport's own copy of the params: client.comm_params is only used to build it.
+        comm_params = getattr(getattr(entry["client"], "ctx", None), "comm_params", None)
+        if comm_params is not None:
+            comm_params.timeout_connect = timeout_s
+
+    def get_pipeline(self, connection_id: str) -> ModbusTcpPipeline | None:
+        """The link's read pipeline, if it was enabled."""
+        if connection_id in self._clients:
+            return self._clients[connection_id]["pipeline"]
+        return None
+
     def get_last_modbus_request(self, connection_id: str) -> float:
         """Monotonic time of last inter-frame wait start for this link (shared across Modbus slaves)."""
         if connection_id in self._clients:
             return float(self._clients[connection_id].get("last_modbus_request", 0.0))
         return 0.0
 
+    def get_link_stats(self, connection_id: str) -> dict | None:
+        """Current adaptive pacing state for a link (for diagnostics)."""
+        if connection_id in self._clients:
+            entry = self._clients[connection_id]
+            stats = {
+                **entry["pacer"].as_dict(),
+                "request_timeout": entry["timeout"].as_dict(),
+                "queue_wait": entry["lock"].wait_stats(),
+                "coordinator": entry["coordinator"].as_dict(),
+            }
+            if entry["pipeline"] is not None:
+                stats["pipeline"] = entry["pipeline"].as_dict()
+            return stats
+        return None
+
+    def record_frame_success(self, connection_id: str, latency_s: float | None = None) -> None:
+        """Feed a completed frame's round trip into the link's pacing and read timeout."""
+        if connection_id in self._clients:
+            self._clients[connection_id]["pacer"].record_success(latency_s)
+            if latency_s is not None:
+                self._clients[connection_id]["timeout"].record_rtt(latency_s)
+
+    def record_frame_failure(self, connection_id: str, reason: str, lost: bool = False) -> None:
+        """Back off the link after a timeout, transaction-ID mismatch or exception response.
+
+        ``lost``: no usable answer arrived (transport failure), so the read timeout backs off too.
+        """
+        if connection_id not in self._clients:
+            return
+        pacer = self._clients[connection_id]["pacer"]
+        pacer.record_failure(reason)
+        if lost:
+            self._clients[connection_id]["timeout"].record_loss()
+        _LOGGER.debug(f"Backing off {connection_id} after {reason}: inter-frame gap now {pacer.delay_ms:.0f} ms (floor {pacer.floor_ms:.0f} ms)")
+
     async def inter_frame_wait(self, connection_id: str, is_write: bool = False) -> None:
-        """Minimum spacing between Modbus operations on one TCP/serial link, across all controllers sharing it."""
+        """Minimum spacing between Modbus operations on one TCP/serial link, across all controllers sharing it.
+
+        Runs right before every request, so it also sets the client's response timeout
+        for it: the learned one for reads, the ceiling for writes (a write timed out
+        early may still have been applied, and pymodbus would send it again).
+        """
         if connection_id not in self._clients:
             return
-        delay_ms = 100 if is_write else 50
         entry = self._clients[connection_id]
+        pacer = entry["pacer"]
+        delay_ms = pacer.write_delay_ms if is_write else pacer.read_delay_ms
         current_time = time.perf_counter()
         last = float(entry.get("last_modbus_request", 0.0))
         elapsed = (current_time - last) * 1000
         if elapsed < delay_ms:
             await asyncio.sleep((delay_ms - elapsed) / 1000)
         entry["last_modbus_request"] = time.perf_counter()
+        timeout = entry["timeout"]
+        self._set_client_timeout(entry, timeout.ceiling_s if is_write else timeout.timeout_s)
 
     def release_client(self, connection_id: str):
         """Release a client and clean up if no more references."""
@@ -120,6 +476,8 @@ class ModbusClientManager:
             if self._clients[connection_id]["ref_count"] <= 0:
                 _LOGGER.debug(f"Closing and removing Modbus client for {connection_id}")
                 client = self._clients[connection_id]["client"]
+                if self._clients[connection_id]["pipeline"] is not None:
+                    self._clients[connection_id]["pipeline"].close()
                 try:
                     if hasattr(client, "connected") and client.connected:
                         client.close()
@@ -8,27 +8,44 @@ from homeassistant.config_entries import OptionsFlow
 from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
 
 from .const import (
+    CONF_ADAPTIVE_CADENCE,
     CONF_BAUDRATE,
     CONF_BYTESIZE,
     CONF_CONNECTION_TYPE,
     CONF_EXTREME_INCLUDE_BATTERY,
     CONF_INVERTER_SERIAL,
+    CONF_MAX_READ_GAP,
     CONF_PARITY,
+    CONF_PIPELINE_WINDOW,
     CONF_POLL_PROFILE,
+    CONF_PUBLISH_DEADBAND,
     CONF_SERIAL_PORT,
     CONF_STOPBITS,
+    CONF_TIMEOUT_CEILING,
+    CONF_TIMEOUT_FLOOR,
+    CONF_VERIFY_WRITES,
     CONN_TYPE_SERIAL,
     CONN_TYPE_TCP,
+    DEFAULT_ADAPTIVE_CADENCE,
     DEFAULT_BAUDRATE,
     DEFAULT_BYTESIZE,
+    DEFAULT_MAX_READ_GAP,
     DEFAULT_PARITY,
+    DEFAULT_PIPELINE_WINDOW,
+    DEFAULT_PUBLISH_DEADBAND,
     DEFAULT_STOPBITS,
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
+    DEFAULT_VERIFY_WRITES,
     DOMAIN,
+    MAX_READ_GAP_LIMIT,
+    PIPELINE_WINDOW_LIMIT,
     POLL_INTERVAL_FAST_MIN,
     POLL_INTERVAL_FAST_MIN_EXTREME,
     POLL_PROFILE_EXTREME,
     POLL_PROFILE_FULL,
     POLL_PROFILES,
+    TIMEOUT_LIMIT,
 )
 from .data.enums import InverterType
 from .data.solis_config import CONNECTION_METHOD, SOLIS_INVERTERS, InverterConfig, inverter_options_from_config
@@ -95,6 +112,13 @@ OPTIONS_SCHEMA = vol.Schema(
         vol.Required("poll_interval_slow"): vol.All(int, vol.Range(min=30)),
         vol.Required(CONF_POLL_PROFILE, default=POLL_PROFILE_FULL): vol.In(POLL_PROFILES),
         vol.Required(CONF_EXTREME_INCLUDE_BATTERY, default=False): bool,
+        vol.Required(CONF_MAX_READ_GAP, default=DEFAULT_MAX_READ_GAP): vol.All(int, vol.Range(min=0, max=MAX_READ_GAP_LIMIT)),
+        vol.Required(CONF_PIPELINE_WINDOW, default=DEFAULT_PIPELINE_WINDOW): vol.All(int, vol.Range(min=1, max=PIPELINE_WINDOW_LIMIT)),
+        vol.Required(CONF_TIMEOUT_FLOOR, default=DEFAULT_TIMEOUT_FLOOR): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=TIMEOUT_LIMIT)),
+        vol.Required(CONF_TIMEOUT_CEILING, default=DEFAULT_TIMEOUT_CEILING): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=TIMEOUT_LIMIT)),
+        vol.Required(CONF_PUBLISH_DEADBAND, default=DEFAULT_PUBLISH_DEADBAND): bool,
+        vol.Required(CONF_VERIFY_WRITES, default=DEFAULT_VERIFY_WRITES): bool,
+        vol.Required(CONF_ADAPTIVE_CADENCE, default=DEFAULT_ADAPTIVE_CADENCE): bool,
         vol.Required("model"): vol.In(SOLIS_MODELS),
         vol.Required("connection", default=list(CONNECTION_METHOD.keys())[0]): vol.In(CONNECTION_METHOD),
         # Boolean options (Yes/No toggle)
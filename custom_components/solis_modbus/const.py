@@ -12,6 +12,7 @@ SWITCH_ENTITIES = "switch_entities"
 NUMBER_ENTITIES = "number_entities"
 SENSOR_DERIVED_ENTITIES = "sensor_derived_entities"
 DRIFT_COUNTER = "drift_counter"
+DERIVED_ENGINES = "derived_engines"
 ENTITIES = "entities"
 
 # Connection types
@@ -64,3 +65,48 @@ POLL_PROFILES = {
 # extreme mode polls few enough frames that a tighter loop is safe.
 POLL_INTERVAL_FAST_MIN = 10
 POLL_INTERVAL_FAST_MIN_EXTREME = 2
+
+# Read coalescing: adjacent groups of the same register type and poll speed are
+# merged into one frame when at most this many unused registers sit between them.
+# Every frame saved is one inter-frame wait plus a datalogger round trip.
+CONF_MAX_READ_GAP = "max_read_gap"
+DEFAULT_MAX_READ_GAP = 16
+MAX_READ_GAP_LIMIT = 100
+
+# Read requests allowed in flight on one Modbus TCP link (1 = strictly one at a
+# time). Only for gateways that handle several transaction IDs; see modbus_pipeline.
+CONF_PIPELINE_WINDOW = "pipeline_window"
+DEFAULT_PIPELINE_WINDOW = 1
+PIPELINE_WINDOW_LIMIT = 8
+
+# Leave out state writes for changes below a per-device-class deadband (see
+# publish_policy). Off by default: every change reaches the recorder.
+CONF_PUBLISH_DEADBAND = "publish_deadband"
+DEFAULT_PUBLISH_DEADBAND = False
+
+# Read written holding registers back once a write burst settled and publish
+# what the inverter kept (see write_verification). A register that reads back
+# different from what was written fires EVENT_WRITE_MISMATCH.
+CONF_VERIFY_WRITES = "verify_writes"
+DEFAULT_VERIFY_WRITES = False
+EVENT_WRITE_MISMATCH = f"{DOMAIN}_write_mismatch"
+
+# Read groups whose registers keep coming back unchanged less often, up to a
+# ceiling (see poll_scheduler). Off by default: every group keeps its interval.
+CONF_ADAPTIVE_CADENCE = "adaptive_cadence"
+DEFAULT_ADAPTIVE_CADENCE = False
+
+# Bounds (seconds) of each link's read timeout, learned from its response
+# times like TCP's retransmission timeout (see client_manager.LinkTimeout).
+# Writes and connects always wait the ceiling. A timed-out read closes the
+# socket, so the floor leaves room for a datalogger's occasional slow answer.
+CONF_TIMEOUT_FLOOR = "timeout_floor"
+DEFAULT_TIMEOUT_FLOOR = 1.0
+CONF_TIMEOUT_CEILING = "timeout_ceiling"
+DEFAULT_TIMEOUT_CEILING = 10.0
+TIMEOUT_LIMIT = 60.0
+
+# A register value restored from the warm-start snapshot may seed a
+# read-modify-write only while it is younger than this; otherwise the
+# inverter is read live first (issue #402).
+RMW_MAX_RESTORED_AGE_SECONDS = 15 * 60
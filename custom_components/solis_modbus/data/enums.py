@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class PollSpeed(Enum):
@@ -9,6 +9,15 @@ class PollSpeed(Enum):
     SLOW = "slow"
 
 
+class LinkPriority(IntEnum):
+    """Who gets the shared Modbus link next (lower value wins)."""
+
+    WRITE = 0
+    FAST = 1
+    NORMAL = 2
+    SLOW = 3
+
+
 class InverterType(Enum):
     HYBRID = "hybrid"
     STRING = "string"
@@ -4,38 +4,79 @@ import time
 from datetime import UTC, datetime, timedelta
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.event import async_track_time_interval
 
 from custom_components.solis_modbus.helpers import (
     cache_get,
-    cache_save,
+    get_register_store,
     mark_platform_entities_unavailable_for_base_sensors,
     notify_register_update,
+    publish_register_block,
 )
 
-from .const import DOMAIN
-from .data.enums import PollSpeed
+from .circuit_breaker import CircuitBreakers
+from .client_manager import current_link_priority
+from .const import DEFAULT_MAX_READ_GAP, DOMAIN
+from .data.enums import LinkPriority, PollSpeed
+from .derived_engine import get_derived_engine
+from .learned_register_map import FIRMWARE_REGISTER_COUNT, LearnedRegisterMap, firmware_register
 from .modbus_controller import RECOVERABLE_REGISTER_READ_EXCEPTIONS, ModbusController
+from .modbus_pipeline import ModbusTcpPipeline
+from .poll_scheduler import PollScheduler
+from .poll_stats import PollStats
+from .read_planner import ReadFrame, ReadPlanner
+from .read_set import enabled_entity_registers
+from .register_snapshot import RegisterSnapshot
 from .sensors.solis_base_sensor import SolisSensorGroup, cluster_sensors_by_contiguous_registers
+from .spike_filter import SpikeFilters
 
 _LOGGER = logging.getLogger(__name__)
 
 _MAX_REGISTER_RECOVERY_DEPTH = 24
 
+# Link priority of each poll cycle's frames (writes always go first).
+_POLL_LINK_PRIORITY = {
+    PollSpeed.STARTUP: LinkPriority.FAST,
+    PollSpeed.FAST: LinkPriority.FAST,
+    PollSpeed.NORMAL: LinkPriority.NORMAL,
+    PollSpeed.SLOW: LinkPriority.SLOW,
+}
+
+# Unchanged registers are still dispatched this often, so entity watchdogs
+# (SolisSensor.async_update) never see a static value as a dead link.
+_DISPATCH_REFRESH_SECONDS = 300.0
+
 # Raise a repair issue once the reconnect loop has failed this many times
 # (~the datalogger has been gone for a while, not a single blip).
 _ISSUE_AFTER_FAILURES = 5
 
 
 class DataRetrieval:
-    def __init__(self, hass: HomeAssistant, controller: ModbusController, entry_id: str | None = None):
-        self._spike_counter = {}
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        controller: ModbusController,
+        entry_id: str | None = None,
+        max_read_gap: int = DEFAULT_MAX_READ_GAP,
+        learned_map: LearnedRegisterMap | None = None,
+        snapshot: RegisterSnapshot | None = None,
+        adaptive_cadence: bool = False,
+    ):
+        self.spike_filters = SpikeFilters()
         self.controller: ModbusController = controller
         self.hass = hass
         self._entry_id = entry_id
-        self.poll_lock = asyncio.Lock()
+        self.poll_lock = asyncio.Lock()  # one poll cycle at a time per entry
+        self.read_planner = ReadPlanner(max_gap=max_read_gap)
+        self.learned_map = learned_map
+        self.snapshot = snapshot
+        self.stats = PollStats()
+        self.scheduler = PollScheduler(controller.poll_speed, adaptive=adaptive_cadence)
+        self.breakers = CircuitBreakers(label=f"({controller.host}.{controller.slave})")
+        self._last_full_dispatch: dict[int, float] = {}
         self.connection_check = False
         self.first_poll = True
         self.poll_updating = {
@@ -49,7 +90,13 @@ class DataRetrieval:
         self._startup_unsub = None  # Store startup listener separately
         self._write_task = None  # process_write_queue task, cancelled on unload
         self._poll_task = None  # poll_controller task, cancelled on unload
+        self._revalidate_task = None  # first full poll after a warm start, cancelled on unload
         self._stopping = False  # set on async_stop so in-flight reconnect loops exit
+        self._read_set_stale = True  # recompute the enabled entities' registers before the next cycle
+
+        if entry_id is not None:
+            self._unsub_listeners.append(self.hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._entity_registry_updated))
+        self._unsub_listeners.append(controller.add_refresh_listener(self._refresh_requested))
 
         if self.hass.is_running:
             self._poll_task = self.hass.async_create_task(self.poll_controller())
@@ -58,13 +105,42 @@ class DataRetrieval:
             self._startup_unsub = self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, self.poll_controller)
 
     async def _read_register_block_with_exception(self, start_register: int, count: int, is_holding: bool) -> tuple[list[int] | None, int | None]:
+        started = time.perf_counter()
         if is_holding:
-            return await self.controller.async_read_holding_registers_with_exception(start_register, count)
-        return await self.controller.async_read_input_registers_with_exception(start_register, count)
+            values, exc_code = await self.controller.async_read_holding_registers_with_exception(start_register, count)
+        else:
+            values, exc_code = await self.controller.async_read_input_registers_with_exception(start_register, count)
+        self.stats.record_frame(start_register, time.perf_counter() - started, values is not None)
+        return values, exc_code
+
+    def _pipeline_active(self) -> bool:
+        pipeline = getattr(self.controller, "pipeline", None)
+        return isinstance(pipeline, ModbusTcpPipeline) and pipeline.active
+
+    async def _read_frames_pipelined(self, frames: list[ReadFrame]) -> list[tuple[list[int] | None, int | None]]:
+        """Send every frame of the cycle through the link's pipeline at once; results are in frame order."""
+
+        async def _read(frame: ReadFrame):
+            started = time.perf_counter()
+            values, exc_code = await self.controller.async_read_registers_pipelined(frame.start, frame.count, frame.is_holding)
+            self.stats.record_frame(frame.start, time.perf_counter() - started, values is not None)
+            return values, exc_code
+
+        return await asyncio.gather(*(_read(frame) for frame in frames))
+
+    def _apply_pipelined_frame(self, frame: ReadFrame, result: tuple[list[int] | None, int | None], marked_for_removal: list) -> bool:
+        """Cache a pipelined frame's groups. False when it failed, to be read again (and recovered) the serial way."""
+        values, _exc_code = result
+        if values is None or len(values) != frame.count:
+            return False
+        for group in frame.groups:
+            self._apply_register_read_to_cache(group, frame.values_for(group, values), marked_for_removal)
+        return True
 
     async def _probe_register_block_quiet(self, start_register: int, count: int, is_holding: bool) -> tuple[bool, list[int] | None]:
         if count <= 0:
             return True, []
+        self.stats.bisection_probes += 1
         if is_holding:
             vals, _err = await self.controller._async_read_holding_register_raw_detailed(start_register, count, quiet=True)
         else:
@@ -93,14 +169,39 @@ class DataRetrieval:
                 return start + off
         return None
 
+    def _dispatch_refresh_due(self, start_register: int) -> bool:
+        """True when a group's registers should all be re-sent even if unchanged (keeps entity watchdogs fed)."""
+        now = time.monotonic()
+        last = self._last_full_dispatch.get(start_register)
+        if last is not None and now - last < _DISPATCH_REFRESH_SECONDS:
+            return False
+        self._last_full_dispatch[start_register] = now
+        return True
+
     def _apply_register_read_to_cache(self, sensor_group: SolisSensorGroup, values: list[int], marked_for_removal: list) -> None:
         start_register = sensor_group.start_register
-        for i, value in enumerate(values):
+        force = self._dispatch_refresh_due(start_register)
+        store = get_register_store(self.hass, self.controller, create=True)
+        self.spike_filters.refresh(self.controller.sensor_groups)
+        corrected_values = self.spike_filters.filter_block(start_register, values, store.get)
+        changed, moved = [], []
+        for i, value in enumerate(corrected_values):
             reg = start_register + i
             _LOGGER.debug("block %s, register %s has value %s", start_register, reg, value)
-            corrected_value = self.spike_filtering(reg, value)
-            cache_save(self.hass, self.controller, reg, corrected_value)
-            notify_register_update(self.hass, self.controller, reg, corrected_value)
+            previous = store.get(reg)
+            if force or previous != value:
+                changed.append(reg)
+            if previous is not None and previous != value:
+                moved.append(reg)
+        store.set_block(start_register, corrected_values)
+        self.breakers.record_success(sensor_group)
+        if self.scheduler.adaptive:
+            self._track_cadence(sensor_group, moved)
+
+        # One publish per block, after it is cached, carrying the group's one-pass decode of it.
+        if changed:
+            publish_register_block(self.hass, self.controller, start_register, corrected_values, changed, sensor_group.decode(corrected_values))
+        self.stats.record_dispatch(len(changed), len(values) - len(changed))
 
         if sensor_group.poll_speed == PollSpeed.ONCE:
             marked_for_removal.append(sensor_group)
@@ -138,16 +239,8 @@ class DataRetrieval:
             )
             return None
 
-        disabled_sensors = [s for s in sensor_group.sensors if bad in s.registrars]
-        for s in disabled_sensors:
-            s.enabled = False
-        mark_platform_entities_unavailable_for_base_sensors(self.hass, disabled_sensors)
-
-        remaining = [s for s in sensor_group.sensors if bad not in s.registrars]
-        clusters = cluster_sensors_by_contiguous_registers(remaining)
-        new_groups = [SolisSensorGroup.from_sensors(c, sensor_group.poll_speed, sensor_group.identification) for c in clusters]
-
-        self.controller.replace_sensor_group(sensor_group, new_groups)
+        disabled_sensors, new_groups = self._split_out_bad_register(sensor_group, bad)
+        self._remember_learned_registers(bad=(bad,))
 
         disabled_names = ", ".join(s.name for s in disabled_sensors) or "(unknown)"
         _LOGGER.warning(
@@ -163,6 +256,7 @@ class DataRetrieval:
 
         results: list[tuple[SolisSensorGroup, list[int]]] = []
         for g in new_groups:
+            self.stats.retries += 1
             vals, exc = await self._read_register_block_with_exception(g.start_register, g.registrar_count, is_holding)
             if vals is not None and len(vals) == g.registrar_count:
                 results.append((g, vals))
@@ -174,6 +268,161 @@ class DataRetrieval:
                     results.extend(nested)
         return results if results else None
 
+    def _split_out_bad_register(self, sensor_group: SolisSensorGroup, bad: int) -> tuple[list, list[SolisSensorGroup]]:
+        """Disable the sensors on ``bad`` and replace their group with the contiguous rest. Returns (disabled sensors, new groups)."""
+        # Keep the planner from bridging this register when it merges groups.
+        self.read_planner.mark_unreadable(bad)
+
+        disabled_sensors = [s for s in sensor_group.sensors if bad in s.registrars]
+        for s in disabled_sensors:
+            s.enabled = False
+        mark_platform_entities_unavailable_for_base_sensors(self.hass, disabled_sensors)
+
+        remaining = [s for s in sensor_group.sensors if bad not in s.registrars]
+        clusters = cluster_sensors_by_contiguous_registers(remaining)
+        new_groups = [SolisSensorGroup.from_sensors(c, sensor_group.poll_speed, sensor_group.identification) for c in clusters]
+
+        self.controller.replace_sensor_group(sensor_group, new_groups)
+        return disabled_sensors, new_groups
+
+    def _remember_learned_registers(self, *, bad=(), unreadable=()) -> None:
+        """Persist newly learned registers with the resulting group layout, so a restart need not probe for them again."""
+        learned = self.learned_map
+        if learned is None:
+            return
+        if learned.firmware is None:
+            start = firmware_register(self.controller.inverter_config.type)
+            firmware = [cache_get(self.hass, self.controller, start + i) for i in range(FIRMWARE_REGISTER_COUNT)]
+            if None not in firmware:
+                learned.firmware = firmware
+        groups = [[group.start_register, group.registrar_count] for group in self.controller.sensor_groups]
+        learned.remember(bad=bad, unreadable=unreadable, groups=groups)
+
+    async def _restore_learned_register_map(self) -> None:
+        """Re-apply the registers learned before the last restart, before the first poll probes for them again."""
+        learned = self.learned_map
+        if learned is None or not self.controller.connected():
+            return
+        start = firmware_register(self.controller.inverter_config.type)
+        firmware, _err = await self.controller._async_read_input_register_raw_detailed(start, FIRMWARE_REGISTER_COUNT, quiet=True)
+        if not await learned.async_restore(firmware):
+            return
+
+        self.read_planner.mark_unreadable(*learned.unreadable_registers)
+        disabled = []
+        for bad in sorted(learned.bad_registers):
+            for group in [g for g in self.controller.sensor_groups if any(bad in s.registrars for s in g.sensors)]:
+                disabled.extend(self._split_out_bad_register(group, bad)[0])
+        _LOGGER.info(
+            "(%s.%s) Re-applied learned register map: bad %s, unreadable %s; disabled: %s",
+            self.controller.host,
+            self.controller.slave,
+            sorted(learned.bad_registers),
+            sorted(learned.unreadable_registers),
+            ", ".join(s.name for s in disabled) or "(none)",
+        )
+
+    async def _read_sensor_group(self, sensor_group: SolisSensorGroup, marked_for_removal: list) -> None:
+        """Read one group as its own frame, recovering from address errors by splitting the group."""
+        start_register = sensor_group.start_register
+        count = sensor_group.registrar_count
+        end_register = start_register + count - 1
+
+        _LOGGER.debug(f"Group {start_register} starting for ({self.controller.host}.{self.controller.slave})")
+
+        is_holding = start_register >= 40000
+        link_up = self.controller.connected()
+        values, exc_code = await self._read_register_block_with_exception(start_register, count, is_holding)
+
+        if values is None:
+            if exc_code in RECOVERABLE_REGISTER_READ_EXCEPTIONS:
+                recovered = await self._recover_sensor_group_after_modbus_failure(sensor_group, start_register, count, is_holding, marked_for_removal)
+                if recovered:
+                    for rg, block_values in recovered:
+                        self._apply_register_read_to_cache(rg, block_values, marked_for_removal)
+                    return
+            else:
+                self._record_read_failure([sensor_group], exc_code, link_up)
+            _LOGGER.debug(f"⚠️ Received None for register {start_register} - {end_register}, for ({self.controller.host}.{self.controller.slave}), skipping.")
+            return
+        if len(values) != count:
+            _LOGGER.debug(
+                f"⚠️ Modbus read mismatch: Received {len(values)} values, expected {count} from ({self.controller.host}.{self.controller.slave}) "
+                f"for register {start_register} - {end_register}. Skipping because linking them is uncertain."
+            )
+            return
+
+        self._apply_register_read_to_cache(sensor_group, values, marked_for_removal)
+
+    def _record_read_failure(self, groups: list[SolisSensorGroup], exc_code: int | None, link_up: bool) -> None:
+        """Count a failed read against its groups' breakers, unless it only found the link down.
+
+        A read that had to reconnect first and got no answer says nothing about the
+        groups. Other unanswered reads are held until the end of the cycle.
+        """
+        if exc_code is None and not link_up:
+            return
+        for group in groups:
+            self.breakers.record_failure(group, answered=exc_code is not None)
+
+    async def _read_planned_frame(self, frame: ReadFrame, marked_for_removal: list, *, _depth: int = 0) -> None:
+        """Read a planned frame and hand each group its slice of the response.
+
+        A merged frame the inverter rejects (exception 2/3) is bisected once to find
+        the offending register, which the planner then refuses to bridge; the groups
+        are re-planned around it. Single-group frames keep the per-group recovery.
+        """
+        if len(frame.groups) == 1:
+            await self._read_sensor_group(frame.groups[0], marked_for_removal)
+            return
+
+        _LOGGER.debug(f"Frame {frame.start} - {frame.end} ({len(frame.groups)} groups) starting for ({self.controller.host}.{self.controller.slave})")
+        link_up = self.controller.connected()
+        values, exc_code = await self._read_register_block_with_exception(frame.start, frame.count, frame.is_holding)
+
+        if values is not None and len(values) == frame.count:
+            for group in frame.groups:
+                self._apply_register_read_to_cache(group, frame.values_for(group, values), marked_for_removal)
+            return
+
+        if values is not None or exc_code not in RECOVERABLE_REGISTER_READ_EXCEPTIONS:
+            _LOGGER.debug(
+                f"⚠️ Merged read {frame.start} - {frame.end} failed for ({self.controller.host}.{self.controller.slave}) "
+                f"(exception {exc_code}, {len(values) if values is not None else 0}/{frame.count} values), skipping."
+            )
+            if values is None:
+                self._record_read_failure(frame.groups, exc_code, link_up)
+            return
+
+        learned = False
+        if _depth < _MAX_REGISTER_RECOVERY_DEPTH:
+            bad = await self._async_isolate_one_bad_register(frame.start, frame.count, frame.is_holding)
+            unreadable = (bad,) if bad is not None else frame.gap_registers()
+            # Without a bad register every register reads on its own but not together: stop bridging these gaps.
+            learned = self.read_planner.mark_unreadable(*unreadable)
+            if learned:
+                self._remember_learned_registers(unreadable=unreadable)
+
+        if learned:
+            sub_frames = self.read_planner.plan(frame.groups)
+            _LOGGER.info(
+                "(%s.%s) Merged Modbus read %s-%s rejected; re-planned as %d frame(s).",
+                self.controller.host,
+                self.controller.slave,
+                frame.start,
+                frame.end,
+                len(sub_frames),
+            )
+            for sub_frame in sub_frames:
+                self.stats.retries += 1
+                await self._read_planned_frame(sub_frame, marked_for_removal, _depth=_depth + 1)
+            return
+
+        # Nothing new to avoid (e.g. adjacent groups): fall back to one frame per group this cycle.
+        for group in frame.groups:
+            self.stats.retries += 1
+            await self._read_sensor_group(group, marked_for_removal)
+
     async def async_stop(self):
         """Cancel all listeners and background tasks."""
         # Signal any in-flight reconnect loop to exit (it may be mid-backoff while
@@ -195,7 +444,7 @@ class DataRetrieval:
         # FIRST: poll_controller() creates _write_task as its last step, so stopping
         # poll first prevents it spawning a fresh write task after we've cancelled the
         # old one. getattr re-reads _write_task afterwards, catching any it just created.
-        for task_attr in ("_poll_task", "_write_task"):
+        for task_attr in ("_poll_task", "_revalidate_task", "_write_task"):
             task = getattr(self, task_attr)
             if task is not None:
                 task.cancel()
@@ -261,8 +510,25 @@ class DataRetrieval:
 
             if self.controller.connected():
                 if self.first_poll:
-                    await self.modbus_update_all()
-                    self.first_poll = False
+                    try:
+                        async with self.poll_lock:
+                            await self._restore_learned_register_map()
+                    except Exception:
+                        # Keep first_poll set: the next connection check tries again.
+                        _LOGGER.warning(
+                            "(%s.%s) Could not re-apply the learned register map; retrying on the next connection check",
+                            self.controller.host,
+                            self.controller.slave,
+                            exc_info=True,
+                        )
+                    else:
+                        self.first_poll = False
+                        if self.snapshot is not None and self.snapshot.restored:
+                            # Entities already show the warm-start values: revalidate them in the
+                            # background; the scheduler holds its ticks until this full poll is done.
+                            self._revalidate_task = self.hass.async_create_task(self.modbus_update_all())
+                        else:
+                            await self.modbus_update_all()
                 if not self._link_is_stale():
                     self._update_connection_issue(False)
                     return
@@ -319,28 +585,104 @@ class DataRetrieval:
 
         await self.check_connection()
 
-        # Start periodic polling
+        # Start periodic polling: the link coordinator ticks the schedules of all slaves on this link.
         self._unsub_listeners.append(async_track_time_interval(self.hass, self.check_connection, timedelta(minutes=2)))
-        self._unsub_listeners.append(
-            async_track_time_interval(self.hass, self.modbus_update_fast, timedelta(seconds=self.controller.poll_speed.get(PollSpeed.FAST, 5)))
-        )
-        self._unsub_listeners.append(
-            async_track_time_interval(
-                self.hass,
-                self.modbus_update_normal,
-                timedelta(seconds=self.controller.poll_speed.get(PollSpeed.NORMAL, 15)),
-            )
-        )
-        self._unsub_listeners.append(
-            async_track_time_interval(
-                self.hass,
-                self.modbus_update_slow,
-                timedelta(seconds=self.controller.poll_speed.get(PollSpeed.SLOW, 30)),
-            )
-        )
+        self._unsub_listeners.append(self.controller.link_coordinator.register(self.hass, self))
 
         self._write_task = self.hass.async_create_task(self.controller.process_write_queue())
 
+    def _track_cadence(self, sensor_group: SolisSensorGroup, moved: list[int]) -> None:
+        """Adaptive cadence: stretch quiet groups; an operating-state change wakes them all. ``moved``: registers that changed value."""
+        self.scheduler.record_read(sensor_group, bool(moved))
+        if moved and any(sensor.operating_state and not set(sensor.registrars).isdisjoint(moved) for sensor in sensor_group.sensors):
+            _LOGGER.debug("(%s.%s) Operating state changed; all groups back to base cadence", self.controller.host, self.controller.slave)
+            self.scheduler.wake()
+
+    @callback
+    def _refresh_requested(self, registers: range | None) -> None:
+        """Read the groups covering written registers (adaptive cadence only) or, when None, every group now."""
+        if registers is None:
+            self.scheduler.wake()
+            return
+        if not self.scheduler.adaptive:
+            return
+        written = set(registers)
+        self.scheduler.wake([g for g in self.controller.sensor_groups if not written.isdisjoint(range(g.start_register, g.start_register + g.registrar_count))])
+
+    @callback
+    def _entity_registry_updated(self, event: Event) -> None:
+        """Replan the read set when an entity of this entry is enabled, disabled or removed."""
+        if event.data.get("action") == "update" and "disabled_by" not in event.data.get("changes", {}):
+            return
+        registry_entry = er.async_get(self.hass).async_get(event.data.get("entity_id"))
+        if registry_entry is None or registry_entry.config_entry_id == self._entry_id:
+            self._read_set_stale = True
+
+    def _sync_read_set(self) -> None:
+        """Trim the poll groups to the registers of the currently enabled entities."""
+        if not self._read_set_stale:
+            return
+        entry = self.hass.config_entries.async_get_entry(self._entry_id) if self._entry_id else None
+        registers = enabled_entity_registers(self.hass, entry) if entry is not None else None
+        if registers is None:
+            return  # entities not set up yet: poll every group
+        self._read_set_stale = False
+        if self.controller.read_set.update(registers):
+            _LOGGER.debug(
+                "(%s.%s) Read set: %d register(s) back enabled entities, %d group(s) to poll",
+                self.controller.host,
+                self.controller.slave,
+                len(registers),
+                len(self.controller.sensor_groups),
+            )
+
+    def _groups_for_speed(self, groups: list[SolisSensorGroup], speed: PollSpeed) -> list[SolisSensorGroup]:
+        if speed == PollSpeed.NORMAL:
+            return [g for g in groups if g.poll_speed in (PollSpeed.NORMAL, PollSpeed.ONCE)]
+        return [g for g in groups if g.poll_speed == speed]
+
+    def _revalidating(self) -> bool:
+        """True while the full poll after a warm start is still running."""
+        return self._revalidate_task is not None and not self._revalidate_task.done()
+
+    async def poll_due_fast(self) -> None:
+        """Read this slave's FAST groups if their deadline has passed (called by the link coordinator)."""
+        if not self.controller.enabled or self._revalidating():
+            return
+        self._sync_read_set()
+        self.scheduler.sync(self.controller.sensor_groups)
+        fast, _ = self.scheduler.due()
+        if not fast:
+            return
+        # Groups a skipped cycle never read stay due and go out with the next tick.
+        if await self.get_modbus_updates(fast, PollSpeed.FAST):
+            self.scheduler.mark_polled(fast)
+        notify_register_update(self.hass, self.controller, 90006, self.controller.last_modbus_success)
+
+    def due_background_groups(self) -> list[SolisSensorGroup]:
+        """NORMAL/SLOW groups past their deadline, most overdue first."""
+        if not self.controller.enabled or self._revalidating():
+            return []
+        self._sync_read_set()
+        self.scheduler.sync(self.controller.sensor_groups)
+        return self.scheduler.due()[1]
+
+    async def poll_background(self, groups: list[SolisSensorGroup]) -> None:
+        """Read the NORMAL/SLOW groups the link coordinator fitted into this tick."""
+        for speed in (PollSpeed.NORMAL, PollSpeed.SLOW):
+            speed_groups = self._groups_for_speed(groups, speed)
+            if speed_groups and await self.get_modbus_updates(speed_groups, speed):
+                self.scheduler.mark_polled(speed_groups)
+
+    def frame_demand(self) -> float:
+        """Frames per second this slave's poll intervals ask of the link."""
+        demand = 0.0
+        for speed in (PollSpeed.FAST, PollSpeed.NORMAL, PollSpeed.SLOW):
+            groups = self._groups_for_speed(self.controller.sensor_groups, speed)
+            if groups:
+                demand += len(self.read_planner.plan(groups)) / self.scheduler.interval(speed)
+        return demand
+
     async def modbus_update_all(self):
         """Updates all sensor groups regardless of their poll speed.
 
@@ -399,7 +741,7 @@ class DataRetrieval:
             PollSpeed.NORMAL,
         )
 
-    async def get_modbus_updates(self, groups: list[SolisSensorGroup], speed: PollSpeed):
+    async def get_modbus_updates(self, groups: list[SolisSensorGroup], speed: PollSpeed) -> bool:
         """Read registers from the Modbus controller, ensuring no concurrent runs.
 
         This method reads register values for the specified sensor groups and
@@ -411,121 +753,69 @@ class DataRetrieval:
             speed (PollSpeed): The poll speed category for these groups.
 
         Returns:
-            None
+            bool: True when the cycle ran; False when it was skipped (controller
+            disabled or disconnected, or the same groups are still being read).
         """
         if not self.controller.enabled or not self.controller.connected():
-            return
+            return False
 
         group_hash = frozenset({group.start_register for group in groups})
 
         if group_hash in self.poll_updating[speed]:
             _LOGGER.debug(f"⚠️({self.controller.host}.{self.controller.slave}) Skipping {speed.name} update: A previous instance is still running")
-            return
+            self.stats.record_skipped_cycle(speed)
+            return False
 
         self.poll_updating[speed][group_hash] = True
-
         try:
+            # One cycle at a time per entry: overlapping cycles (a full update and a
+            # scheduler tick) would read the same frames twice and race on the splits
+            # and ONCE removals in controller._sensor_groups. Frames still take the
+            # shared link one at a time, so writes and other slaves' FAST frames go
+            # out between the frames of a long cycle.
             async with self.poll_lock:
-                total_start_time = time.perf_counter()
-                total_registrars, total_groups = 0, 0
-                marked_for_removal = []
-
-                for sensor_group in groups:
-                    start_register = sensor_group.start_register
-                    count = sensor_group.registrar_count
-                    end_register = start_register + count - 1
-                    total_registrars += count
-                    total_groups += 1
-
-                    _LOGGER.debug(f"Group {start_register} starting for ({self.controller.host}.{self.controller.slave})")
-
-                    is_holding = start_register >= 40000
-                    values, exc_code = await self._read_register_block_with_exception(start_register, count, is_holding)
-
-                    if values is None:
-                        if exc_code in RECOVERABLE_REGISTER_READ_EXCEPTIONS:
-                            recovered = await self._recover_sensor_group_after_modbus_failure(
-                                sensor_group, start_register, count, is_holding, marked_for_removal
-                            )
-                            if recovered:
-                                for rg, block_values in recovered:
-                                    self._apply_register_read_to_cache(rg, block_values, marked_for_removal)
-                            else:
-                                _LOGGER.debug(
-                                    f"⚠️ Received None for register {start_register} - {end_register}, "
-                                    f"for ({self.controller.host}.{self.controller.slave}), skipping."
-                                )
-                        else:
-                            _LOGGER.debug(
-                                f"⚠️ Received None for register {start_register} - {end_register}, "
-                                f"for ({self.controller.host}.{self.controller.slave}), skipping."
-                            )
-                        continue
-                    if len(values) != count:
-                        _LOGGER.debug(
-                            f"⚠️ Modbus read mismatch: Received {len(values)} values, expected {count} from ({self.controller.host}.{self.controller.slave}) "
-                            f"for register {start_register} - {end_register}. Skipping because linking them is uncertain."
-                        )
-                        continue
-
-                    self._apply_register_read_to_cache(sensor_group, values, marked_for_removal)
+                await self._read_cycle(groups, speed)
+        finally:
+            del self.poll_updating[speed][group_hash]  # ✅ Reset only this group set
+        return True
 
-                # Remove "ONCE" poll speed groups
-                self.controller._sensor_groups = [g for g in self.controller.sensor_groups if g not in marked_for_removal]
+    async def _read_cycle(self, groups: list[SolisSensorGroup], speed: PollSpeed) -> None:
+        """One poll cycle: read the groups' frames at the speed's link priority and cache the results."""
+        # Derived values are evaluated once at the end of the cycle, not per block.
+        derived = get_derived_engine(self.hass, self.controller)
+        if derived is not None:
+            derived.begin_cycle()
 
-                total_duration = time.perf_counter() - total_start_time
-                _LOGGER.debug(f"✅ {speed.name} update completed in {total_duration:.4f}s")
+        priority_token = current_link_priority.set(_POLL_LINK_PRIORITY.get(speed, LinkPriority.NORMAL))
+        try:
+            total_start_time = time.perf_counter()
+            total_registrars, total_groups = 0, 0
+            marked_for_removal = []
+
+            # Groups whose breaker is open are skipped; a half-open group gets its trial read in a frame of its own.
+            self.breakers.begin_cycle()
+            groups, trials = self.breakers.partition(groups)
+            frames = self.read_planner.plan(groups) + [frame for group in trials for frame in self.read_planner.plan([group])]
+            pipelined = await self._read_frames_pipelined(frames) if len(frames) > 1 and self._pipeline_active() else None
+            for index, frame in enumerate(frames):
+                total_registrars += frame.count
+                total_groups += len(frame.groups)
+                if pipelined is not None and self._apply_pipelined_frame(frame, pipelined[index], marked_for_removal):
+                    continue
+                await self._read_planned_frame(frame, marked_for_removal)
+
+            # Remove "ONCE" poll speed groups
+            self.controller.remove_sensor_groups(marked_for_removal)
+
+            total_duration = time.perf_counter() - total_start_time
+            self.stats.record_cycle(speed, total_duration, len(frames))
+            if self.snapshot is not None:
+                self.snapshot.schedule_save()
+            _LOGGER.debug(f"✅ {speed.name} update completed in {total_duration:.4f}s ({total_groups} group(s), {total_registrars} register(s))")
         except Exception:
             _LOGGER.warning("(%s.%s) Unexpected error during %s poll", self.controller.host, self.controller.slave, speed.name, exc_info=True)
         finally:
-            del self.poll_updating[speed][group_hash]  # ✅ Reset only this group set
-
-    # https://github.com/Pho3niX90/solis_modbus/issues/138
-    def spike_filtering(self, register: int, value: int):
-        """Filter short-lived implausible readings for known noisy registers."""
-        cached_value = cache_get(self.hass, self.controller, register)
-        if register not in self._spike_counter:
-            self._spike_counter[register] = 0
-
-        # 33139 Battery SOC: readings stuck at hard edge can briefly spike.
-        if register == 33139:
-            if value not in (0, 100):
-                self._spike_counter[register] = 0
-                return value
-
-            self._spike_counter[register] += 1
-            if self._spike_counter[register] < 3:
-                _LOGGER.debug(
-                    f"Ignoring short spike value {value} for battery SOC sensor; "
-                    f"retaining previous value {cached_value} (counter={self._spike_counter[register]})"
-                )
-                return cached_value if cached_value is not None else value
-
-            _LOGGER.debug(f"Accepting persistent spike value {value} for battery SOC sensor after {self._spike_counter[register]} cycles")
-            self._spike_counter[register] = 0
-            return value
-
-        # 33148 Backup load power (U16): parallel inverter setups can briefly
-        # report wrap-around/sentinel-like values (for example 65526).
-        if register == 33148:
-            wattage = getattr(self.controller.inverter_config, "wattage_chosen", 0) or 0
-            plausible_max = int(max(10000, wattage * 2))
-            is_implausible = value >= 65000 or value > plausible_max
-
-            if not is_implausible:
-                self._spike_counter[register] = 0
-                return value
-
-            self._spike_counter[register] += 1
-            if self._spike_counter[register] < 3:
-                _LOGGER.debug(
-                    f"Ignoring transient backup load outlier {value}W (max={plausible_max}W); "
-                    f"retaining previous value {cached_value} (counter={self._spike_counter[register]})"
-                )
-                return cached_value if cached_value is not None else value
-
-            _LOGGER.debug(f"Accepting persistent backup load outlier {value}W after {self._spike_counter[register]} cycles (max={plausible_max}W)")
-            self._spike_counter[register] = 0
-            return value
-
-        return value
+            self.breakers.end_cycle()
+            current_link_priority.reset(priority_token)
+            if derived is not None:
+                derived.end_cycle()
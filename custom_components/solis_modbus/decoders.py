@@ -0,0 +1,87 @@
+"""Register decoders resolved once per sensor, instead of re-deciding on every value.
+
+``resolve_decoder`` picks the word combination (serial string, U16/S16, U32/S32
+and their low-word-first variants) and the scaling for one sensor and returns a
+plain function of its raw registers. ``BlockDecoder`` holds those functions for
+a whole poll group, with each sensor's offset into the block, so one read is
+decoded into every sensor value in a single pass.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from .data.enums import DataType
+from .helpers import combine_u32, combine_u32_le, extract_serial_number, split_s32, split_s32_le
+
+if TYPE_CHECKING:
+    from .sensors.solis_base_sensor import SolisBaseSensor
+
+Decoder = Callable[[Sequence[int]], Any]
+
+# Sensors spanning at least this many registers hold an ASCII string (the serial number).
+STRING_REGISTER_COUNT = 15
+
+_u16 = itemgetter(0)
+
+
+def _s16(values: Sequence[int]) -> int:
+    raw = values[0]
+    return raw - 65536 if raw > 32767 else raw
+
+
+# Two-register values default to signed 32-bit big-endian (historical behaviour —
+# the many 2-register power/current registers are genuinely signed).
+_WORD_DECODERS: dict[str | None, Decoder] = {
+    DataType.U32.value: combine_u32,
+    DataType.U32_LE.value: combine_u32_le,
+    DataType.S32_LE.value: split_s32_le,
+}
+
+
+def resolve_decoder(register_count: int, data_type: str | None, multiplier) -> Decoder:
+    """The decode function for a sensor of ``register_count`` registers, ``data_type`` and ``multiplier``."""
+    if register_count >= STRING_REGISTER_COUNT:
+        return extract_serial_number
+
+    if register_count > 1:
+        combine = _WORD_DECODERS.get(data_type, split_s32)
+    else:
+        combine = _s16 if data_type == DataType.S16.value else _u16
+
+    # A multiplier of 0 is treated as 1 (unscaled).
+    if multiplier == 0 or multiplier == 1:
+        return lambda values: round(combine(values))
+    return lambda values: combine(values) * multiplier
+
+
+class BlockDecoder:
+    """Decodes every sensor of a poll group from the group's raw registers in one pass."""
+
+    __slots__ = ("_gathered", "_sliced")
+
+    def __init__(self, start_register: int, sensors: Iterable[SolisBaseSensor]):
+        self._sliced: list[tuple[SolisBaseSensor, int, int, Decoder]] = []
+        self._gathered: list[tuple[SolisBaseSensor, Callable, int, Decoder]] = []
+        for sensor in sensors:
+            if sensor.name == "reserve":
+                continue
+            offsets = [register - start_register for register in sensor.registrars]
+            first, last = offsets[0], offsets[-1]
+            if offsets == list(range(first, last + 1)):
+                self._sliced.append((sensor, first, last + 1, sensor.decoder))
+            else:
+                # itemgetter of one index returns a scalar; decoders always take a sequence.
+                getter = itemgetter(*offsets) if len(offsets) > 1 else lambda values, i=first: (values[i],)
+                self._gathered.append((sensor, getter, max(offsets) + 1, sensor.decoder))
+
+    def decode(self, values: Sequence[int]) -> dict[SolisBaseSensor, Any]:
+        """Sensor -> decoded value for every sensor the block fully covers."""
+        size = len(values)
+        decoded = {sensor: decode(values[lo:hi]) for sensor, lo, hi, decode in self._sliced if hi <= size}
+        for sensor, getter, needed, decode in self._gathered:
+            if needed <= size:
+                decoded[sensor] = decode(getter(values))
+        return decoded
@@ -0,0 +1,190 @@
+"""Indexed, lazily loaded sensor definitions.
+
+``sensor_data/hybrid_sensors.py`` is a literal list of several hundred entity
+dicts; executing it (every enum attribute lookup included) is a noticeable part
+of setting up an entry, and setup, the migrations and the docs generator each
+used to walk it whole. The definitions are now loaded per register map (hybrid
+or string/grid), only when an entry of that type needs them, and compiled once
+into ``SensorDefinitions``: the groups and derived entities plus indexes by
+register, unique key, feature requirement and poll profile.
+
+The loaded definitions are also cached to disk (a pickle next to the module's
+bytecode, keyed on the source file like a ``.pyc``), so later starts unpickle
+them instead of executing the module. A cache that cannot be read or written is
+ignored; the module import is always the fallback.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import pickle
+import sys
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+
+from .const import POLL_PROFILE_ESSENTIAL, POLL_PROFILE_EXTREME, POLL_PROFILE_FULL
+from .data.enums import InverterFeature, InverterType
+from .helpers import group_in_poll_profile, registers_declared_by
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+# Register map -> (module in sensor_data, groups attribute, derived attribute).
+_MODULES = {
+    "hybrid": ("hybrid_sensors", "hybrid_sensors", "hybrid_sensors_derived"),
+    "string": ("string_sensors", "string_sensors", "string_sensors_derived"),
+}
+_SENSOR_DATA = Path(__file__).parent / "sensor_data"
+
+_loaded: dict[str, SensorDefinitions] = {}
+_load_lock = threading.Lock()
+
+
+def register_map_for(inverter_type: InverterType) -> str:
+    """The register map an inverter type uses: string and grid inverters share one, everything else is hybrid."""
+    return "string" if inverter_type in (InverterType.STRING, InverterType.GRID) else "hybrid"
+
+
+@dataclass(slots=True)
+class SensorDefinitions:
+    """One register map's sensor groups and derived entities, with lookup indexes."""
+
+    register_map: str
+    groups: list[dict]
+    derived: list[dict]
+    by_register: dict[int, int] = field(default_factory=dict)  # register -> index into groups
+    by_unique: dict[str, dict] = field(default_factory=dict)  # unique key -> entity definition (derived included)
+    unique_keys: list[str] = field(default_factory=list)  # group entity keys in definition order, reserves left out
+    known_registers: set[int] = field(default_factory=set)
+    _unconditional: tuple[int, ...] = ()
+    _by_feature: dict[InverterFeature, tuple[int, ...]] = field(default_factory=dict)
+    _by_profile: dict[tuple[str, bool], frozenset[int]] = field(default_factory=dict)
+
+    @classmethod
+    def compile(cls, register_map: str, groups: list[dict], derived: list[dict]) -> SensorDefinitions:
+        definitions = cls(register_map, groups, derived)
+        unconditional, by_feature = [], {}
+        for index, group in enumerate(groups):
+            requirement = group.get("feature_requirement", [])
+            if not requirement:
+                unconditional.append(index)
+            for feature in requirement:
+                by_feature.setdefault(feature, []).append(index)
+            for entity in group.get("entities", []):
+                for register in entity.get("register", []):
+                    definitions.by_register.setdefault(int(register), index)
+                unique_key = entity.get("unique")
+                if entity.get("type") != "reserve" and unique_key:
+                    definitions.unique_keys.append(unique_key)
+                    definitions.by_unique.setdefault(unique_key, entity)
+        for entity in derived:
+            if entity.get("unique"):
+                definitions.by_unique.setdefault(entity["unique"], entity)
+        definitions._unconditional = tuple(unconditional)
+        definitions._by_feature = {feature: tuple(indexes) for feature, indexes in by_feature.items()}
+        definitions._by_profile = {
+            (profile, include_battery): frozenset(index for index, group in enumerate(groups) if group_in_poll_profile(group, profile, include_battery))
+            for profile in (POLL_PROFILE_ESSENTIAL, POLL_PROFILE_EXTREME)
+            for include_battery in (False, True)
+        }
+        definitions.known_registers = registers_declared_by(groups)
+        return definitions
+
+    def groups_for(self, features: Iterable[InverterFeature], poll_profile: str = POLL_PROFILE_FULL, include_battery: bool = False) -> list[dict]:
+        """The groups an inverter with ``features`` polls under ``poll_profile``, in definition order."""
+        indexes = set(self._unconditional)
+        for feature in features:
+            indexes.update(self._by_feature.get(feature, ()))
+        if poll_profile != POLL_PROFILE_FULL:
+            indexes &= self._by_profile.get((poll_profile, bool(include_battery)), frozenset())
+        return [self.groups[index] for index in sorted(indexes)]
+
+    def groups_missing_features(self, features: Iterable[InverterFeature]) -> list[dict]:
+        """The groups an inverter with ``features`` does not have."""
+        supported = {id(group) for group in self.groups_for(features)}
+        return [group for group in self.groups if id(group) not in supported]
+
+    def maps_profile(self, poll_profile: str) -> bool:
+        """True when at least one group belongs to ``poll_profile`` (every group belongs to the full profile)."""
+        return poll_profile == POLL_PROFILE_FULL or bool(self._by_profile.get((poll_profile, False)))
+
+    def group_for_register(self, register: int) -> dict | None:
+        index = self.by_register.get(register)
+        return self.groups[index] if index is not None else None
+
+
+def cache_path(register_map: str) -> Path:
+    return _SENSOR_DATA / "__pycache__" / f"{_MODULES[register_map][0]}.definitions.pickle"
+
+
+def _source_key(register_map: str) -> tuple:
+    stat = (_SENSOR_DATA / f"{_MODULES[register_map][0]}.py").stat()
+    return (CACHE_VERSION, sys.version_info[:2], stat.st_mtime_ns, stat.st_size)
+
+
+def _read_cache(register_map: str) -> tuple[list[dict], list[dict]] | None:
+    try:
+        key = _source_key(register_map)
+        with cache_path(register_map).open("rb") as handle:
+            cached_key, groups, derived = pickle.load(handle)
+    except FileNotFoundError:
+        return None
+    except Exception as err:
+        _LOGGER.debug("Ignoring unreadable sensor definition cache for %s: %r", register_map, err)
+        return None
+    return (groups, derived) if cached_key == key else None
+
+
+def _write_cache(register_map: str, groups: list[dict], derived: list[dict]) -> None:
+    path = cache_path(register_map)
+    try:
+        payload = pickle.dumps((_source_key(register_map), groups, derived), protocol=pickle.HIGHEST_PROTOCOL)
+        path.parent.mkdir(exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_bytes(payload)
+        temporary.replace(path)
+    except Exception as err:
+        _LOGGER.debug("Could not write sensor definition cache for %s: %r", register_map, err)
+
+
+def _import_definitions(register_map: str) -> tuple[list[dict], list[dict]]:
+    module_name, groups_name, derived_name = _MODULES[register_map]
+    module = importlib.import_module(f"{__package__}.sensor_data.{module_name}")
+    return getattr(module, groups_name), getattr(module, derived_name)
+
+
+def load_definitions(register_map: str, *, use_cache: bool = True) -> SensorDefinitions:
+    """Load and index one register map (``"hybrid"`` or ``"string"``). Blocking; loaded once per process."""
+    definitions = _loaded.get(register_map)
+    if definitions is not None:
+        return definitions
+    with _load_lock:
+        definitions = _loaded.get(register_map)
+        if definitions is not None:
+            return definitions
+        cached = _read_cache(register_map) if use_cache else None
+        if cached is None:
+            cached = _import_definitions(register_map)
+            if use_cache:
+                _write_cache(register_map, *cached)
+        definitions = _loaded[register_map] = SensorDefinitions.compile(register_map, *cached)
+        return definitions
+
+
+def get_definitions(inverter_type: InverterType) -> SensorDefinitions:
+    """The sensor definitions for an inverter type. Blocking the first time; see async_get_definitions."""
+    return load_definitions(register_map_for(inverter_type))
+
+
+async def async_get_definitions(hass: HomeAssistant, inverter_type: InverterType) -> SensorDefinitions:
+    """The sensor definitions for an inverter type, loaded in the executor the first time."""
+    definitions = _loaded.get(register_map_for(inverter_type))
+    if definitions is not None:
+        return definitions
+    return await hass.async_add_executor_job(get_definitions, inverter_type)
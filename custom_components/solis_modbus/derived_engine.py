@@ -0,0 +1,292 @@
+"""Derived sensor values evaluated from a dependency graph over register inputs.
+
+Derived entities (PV power, power factor, battery charge/discharge power, net
+grid energy, status string, ...) are computed from registers other sensors
+poll. Each used to subscribe to its source registers on its own and re-collect
+them on every block, picking its formula through a chain of register checks.
+
+Here every derived definition is compiled once into a ``DerivedNode``: its input
+registers and a formula chosen from ``_FORMULAS`` (first matching rule wins; a
+new metric is one more rule). One ``DerivedEngine`` per link+slave keeps the
+graph from input register to nodes and subscribes each input to the register
+store once. A published block only marks the nodes of the registers that
+changed; the marked nodes are evaluated once when the poll cycle ends (or on
+the next loop iteration for blocks published outside a cycle, such as writes
+and the 90006 last-success tick), however many of their inputs arrived.
+"""
+
+from __future__ import annotations
+
+import decimal
+import fractions
+import logging
+import numbers
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DERIVED_ENGINES, DOMAIN
+from .data.status_mapping import STATUS_MAPPING
+from .helpers import clock_drift_test, decode_inverter_model, get_register_store, register_cache_key
+from .register_store import RegisterBlock
+
+_LOGGER = logging.getLogger(__name__)
+
+# Registers in a derived definition that are not inputs: the clock-adjustment
+# marker and the literal direction flag of the battery charge/discharge power.
+NON_INPUT_REGISTERS = frozenset({0, 1, 90007})
+
+LAST_MODBUS_SUCCESS = "last_modbus_success"
+CLOCK_ADJUSTMENT = "clock_adjustment"
+INVERTER_MODEL = "inverter_model"
+
+Formula = Callable[[HomeAssistant, Any, dict[int, Any]], Any]
+ValueListener = Callable[[Any], None]
+
+
+def _last_modbus_success(hass, sensor, received):
+    value = sensor.controller.last_modbus_success
+    return None if value == 0 else value
+
+
+def _clock_adjustment(hass, sensor, received):
+    """Checks the inverter clock (33022-33027); the time of the correction if one was written, else None."""
+    if clock_drift_test(hass, sensor.controller, *(received[register] for register in range(33022, 33028))):
+        return datetime.now(UTC)
+    return None
+
+
+def _status_string(hass, sensor, received):
+    code = round(sensor.get_value)
+    # Preserve the raw hex code for unmapped faults (matches SolisCloud alarm codes).
+    return STATUS_MAPPING.get(code, f"Unknown (0x{code:04X})")
+
+
+def _dc_power(hass, sensor, received):
+    """DC voltage × DC current of one string (hybrid 33049-33056, string inverter 3021-3028, protocol Ver19)."""
+    voltage, current = (received[register] * sensor.multiplier for register in sensor.registrars[:2])
+    return round(voltage * current)
+
+
+def _power_factor(hass, sensor, received):
+    registers = sensor.registrars
+    active_power = sensor.convert_value([received[registers[0]], received[registers[1]]])
+    reactive_power = sensor.convert_value([received[registers[2]], received[registers[3]]])
+    if active_power == 0 or reactive_power == 0:
+        return 1
+    return round(active_power / ((active_power**2 + reactive_power**2) ** 0.5), 3)
+
+
+def _battery_power(sensor, received) -> tuple[float, Any]:
+    """Battery power (33149-33150, unsigned) and direction (33135: 0 charging, 1 discharging)."""
+    registers = sensor.registrars
+    power = sensor.convert_value([received[register] for register in registers if register not in NON_INPUT_REGISTERS])
+    return power, received[registers[2]]
+
+
+def _battery_directional_power(hass, sensor, received):
+    """Battery power while it flows in the direction the definition's fourth register names, else 0."""
+    power, direction = _battery_power(sensor, received)
+    return round(power * 10) if str(direction) == str(sensor.registrars[3]) else 0
+
+
+def _battery_net_power(hass, sensor, received):
+    power, direction = _battery_power(sensor, received)
+    return round(power * 10) * -1 if str(direction) == str(0) else round(power * 10)
+
+
+def _negated(hass, sensor, received):
+    return sensor.get_value * -1
+
+
+def _net_grid_energy(hass, sensor, received):
+    # 33175 - to grid, 33171 - from grid
+    to_grid = received[sensor.registrars[0]] * sensor.multiplier
+    from_grid = received[sensor.registrars[1]] * sensor.multiplier
+    return from_grid - to_grid
+
+
+def _inverter_model(hass, sensor, received):
+    protocol_version, model_description = decode_inverter_model(sensor.get_value)
+    sensor.controller._sw_version = protocol_version
+    return model_description + f"(Protocol {protocol_version})"
+
+
+def _value(hass, sensor, received):
+    return sensor.get_value
+
+
+def _touches(*registers: int) -> Callable[[list[int]], bool]:
+    wanted = frozenset(registers)
+    return lambda sources: not wanted.isdisjoint(sources)
+
+
+# (matches the definition's registers, kind, formula); the first match wins, anything else is the sensor's own decode.
+_FORMULAS: list[tuple[Callable[[list[int]], bool], str, Formula]] = [
+    (_touches(90006), LAST_MODBUS_SUCCESS, _last_modbus_success),
+    (_touches(90007), CLOCK_ADJUSTMENT, _clock_adjustment),
+    (_touches(33095), "status_string", _status_string),
+    (_touches(33049, 33051, 33053, 33055, 3021, 3023, 3025, 3027), "dc_power", _dc_power),
+    (_touches(33079, 33080, 33081, 33082), "power_factor", _power_factor),
+    (lambda sources: 33135 in sources and len(sources) == 4, "battery_directional_power", _battery_directional_power),
+    (lambda sources: 33135 in sources and len(sources) == 3, "battery_net_power", _battery_net_power),
+    (lambda sources: 33263 in sources and len(sources) == 2, "negated", _negated),
+    (_touches(33175, 33171), "net_grid_energy", _net_grid_energy),
+    (_touches(35000), INVERTER_MODEL, _inverter_model),
+]
+
+
+@dataclass(eq=False, slots=True)
+class DerivedNode:
+    """One derived sensor in the graph: the registers it is computed from and how."""
+
+    sensor: Any  # SolisBaseSensor
+    kind: str
+    inputs: tuple[int, ...]
+    formula: Formula
+    listeners: list[ValueListener] = field(default_factory=list)
+
+
+def compile_derived(sensor) -> DerivedNode:
+    """The node of a derived base sensor, with the formula its source registers select."""
+    sources = list(sensor.registrars)
+    kind, formula = next(((kind, formula) for matches, kind, formula in _FORMULAS if matches(sources)), ("value", _value))
+    return DerivedNode(sensor, kind, tuple(register for register in sources if register not in NON_INPUT_REGISTERS), formula)
+
+
+def evaluate_derived(hass: HomeAssistant, node: DerivedNode, block: RegisterBlock | None = None) -> Any:
+    """The node's value from the register store (and ``block``, where it covers the inputs); None until all inputs are known."""
+    store = get_register_store(hass, node.sensor.controller, create=True)
+    received = dict(zip(node.inputs, store.values_for(node.inputs, block), strict=True))
+    if None in received.values():
+        _LOGGER.debug(f"not all values received yet = {received}")
+        return None  # Wait until all registers are known
+    value = node.formula(hass, node.sensor, received)
+    if isinstance(value, (numbers.Number, decimal.Decimal, fractions.Fraction, str, datetime)):
+        return value
+    return None
+
+
+class DerivedEngine:
+    """The derived-value graph of one link+slave: input register -> nodes, evaluated once per poll cycle."""
+
+    def __init__(self, hass: HomeAssistant, controller):
+        self.hass = hass
+        self.controller = controller
+        self.evaluations = 0
+        self._dependents: dict[int, list[DerivedNode]] = {}
+        self._unsubscribe_inputs: dict[int, Callable[[], None]] = {}
+        self._dirty: dict[DerivedNode, None] = {}
+        self._cycles = 0
+        self._flush_handle = None
+
+    def subscribe(self, node: DerivedNode, listener: ValueListener) -> Callable[[], None]:
+        """Call ``listener`` with the node's new value after its inputs change. Returns the unsubscribe callback."""
+        node.listeners.append(listener)
+        if len(node.listeners) == 1:
+            store = get_register_store(self.hass, self.controller, create=True)
+            for register in node.inputs:
+                if register not in self._dependents:
+                    self._dependents[register] = []
+                    self._unsubscribe_inputs[register] = store.subscribe((register,), partial(self._input_changed, register))
+                self._dependents[register].append(node)
+
+        def _unsubscribe() -> None:
+            if listener in node.listeners:
+                node.listeners.remove(listener)
+            if not node.listeners:
+                self._drop(node)
+
+        return _unsubscribe
+
+    def _drop(self, node: DerivedNode) -> None:
+        self._dirty.pop(node, None)
+        for register in node.inputs:
+            dependents = self._dependents.get(register)
+            if dependents and node in dependents:
+                dependents.remove(node)
+                if not dependents:
+                    del self._dependents[register]
+                    self._unsubscribe_inputs.pop(register)()
+
+    def _input_changed(self, register: int, block: RegisterBlock) -> None:
+        for node in self._dependents.get(register, ()):
+            self._dirty[node] = None
+        if self._cycles == 0 and self._flush_handle is None and self._dirty:
+            self._flush_handle = self.hass.loop.call_soon(self.flush)
+
+    def begin_cycle(self) -> None:
+        """Hold evaluation until ``end_cycle``: a cycle's blocks re-evaluate each affected node once."""
+        self._cycles += 1
+
+    def end_cycle(self) -> None:
+        """Evaluate what the cycle changed (overlapping cycles each flush, so a FAST cycle never waits for a SLOW one)."""
+        self._cycles = max(0, self._cycles - 1)
+        self.flush()
+
+    def flush(self) -> None:
+        """Evaluate every node whose inputs changed since the last flush and hand new values to their listeners."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        dirty, self._dirty = self._dirty, {}
+        for node in dirty:
+            self.evaluations += 1
+            try:
+                value = evaluate_derived(self.hass, node)
+            except Exception:
+                _LOGGER.exception("Error evaluating derived sensor %s", node.sensor.name)
+                continue
+            if value is None:
+                continue
+            for listener in list(node.listeners):
+                listener(value)
+
+    def close(self) -> None:
+        """Stop listening to the register store (the entry was unloaded)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for unsubscribe in self._unsubscribe_inputs.values():
+            unsubscribe()
+        self._unsubscribe_inputs.clear()
+        self._dependents.clear()
+        self._dirty.clear()
+
+    @property
+    def nodes(self) -> int:
+        return len({id(node) for nodes in self._dependents.values() for node in nodes})
+
+    def as_dict(self) -> dict:
+        return {"nodes": self.nodes, "inputs": len(self._dependents), "evaluations": self.evaluations}
+
+
+def get_derived_engine(hass: HomeAssistant, controller, create: bool = False) -> DerivedEngine | None:
+    """The derived-value engine of one link+slave; None until a derived entity subscribed, unless ``create``."""
+    engines = hass.data.get(DOMAIN, {}).get(DERIVED_ENGINES)
+    if engines is None:
+        if not create:
+            return None
+        engines = hass.data.setdefault(DOMAIN, {}).setdefault(DERIVED_ENGINES, {})
+    key = register_cache_key(controller, "derived")
+    engine = engines.get(key)
+    if engine is None and create:
+        engine = engines[key] = DerivedEngine(hass, controller)
+    return engine
+
+
+def remove_derived_engine(hass: HomeAssistant, controller) -> None:
+    """Drop the engine of a link+slave on unload, so a reload builds a new one around the new controller."""
+    engines = hass.data.get(DOMAIN, {}).get(DERIVED_ENGINES)
+    engine = engines.pop(register_cache_key(controller, "derived"), None) if engines else None
+    if engine is not None:
+        engine.close()
+
+
+def derived_inputs(sensors: Iterable) -> set[int]:
+    """Every register the given derived base sensors are computed from."""
+    return {register for sensor in sensors for register in compile_derived(sensor).inputs}
@@ -7,7 +7,8 @@ from typing import Any
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_INVERTER_SERIAL, DOMAIN, VALUES
+from .const import CONF_INVERTER_SERIAL
+from .helpers import get_register_store
 from .runtime import SolisConfigEntry
 
 TO_REDACT = {"host", CONF_INVERTER_SERIAL, "serial_port", "identification"}
@@ -28,18 +29,13 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: SolisCo
         return {"error": "entry has no runtime data (not set up)"}
 
     controller = runtime.controller
-    cache = hass.data.get(DOMAIN, {}).get(VALUES, {})
-    cache_prefix = f"{controller.connection_id}|{controller.device_id}|"
+    store = get_register_store(hass, controller)
     register_cache = {}
-    for key, value in cache.items():
-        if not key.startswith(cache_prefix):
-            continue
-        register = key.removeprefix(cache_prefix)
-        if register.isdigit() and int(register) in _SERIAL_REGISTER_RANGE:
-            continue
-        register_cache[register] = value
+    if store is not None:
+        register_cache = {str(register): value for register, value in store.items() if register not in _SERIAL_REGISTER_RANGE}
 
     last_success = controller.last_modbus_success
+    data_retrieval = runtime.data_retrieval
 
     return {
         "entry": {
@@ -58,6 +54,8 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: SolisCo
             "last_modbus_success": last_success.isoformat() if last_success else None,
             "poll_speed": {speed.name: interval for speed, interval in controller.poll_speed.items()},
             "sw_version": controller.sw_version,
+            "link_pacing": controller.link_stats,
+            "io": controller.io_stats,
         },
         "inverter_config": {
             "model": controller.inverter_config.model,
@@ -76,6 +74,13 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: SolisCo
             }
             for group in controller.sensor_groups
         ],
+        "poll_stats": data_retrieval.stats.as_dict() if data_retrieval is not None else None,
+        "poll_scheduler": data_retrieval.scheduler.as_dict() if data_retrieval is not None else None,
+        "circuit_breakers": data_retrieval.breakers.as_dict() if data_retrieval is not None else None,
+        "read_set": controller.read_set.as_dict(),
+        "write_verification": controller.write_verifier.as_dict() if controller.write_verifier is not None else None,
+        "held_spikes": data_retrieval.spike_filters.as_dict() if data_retrieval is not None else None,
+        "learned_registers": data_retrieval.learned_map.as_dict() if data_retrieval is not None and data_retrieval.learned_map is not None else None,
         "entity_counts": {platform: len(entities) for platform, entities in runtime.entities.items()},
         "register_cache": register_cache,
     }
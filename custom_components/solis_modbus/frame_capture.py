@@ -0,0 +1,265 @@
+"""Raw Modbus frame capture and deterministic replay.
+
+With capture on (the ``solis_capture_frames`` service), ModbusController
+records every request it makes and what came back: function code, slave,
+address, count, the registers read or written, the exception code or transport
+error, a monotonic timestamp and the round-trip latency. Frames are written as
+one compact JSON object per line (NDJSON) to an append-only file that rotates
+by size, like a log file (``capture.ndjson``, ``capture.ndjson.1`` ...).
+
+``ReplayClient`` answers the same client calls as a pymodbus client from such a
+capture: each request gets the next captured answer to that exact request, after
+the captured latency (scaled by ``speed``; 0 answers immediately). Put it in
+place of a controller's client and a user's "values jump" or "group fails"
+report can be replayed through DataRetrieval offline (see tests/replay_capture.py).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from pymodbus.exceptions import ModbusIOException
+from pymodbus.pdu import ExceptionResponse
+from pymodbus.pdu.register_message import (
+    ReadHoldingRegistersResponse,
+    ReadInputRegistersResponse,
+    WriteMultipleRegistersResponse,
+    WriteSingleRegisterResponse,
+)
+
+from .modbus_pipeline import FC_READ_HOLDING, FC_READ_INPUT
+
+_LOGGER = logging.getLogger(__name__)
+
+FC_WRITE_SINGLE = 6
+FC_WRITE_MULTIPLE = 16
+
+CAPTURE_FORMAT = "solis_modbus_capture"
+CAPTURE_VERSION = 1
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+# Frames buffered in memory before they are handed to the executor for writing.
+FLUSH_EVERY = 50
+
+
+@dataclass(slots=True)
+class CapturedFrame:
+    """One request and its outcome. ``t`` is seconds since the capture started."""
+
+    t: float
+    slave: int
+    function_code: int
+    address: int
+    count: int
+    registers: list[int] | None = None
+    exception_code: int | None = None
+    error: str | None = None
+    latency: float = 0.0
+
+    def to_json(self) -> str:
+        record = {"t": round(self.t, 4), "s": self.slave, "fc": self.function_code, "a": self.address, "n": self.count, "l": round(self.latency, 4)}
+        if self.registers is not None:
+            record["r"] = self.registers
+        if self.exception_code is not None:
+            record["x"] = self.exception_code
+        if self.error is not None:
+            record["e"] = self.error
+        return json.dumps(record, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, record: dict) -> CapturedFrame:
+        return cls(
+            t=record["t"],
+            slave=record["s"],
+            function_code=record["fc"],
+            address=record["a"],
+            count=record["n"],
+            registers=record.get("r"),
+            exception_code=record.get("x"),
+            error=record.get("e"),
+            latency=record.get("l", 0.0),
+        )
+
+
+class FrameCapture:
+    """Append-only, size-rotated NDJSON capture of one controller's frames.
+
+    ``record`` only buffers (it runs on the event loop); ``take`` hands a batch of
+    lines to ``write``, which does the file I/O and belongs in the executor.
+    """
+
+    def __init__(self, path: str | os.PathLike, max_bytes: int = DEFAULT_MAX_BYTES, backups: int = DEFAULT_BACKUPS):
+        self.path = Path(path)
+        self.max_bytes = max(1024, int(max_bytes))
+        self.backups = max(0, int(backups))
+        self.frames = 0
+        self._origin = time.perf_counter()
+        self._buffer: list[str] = []
+        self._writing = False
+        self._file_lock = threading.Lock()
+
+    def record(
+        self,
+        slave: int,
+        function_code: int,
+        address: int,
+        count: int,
+        started: float,
+        *,
+        registers: Iterable[int] | None = None,
+        exception_code: int | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Buffer one frame; ``started`` is the ``time.perf_counter()`` the request went out at."""
+        now = time.perf_counter()
+        frame = CapturedFrame(
+            t=started - self._origin,
+            slave=int(slave),
+            function_code=function_code,
+            address=int(address),
+            count=int(count),
+            registers=[int(value) for value in registers] if registers is not None else None,
+            exception_code=exception_code,
+            error=error,
+            latency=now - started,
+        )
+        self._buffer.append(frame.to_json())
+        self.frames += 1
+
+    def take(self, force: bool = False) -> list[str] | None:
+        """The buffered lines to write, once there are enough (or any, with ``force``) and no write is running."""
+        if not self._buffer or (not force and (len(self._buffer) < FLUSH_EVERY or self._writing)):
+            return None
+        self._writing = True
+        lines, self._buffer = self._buffer, []
+        return lines
+
+    def write(self, lines: list[str]) -> None:
+        """Append ``lines`` to the capture file, rotating first when it would grow past ``max_bytes``. Blocking."""
+        try:
+            with self._file_lock:
+                payload = "".join(f"{line}\n" for line in lines)
+                size = self.path.stat().st_size if self.path.exists() else 0
+                if size and size + len(payload) > self.max_bytes:
+                    self._rotate()
+                    size = 0
+                with self.path.open("a", encoding="utf-8") as handle:
+                    if size == 0:
+                        handle.write(json.dumps({"format": CAPTURE_FORMAT, "version": CAPTURE_VERSION}) + "\n")
+                    handle.write(payload)
+        except OSError as err:
+            _LOGGER.warning("Could not write Modbus frame capture %s: %s", self.path, err)
+        finally:
+            self._writing = False
+
+    def _rotate(self) -> None:
+        if self.backups == 0:
+            self.path.unlink(missing_ok=True)
+            return
+        for index in range(self.backups - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{index}")
+            if older.exists():
+                older.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+
+
+def capture_files(path: str | os.PathLike) -> list[Path]:
+    """A capture and its rotated files, oldest first."""
+    path = Path(path)
+    rotated = sorted(path.parent.glob(f"{path.name}.*"), key=lambda p: int(p.suffix[1:]) if p.suffix[1:].isdigit() else -1, reverse=True)
+    return [p for p in rotated if p.suffix[1:].isdigit()] + ([path] if path.exists() else [])
+
+
+def load_capture(path: str | os.PathLike) -> list[CapturedFrame]:
+    """Every frame of a capture (including its rotated files), in capture order."""
+    frames: list[CapturedFrame] = []
+    for file in capture_files(path):
+        with file.open(encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if "format" not in record:
+                    frames.append(CapturedFrame.from_json(record))
+    return frames
+
+
+class ReplayClient:
+    """Pymodbus client stand-in answering from a capture instead of a link.
+
+    Answers are matched per (slave, function code, address, count) in capture
+    order, so a poll path that makes the same requests gets the same answers. A
+    request the capture has no (more) answers for fails like a timeout.
+    """
+
+    def __init__(self, frames: Iterable[CapturedFrame], speed: float = 1.0):
+        self.speed = speed
+        self.connected = False
+        self.slave = 1  # serial clients are addressed by attribute
+        self.replayed = 0
+        self.unmatched = 0
+        self._answers: dict[tuple[int, int, int, int], deque[CapturedFrame]] = {}
+        for frame in frames:
+            self._answers.setdefault((frame.slave, frame.function_code, frame.address, frame.count), deque()).append(frame)
+
+    @property
+    def remaining(self) -> int:
+        return sum(len(answers) for answers in self._answers.values())
+
+    async def connect(self) -> bool:
+        self.connected = True
+        return True
+
+    def close(self) -> None:
+        self.connected = False
+
+    async def read_input_registers(self, address: int, count: int = 1, device_id: int | None = None, **kwargs):
+        return await self._answer(FC_READ_INPUT, address, count, device_id, ReadInputRegistersResponse)
+
+    async def read_holding_registers(self, address: int, count: int = 1, device_id: int | None = None, **kwargs):
+        return await self._answer(FC_READ_HOLDING, address, count, device_id, ReadHoldingRegistersResponse)
+
+    async def write_register(self, address: int, value: int, device_id: int | None = None, **kwargs):
+        frame = await self._next(FC_WRITE_SINGLE, address, 1, device_id)
+        failed = self._failure(frame, FC_WRITE_SINGLE)
+        return failed if failed is not None else WriteSingleRegisterResponse(address=address, registers=[value], dev_id=frame.slave)
+
+    async def write_registers(self, address: int, values: list[int], device_id: int | None = None, **kwargs):
+        frame = await self._next(FC_WRITE_MULTIPLE, address, len(values), device_id)
+        failed = self._failure(frame, FC_WRITE_MULTIPLE)
+        return failed if failed is not None else WriteMultipleRegistersResponse(address=address, count=len(values), dev_id=frame.slave)
+
+    async def _answer(self, function_code: int, address: int, count: int, device_id: int | None, response_type):
+        frame = await self._next(function_code, address, count, device_id)
+        failed = self._failure(frame, function_code)
+        return failed if failed is not None else response_type(registers=list(frame.registers or []), dev_id=frame.slave)
+
+    async def _next(self, function_code: int, address: int, count: int, device_id: int | None) -> CapturedFrame:
+        slave = int(device_id if device_id is not None else self.slave)
+        answers = self._answers.get((slave, function_code, address, count))
+        if not answers:
+            self.unmatched += 1
+            raise ModbusIOException(f"No captured answer for slave {slave} FC{function_code} {address}+{count}")
+        frame = answers.popleft()
+        self.replayed += 1
+        # Always yield, like a real transport, so concurrent pollers interleave.
+        await asyncio.sleep(frame.latency / self.speed if self.speed else 0)
+        return frame
+
+    @staticmethod
+    def _failure(frame: CapturedFrame, function_code: int):
+        """The captured failure, if the frame failed: raises the transport error or returns the exception response."""
+        if frame.error is not None:
+            raise ModbusIOException(frame.error)
+        if frame.exception_code is not None:
+            return ExceptionResponse(function_code, frame.exception_code)
+        return None
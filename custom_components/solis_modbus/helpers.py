@@ -1,28 +1,24 @@
 import logging
 import struct
+from collections.abc import Callable
 from datetime import datetime
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.util import dt as dt_utils
 
 from custom_components.solis_modbus import DOMAIN
 from custom_components.solis_modbus.const import (
     CONF_EXTREME_INCLUDE_BATTERY,
     CONF_POLL_PROFILE,
-    CONN_TYPE_TCP,
-    CONTROLLER,
     DRIFT_COUNTER,
     POLL_PROFILE_ESSENTIAL,
     POLL_PROFILE_EXTREME,
     POLL_PROFILE_FULL,
     POLL_PROFILES,
-    REGISTER,
-    SLAVE,
-    VALUE,
     VALUES,
 )
+from custom_components.solis_modbus.register_store import BlockListener, RegisterBlock, RegisterStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -172,21 +168,47 @@ def decode_inverter_model(hex_value):
     return protocol_version, model_description
 
 
-def register_cache_key(controller, register: str | int) -> str:
-    """Build a register cache key scoped to Modbus link + slave (parallel inverters on one logger)."""
+def _register_scope(controller) -> tuple[str, int]:
+    """(connection_id, slave) a register value belongs to (parallel inverters on one logger)."""
     conn = getattr(controller, "connection_id", None)
     if not isinstance(conn, str):
         conn = str(getattr(controller, "host", "") or "")
-    slave = int(getattr(controller, "device_id", 1))
+    return conn, int(getattr(controller, "device_id", 1))
+
+
+def register_cache_key(controller, register: str | int) -> str:
+    """Build a string key scoped to Modbus link + slave (parallel inverters on one logger)."""
+    conn, slave = _register_scope(controller)
     return f"{conn}|{slave}|{register}"
 
 
+def get_register_store(hass: HomeAssistant, controller, create: bool = False) -> RegisterStore | None:
+    """The register store of one link+slave; None until something was cached, unless ``create``."""
+    stores = hass.data.get(DOMAIN, {}).get(VALUES)
+    if stores is None:
+        if not create:
+            return None
+        stores = hass.data.setdefault(DOMAIN, {}).setdefault(VALUES, {})
+    scope = _register_scope(controller)
+    store = stores.get(scope)
+    if store is None and create:
+        store = stores[scope] = RegisterStore()
+    return store
+
+
 def cache_save(hass: HomeAssistant, controller, register: str | int, value):
-    hass.data[DOMAIN][VALUES][register_cache_key(controller, register)] = value
+    get_register_store(hass, controller, create=True).set(int(register), value)
 
 
-def cache_get(hass: HomeAssistant, controller, register: str | int):
-    return hass.data[DOMAIN][VALUES].get(register_cache_key(controller, register), None)
+def cache_get(hass: HomeAssistant, controller, register: str | int, max_restored_age: float | None = None):
+    """Cached value of a register. With ``max_restored_age``, a warm-start value older than that counts as missing."""
+    # Entities may ask before the integration has created the store.
+    store = get_register_store(hass, controller)
+    if store is None:
+        return None
+    if max_restored_age is not None:
+        return store.get_for_write(int(register), max_restored_age)
+    return store.get(int(register))
 
 
 def iter_platform_entities(hass: HomeAssistant, *platforms: str):
@@ -370,24 +392,23 @@ def is_correct_controller(controller, host: str, slave: int):
     return controller.host == host and controller.device_id == slave
 
 
-def register_update_signal(controller, register: int) -> str:
-    """Dispatcher signal for one Modbus register on a specific controller (not recorded by the HA recorder)."""
-    cid = getattr(controller, "connection_id", None)
-    if isinstance(cid, str):
-        scope = f"{cid}_{int(controller.device_id)}"
-    elif isinstance(getattr(controller, "connection_type", None), str) and controller.connection_type == CONN_TYPE_TCP:
-        scope = f"{controller.host}_{int(controller.port)}_{int(controller.device_id)}"
-    else:
-        scope = f"{controller.host}_{int(controller.device_id)}"
-    return f"{DOMAIN}_{scope}_{int(register)}"
+def subscribe_register_blocks(hass: HomeAssistant, controller, registers, listener: BlockListener) -> Callable[[], None]:
+    """Subscribe an entity to the blocks that touch any of ``registers`` on this link+slave. Returns the unsubscribe callback."""
+    return get_register_store(hass, controller, create=True).subscribe(registers, listener)
+
+
+def publish_register_block(hass: HomeAssistant, controller, start: int, values, registers=None, decoded=None) -> None:
+    """Hand one read/written block to its listeners (only those of ``registers`` when given). Values must already be cached.
+
+    ``decoded`` is the group's sensor -> value decode of the block, if the caller has one.
+    """
+    store = get_register_store(hass, controller)
+    if store is None:
+        return  # nothing has subscribed or cached for this slave yet
+    store.publish(RegisterBlock(start, tuple(values), controller.host, int(controller.device_id), decoded), registers)
 
 
 def notify_register_update(hass: HomeAssistant, controller, register: int, value) -> None:
-    """Notify listeners for a single register; replaces bus.async_fire(DOMAIN, ...) for Modbus data."""
-    payload = {
-        REGISTER: register,
-        VALUE: value,
-        CONTROLLER: controller.host,
-        SLAVE: int(controller.device_id),
-    }
-    async_dispatcher_send(hass, register_update_signal(controller, register), payload)
+    """Store and publish a single register (writes and virtual registers such as 90006, which no read caches)."""
+    get_register_store(hass, controller, create=True).set(register, value)
+    publish_register_block(hass, controller, register, (value,))
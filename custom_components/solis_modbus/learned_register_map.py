@@ -0,0 +1,112 @@
+"""Registers an inverter's firmware rejects, remembered across restarts.
+
+Recovery finds a bad register by bisecting a failing block with quiet probe
+reads, then disables the sensors on it and splits their group. Rediscovering
+the same firmware holes after every restart costs minutes of probe traffic per
+inverter, so the result is kept in a Home Assistant ``Store`` per serial number:
+the bad registers (which reproduce the group split), the registers the read
+planner must not bridge, and a fingerprint of model and DSP/HMI firmware. A
+stored map is only re-applied while the fingerprint still matches.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .data.enums import InverterType
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Learned registers usually arrive in bursts during the first polls.
+SAVE_DELAY_SECONDS = 30
+
+# DSP and HMI firmware version words (two consecutive input registers).
+_FIRMWARE_REGISTER = {
+    InverterType.STRING: 3000,
+    InverterType.GRID: 3000,
+}
+_HYBRID_FIRMWARE_REGISTER = 33001
+FIRMWARE_REGISTER_COUNT = 2
+
+
+def firmware_register(inverter_type: InverterType) -> int:
+    """First of the DSP/HMI version registers for this inverter type's register map."""
+    return _FIRMWARE_REGISTER.get(inverter_type, _HYBRID_FIRMWARE_REGISTER)
+
+
+def storage_key(serial_number: str) -> str:
+    return f"{DOMAIN}.learned_registers.{serial_number}"
+
+
+class LearnedRegisterMap:
+    """Persisted bad/unreadable registers of one inverter, valid for one firmware fingerprint."""
+
+    def __init__(self, hass: HomeAssistant, serial_number: str, model: str):
+        self.serial_number = serial_number
+        self.model = model
+        self.firmware: list[int] | None = None
+        self.bad_registers: set[int] = set()
+        self.unreadable_registers: set[int] = set()
+        self.groups: list[list[int]] = []
+        self._store: Store = Store(hass, STORAGE_VERSION, storage_key(serial_number))
+
+    @property
+    def fingerprint(self) -> dict:
+        return {"model": self.model, "firmware": self.firmware}
+
+    async def async_restore(self, firmware: list[int] | None) -> bool:
+        """Load the stored map if it was learned on this model and ``firmware``; drop it otherwise.
+
+        Returns True when there is something to re-apply. Without a firmware reading
+        nothing is applied (and nothing is dropped): a hole may since have been fixed.
+        """
+        self.firmware = firmware
+        data = await self._store.async_load()
+        if not data:
+            return False
+        if firmware is None:
+            _LOGGER.debug("(%s) Firmware unknown, not re-applying learned registers", self.serial_number)
+            return False
+        if data.get("fingerprint") != self.fingerprint:
+            _LOGGER.info(
+                "(%s) Firmware or model changed (%s -> %s), discarding learned registers",
+                self.serial_number,
+                data.get("fingerprint"),
+                self.fingerprint,
+            )
+            await self._store.async_remove()
+            return False
+
+        self.bad_registers = {int(reg) for reg in data.get("bad_registers", [])}
+        self.unreadable_registers = {int(reg) for reg in data.get("unreadable_registers", [])}
+        self.groups = [list(group) for group in data.get("groups", [])]
+        return bool(self.bad_registers or self.unreadable_registers)
+
+    def remember(self, *, bad: Iterable[int] = (), unreadable: Iterable[int] = (), groups: list[list[int]] | None = None) -> None:
+        """Add newly learned registers (and the resulting group layout) and schedule a save."""
+        self.bad_registers.update(int(reg) for reg in bad)
+        self.unreadable_registers.update(int(reg) for reg in unreadable)
+        if groups is not None:
+            self.groups = groups
+        if self.firmware is None:
+            # Never persist a map that could not be invalidated by a firmware update.
+            return
+        self._store.async_delay_save(self._data, SAVE_DELAY_SECONDS)
+
+    def _data(self) -> dict:
+        return {
+            "fingerprint": self.fingerprint,
+            "bad_registers": sorted(self.bad_registers),
+            "unreadable_registers": sorted(self.unreadable_registers),
+            "groups": self.groups,
+        }
+
+    def as_dict(self) -> dict:
+        return self._data()
@@ -0,0 +1,154 @@
+"""One poll schedule for every slave sharing a Modbus link.
+
+Parallel inverters behind one datalogger each used to run their own timers and
+only met at the link lock, so whichever slave's cycles happened to line up
+with the others' got starved. The coordinator owns the single tick for the
+link: every slave's due FAST groups go first (starting with a different slave
+each tick), then NORMAL/SLOW groups from all slaves are ordered by deadline and
+fitted into the idle gap before the earliest next FAST deadline on the link.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections.abc import Callable
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+
+from .poll_scheduler import POLL_TICK_SECONDS
+
+if TYPE_CHECKING:
+    from .data_retrieval import DataRetrieval
+    from .sensors.solis_base_sensor import SolisSensorGroup
+
+_LOGGER = logging.getLogger(__name__)
+
+# Frame cost assumed for a block that has not been timed yet.
+DEFAULT_FRAME_SECONDS = 0.2
+
+# How often link demand is compared against the link's measured frame capacity.
+CAPACITY_CHECK_SECONDS = 60.0
+
+
+def estimated_group_seconds(member: DataRetrieval, group: SolisSensorGroup) -> float:
+    """Median measured frame time for a group's block, or a default until it has been timed."""
+    stat = member.stats.frame_latency.get(group.start_register)
+    samples = sorted(stat.samples) if stat else []
+    if not samples:
+        return DEFAULT_FRAME_SECONDS
+    return samples[len(samples) // 2]
+
+
+class LinkPollCoordinator:
+    """Runs the poll schedules of all DataRetrievals on one connection_id."""
+
+    def __init__(self, connection_id: str):
+        self.connection_id = connection_id
+        self._members: list[DataRetrieval] = []
+        self._unsub_tick = None
+        self._tick_running = False
+        self._rotation = 0
+        self._last_capacity_check: float | None = None
+        self.ticks = 0
+        self.skipped_ticks = 0
+        self.deferred: dict[int, int] = {}
+
+    @property
+    def members(self) -> list[DataRetrieval]:
+        return list(self._members)
+
+    def register(self, hass: HomeAssistant, member: DataRetrieval) -> Callable[[], None]:
+        """Add a slave to the link schedule; starts the link tick with the first one. Returns the unregister callback."""
+        if member not in self._members:
+            self._members.append(member)
+        if self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(hass, self.tick, timedelta(seconds=POLL_TICK_SECONDS))
+
+        def _unregister() -> None:
+            if member in self._members:
+                self._members.remove(member)
+            if not self._members and self._unsub_tick is not None:
+                self._unsub_tick()
+                self._unsub_tick = None
+
+        return _unregister
+
+    def _rotated_members(self) -> list[DataRetrieval]:
+        """Members starting with a different slave each tick, so no slave always goes last."""
+        if not self._members:
+            return []
+        start = self._rotation % len(self._members)
+        self._rotation += 1
+        return self._members[start:] + self._members[:start]
+
+    async def tick(self, now=None) -> None:
+        if self._tick_running:
+            self.skipped_ticks += 1
+            return
+        self._tick_running = True
+        try:
+            self.ticks += 1
+            members = self._rotated_members()
+            for member in members:
+                await member.poll_due_fast()
+
+            idle = min((member.scheduler.seconds_until_next_fast() for member in members), default=math.inf)
+            candidates = []
+            for order, member in enumerate(members):
+                for group in member.due_background_groups():
+                    candidates.append((member.scheduler.deadline(group), order, member, group))
+            candidates.sort(key=lambda c: (c[0], c[1]))
+
+            picked: dict[DataRetrieval, list[SolisSensorGroup]] = {}
+            budget = 0.0
+            for _, _, member, group in candidates:
+                cost = estimated_group_seconds(member, group)
+                if budget + cost <= idle or member.scheduler.is_starving(group):
+                    picked.setdefault(member, []).append(group)
+                    budget += cost
+                else:
+                    slave = member.controller.slave
+                    self.deferred[slave] = self.deferred.get(slave, 0) + 1
+
+            for member in members:
+                if member in picked:
+                    await member.poll_background(picked[member])
+
+            self._check_link_capacity(members)
+        finally:
+            self._tick_running = False
+
+    def _check_link_capacity(self, members: list[DataRetrieval]) -> None:
+        """Warn (once per overload) when the slaves' intervals together need more frames than the link carries."""
+        if not members:
+            return
+        now = members[0].scheduler.now()
+        if self._last_capacity_check is not None and now - self._last_capacity_check < CAPACITY_CHECK_SECONDS:
+            return
+        self._last_capacity_check = now
+
+        demand = sum(member.frame_demand() for member in members)
+        samples = sorted(sample for member in members for stat in member.stats.frame_latency.values() for sample in stat.samples)
+        frame_seconds = samples[len(samples) // 2] if samples else None
+        newly_overloaded = [member.scheduler.update_capacity(demand, frame_seconds) for member in members]
+        if any(newly_overloaded):
+            scheduler = members[0].scheduler
+            _LOGGER.warning(
+                "(%s) Poll intervals of %s slave(s) need %.1f frames/s but the link has only carried %.1f frames/s; increase the poll intervals",
+                self.connection_id,
+                len(members),
+                scheduler.demand_frames_per_s,
+                scheduler.capacity_frames_per_s,
+            )
+
+    def as_dict(self) -> dict:
+        return {
+            "slaves": [member.controller.slave for member in self._members],
+            "ticks": self.ticks,
+            "skipped_ticks": self.skipped_ticks,
+            "deferred_groups": {str(slave): count for slave, count in sorted(self.deferred.items())},
+        }
@@ -1,25 +1,35 @@
 import asyncio
 import logging
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime
+from pathlib import Path
 
 from homeassistant.helpers.device_registry import DeviceInfo
 from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
 
-from custom_components.solis_modbus.client_manager import ModbusClientManager
+from custom_components.solis_modbus.client_manager import ModbusClientManager, current_link_priority
 from custom_components.solis_modbus.const import (
     CONN_TYPE_TCP,
     DEFAULT_BAUDRATE,
     DEFAULT_BYTESIZE,
     DEFAULT_PARITY,
     DEFAULT_STOPBITS,
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
     DOMAIN,
+    EVENT_WRITE_MISMATCH,
     MANUFACTURER,
 )
-from custom_components.solis_modbus.data.enums import PollSpeed
+from custom_components.solis_modbus.data.enums import LinkPriority, PollSpeed
 from custom_components.solis_modbus.data.solis_config import InverterConfig
-from custom_components.solis_modbus.helpers import cache_save, notify_register_update
-from custom_components.solis_modbus.sensors.solis_base_sensor import SolisSensorGroup
+from custom_components.solis_modbus.frame_capture import DEFAULT_MAX_BYTES, FC_WRITE_MULTIPLE, FC_WRITE_SINGLE, FrameCapture
+from custom_components.solis_modbus.helpers import cache_save, get_register_store, notify_register_update, publish_register_block
+from custom_components.solis_modbus.modbus_pipeline import FC_READ_HOLDING, FC_READ_INPUT, PipelineFallbackError
+from custom_components.solis_modbus.read_set import ReadSet
+from custom_components.solis_modbus.sensors.solis_base_sensor import SolisSensorGroup, cluster_sensors_by_contiguous_registers
 from custom_components.solis_modbus.sensors.solis_derived_sensor import SolisDerivedSensor
+from custom_components.solis_modbus.write_verification import VERIFY_SETTLE_SECONDS, WriteVerifier
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +48,58 @@ def is_number(value) -> bool:
 # Modbus exception codes we treat as address/map issues worth splitting reads (see data_retrieval recovery).
 RECOVERABLE_REGISTER_READ_EXCEPTIONS = frozenset({2, 3})
 
+# Modbus PDU limit for FC16 (write multiple registers).
+MAX_WRITE_REGISTERS = 123
+
+# Queued between writes whose order matters to the inverter (e.g. the #352 RC
+# latch, the dispatch blocks): writes are never merged or reordered across it.
+WRITE_BARRIER = object()
+
+
+def coalesce_write_requests(requests: list) -> list[tuple[int, list[int], bool]]:
+    """Turn a drained burst of queued writes into as few frames as possible.
+
+    Within each barrier-delimited segment only the last value per register is
+    kept, and contiguous registers are merged into one FC16 frame. Frames go out
+    in the order their first register was queued, so independent writes keep
+    their relative order. Returns (start_register, values, multiple) tuples;
+    ``multiple`` is False only for a lone register that was queued as FC06.
+    """
+    frames: list[tuple[int, list[int], bool]] = []
+    segment: list = []
+    for request in [*requests, WRITE_BARRIER]:
+        if request is not WRITE_BARRIER:
+            segment.append(request)
+            continue
+        if not segment:
+            continue
+
+        # dict keeps first-queued order while later writes overwrite the value.
+        pending: dict[int, int] = {}
+        multiple_registers: set[int] = set()
+        for register, value, multiple in segment:
+            if multiple:
+                for offset, word in enumerate(value):
+                    pending[int(register) + offset] = int(word)
+                    multiple_registers.add(int(register) + offset)
+            else:
+                pending[int(register)] = int(value)
+        segment = []
+
+        first_seen = {register: index for index, register in enumerate(pending)}
+        runs: list[list[int]] = []
+        for register in sorted(pending):
+            if runs and register == runs[-1][-1] + 1 and len(runs[-1]) < MAX_WRITE_REGISTERS:
+                runs[-1].append(register)
+            else:
+                runs.append([register])
+        runs.sort(key=lambda run: min(first_seen[register] for register in run))
+
+        for run in runs:
+            multiple = len(run) > 1 or run[0] in multiple_registers
+            frames.append((run[0], [pending[register] for register in run], multiple))
+    return frames
+
 
 def _exception_code_from_modbus_result(result) -> int | None:
     """Best-effort Modbus exception code from a pymodbus response object."""
@@ -67,6 +129,10 @@ class ModbusController:
         parity=DEFAULT_PARITY,
         stopbits=DEFAULT_STOPBITS,
         serial_number=None,
+        pipeline_window=1,
+        verify_writes=False,
+        timeout_floor=DEFAULT_TIMEOUT_FLOOR,
+        timeout_ceiling=DEFAULT_TIMEOUT_CEILING,
     ):
         """
         Initialize ModbusController with support for both TCP and Serial connections.
@@ -75,10 +141,14 @@ class ModbusController:
             hass: Home Assistant instance
             inverter_config: Inverter configuration object
             connection_type: Either CONN_TYPE_TCP or CONN_TYPE_SERIAL
+            verify_writes: Read back written holding registers once a write burst settled
+            timeout_floor: Lower bound (s) of the link's learned read timeout
+            timeout_ceiling: Upper bound (s) of the link's learned read timeout, also used for writes and connects
 
             TCP parameters:
                 host: IP address or hostname for TCP connection
                 port: Port number for TCP connection (default 502)
+                pipeline_window: Read requests allowed in flight on the link (1 = strictly serial)
 
             Serial parameters:
                 serial_port: Serial port path (e.g., /dev/ttyUSB0)
@@ -107,6 +177,8 @@ class ModbusController:
             self.connection_id = f"{host}:{port}"
             self.client: AsyncModbusTcpClient | AsyncModbusSerialClient = manager.get_tcp_client(host, port)
             self.poll_lock = manager.get_client_lock(self.connection_id)
+            self.link_coordinator = manager.get_link_coordinator(self.connection_id)
+            self.pipeline = manager.enable_pipeline(self.connection_id, pipeline_window)
         else:  # CONN_TYPE_SERIAL
             if not serial_port:
                 raise ValueError("serial_port is required for Serial connection")
@@ -120,6 +192,9 @@ class ModbusController:
             self.host = serial_port
             self.client: AsyncModbusTcpClient | AsyncModbusSerialClient = manager.get_serial_client(serial_port, baudrate, bytesize, parity, stopbits)
             self.poll_lock = manager.get_client_lock(self.connection_id)
+            self.link_coordinator = manager.get_link_coordinator(self.connection_id)
+            self.pipeline = None
+        manager.configure_request_timeout(self.connection_id, timeout_floor, timeout_ceiling)
 
         self.connect_failures = 0
         self._data_received = False
@@ -132,19 +207,28 @@ class ModbusController:
         self.enabled = True
         self._last_attempt = 0  # Track last connection attempt time
         self._sensor_groups = sensor_groups
+        # Trims the polled groups to the registers of enabled entities (see read_set.py).
+        self.read_set = ReadSet()
         self._derived_sensors = derived_sensors
         # self.poll_lock = asyncio.Lock() # Replaced by shared lock from manager
 
         # Modbus Write Queue
         self.write_queue = asyncio.Queue()
+        self._write_queue_max_depth = 0
+        self.write_verifier = WriteVerifier() if verify_writes else None
+        self._refresh_listeners: list[Callable[[range | None], None]] = []
+        self._inter_frame_wait_s = 0.0
+        self._inter_frame_waits = 0
         self._last_modbus_success = datetime.now(UTC)
+        self.capture: FrameCapture | None = None  # frame capture, off unless started (solis_capture_frames)
 
     async def process_write_queue(self):
-        """Process queued Modbus write requests sequentially.
+        """Process queued Modbus write requests in batches.
 
-        This method runs in an infinite loop, processing write requests from the queue.
-        It ensures that write operations are executed one at a time, with appropriate
-        delays between operations to avoid overwhelming the Modbus device.
+        This method runs in an infinite loop. Each time it wakes up it drains every
+        pending request, drops superseded writes to the same register and merges
+        contiguous registers into FC16 frames (see coalesce_write_requests), then
+        sends the frames one at a time with the usual inter-frame delays.
 
         Returns:
             None
@@ -152,21 +236,36 @@ class ModbusController:
         try:
             while True:
                 # Block until a write is queued instead of busy-polling.
-                write_request = await self.write_queue.get()
+                batch = [await self.write_queue.get()]
                 try:
                     # Wait for the link BEFORE processing, so a write queued during a
                     # reconnect window isn't executed (and acked via task_done) while
                     # still disconnected — which could silently drop a control write.
                     while not self.connected():
                         await asyncio.sleep(5)
-                    register, value, multiple = write_request
-
-                    if multiple:
-                        await self._execute_write_holding_registers(register, value)
-                    else:
-                        await self._execute_write_holding_register(register, value)
+                    while not self.write_queue.empty():
+                        batch.append(self.write_queue.get_nowait())
+                    self._write_queue_max_depth = max(self._write_queue_max_depth, len(batch))
+
+                    frames = coalesce_write_requests(batch)
+                    queued = sum(1 for request in batch if request is not WRITE_BARRIER)
+                    if len(frames) < queued:
+                        _LOGGER.debug(f"({self.host}.{self.device_id}) Coalesced {queued} queued write(s) into {len(frames)} frame(s)")
+
+                    for register, values, multiple in frames:
+                        if multiple:
+                            await self._execute_write_holding_registers(register, values)
+                        else:
+                            await self._execute_write_holding_register(register, values[0])
                 finally:
-                    self.write_queue.task_done()
+                    for _ in batch:
+                        self.write_queue.task_done()
+
+                if self.write_verifier is not None and self.write_verifier.pending:
+                    # Let the rest of the burst arrive first; it is verified together.
+                    await asyncio.sleep(VERIFY_SETTLE_SECONDS)
+                    if self.write_queue.empty():
+                        await self._verify_writes()
         except asyncio.CancelledError:
             # Clean shutdown on entry unload/reload.
             raise
@@ -184,10 +283,13 @@ class ModbusController:
         Raises:
             Exception: If there is an error during the write operation.
         """
+        started = None
         try:
             await self.connect()
-            async with self.poll_lock:
+            # Control writes jump ahead of queued poll frames on the shared link.
+            async with self.poll_lock.priority(LinkPriority.WRITE):
                 await self.inter_frame_wait(is_write=True)  # Delay before write
+                started = time.perf_counter()
                 int_value = int(value)
                 int_register = register if is_number(register) else int(register)
 
@@ -202,14 +304,25 @@ class ModbusController:
                 )
 
                 if result.isError():
+                    exc = _exception_code_from_modbus_result(result)
+                    self._record_frame_result(started, exc)
+                    self._capture_frame(FC_WRITE_SINGLE, int_register, 1, started, registers=[int_value], exception_code=exc)
                     _LOGGER.error(f"({self.host}.{self.device_id}) Failed to write holding register {register} with value {value}: {result}")
                     return None
 
+                self._record_frame_result(started)
+                self._capture_frame(FC_WRITE_SINGLE, int_register, 1, started, registers=[int_value])
                 cache_save(self.hass, self, int_register, result.registers[0])
                 notify_register_update(self.hass, self, int_register, result.registers[0])
+                if self.write_verifier is not None:
+                    self.write_verifier.expect(int_register, [int_value])
+                self.request_refresh(range(int_register, int_register + 1))
 
                 return result
         except Exception as e:
+            self._record_frame_error(e)
+            if started is not None:
+                self._capture_frame(FC_WRITE_SINGLE, int(register), 1, started, error=repr(e))
             _LOGGER.error(f"Failed to write holding register {register}: {str(e)}")
             return None
 
@@ -228,8 +341,9 @@ class ModbusController:
         """
         try:
             await self.connect()
-            async with self.poll_lock:
+            async with self.poll_lock.priority(LinkPriority.WRITE):
                 await self.inter_frame_wait(is_write=True)  # Delay before write
+                started = time.perf_counter()
 
                 try:
                     # Different pymodbus APIs for TCP vs Serial
@@ -243,15 +357,23 @@ class ModbusController:
                     )
 
                     if result.isError():
+                        exc = _exception_code_from_modbus_result(result)
+                        self._record_frame_result(started, exc)
+                        self._capture_frame(FC_WRITE_MULTIPLE, start_register, len(values), started, registers=values, exception_code=exc)
                         _LOGGER.error(f"({self.host}.{self.device_id}) Write block failed: {result}")
                         return None
 
-                    for i, value in enumerate(values):
-                        reg_addr = start_register + i
-                        cache_save(self.hass, self, reg_addr, value)
-                        notify_register_update(self.hass, self, reg_addr, value)
+                    self._record_frame_result(started)
+                    self._capture_frame(FC_WRITE_MULTIPLE, start_register, len(values), started, registers=values)
+                    get_register_store(self.hass, self, create=True).set_block(start_register, values)
+                    publish_register_block(self.hass, self, start_register, values)
+                    if self.write_verifier is not None:
+                        self.write_verifier.expect(start_register, values)
+                    self.request_refresh(range(start_register, start_register + len(values)))
                     return result
                 except Exception as write_error:
+                    self._record_frame_error(write_error)
+                    self._capture_frame(FC_WRITE_MULTIPLE, start_register, len(values), started, error=repr(write_error))
                     _LOGGER.error(
                         f"({self.host}.{self.device_id}) Exception during write holding registers "
                         f"{start_register}-{start_register + len(values) - 1}: {str(write_error)}"
@@ -262,6 +384,39 @@ class ModbusController:
             _LOGGER.error(f"({self.host}.{self.device_id}) Failed to write holding registers {start_register}-{start_register + len(values) - 1}: {str(e)}")
             return None
 
+    async def _verify_writes(self):
+        """Read back the registers written since the last verification and publish what the inverter kept.
+
+        A register that reads back different from what was written (clamped or
+        rejected by the firmware) fires EVENT_WRITE_MISMATCH.
+
+        Returns:
+            None
+        """
+        verifier = self.write_verifier
+        priority_token = current_link_priority.set(LinkPriority.WRITE)
+        try:
+            for start_register, count in verifier.blocks():
+                try:
+                    values, _err = await self._async_read_holding_register_raw_detailed(start_register, count, quiet=True)
+                except Exception as e:
+                    _LOGGER.debug(f"({self.host}.{self.device_id}) Write verification read of {start_register} failed: {str(e)}")
+                    values = None
+                if values is None or len(values) != count:
+                    verifier.discard(start_register, count)
+                    continue
+
+                get_register_store(self.hass, self, create=True).set_block(start_register, values)
+                publish_register_block(self.hass, self, start_register, values)
+                for register, written, read in verifier.check(start_register, values):
+                    _LOGGER.warning(f"({self.host}.{self.device_id}) Register {register} reads back {read} after writing {written}")
+                    self.hass.bus.async_fire(
+                        EVENT_WRITE_MISMATCH,
+                        {"host": self.host, "slave": self.device_id, "register": register, "written": written, "read": read},
+                    )
+        finally:
+            current_link_priority.reset(priority_token)
+
     async def async_write_holding_register(self, register, value):
         """Queues a write request to the Modbus device (write single register).
 
@@ -286,14 +441,90 @@ class ModbusController:
         """
         await self.write_queue.put((start_register, values, True))
 
+    def add_refresh_listener(self, listener: Callable[[range | None], None]) -> Callable[[], None]:
+        """Call ``listener`` with the registers just written, or None when a refresh of everything is requested.
+
+        Returns:
+            Callable: removes the listener again
+        """
+        self._refresh_listeners.append(listener)
+        return lambda: self._refresh_listeners.remove(listener)
+
+    def request_refresh(self, registers: range | None = None):
+        """Ask the poller to read these registers (all groups when None) at their base cadence again.
+
+        Returns:
+            None
+        """
+        for listener in list(self._refresh_listeners):
+            listener(registers)
+
+    def queue_write_barrier(self):
+        """Keep the writes queued so far ahead of any queued afterwards.
+
+        Writes on either side of a barrier are never merged into one frame or
+        reordered, for sequences the firmware only latches in order.
+
+        Returns:
+            None
+        """
+        self.write_queue.put_nowait(WRITE_BARRIER)
+
     async def inter_frame_wait(self, is_write=False):
         """Spacing between Modbus frames on this link (shared across parallel inverters on the same host:port)."""
+        started = time.perf_counter()
         await self._client_manager.inter_frame_wait(self.connection_id, is_write=is_write)
+        self._inter_frame_wait_s += time.perf_counter() - started
+        self._inter_frame_waits += 1
+
+    def _record_frame_result(self, started: float, exception_code: int | None = None) -> None:
+        """Report a frame's outcome to the link pacing.
+
+        Address-map answers (exception 2/3) prove the link is healthy, so they count
+        as round trips; any other exception response means the device is struggling.
+        """
+        if exception_code is None or exception_code in RECOVERABLE_REGISTER_READ_EXCEPTIONS:
+            self._client_manager.record_frame_success(self.connection_id, time.perf_counter() - started)
+        else:
+            self._client_manager.record_frame_failure(self.connection_id, f"exception response {exception_code}")
+
+    def start_frame_capture(self, path, max_bytes: int = DEFAULT_MAX_BYTES) -> FrameCapture:
+        """Record every frame of this controller to an NDJSON capture at ``path`` (see frame_capture)."""
+        if self.capture is None or self.capture.path != Path(path):
+            self.capture = FrameCapture(path, max_bytes=max_bytes)
+        _LOGGER.info(f"({self.host}.{self.device_id}) Capturing Modbus frames to {self.capture.path}")
+        return self.capture
+
+    async def async_stop_frame_capture(self) -> FrameCapture | None:
+        """Stop capturing and write out what is still buffered. Returns the finished capture, if one was running."""
+        capture, self.capture = self.capture, None
+        if capture is not None:
+            lines = capture.take(force=True)
+            if lines is not None:
+                await self.hass.async_add_executor_job(capture.write, lines)
+            _LOGGER.info(f"({self.host}.{self.device_id}) Captured {capture.frames} Modbus frame(s) to {capture.path}")
+        return capture
+
+    def _capture_frame(self, function_code: int, register: int, count: int, started: float, **outcome) -> None:
+        """Hand a finished frame to the running capture, if any; file writes go to the executor in batches."""
+        capture = self.capture
+        if capture is None:
+            return
+        capture.record(self.device_id, function_code, register, count, started, **outcome)
+        lines = capture.take()
+        if lines is not None:
+            self.hass.async_add_executor_job(capture.write, lines)
+
+    def _record_frame_error(self, error: Exception) -> None:
+        """Report a transport failure (timeout, transaction-ID mismatch, dropped socket) to the link pacing."""
+        self._client_manager.record_frame_failure(self.connection_id, type(error).__name__, lost=True)
 
     async def _async_read_input_register_raw_detailed(self, register: int, count: int, *, quiet: bool = False) -> tuple[list[int] | None, int | None]:
-        """Read input registers under poll_lock. Returns (registers, None) or (None, exception_code|None)."""
+        """Read input registers under poll_lock (at the calling task's link priority). Returns (registers, None) or (None, exception_code|None)."""
+        function_code = FC_READ_INPUT
         async with self.poll_lock:
             await self.inter_frame_wait()
+            started = time.perf_counter()
 
             try:
                 if self.connection_type == CONN_TYPE_TCP:
@@ -306,17 +537,23 @@ class ModbusController:
 
                 if result.isError():
                     exc = _exception_code_from_modbus_result(result)
+                    self._record_frame_result(started, exc)
                     log_fn = _LOGGER.debug if quiet else _LOGGER.error
                     log_fn(f"({self.host}.{self.device_id}) Failed to read input registers starting at {register}: {result}")
+                    self._capture_frame(function_code, register, count, started, exception_code=exc)
                     return None, exc
 
+                self._record_frame_result(started)
                 self._last_modbus_success = datetime.now(UTC)
+                self._capture_frame(function_code, register, count, started, registers=result.registers)
                 return result.registers, None
             except Exception as e:
+                self._record_frame_error(e)
                 # Log the exception, close connection, and return error
                 error_msg = str(e)
                 log_fn = _LOGGER.debug if quiet else _LOGGER.error
                 log_fn(f"({self.host}.{self.device_id}) Exception reading input registers at {register}: {error_msg}")
+                self._capture_frame(function_code, register, count, started, error=repr(e))
                 self._safe_close()
                 return None, None
 
@@ -355,9 +592,11 @@ class ModbusController:
             return None
 
     async def _async_read_holding_register_raw_detailed(self, register: int, count: int, *, quiet: bool = False) -> tuple[list[int] | None, int | None]:
-        """Read holding registers under poll_lock. Returns (registers, None) or (None, exception_code|None)."""
+        """Read holding registers under poll_lock (at the calling task's link priority). Returns (registers, None) or (None, exception_code|None)."""
+        function_code = FC_READ_HOLDING
         async with self.poll_lock:
             await self.inter_frame_wait()
+            started = time.perf_counter()
 
             try:
                 if self.connection_type == CONN_TYPE_TCP:
@@ -370,17 +609,23 @@ class ModbusController:
 
                 if result.isError():
                     exc = _exception_code_from_modbus_result(result)
+                    self._record_frame_result(started, exc)
                     log_fn = _LOGGER.debug if quiet else _LOGGER.error
                     log_fn(f"({self.host}.{self.device_id}) Failed to read holding registers starting at {register}: {result}")
+                    self._capture_frame(function_code, register, count, started, exception_code=exc)
                     return None, exc
 
+                self._record_frame_result(started)
                 self._last_modbus_success = datetime.now(UTC)
+                self._capture_frame(function_code, register, count, started, registers=result.registers)
                 return result.registers, None
             except Exception as e:
+                self._record_frame_error(e)
                 # Log the exception, close connection, and return error
                 error_msg = str(e)
                 log_fn = _LOGGER.debug if quiet else _LOGGER.error
                 log_fn(f"({self.host}.{self.device_id}) Exception reading holding registers at {register}: {error_msg}")
+                self._capture_frame(function_code, register, count, started, error=repr(e))
                 self._safe_close()
                 return None, None
 
@@ -417,6 +662,37 @@ class ModbusController:
             _LOGGER.error(f"({self.host}.{self.device_id}) Exception while reading holding registers starting at {register} (count={count}): {str(e)}")
             return None
 
+    async def async_read_registers_pipelined(self, register: int, count: int, is_holding: bool) -> tuple[list[int] | None, int | None]:
+        """Read through the link's pipeline, without holding poll_lock. Returns (registers, None) or (None, exception_code|None).
+
+        Falls back to the serial read when the pipeline is off; a request the pipeline
+        dropped while switching off returns (None, None) and is left to the caller to retry.
+        """
+        if self.pipeline is None or not self.pipeline.active:
+            if is_holding:
+                return await self.async_read_holding_registers_with_exception(register, count)
+            return await self.async_read_input_registers_with_exception(register, count)
+
+        function_code = FC_READ_HOLDING if is_holding else FC_READ_INPUT
+        started = time.perf_counter()
+        try:
+            registers, exc = await self.pipeline.read(function_code, register, count, int(self.device_id), pace=self.inter_frame_wait)
+        except PipelineFallbackError as e:
+            _LOGGER.debug(f"({self.host}.{self.device_id}) Pipelined read at {register} dropped: {e}")
+            return None, None
+        except Exception as e:
+            self._record_frame_error(e)
+            self._capture_frame(function_code, register, count, started, error=repr(e))
+            _LOGGER.debug(f"({self.host}.{self.device_id}) Pipelined read at {register} failed: {e!r}")
+            return None, None
+
+        self._record_frame_result(started, exc)
+        self._capture_frame(function_code, register, count, started, registers=registers, exception_code=exc)
+        if registers is None:
+            return None, exc
+        self._last_modbus_success = datetime.now(UTC)
+        return registers, None
+
     async def connect(self):
         """Establishes a connection to the Modbus device.
 
@@ -431,6 +707,7 @@ class ModbusController:
 
         async def _try_connect() -> bool:
             try:
+                self._client_manager.apply_connect_timeout(self.connection_id)
                 await self.client.connect()
                 if self.connected():
                     _LOGGER.info(f"✅ ({self.host}.{self.device_id}) Connected to Modbus device")
@@ -482,6 +759,8 @@ class ModbusController:
             self.client.close()
         except Exception as e:
             _LOGGER.debug(f"({self.host}.{self.device_id}) Error closing stale client: {e}")
+        if self.pipeline is not None:
+            self.pipeline.close()
 
     def disable_connection(self):
         """Disables the Modbus connection.
@@ -540,7 +819,16 @@ class ModbusController:
         return self._sw_version
 
     def replace_sensor_group(self, old_group: SolisSensorGroup, new_groups: list[SolisSensorGroup]) -> None:
-        """Replace one sensor group with several (or none) at the same list index."""
+        """Replace one sensor group with several (or none) at the same list index.
+
+        A piece trimmed by the read set stands for part of a configured group, so
+        that group is re-split around its disabled sensors instead.
+        """
+        source = old_group if old_group in self._sensor_groups else self.read_set.source_of(old_group)
+        if source is not old_group:
+            clusters = cluster_sensors_by_contiguous_registers(source.sensors)
+            new_groups = [SolisSensorGroup.from_sensors(c, source.poll_speed, source.identification) for c in clusters]
+            old_group = source
         try:
             idx = self._sensor_groups.index(old_group)
         except ValueError:
@@ -548,10 +836,17 @@ class ModbusController:
             return
         self._sensor_groups = self._sensor_groups[:idx] + new_groups + self._sensor_groups[idx + 1 :]
 
+    def remove_sensor_groups(self, groups: list[SolisSensorGroup]) -> None:
+        """Stop polling these groups (ONCE groups after their read), trimmed pieces included."""
+        if not groups:
+            return
+        removed = {self.read_set.source_of(group) for group in groups}
+        self._sensor_groups = [g for g in self._sensor_groups if g not in removed]
+
     @property
     def sensor_groups(self):
-        """Returns the list of sensor groups."""
-        return self._sensor_groups
+        """Returns the list of sensor groups to poll, trimmed to the read set."""
+        return self.read_set.apply(self._sensor_groups)
 
     @property
     def derived_sensors(self):
@@ -572,6 +867,22 @@ class ModbusController:
         """
         return self._client_manager.get_last_modbus_request(self.connection_id)
 
+    @property
+    def io_stats(self) -> dict:
+        """Write-queue depth and time this controller spent in inter-frame waits."""
+        return {
+            "write_queue_depth": self.write_queue.qsize(),
+            "write_queue_max_depth": self._write_queue_max_depth,
+            "inter_frame_waits": self._inter_frame_waits,
+            "inter_frame_wait_total_s": round(self._inter_frame_wait_s, 3),
+            "inter_frame_wait_mean_ms": round(self._inter_frame_wait_s * 1000 / self._inter_frame_waits, 1) if self._inter_frame_waits else None,
+        }
+
+    @property
+    def link_stats(self) -> dict | None:
+        """Adaptive inter-frame pacing state of the shared link (see ModbusClientManager)."""
+        return self._client_manager.get_link_stats(self.connection_id)
+
     @property
     def last_modbus_success(self):
         """Returns the timestamp of the last successful Modbus operation."""
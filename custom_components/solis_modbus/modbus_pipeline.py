@@ -0,0 +1,190 @@
+"""Pipelined Modbus TCP reads: several transactions in flight on one link.
+
+pymodbus runs one transaction at a time per client (its transaction manager
+holds a lock across each request/response), so on a high-latency link most of a
+poll cycle is spent waiting for round trips. Gateways such as Waveshare
+RS485-to-Ethernet converters and inverters with native Modbus TCP accept several
+outstanding transaction IDs and answer them in order.
+
+``ModbusTcpPipeline`` opens its own TCP connection and sends read requests
+(FC03/FC04) without waiting for earlier answers, up to ``window`` in flight,
+matching each response to its request by transaction ID. The first response
+that arrives out of order, carries an unknown transaction ID or does not match
+its request switches the pipeline off for good (until the entry is reloaded):
+every request still in flight fails with ``PipelineFallbackError`` and callers
+go back to the strict one-at-a-time path. A late answer to a request that
+already timed out counts as an unknown transaction ID. S2-WL sticks desync
+transaction IDs when hurried, so this mode is opt-in per link.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import struct
+from collections.abc import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+FC_READ_HOLDING = 3
+FC_READ_INPUT = 4
+
+_MBAP_HEADER = struct.Struct(">HHHB")  # transaction id, protocol id, length, unit id
+_READ_REQUEST = struct.Struct(">HHHBBHH")  # MBAP header + function code, address, count
+
+
+class PipelineFallbackError(Exception):
+    """The pipeline was switched off while (or before) this request was in flight."""
+
+
+class ModbusTcpPipeline:
+    """Up to ``window`` outstanding read transactions on a dedicated TCP connection."""
+
+    def __init__(self, host: str, port: int, window: int, timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.window = max(1, int(window))
+        self.timeout = timeout
+        self.active = True
+        self.fallback_reason: str | None = None
+        self.requests = 0
+        self.max_in_flight = 0
+        self._slots = asyncio.Semaphore(self.window)
+        self._send_lock = asyncio.Lock()
+        self._connect_lock = asyncio.Lock()
+        self._tids = itertools.cycle(range(1, 0x10000))
+        # Insertion order is send order: the oldest entry is the answer expected next.
+        self._pending: dict[int, tuple[asyncio.Future, int, int, int]] = {}
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def read(
+        self, function_code: int, address: int, count: int, unit: int, *, pace: Callable[[], Awaitable[None]] | None = None
+    ) -> tuple[list[int] | None, int | None]:
+        """Read ``count`` registers. Returns (registers, None) or (None, exception_code).
+
+        ``pace`` is awaited before the request is sent (the link's inter-frame spacing).
+        Raises PipelineFallbackError once the pipeline is off, TimeoutError or OSError on transport failures.
+        """
+        if not self.active:
+            raise PipelineFallbackError(self.fallback_reason)
+        async with self._slots:
+            await self._ensure_connected()
+            async with self._send_lock:
+                if pace is not None:
+                    await pace()
+                if not self.active or not self.connected:
+                    raise PipelineFallbackError(self.fallback_reason or "connection closed")
+                tid = next(self._tids)
+                future = asyncio.get_running_loop().create_future()
+                self._pending[tid] = (future, function_code, count, unit)
+                self.requests += 1
+                self.max_in_flight = max(self.max_in_flight, len(self._pending))
+                try:
+                    self._writer.write(_READ_REQUEST.pack(tid, 0, 6, unit, function_code, address, count))
+                    await self._writer.drain()
+                except OSError:
+                    self._pending.pop(tid, None)
+                    raise
+            try:
+                return await asyncio.wait_for(future, self.timeout)
+            finally:
+                self._pending.pop(tid, None)
+
+    async def _ensure_connected(self) -> None:
+        if self.connected:
+            return
+        async with self._connect_lock:
+            if self.connected:
+                return
+            try:
+                self._reader, self._writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+            except (TimeoutError, OSError) as err:
+                # Gateways that take a single client refuse the pipeline's own connection.
+                self.fall_back(f"connect failed: {err!r}")
+                raise PipelineFallbackError(self.fallback_reason) from err
+            self._reader_task = asyncio.get_running_loop().create_task(self._read_responses(self._reader))
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                header = await reader.readexactly(_MBAP_HEADER.size)
+                tid, _protocol, length, unit = _MBAP_HEADER.unpack(header)
+                pdu = await reader.readexactly(length - 1)
+                self._dispatch(tid, unit, pdu)
+        except asyncio.CancelledError:
+            raise
+        except (asyncio.IncompleteReadError, OSError) as err:
+            self._fail_pending(ConnectionError(f"pipeline connection lost: {err!r}"))
+            self._close_transport()
+        except Exception as err:
+            self.fall_back(f"malformed response: {err!r}")
+
+    def _dispatch(self, tid: int, unit: int, pdu: bytes) -> None:
+        if tid not in self._pending:
+            self.fall_back(f"unknown transaction id {tid}")
+            return
+        if tid != next(iter(self._pending)):
+            self.fall_back(f"transaction {tid} answered out of order")
+            return
+        future, function_code, count, expected_unit = self._pending[tid]
+        if unit != expected_unit or not pdu or pdu[0] & 0x7F != function_code:
+            self.fall_back(f"response to transaction {tid} does not match its request")
+            return
+        if pdu[0] & 0x80:
+            result = (None, pdu[1] if len(pdu) > 1 else None)
+        else:
+            byte_count = pdu[1] if len(pdu) > 1 else 0
+            if byte_count != count * 2 or len(pdu) < 2 + byte_count:
+                self.fall_back(f"response to transaction {tid} has {byte_count} bytes for {count} registers")
+                return
+            result = (list(struct.unpack_from(f">{count}H", pdu, 2)), None)
+        del self._pending[tid]
+        if not future.done():
+            future.set_result(result)
+
+    def fall_back(self, reason: str) -> None:
+        """Switch to strict serial reads: fail everything in flight and close the connection."""
+        if self.active:
+            _LOGGER.warning("(%s:%s) Pipelined reads disabled, falling back to one request at a time: %s", self.host, self.port, reason)
+        self.active = False
+        self.fallback_reason = self.fallback_reason or reason
+        self._fail_pending(PipelineFallbackError(reason))
+        self.close()
+
+    def _fail_pending(self, error: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future, *_ in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def _close_transport(self) -> None:
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+        self._reader = self._writer = None
+
+    def close(self) -> None:
+        """Close the pipeline's connection; it reconnects on the next read while still active."""
+        task, self._reader_task = self._reader_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._fail_pending(ConnectionError("pipeline closed"))
+        self._close_transport()
+
+    def as_dict(self) -> dict:
+        return {
+            "window": self.window,
+            "active": self.active,
+            "fallback_reason": self.fallback_reason,
+            "requests": self.requests,
+            "max_in_flight": self.max_in_flight,
+        }
@@ -0,0 +1,216 @@
+"""Deadline-based poll scheduling for one controller's sensor groups.
+
+Three independent FAST/NORMAL/SLOW timers line up every few cycles and then
+all fight for the link at once, and the re-entrancy guard silently drops the
+losers. Instead every group gets its own next-due deadline. FAST groups share
+one deadline so they are still read together (and coalesced by the read
+planner). NORMAL/SLOW groups are spread across their interval in register-order
+slots, and are read in the idle gap before the next FAST deadline.
+
+In adaptive mode a group whose registers came back unchanged for
+``ADAPTIVE_QUIET_READS`` reads in a row is read half as often, again and again
+up to ``ADAPTIVE_MAX_INTERVAL``. Stretches are powers of two, so a stretched
+group stays in phase with the other groups of its speed and is still read
+together with them. A changed read, a write to the group, an operating-state
+change of the inverter or an explicit refresh (``wake``) brings it back to its
+base cadence.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from .data.enums import PollSpeed
+
+if TYPE_CHECKING:
+    from .sensors.solis_base_sensor import SolisSensorGroup
+
+_LOGGER = logging.getLogger(__name__)
+
+# How often the scheduler looks for due groups.
+POLL_TICK_SECONDS = 1.0
+
+# Warn when the configured intervals ask for more than this share of the
+# frames the link has been measured to carry.
+CAPACITY_WARN_RATIO = 0.9
+
+_DEFAULT_INTERVALS = {PollSpeed.FAST: 5, PollSpeed.NORMAL: 15, PollSpeed.SLOW: 30}
+
+# Adaptive cadence: unchanged reads in a row before a group's interval doubles,
+# and the longest interval a quiet group is stretched to (seconds).
+ADAPTIVE_QUIET_READS = 3
+ADAPTIVE_MAX_INTERVAL = 300
+
+
+def _schedule_speed(speed: PollSpeed) -> PollSpeed:
+    """ONCE groups are read with the NORMAL groups; STARTUP with FAST."""
+    if speed == PollSpeed.ONCE:
+        return PollSpeed.NORMAL
+    if speed == PollSpeed.STARTUP:
+        return PollSpeed.FAST
+    return speed
+
+
+class PollScheduler:
+    """Tracks when each sensor group is next due."""
+
+    def __init__(self, intervals: dict[PollSpeed, float] | None = None, clock: Callable[[], float] = time.monotonic, adaptive: bool = False):
+        self._intervals = dict(_DEFAULT_INTERVALS)
+        self._intervals.update(intervals or {})
+        self._clock = clock
+        self.adaptive = adaptive
+        self._deadlines: dict[SolisSensorGroup, float] = {}
+        self._stretch: dict[SolisSensorGroup, int] = {}
+        self._quiet_reads: dict[SolisSensorGroup, int] = {}
+        self._fast_deadline: float | None = None
+        self.demand_frames_per_s: float | None = None
+        self.capacity_frames_per_s: float | None = None
+        self.overloaded = False
+
+    def now(self) -> float:
+        return self._clock()
+
+    def interval(self, speed: PollSpeed) -> float:
+        return float(self._intervals.get(_schedule_speed(speed), _DEFAULT_INTERVALS[PollSpeed.NORMAL]))
+
+    def sync(self, groups: Iterable[SolisSensorGroup], now: float | None = None) -> None:
+        """Track new groups (e.g. after a split) and forget removed ones (e.g. ONCE groups)."""
+        now = self.now() if now is None else now
+        groups = list(groups)
+        current = set(groups)
+        for group in [g for g in self._deadlines if g not in current]:
+            del self._deadlines[group]
+            self._stretch.pop(group, None)
+            self._quiet_reads.pop(group, None)
+
+        new_by_speed: dict[PollSpeed, list[SolisSensorGroup]] = {}
+        for group in groups:
+            if group not in self._deadlines:
+                new_by_speed.setdefault(_schedule_speed(group.poll_speed), []).append(group)
+
+        for speed, new_groups in new_by_speed.items():
+            if speed == PollSpeed.FAST:
+                if self._fast_deadline is None:
+                    self._fast_deadline = now
+                for group in new_groups:
+                    self._deadlines[group] = self._fast_deadline
+                continue
+            self._stagger(new_groups, speed, now)
+
+    def _stagger(self, groups: list[SolisSensorGroup], speed: PollSpeed, now: float) -> None:
+        """Spread groups over their interval in contiguous register-order slots (one slot per FAST cycle)."""
+        interval = self.interval(speed)
+        slots = max(1, min(len(groups), math.floor(interval / self.interval(PollSpeed.FAST))))
+        ordered = sorted(groups, key=lambda g: g.start_register)
+        per_slot = math.ceil(len(ordered) / slots)
+        for index, group in enumerate(ordered):
+            slot = index // per_slot
+            self._deadlines[group] = now + interval * slot / slots
+
+    def due(self, now: float | None = None) -> tuple[list[SolisSensorGroup], list[SolisSensorGroup]]:
+        """(due FAST groups, due NORMAL/SLOW groups most-overdue first)."""
+        now = self.now() if now is None else now
+        fast, background = [], []
+        for group, deadline in self._deadlines.items():
+            if deadline > now:
+                continue
+            if _schedule_speed(group.poll_speed) == PollSpeed.FAST:
+                fast.append(group)
+            else:
+                background.append(group)
+        background.sort(key=lambda g: self._deadlines[g])
+        if not fast and self._fast_deadline is not None and self._fast_deadline <= now:
+            # Every FAST group is stretched past this slot: keep the FAST phase moving.
+            self._fast_deadline = self._advance(self._fast_deadline, self.interval(PollSpeed.FAST), now)
+        return fast, background
+
+    def deadline(self, group: SolisSensorGroup) -> float | None:
+        return self._deadlines.get(group)
+
+    def is_starving(self, group: SolisSensorGroup, now: float | None = None) -> bool:
+        """True once a group is overdue by a whole interval: read it even without an idle gap."""
+        now = self.now() if now is None else now
+        return now - self._deadlines.get(group, now) >= self.interval(group.poll_speed)
+
+    def seconds_until_next_fast(self, now: float | None = None) -> float:
+        now = self.now() if now is None else now
+        if self._fast_deadline is None:
+            return math.inf
+        return max(0.0, self._fast_deadline - now)
+
+    def mark_polled(self, groups: Iterable[SolisSensorGroup], now: float | None = None) -> None:
+        """Advance deadlines by whole intervals (keeps each group's phase; missed slots are dropped)."""
+        now = self.now() if now is None else now
+        for group in groups:
+            if group not in self._deadlines:
+                continue
+            base = self.interval(group.poll_speed)
+            deadline = self._advance(self._deadlines[group], base, now)
+            if _schedule_speed(group.poll_speed) == PollSpeed.FAST:
+                self._fast_deadline = deadline
+            stretch = self._stretch.get(group, 1)
+            self._deadlines[group] = deadline + base * (stretch - 1)
+
+    @staticmethod
+    def _advance(deadline: float, interval: float, now: float) -> float:
+        deadline += interval
+        if deadline <= now:
+            deadline += math.ceil((now - deadline) / interval) * interval
+            if deadline <= now:
+                deadline += interval
+        return deadline
+
+    def stretch(self, group: SolisSensorGroup) -> int:
+        """How many base intervals the group currently waits between reads."""
+        return self._stretch.get(group, 1)
+
+    def record_read(self, group: SolisSensorGroup, changed: bool) -> None:
+        """Adaptive mode: note whether a read of the group changed any register (call before mark_polled)."""
+        if not self.adaptive or group not in self._deadlines:
+            return
+        if changed:
+            self._stretch.pop(group, None)
+            self._quiet_reads.pop(group, None)
+            return
+        quiet = self._quiet_reads.get(group, 0) + 1
+        stretch = self._stretch.get(group, 1)
+        if quiet >= ADAPTIVE_QUIET_READS and self.interval(group.poll_speed) * stretch * 2 <= ADAPTIVE_MAX_INTERVAL:
+            self._stretch[group] = stretch * 2
+            quiet = 0
+        self._quiet_reads[group] = quiet
+
+    def wake(self, groups: Iterable[SolisSensorGroup] | None = None, now: float | None = None) -> None:
+        """Back to base cadence and due now (FAST groups: at the next FAST deadline); all groups when ``groups`` is None."""
+        now = self.now() if now is None else now
+        for group in list(self._deadlines) if groups is None else groups:
+            if group not in self._deadlines:
+                continue
+            self._stretch.pop(group, None)
+            self._quiet_reads.pop(group, None)
+            due = self._fast_deadline if _schedule_speed(group.poll_speed) == PollSpeed.FAST and self._fast_deadline is not None else now
+            self._deadlines[group] = min(self._deadlines[group], due)
+
+    def update_capacity(self, demand_frames_per_s: float, frame_seconds: float | None) -> bool:
+        """Record demand vs. measured capacity. Returns True when the link just became overloaded."""
+        self.demand_frames_per_s = demand_frames_per_s
+        self.capacity_frames_per_s = (1.0 / frame_seconds) if frame_seconds else None
+        overloaded = self.capacity_frames_per_s is not None and demand_frames_per_s > self.capacity_frames_per_s * CAPACITY_WARN_RATIO
+        newly = overloaded and not self.overloaded
+        self.overloaded = overloaded
+        return newly
+
+    def as_dict(self, now: float | None = None) -> dict:
+        now = self.now() if now is None else now
+        return {
+            "groups": len(self._deadlines),
+            "next_fast_in_s": round(self.seconds_until_next_fast(now), 2) if self._fast_deadline is not None else None,
+            "overdue_groups": sum(1 for deadline in self._deadlines.values() if deadline <= now),
+            "stretched_groups": len(self._stretch) if self.adaptive else None,
+            "demand_frames_per_s": round(self.demand_frames_per_s, 2) if self.demand_frames_per_s is not None else None,
+            "capacity_frames_per_s": round(self.capacity_frames_per_s, 2) if self.capacity_frames_per_s is not None else None,
+            "overloaded": self.overloaded,
+        }
@@ -0,0 +1,111 @@
+"""Rolling poll-cycle and link-health statistics.
+
+Kept in memory only (reset on reload) and small: every series is a bounded
+window of recent samples. Surfaced through diagnostics and the optional
+diagnostic sensors, so poll intervals can be tuned from measured numbers.
+"""
+
+from __future__ import annotations
+
+import statistics
+from collections import deque
+
+from .data.enums import PollSpeed
+
+STATS_WINDOW = 100
+
+
+class RollingStat:
+    """The last ``window`` samples of one measurement, summarised as p50/p95/max."""
+
+    def __init__(self, window: int = STATS_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+        self.total = 0
+
+    def add(self, value: float) -> None:
+        self._samples.append(float(value))
+        self.total += 1
+
+    @property
+    def samples(self) -> list[float]:
+        return list(self._samples)
+
+    def summary(self, scale: float = 1.0, digits: int = 1) -> dict:
+        if not self._samples:
+            return {"count": self.total, "p50": None, "p95": None, "max": None}
+        ordered = sorted(self._samples)
+        p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+        return {
+            "count": self.total,
+            "p50": round(statistics.median(ordered) * scale, digits),
+            "p95": round(p95 * scale, digits),
+            "max": round(ordered[-1] * scale, digits),
+        }
+
+
+class PollStats:
+    """Per-DataRetrieval counters: frame latency per block, cycle timing per speed, recovery work."""
+
+    def __init__(self, window: int = STATS_WINDOW):
+        self._window = window
+        self.frame_latency: dict[int, RollingStat] = {}
+        self.cycle_duration: dict[PollSpeed, RollingStat] = {}
+        self.frames_per_cycle: dict[PollSpeed, RollingStat] = {}
+        self.cycles: dict[PollSpeed, int] = {}
+        self.skipped_cycles: dict[PollSpeed, int] = {}
+        self.failed_frames = 0
+        self.retries = 0
+        self.bisection_probes = 0
+        self.dispatched_registers = 0
+        self.suppressed_registers = 0
+
+    def record_frame(self, start_register: int, latency_s: float, ok: bool) -> None:
+        self.frame_latency.setdefault(start_register, RollingStat(self._window)).add(latency_s)
+        if not ok:
+            self.failed_frames += 1
+
+    def record_cycle(self, speed: PollSpeed, duration_s: float, frames: int) -> None:
+        self.cycles[speed] = self.cycles.get(speed, 0) + 1
+        self.cycle_duration.setdefault(speed, RollingStat(self._window)).add(duration_s)
+        self.frames_per_cycle.setdefault(speed, RollingStat(self._window)).add(frames)
+
+    def record_skipped_cycle(self, speed: PollSpeed) -> None:
+        self.skipped_cycles[speed] = self.skipped_cycles.get(speed, 0) + 1
+
+    def record_dispatch(self, dispatched: int, suppressed: int) -> None:
+        self.dispatched_registers += dispatched
+        self.suppressed_registers += suppressed
+
+    def overall_frame_latency(self) -> dict:
+        """Latency across every block (ms)."""
+        combined = RollingStat(window=self._window * max(1, len(self.frame_latency)))
+        for stat in self.frame_latency.values():
+            for sample in stat.samples:
+                combined.add(sample)
+        return combined.summary(scale=1000)
+
+    def cycle_summary(self, speed: PollSpeed) -> dict:
+        """Cycle duration (ms) for one poll speed."""
+        stat = self.cycle_duration.get(speed)
+        return stat.summary(scale=1000) if stat else RollingStat().summary()
+
+    def as_dict(self) -> dict:
+        speeds = sorted(set(self.cycles) | set(self.skipped_cycles), key=lambda speed: speed.name)
+        return {
+            "cycles": {
+                speed.name: {
+                    "completed": self.cycles.get(speed, 0),
+                    "skipped": self.skipped_cycles.get(speed, 0),
+                    "duration_ms": self.cycle_summary(speed),
+                    "frames": self.frames_per_cycle[speed].summary(digits=0) if speed in self.frames_per_cycle else None,
+                }
+                for speed in speeds
+            },
+            "frame_latency_ms": self.overall_frame_latency(),
+            "frame_latency_by_block_ms": {str(start): stat.summary(scale=1000) for start, stat in sorted(self.frame_latency.items())},
+            "failed_frames": self.failed_frames,
+            "retries": self.retries,
+            "bisection_probes": self.bisection_probes,
+            "dispatched_registers": self.dispatched_registers,
+            "suppressed_registers": self.suppressed_registers,
+        }
@@ -0,0 +1,145 @@
+"""When a new sensor value is worth a state write.
+
+FAST groups refresh every few seconds and every state change lands in the
+recorder database, mostly as power readings moving by a watt or two. With the
+``publish_deadband`` option on, each entity gets a ``PublishPolicy`` and a
+``PublishGate`` that drops the changes that policy calls noise:
+
+- ``absolute`` / ``relative``: a change of at most this much (entity unit), or
+  this fraction of the last published value, is not published.
+- ``min_interval``: seconds that must pass between two publishes.
+- ``max_silence``: a held-back value is still published once this many seconds
+  have passed since the last publish (the heartbeat), also when no new value
+  arrives in the meantime: the entity then publishes it from a timer.
+
+Policies come from ``DEVICE_CLASS_POLICIES``, then ``CATEGORY_POLICIES``, then a
+``"publish"`` entry on the entity definition, each overriding the fields it
+sets. Cumulative counters (state class total / total_increasing) never get a
+deadband, so energy statistics see every step. Availability changes are always
+published right away.
+"""
+
+from __future__ import annotations
+
+import numbers
+from dataclasses import dataclass, fields, replace
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+
+from .data.enums import Category
+
+_UNSET = object()
+
+
+@dataclass(frozen=True, slots=True)
+class PublishPolicy:
+    """How much a value must change, and how often it may or must be written (see the module docstring)."""
+
+    absolute: float = 0
+    relative: float = 0
+    min_interval: float = 0
+    max_silence: float | None = None
+
+    def updated(self, spec: dict) -> PublishPolicy:
+        """This policy with the fields ``spec`` sets replaced."""
+        known = {field.name for field in fields(self)}
+        return replace(self, **{key: value for key, value in spec.items() if key in known})
+
+    @property
+    def immediate(self) -> bool:
+        """True when every change is published as it arrives (no gate needed)."""
+        return not (self.absolute or self.relative or self.min_interval)
+
+
+IMMEDIATE = PublishPolicy()
+
+DEVICE_CLASS_POLICIES: dict[SensorDeviceClass, dict] = {
+    SensorDeviceClass.POWER: {"absolute": 10, "relative": 0.01, "max_silence": 60},
+    SensorDeviceClass.APPARENT_POWER: {"absolute": 10, "relative": 0.01, "max_silence": 60},
+    SensorDeviceClass.REACTIVE_POWER: {"absolute": 10, "relative": 0.01, "max_silence": 60},
+    SensorDeviceClass.CURRENT: {"absolute": 0.1, "relative": 0.01, "max_silence": 60},
+    SensorDeviceClass.VOLTAGE: {"absolute": 1, "max_silence": 120},
+    SensorDeviceClass.FREQUENCY: {"absolute": 0.05, "max_silence": 300},
+    SensorDeviceClass.POWER_FACTOR: {"absolute": 0.01, "max_silence": 300},
+    SensorDeviceClass.TEMPERATURE: {"absolute": 0.5, "max_silence": 300},
+}
+
+CATEGORY_POLICIES: dict[Category, dict] = {
+    # Internal diagnostics (bus voltages, leakage current, ...) are for troubleshooting, not graphs.
+    Category.DEVICE_INTERNAL_DATA: {"min_interval": 60, "max_silence": 600},
+}
+
+CUMULATIVE_STATE_CLASSES = (SensorStateClass.TOTAL, SensorStateClass.TOTAL_INCREASING)
+
+
+def resolve_policy(sensor) -> PublishPolicy:
+    """The publish policy of a base sensor: device class, then category, then its definition's ``"publish"`` entry."""
+    policy = IMMEDIATE
+    for spec in (DEVICE_CLASS_POLICIES.get(sensor.device_class), CATEGORY_POLICIES.get(sensor.category), sensor.publish):
+        if isinstance(spec, dict):
+            policy = policy.updated(spec)
+    if sensor.state_class in CUMULATIVE_STATE_CLASSES:
+        policy = replace(policy, absolute=0, relative=0)
+    return policy
+
+
+def publish_gate_for(sensor) -> PublishGate | None:
+    """A gate for the base sensor's entity, or None when its policy publishes every change."""
+    policy = resolve_policy(sensor)
+    return None if policy.immediate else PublishGate(policy)
+
+
+class PublishGate:
+    """Decides per new value whether one entity writes its state."""
+
+    def __init__(self, policy: PublishPolicy):
+        self.policy = policy
+        self.suppressed = 0
+        self._value = _UNSET
+        self._held = _UNSET
+        self._published_at: float | None = None
+
+    def admit(self, value, now: float) -> bool:
+        """True when ``value`` should be published at monotonic time ``now`` (it then counts as published)."""
+        if self._published_at is not None and not self._significant(value, now - self._published_at):
+            self.suppressed += 1
+            self._held = value
+            return False
+        self._publish(value, now)
+        return True
+
+    def heartbeat_in(self, now: float) -> float | None:
+        """Seconds until the held-back value is due, or None when nothing is held back or the policy has no heartbeat."""
+        policy = self.policy
+        if self._held is _UNSET or policy.max_silence is None or self._published_at is None:
+            return None
+        return max(max(policy.max_silence, policy.min_interval) - (now - self._published_at), 0.0)
+
+    def release(self, now: float):
+        """The held-back value, now counted as published (None when nothing is held back)."""
+        value = self._held
+        if value is _UNSET:
+            return None
+        self._publish(value, now)
+        return value
+
+    def _publish(self, value, now: float) -> None:
+        self._value = value
+        self._held = _UNSET
+        self._published_at = now
+
+    def _significant(self, value, elapsed: float) -> bool:
+        policy = self.policy
+        if elapsed < policy.min_interval:
+            return False
+        heartbeat = policy.max_silence is not None and elapsed >= policy.max_silence
+        last = self._value
+        if not (isinstance(value, numbers.Real) and isinstance(last, numbers.Real)):
+            return heartbeat or value != last
+        change = abs(value - last)
+        return heartbeat or (change > policy.absolute and change > policy.relative * abs(last))
+
+    def reset(self) -> None:
+        """Publish the next value whatever it is (after the entity went unavailable)."""
+        self._held = _UNSET
+        self._published_at = None
@@ -0,0 +1,133 @@
+"""Coalesce sensor groups into as few Modbus read frames as the link allows.
+
+Every frame costs the inter-frame wait plus a full round trip through the
+datalogger, so reading ten small FAST groups one by one is mostly dead time.
+The planner merges groups of the same register type (input/holding) and poll
+speed into one frame when the registers between them are few enough to read
+and throw away, without ever crossing a register the inverter is known to
+reject.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+
+from .sensors.solis_base_sensor import SolisSensorGroup
+
+_LOGGER = logging.getLogger(__name__)
+
+# Modbus PDU limit for FC03/FC04: 125 registers per read.
+MAX_READ_REGISTERS = 125
+
+# Holding registers live at 40000+; a frame never spans both tables.
+HOLDING_REGISTER_START = 40000
+
+
+def is_holding_register(register: int) -> bool:
+    return register >= HOLDING_REGISTER_START
+
+
+@dataclass
+class ReadFrame:
+    """One Modbus read covering one or more sensor groups (plus the gaps between them)."""
+
+    start: int
+    count: int
+    is_holding: bool
+    groups: list[SolisSensorGroup] = field(default_factory=list)
+
+    @property
+    def end(self) -> int:
+        return self.start + self.count - 1
+
+    def values_for(self, group: SolisSensorGroup, values: list[int]) -> list[int]:
+        """Slice one group's registers out of this frame's response."""
+        offset = group.start_register - self.start
+        return values[offset : offset + group.registrar_count]
+
+    def gap_registers(self) -> list[int]:
+        """Registers read only to bridge two groups (not owned by any group)."""
+        owned: set[int] = set()
+        for group in self.groups:
+            owned.update(range(group.start_register, group.start_register + group.registrar_count))
+        return [reg for reg in range(self.start, self.end + 1) if reg not in owned]
+
+
+class ReadPlanner:
+    """Plans read frames for a set of sensor groups.
+
+    ``max_gap`` is the largest run of unused registers worth reading to save a
+    frame; 0 still merges groups that are directly adjacent. Registers the
+    inverter rejected (learned from failed merged reads and from the per-group
+    bisection recovery) are never bridged, and a group that still contains one is
+    always read on its own so the group-level recovery can deal with it.
+    """
+
+    def __init__(self, max_gap: int = 0, max_registers: int = MAX_READ_REGISTERS):
+        self.max_gap = max(0, int(max_gap))
+        self.max_registers = max(1, min(int(max_registers), MAX_READ_REGISTERS))
+        self._unreadable: set[int] = set()
+
+    @property
+    def unreadable_registers(self) -> frozenset[int]:
+        return frozenset(self._unreadable)
+
+    def mark_unreadable(self, *registers: int) -> bool:
+        """Remember registers the inverter rejects. Returns True if anything new was learned."""
+        new = {int(reg) for reg in registers} - self._unreadable
+        if new:
+            self._unreadable.update(new)
+            _LOGGER.debug("Read planner learned unreadable register(s) %s", sorted(new))
+        return bool(new)
+
+    def _contains_unreadable(self, start: int, end: int) -> bool:
+        return any(start <= reg <= end for reg in self._unreadable)
+
+    def plan(self, groups: list[SolisSensorGroup]) -> list[ReadFrame]:
+        """Return frames covering every group, in register order."""
+        buckets: dict[tuple, list[SolisSensorGroup]] = {}
+        for group in groups:
+            if group.registrar_count <= 0:
+                continue
+            key = (is_holding_register(group.start_register), group.poll_speed)
+            buckets.setdefault(key, []).append(group)
+
+        frames: list[ReadFrame] = []
+        for (is_holding, _speed), bucket in buckets.items():
+            frames.extend(self._plan_bucket(bucket, is_holding))
+        frames.sort(key=lambda frame: frame.start)
+        return frames
+
+    def _plan_bucket(self, groups: list[SolisSensorGroup], is_holding: bool) -> list[ReadFrame]:
+        frames: list[ReadFrame] = []
+        current: ReadFrame | None = None
+
+        for group in sorted(groups, key=lambda g: g.start_register):
+            start = group.start_register
+            end = start + group.registrar_count - 1
+            isolated = self._contains_unreadable(start, end)
+
+            if current is not None and not isolated and self._can_extend(current, start, end):
+                current.count = end - current.start + 1
+                current.groups.append(group)
+                continue
+
+            current = ReadFrame(start=start, count=end - start + 1, is_holding=is_holding, groups=[group])
+            frames.append(current)
+            if isolated:
+                # Never extend a frame that holds a known-bad register.
+                current = None
+
+        return frames
+
+    def _can_extend(self, frame: ReadFrame, start: int, end: int) -> bool:
+        if start <= frame.end:
+            # Overlapping definitions: keep them as separate frames rather than guess.
+            return False
+        gap = start - frame.end - 1
+        if gap > self.max_gap:
+            return False
+        if end - frame.start + 1 > self.max_registers:
+            return False
+        return not self._contains_unreadable(frame.end + 1, start - 1)
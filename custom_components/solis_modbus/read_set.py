@@ -0,0 +1,114 @@
+"""Poll only the registers that back enabled entities.
+
+Sensor groups are built from every entity of a group definition, so a block is
+read whole even when most of its entities are disabled in the entity registry.
+The read set is the union of the registers the enabled entities listen to
+(``polled_registers`` on each entity: a sensor's registers, a derived sensor's
+inputs, a switch/select/time register) plus registers the integration reads
+itself (the firmware version). ``ReadSet.apply`` trims each input-register group
+to the sensors touching that set and splits it where unused sensors leave a
+hole; the read planner merges pieces separated by small gaps again.
+
+Holding-register groups (43xxx) are always read whole: writes read-modify-write
+their registers and several entities read companion registers from the cache.
+
+The set is recomputed when an entity of the entry is enabled or disabled in the
+registry, so the next poll cycle already reads the new layout.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+from .learned_register_map import FIRMWARE_REGISTER_COUNT, firmware_register
+from .sensors.solis_base_sensor import SolisSensorGroup, cluster_sensors_by_contiguous_registers
+
+# Groups starting here are holding registers and are never trimmed.
+HOLDING_REGISTER_START = 40000
+
+# runtime.entities key -> entity platform domain
+_PLATFORM_DOMAINS = {
+    "sensor": "sensor",
+    "sensor_derived": "sensor",
+    "number": "number",
+    "switch": "switch",
+    "select": "select",
+    "time": "time",
+}
+
+
+def enabled_entity_registers(hass: HomeAssistant, entry) -> set[int] | None:
+    """Registers the entry's enabled entities depend on, or None while its entities are not set up yet."""
+    runtime = getattr(entry, "runtime_data", None)
+    entities = getattr(runtime, "entities", None)
+    if not entities:
+        return None
+    registry = er.async_get(hass)
+    registers: set[int] = set()
+    for platform, domain in _PLATFORM_DOMAINS.items():
+        for entity in entities.get(platform, []):
+            entity_id = registry.async_get_entity_id(domain, DOMAIN, entity.unique_id)
+            registry_entry = registry.async_get(entity_id) if entity_id else None
+            if registry_entry is not None and registry_entry.disabled:
+                continue
+            registers.update(int(register) for register in getattr(entity, "polled_registers", ()))
+    controller = getattr(runtime, "controller", None)
+    if controller is not None:
+        start = firmware_register(controller.inverter_config.type)
+        registers.update(range(start, start + FIRMWARE_REGISTER_COUNT))
+    return registers
+
+
+class ReadSet:
+    """The poll groups of one controller, trimmed to the registers its enabled entities need."""
+
+    def __init__(self):
+        self.registers: frozenset[int] | None = None
+        self._configured = None
+        self._groups: list[SolisSensorGroup] = []
+        self._sources: dict[SolisSensorGroup, SolisSensorGroup] = {}
+        self._parts: dict[tuple, SolisSensorGroup] = {}
+
+    def update(self, registers: Iterable[int] | None) -> bool:
+        """Set the registers to poll (None polls every group whole). True when the set changed."""
+        registers = None if registers is None else frozenset(registers)
+        if registers == self.registers:
+            return False
+        self.registers = registers
+        self._configured = None
+        return True
+
+    def apply(self, configured: list[SolisSensorGroup]) -> list[SolisSensorGroup]:
+        """The groups to poll out of ``configured``; unchanged groups and pieces keep their identity between calls."""
+        if self.registers is None:
+            return configured
+        if configured is self._configured:
+            return self._groups
+        groups, sources, parts = [], {}, {}
+        for group in configured:
+            enabled = [s for s in group.sensors if s.enabled]
+            kept = enabled if group.start_register >= HOLDING_REGISTER_START else [s for s in enabled if not self.registers.isdisjoint(s.registrars)]
+            if len(kept) == len(enabled):
+                groups.append(group)
+                continue
+            for cluster in cluster_sensors_by_contiguous_registers(kept):
+                key = (group, tuple(id(s) for s in cluster))
+                part = self._parts.get(key) or SolisSensorGroup.from_sensors(cluster, group.poll_speed, group.identification)
+                parts[key] = part
+                sources[part] = group
+                groups.append(part)
+        self._configured, self._groups, self._sources, self._parts = configured, groups, sources, parts
+        return groups
+
+    def source_of(self, group: SolisSensorGroup) -> SolisSensorGroup:
+        """The configured group a trimmed piece was cut from (the group itself when it was not trimmed)."""
+        return self._sources.get(group, group)
+
+    def as_dict(self) -> dict:
+        if self.registers is None:
+            return {"registers": None, "trimmed_groups": 0}
+        return {"registers": len(self.registers), "trimmed_groups": len(set(self._sources.values()))}
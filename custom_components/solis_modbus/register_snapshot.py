@@ -0,0 +1,84 @@
+"""Warm-start snapshot of one inverter's register cache.
+
+After a restart the first full poll takes a while (every speed, serially), and
+until it is done the select, switch and number entities see an empty cache.
+Their read-modify-write paths then need a live read first (issue #402). The
+register store is therefore saved per inverter serial, each value with the time
+it was read, and seeded back at setup before the entities are added.
+
+Restored values are shown straight away and replaced by the first live poll,
+which runs in the background. A read-modify-write only trusts a restored value
+younger than ``const.RMW_MAX_RESTORED_AGE_SECONDS``; older ones still get the live read.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .helpers import get_register_store
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+# Values older than this are not restored at all (a settings change made on the
+# inverter or in the Solis app while HA was down would otherwise linger).
+MAX_RESTORED_AGE_SECONDS = 7 * 24 * 3600
+
+# Polls write the store every few seconds; save at most this often (and on HA stop).
+SAVE_INTERVAL_SECONDS = 300
+SAVE_DELAY_SECONDS = 10
+
+
+def storage_key(serial_number: str) -> str:
+    return f"{DOMAIN}.register_snapshot.{serial_number}"
+
+
+class RegisterSnapshot:
+    """Debounced copy of one controller's register store in a Home Assistant ``Store``."""
+
+    def __init__(self, hass: HomeAssistant, controller, serial_number: str):
+        self.hass = hass
+        self.controller = controller
+        self.serial_number = serial_number
+        self.restored = 0
+        self._last_scheduled: float | None = None
+        self._store: Store = Store(hass, STORAGE_VERSION, storage_key(serial_number))
+
+    async def async_restore(self, max_age: float = MAX_RESTORED_AGE_SECONDS) -> int:
+        """Seed the register store from the snapshot. Returns how many values were restored."""
+        data = await self._store.async_load()
+        if not data:
+            return 0
+        store = get_register_store(self.hass, self.controller, create=True)
+        now = time.time()
+        restored = 0
+        for register, (value, read_at) in data.get("registers", {}).items():
+            if now - read_at <= max_age and store.restore(int(register), value, read_at):
+                restored += 1
+        self.restored = restored
+        _LOGGER.debug("(%s) Restored %s register value(s) from the warm-start snapshot", self.serial_number, restored)
+        return restored
+
+    def schedule_save(self) -> None:
+        """Save the current register store soon, unless a save was scheduled within the last ``SAVE_INTERVAL_SECONDS``."""
+        now = time.monotonic()
+        if self._last_scheduled is not None and now - self._last_scheduled < SAVE_INTERVAL_SECONDS:
+            return
+        self._last_scheduled = now
+        self._store.async_delay_save(self._data, SAVE_DELAY_SECONDS)
+
+    def _data(self) -> dict:
+        store = get_register_store(self.hass, self.controller)
+        registers = {}
+        if store is not None:
+            for register, value in store.items():
+                read_at = store.read_at(register)
+                if read_at is not None and isinstance(value, int):
+                    registers[str(register)] = [value, read_at]
+        return {"saved_at": time.time(), "registers": registers}
@@ -0,0 +1,155 @@
+"""Latest register values of one Modbus slave, and the entities listening to them.
+
+One store per link+slave lives in ``hass.data[DOMAIN][VALUES]`` (keyed by
+``(connection_id, slave)``), so parallel inverters on one datalogger never see
+each other's values and the values survive an entry reload. Lookups are plain
+register numbers; a read frame is written as one block.
+
+Entities subscribe to the registers they decode and are called once per
+published block that touches any of them, with the whole block. A U32/S32
+value is then decoded from one read, never from half-old, half-new words.
+
+Every value carries the wall-clock time it was read. Values restored from a
+warm-start snapshot (see register_snapshot.py) keep their original read time and
+stay marked as restored until a live read or write replaces them.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RegisterBlock:
+    """Consecutive register values from one read (or write), as published to entities.
+
+    ``decoded`` is the poll group's one-pass decode of the block (sensor -> value),
+    when it came from a group read.
+    """
+
+    start: int
+    values: tuple
+    host: str
+    slave: int
+    decoded: Mapping[Any, Any] | None = field(default=None, compare=False)
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.values)
+
+    def __contains__(self, register: int) -> bool:
+        return self.start <= register < self.end
+
+    def get(self, register: int, default: Any = None) -> Any:
+        if self.start <= register < self.end:
+            return self.values[register - self.start]
+        return default
+
+
+BlockListener = Callable[[RegisterBlock], None]
+
+
+class RegisterStore:
+    """Register number -> last value read (or written) for one slave."""
+
+    __slots__ = ("_listeners", "_read_at", "_restored", "_values")
+
+    def __init__(self):
+        self._values: dict[int, Any] = {}
+        self._read_at: dict[int, float] = {}
+        self._restored: set[int] = set()
+        self._listeners: dict[int, list[BlockListener]] = {}
+
+    def get(self, register: int, default: Any = None) -> Any:
+        return self._values.get(register, default)
+
+    def set(self, register: int, value: Any) -> None:
+        self._values[register] = value
+        self._read_at[register] = time.time()
+        self._restored.discard(register)
+
+    def get_block(self, start: int, count: int) -> list[Any]:
+        get = self._values.get
+        return [get(register) for register in range(start, start + count)]
+
+    def set_block(self, start: int, values: Sequence[Any]) -> None:
+        registers = range(start, start + len(values))
+        self._values.update(zip(registers, values, strict=True))
+        self._read_at.update(dict.fromkeys(registers, time.time()))
+        if self._restored:
+            self._restored.difference_update(registers)
+
+    def restore(self, register: int, value: Any, read_at: float) -> bool:
+        """Seed a value from a snapshot, unless a live value is already stored. Returns True if it was taken."""
+        if register in self._values:
+            return False
+        self._values[register] = value
+        self._read_at[register] = read_at
+        self._restored.add(register)
+        return True
+
+    def read_at(self, register: int) -> float | None:
+        """Wall-clock time the register's value was read (or written), None if it has none."""
+        return self._read_at.get(register)
+
+    def is_restored(self, register: int) -> bool:
+        """True while the value still comes from a snapshot, not from this run's reads."""
+        return register in self._restored
+
+    def get_for_write(self, register: int, max_restored_age: float) -> Any:
+        """The value to base a read-modify-write on: like ``get``, but a restored value older than ``max_restored_age`` seconds counts as missing."""
+        if register in self._restored and time.time() - self._read_at[register] > max_restored_age:
+            return None
+        return self._values.get(register)
+
+    def values_for(self, registers: Iterable[int], block: RegisterBlock | None = None) -> list[Any]:
+        """Values of ``registers``: from ``block`` where it covers them, otherwise the last stored value."""
+        get = self._values.get
+        if block is None:
+            return [get(register) for register in registers]
+        return [block.values[register - block.start] if register in block else get(register) for register in registers]
+
+    def subscribe(self, registers: Iterable[int], listener: BlockListener) -> Callable[[], None]:
+        """Call ``listener`` for every published block touching one of ``registers``. Returns the unsubscribe callback."""
+        registers = set(registers)
+        for register in registers:
+            self._listeners.setdefault(register, []).append(listener)
+
+        def _unsubscribe() -> None:
+            for register in registers:
+                listeners = self._listeners.get(register)
+                if listeners and listener in listeners:
+                    listeners.remove(listener)
+                    if not listeners:
+                        del self._listeners[register]
+
+        return _unsubscribe
+
+    def publish(self, block: RegisterBlock, registers: Iterable[int] | None = None) -> int:
+        """Call each listener of the block's registers (or only of ``registers``) once. Returns how many were called."""
+        listeners: dict[BlockListener, None] = {}
+        for register in range(block.start, block.end) if registers is None else registers:
+            for listener in self._listeners.get(register, ()):
+                listeners[listener] = None
+        for listener in listeners:
+            try:
+                listener(block)
+            except Exception:
+                _LOGGER.exception("Error handling register block %s-%s", block.start, block.end - 1)
+        return len(listeners)
+
+    def items(self) -> Iterator[tuple[int, Any]]:
+        """(register, value) pairs in register order."""
+        return iter(sorted(self._values.items()))
+
+    def __contains__(self, register: int) -> bool:
+        return register in self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -2,8 +2,8 @@
 
 Everything scoped to one inverter entry lives here instead of nested
 hass.data buckets. Deliberately NOT here:
-- the register VALUES cache (shared across entries, keys namespaced per
-  link|slave — parallel inverters on one datalogger share reads),
+- the register VALUES cache (one RegisterStore per link+slave, kept across
+  reloads — parallel inverters on one datalogger share reads),
 - the ModbusClientManager singleton (shares one pymodbus client per link).
 """
 
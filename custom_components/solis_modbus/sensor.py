@@ -5,9 +5,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 
 from custom_components.solis_modbus import ModbusController
-from custom_components.solis_modbus.const import DOMAIN, VALUES
+from custom_components.solis_modbus.const import CONF_PUBLISH_DEADBAND, DEFAULT_PUBLISH_DEADBAND, DOMAIN, VALUES
 from custom_components.solis_modbus.helpers import get_controller_from_entry
 from custom_components.solis_modbus.sensors.solis_derived_sensor import SolisDerivedSensor
+from custom_components.solis_modbus.sensors.solis_poll_stats_sensor import POLL_STATS_SENSORS, SolisPollStatsSensor
 from custom_components.solis_modbus.sensors.solis_sensor import SolisSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,20 +26,24 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     # Never wipe the shared register cache on setup/reload — keys are namespaced
     # per link+slave, so other controllers' cached values must survive.
     hass.data[DOMAIN].setdefault(VALUES, {})
+    deadband = {**config_entry.data, **config_entry.options}.get(CONF_PUBLISH_DEADBAND, DEFAULT_PUBLISH_DEADBAND)
 
     for sensor_group in controller.sensor_groups:
         for sensor in sensor_group.sensors:
             if sensor.name != "reserve":
-                sensor_entities.append(SolisSensor(hass, sensor))
+                sensor_entities.append(SolisSensor(hass, sensor, deadband=deadband))
 
     for sensor in controller.derived_sensors:
-        sensor_derived_entities.append(SolisDerivedSensor(hass, sensor))
+        sensor_derived_entities.append(SolisDerivedSensor(hass, sensor, deadband=deadband))
+
+    poll_stats_entities = [SolisPollStatsSensor(config_entry, definition) for definition in POLL_STATS_SENSORS]
 
     config_entry.runtime_data.entities["sensor"] = sensor_entities
     config_entry.runtime_data.entities["sensor_derived"] = sensor_derived_entities
 
     async_add_entities(sensor_entities, True)
     async_add_entities(sensor_derived_entities, True)
+    async_add_entities(poll_stats_entities)
 
     @callback
     def update(now):
@@ -357,6 +357,7 @@ hybrid_sensors = [
                 "multiplier": 0,
                 "unit_of_measurement": UnitOfPower.WATT,
                 "state_class": SensorStateClass.MEASUREMENT,
+                "spike_filter": {"max_rated": 2, "max_floor": 10000},
             },
         ],
     },
@@ -512,6 +513,7 @@ hybrid_sensors = [
                 "register": ["33095"],
                 "multiplier": 0,
                 "state_class": SensorStateClass.MEASUREMENT,
+                "operating_state": True,
             },
             {
                 "name": "Lead-acid Battery Temperature",
@@ -644,6 +646,7 @@ hybrid_sensors = [
                 "multiplier": 0,
                 "unit_of_measurement": UnitOfPower.WATT,
                 "state_class": SensorStateClass.MEASUREMENT,
+                "spike_filter": {"max_rated": 4, "max_floor": 30000},
             },
         ],
     },
@@ -729,6 +732,7 @@ hybrid_sensors = [
                 "multiplier": 0,
                 "unit_of_measurement": PERCENTAGE,
                 "state_class": SensorStateClass.MEASUREMENT,
+                "spike_filter": {"suspect_values": [0, 100]},
             },
             {
                 "name": "Battery SOH",
@@ -815,6 +819,7 @@ hybrid_sensors = [
                 "multiplier": 0,
                 "unit_of_measurement": UnitOfPower.WATT,
                 "state_class": SensorStateClass.MEASUREMENT,
+                "spike_filter": {"max": 64999, "max_rated": 2, "max_floor": 10000},
             },
             {
                 "name": "Battery Power",
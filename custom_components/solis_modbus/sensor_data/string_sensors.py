@@ -64,6 +64,7 @@ string_sensors = [
                 "unit_of_measurement": UnitOfPower.WATT,
                 "register": ["3004", "3005"],
                 "multiplier": 1,
+                "spike_filter": {"max_rated": 2, "max_floor": 10000},
             },
             {
                 "name": "Total DC Output Power",
@@ -73,6 +74,7 @@ string_sensors = [
                 "state_class": SensorStateClass.MEASUREMENT,
                 "register": ["3006", "3007"],
                 "multiplier": 1,
+                "spike_filter": {"max_rated": 2, "max_floor": 10000},
             },
             {
                 "name": "Total Energy",
@@ -309,6 +311,7 @@ string_sensors = [
                 "state_class": SensorStateClass.MEASUREMENT,
                 "register": ["3043"],
                 "multiplier": 1,
+                "operating_state": True,
             },
             {
                 "name": "Limited active power adjustment rated power output value",
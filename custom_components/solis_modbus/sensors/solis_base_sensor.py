@@ -16,16 +16,10 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 
 from custom_components.solis_modbus.data.enums import Category, DataType, InverterFeature, PollSpeed
-from custom_components.solis_modbus.helpers import (
-    _any_in,
-    cache_get,
-    combine_u32,
-    combine_u32_le,
-    extract_serial_number,
-    split_s32,
-    split_s32_le,
-    unique_id_generator,
-)
+from custom_components.solis_modbus.decoders import BlockDecoder, Decoder, resolve_decoder
+from custom_components.solis_modbus.helpers import _any_in, cache_get, get_register_store, unique_id_generator
+from custom_components.solis_modbus.register_store import RegisterBlock
+from custom_components.solis_modbus.spike_filter import SpikeRule
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -132,6 +126,9 @@ class SolisBaseSensor:
         identification=None,
         poll_speed=PollSpeed.NORMAL,
         data_type: str | None = None,
+        spike_filter: SpikeRule | None = None,
+        publish: dict | None = None,
+        operating_state: bool = False,
     ):
         """
         :param name: Sensor name
@@ -171,9 +168,38 @@ class SolisBaseSensor:
         self.poll_speed = poll_speed
         self.category = category
         self.identification = identification
+        self.spike_filter = spike_filter
+        self.publish = publish
+        # A change of this register (e.g. generating -> standby at dusk) returns every group to its base cadence.
+        self.operating_state = operating_state
 
         self.dynamic_adjustments()
 
+    @property
+    def multiplier(self):
+        return self._multiplier
+
+    @multiplier.setter
+    def multiplier(self, value):
+        self._multiplier = value
+        self._decoder = None
+
+    @property
+    def data_type(self) -> str | None:
+        return self._data_type
+
+    @data_type.setter
+    def data_type(self, value: str | None):
+        self._data_type = value
+        self._decoder = None
+
+    @property
+    def decoder(self) -> Decoder:
+        """The decode function for this sensor's raw registers, resolved once (again only if scaling or type change)."""
+        if self._decoder is None:
+            self._decoder = resolve_decoder(len(self.registrars), self.data_type, self.multiplier)
+        return self._decoder
+
     def dynamic_adjustments(self):
         inv_model = self.controller.inverter_config.model
         inv_features = self.controller.inverter_config.features
@@ -254,7 +280,7 @@ class SolisBaseSensor:
         """The raw (min, max) this register can carry, from its width."""
         data_type = self.data_type
         if data_type not in DATA_TYPE_RAW_RANGES:
-            # Mirror what _convert_raw_value assumes when nothing is declared: a pair of
+            # Mirror what resolve_decoder assumes when nothing is declared: a pair of
             # registers decodes as signed 32-bit, a lone one as unsigned 16-bit.
             data_type = DataType.S32.value if len(self.registrars) > 1 else DataType.U16.value
         return DATA_TYPE_RAW_RANGES[data_type]
@@ -341,41 +367,21 @@ class SolisBaseSensor:
     def _convert_raw_value(self, values: list[int]):
         if not values or None in values:
             return None
+        return self.decoder(values)
 
-        if len(self.registrars) >= 15:
-            values = values
-            n_value = extract_serial_number(values)
-        elif len(self.registrars) > 1:
-            # Default to signed 32-bit big-endian (historical behaviour — the many
-            # 2-register power/current registers are genuinely signed). Registers
-            # explicitly tagged U32 (e.g. lifetime energy totals) decode unsigned so
-            # they never wrap negative; *_LE variants are low-word-first (the
-            # string-inverter EPM block 36028-36057 is documented little-endian).
-            if self.data_type == DataType.U32.value:
-                combined_value = combine_u32(values)
-            elif self.data_type == DataType.U32_LE.value:
-                combined_value = combine_u32_le(values)
-            elif self.data_type == DataType.S32_LE.value:
-                combined_value = split_s32_le(values)
-            else:
-                combined_value = split_s32(values)
-
-            if self.multiplier == 0 or self.multiplier == 1:
-                n_value = round(combined_value)
-            else:
-                n_value = combined_value * self.multiplier
-        else:
-            # Treat it as a single register (U16/S16)
-            raw = values[0]
-            if getattr(self, "data_type", None) == DataType.S16.value and raw > 32767:
-                raw -= 65536
-
-            if self.multiplier == 0 or self.multiplier == 1:
-                n_value = round(raw)
-            else:
-                n_value = raw * self.multiplier
+    def value_from_block(self, block: RegisterBlock):
+        """This sensor's value from a published block, or None until all its registers are known.
 
-        return n_value
+        Uses the group decode carried by the block when there is one; registers outside
+        the block come from the register store.
+        """
+        decoded = block.decoded
+        if decoded is not None and self in decoded:
+            return decoded[self]
+        values = get_register_store(self.hass, self.controller, create=True).values_for(self.registrars, block)
+        if None in values:
+            return None
+        return self._convert_raw_value([int(value) for value in values])
 
     def get_info(self):
         """Return basic sensor information."""
@@ -433,6 +439,9 @@ class SolisSensorGroup:
                     data_type=entity.get("data_type", None),
                     unique_id=unique_id_generator(controller, entity.get("unique", "reserve")),
                     poll_speed=definition.get("poll_speed", PollSpeed.NORMAL),
+                    spike_filter=SpikeRule.from_definition(entity["spike_filter"]) if "spike_filter" in entity else None,
+                    publish=entity.get("publish", None),
+                    operating_state=entity.get("operating_state", False),
                 ),
                 definition.get("entities", []),
             )
@@ -444,6 +453,7 @@ class SolisSensorGroup:
         )
         self.validate_sequential_registrars()
         self.identification = identification
+        self.block_decoder = BlockDecoder(self.start_register, self._sensors)
 
     @classmethod
     def from_sensors(
@@ -458,6 +468,7 @@ class SolisSensorGroup:
         inst.poll_speed = poll_speed
         inst.identification = identification
         inst.validate_sequential_registrars()
+        inst.block_decoder = BlockDecoder(inst.start_register, inst._sensors)
         return inst
 
     def validate_sequential_registrars(self):
@@ -483,3 +494,7 @@ class SolisSensorGroup:
     @property
     def start_register(self):
         return min(reg for sensor in self._sensors for reg in sensor.registrars)
+
+    def decode(self, values: list[int]) -> dict[SolisBaseSensor, object]:
+        """Every sensor's value from one read of this group."""
+        return self.block_decoder.decode(values)
@@ -3,21 +3,21 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.core import callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from custom_components.solis_modbus import ModbusController
-from custom_components.solis_modbus.const import CONTROLLER, REGISTER, SLAVE, VALUE
+from custom_components.solis_modbus.const import RMW_MAX_RESTORED_AGE_SECONDS
 from custom_components.solis_modbus.helpers import (
     cache_get,
     cache_save,
     get_bit_bool,
     is_correct_controller,
-    register_update_signal,
     set_bit,
+    subscribe_register_blocks,
     unique_id_generator_binary,
 )
+from custom_components.solis_modbus.register_store import RegisterBlock
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,26 +50,17 @@ class SolisBinaryEntity(RestoreEntity, SwitchEntity):
         """Called when entity is added to HA."""
         await super().async_added_to_hass()
 
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self._hass,
-                register_update_signal(self._modbus_controller, self._register),
-                self.handle_modbus_update,
-            )
-        )
+        self.async_on_remove(subscribe_register_blocks(self._hass, self._modbus_controller, [self._register], self.handle_register_block))
 
     @callback
-    def handle_modbus_update(self, data):
-        """Callback when register data is available (per-register dispatcher)."""
-        updated_register = int(data.get(REGISTER))
-        updated_controller = str(data.get(CONTROLLER))
-        updated_controller_slave = int(data.get(SLAVE))
-
-        if not is_correct_controller(self._modbus_controller, updated_controller, updated_controller_slave):
+    def handle_register_block(self, block: RegisterBlock):
+        """Callback when a block covering this switch's register was read (or written)."""
+        if not is_correct_controller(self._modbus_controller, block.host, block.slave):
             return  # meant for a different sensor/inverter combo
 
-        if updated_register == self._register:
-            updated_value = int(data.get(VALUE))
+        if self._register in block:
+            updated_register = self._register
+            updated_value = int(block.get(self._register))
 
             if self._bit_position is not None:
                 bit_bool = get_bit_bool(updated_value, self._bit_position)
@@ -158,13 +149,13 @@ class SolisBinaryEntity(RestoreEntity, SwitchEntity):
         reverted while our cache still holds the value we last wrote.
         """
         controller = self._modbus_controller
-        current_register_value: int = cache_get(self._hass, self._modbus_controller, self._register)
+        current_register_value: int = cache_get(self._hass, self._modbus_controller, self._register, max_restored_age=RMW_MAX_RESTORED_AGE_SECONDS)
 
         if current_register_value is None and self._bit_position is not None:
             # A read-modify-write from an empty cache (e.g. right after a reload,
             # before this register's group has been polled) would start from 0 and
             # clear every other bit in the register (issue #402). Read the live
-            # value from the inverter first.
+            # value from the inverter first. An old warm-start value counts as empty.
             registers = await controller.async_read_holding_register(self._register, 1)
             if not registers:
                 _LOGGER.warning(
@@ -218,6 +209,11 @@ class SolisBinaryEntity(RestoreEntity, SwitchEntity):
         self._attr_is_on = value
         self._attr_available = True
 
+    @property
+    def polled_registers(self) -> list[int]:
+        """Registers this entity needs polled."""
+        return [self._register]
+
     @property
     def device_info(self):
         """Return device info."""
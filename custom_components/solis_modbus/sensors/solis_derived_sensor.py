@@ -1,16 +1,13 @@
-import decimal
-import fractions
 import logging
-import numbers
+import time
 from datetime import UTC, datetime
 
 from homeassistant.components.sensor import RestoreSensor, SensorDeviceClass, SensorEntity
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
 
-from custom_components.solis_modbus.const import CONTROLLER, REGISTER, SLAVE, VALUE
-from custom_components.solis_modbus.data.status_mapping import STATUS_MAPPING
-from custom_components.solis_modbus.helpers import clock_drift_test, decode_inverter_model, is_correct_controller, register_update_signal
+from custom_components.solis_modbus.derived_engine import INVERTER_MODEL, compile_derived, get_derived_engine
+from custom_components.solis_modbus.publish_policy import publish_gate_for
 from custom_components.solis_modbus.sensors.solis_base_sensor import SolisBaseSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -19,7 +16,7 @@ _LOGGER = logging.getLogger(__name__)
 class SolisDerivedSensor(RestoreSensor, SensorEntity):
     """Representation of a Modbus derived/calculated sensor."""
 
-    def __init__(self, hass: HomeAssistant, sensor: SolisBaseSensor):
+    def __init__(self, hass: HomeAssistant, sensor: SolisBaseSensor, deadband: bool = False):
         self._hass = hass if hass else sensor.hass
         self.base_sensor = sensor
 
@@ -28,6 +25,9 @@ class SolisDerivedSensor(RestoreSensor, SensorEntity):
         self._attr_unique_id = sensor.unique_id
 
         self._register: list[int] = sensor.registrars
+        self._node = compile_derived(sensor)
+        self._publish_gate = publish_gate_for(sensor) if deadband else None
+        self._heartbeat_unsub = None
 
         self._device_class = sensor.device_class
         self._unit_of_measurement = sensor.unit_of_measurement
@@ -42,7 +42,6 @@ class SolisDerivedSensor(RestoreSensor, SensorEntity):
 
         self.is_added_to_hass = False
         self._state = None
-        self._received_values = {}
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
@@ -54,146 +53,52 @@ class SolisDerivedSensor(RestoreSensor, SensorEntity):
                 self._attr_native_value = datetime.now(UTC)
         self.is_added_to_hass = True
 
-        for reg in set(self._register):
-            self.async_on_remove(
-                async_dispatcher_connect(
-                    self._hass,
-                    register_update_signal(self.base_sensor.controller, reg),
-                    self.handle_modbus_update,
-                )
-            )
+        engine = get_derived_engine(self._hass, self.base_sensor.controller, create=True)
+        self.async_on_remove(engine.subscribe(self._node, self._apply_value))
 
     @callback
-    def handle_modbus_update(self, data):
-        """Callback when register data is available (per-register dispatcher)."""
-        updated_register = int(data.get(REGISTER))
-        updated_controller = str(data.get(CONTROLLER))
-        updated_controller_slave = int(data.get(SLAVE))
-
-        if not is_correct_controller(self.base_sensor.controller, updated_controller, updated_controller_slave):
-            return  # meant for a different sensor/inverter combo
-
-        # Only process if this register belongs to the sensor
-        if updated_register in self._register:
-            self._received_values[updated_register] = data.get(VALUE)
-
-            # If we haven't received all registers yet, wait
-            filtered_registers = {reg for reg in self._register if reg not in (0, 1, 90007)}
-            if not all(reg in self._received_values for reg in filtered_registers):
-                _LOGGER.debug(f"not all values received yet = {self._received_values}")
-                return  # Wait until all registers are received
-
-            ## start
-            if 90007 in self._register:
-                is_adjusted = clock_drift_test(
-                    self.hass,
-                    self.base_sensor.controller,
-                    self._received_values[33022],
-                    self._received_values[33023],
-                    self._received_values[33024],
-                    self._received_values[33025],
-                    self._received_values[33026],
-                    self._received_values[33027],
-                )
-                if is_adjusted:
-                    self._attr_available = True
-                    self._attr_native_value = datetime.now(UTC)
-                    self.schedule_update_ha_state()
-                    self._received_values.clear()
-
-            if 90006 in self._register:
-                new_value = self.base_sensor.controller.last_modbus_success
-                if new_value == 0 or new_value is None:
-                    return
-                self._attr_available = True
-                self._attr_native_value = new_value
-                self.schedule_update_ha_state()
-                self._received_values.clear()
-                return
-
-            new_value = self.base_sensor.get_value
-
-            if 33095 in self._register:
-                code = round(self.base_sensor.get_value)
-                # Preserve the raw hex code for unmapped faults (matches SolisCloud alarm codes).
-                new_value = STATUS_MAPPING.get(code, f"Unknown (0x{code:04X})")
-
-            if 33049 in self._register or 33051 in self._register or 33053 in self._register or 33055 in self._register:
-                r1_value = self._received_values[self._register[0]] * self.base_sensor.multiplier
-                r2_value = self._received_values[self._register[1]] * self.base_sensor.multiplier
-                new_value = round(r1_value * r2_value)
-
-            # String inverter: DC Voltage [n] × DC Current [n] (registers 3021–3028, protocol Ver19)
-            if 3021 in self._register or 3023 in self._register or 3025 in self._register or 3027 in self._register:
-                r1_value = self._received_values[self._register[0]] * self.base_sensor.multiplier
-                r2_value = self._received_values[self._register[1]] * self.base_sensor.multiplier
-                new_value = round(r1_value * r2_value)
-
-            if 33079 in self._register or 33080 in self._register or 33081 in self._register or 33082 in self._register:
-                active_power = self.base_sensor.convert_value([self._received_values[self._register[0]], self._received_values[self._register[1]]])
-                reactive_power = self.base_sensor.convert_value([self._received_values[self._register[2]], self._received_values[self._register[3]]])
-
-                if active_power == 0 or reactive_power == 0:
-                    new_value = 1
-                else:
-                    new_value = round(active_power / ((active_power**2 + reactive_power**2) ** 0.5), 3)
-
-            if 33135 in self._register and len(self._register) == 4:
-                registers = self._register.copy()
-                self._register = registers[:2]
-
-                p_value = self.base_sensor.convert_value([self._received_values[reg] for reg in filtered_registers])
-                d_w_value = registers[3]
-                d_value = self._received_values[registers[2]]
-
-                self._register = registers
-
-                if str(d_value) == str(d_w_value):
-                    new_value = round(p_value * 10)
-                else:
-                    new_value = 0
-
-            if 33135 in self._register and len(self._register) == 3:
-                registers = self._register.copy()
-                self._register = registers[:2]
-
-                p_value = self.base_sensor.convert_value([self._received_values[reg] for reg in filtered_registers])
-                d_value = self._received_values[registers[2]]
-
-                self._register = registers
-
-                # 0 indicated charging, 1 indicated discharging
-                if str(d_value) == str(0):
-                    new_value = round(p_value * 10) * -1
-                else:
-                    new_value = round(p_value * 10)
-
-            if 33263 in self._register and len(self._register) == 2:
-                new_value = new_value * -1
-
-            if 33175 in self._register or 33171 in self._register:
-                # 33175 - to grid
-                # 33171 - from grid
-                to_grid = self._received_values[self._register[0]] * self.base_sensor.multiplier
-                from_grid = self._received_values[self._register[1]] * self.base_sensor.multiplier
-                new_value = from_grid - to_grid
-
-            # set after
-            if 35000 in self._register:
-                protocol_version, model_description = decode_inverter_model(new_value)
-                self.base_sensor.controller._sw_version = protocol_version
-                ## self.base_sensor.controller._model = model_description
-                new_value = model_description + f"(Protocol {protocol_version})"
-                self._update_device_sw_version(protocol_version)
-
-            if isinstance(new_value, (numbers.Number, decimal.Decimal, fractions.Fraction)) or isinstance(new_value, str):
-                self._attr_available = True
-                self._attr_native_value = new_value
-                self._state = new_value
-                self.schedule_update_ha_state()  # single update — no redundant re-schedule
-
-            # Clear received values after update
-            self._received_values.clear()
+    def _apply_value(self, new_value) -> None:
+        if new_value is None:
+            return
+        if self._node.kind == INVERTER_MODEL:
+            self._update_device_sw_version(self.base_sensor.controller._sw_version)
+        gate = self._publish_gate
+        if gate is not None and self._attr_available and not gate.admit(new_value, time.monotonic()):
+            self._schedule_heartbeat()
+            return  # insignificant change
+        self._cancel_heartbeat()
+        self._attr_available = True
+        self._attr_native_value = new_value
+        self._state = new_value
+        self.schedule_update_ha_state()  # single update — no redundant re-schedule
+
+    def _schedule_heartbeat(self) -> None:
+        """Publish the held-back value at its heartbeat even if the inputs stop changing."""
+        if self._heartbeat_unsub is not None:
+            return  # armed by an earlier held-back value; the deadline has not moved
+        delay = self._publish_gate.heartbeat_in(time.monotonic())
+        if delay is not None:
+            self._heartbeat_unsub = async_call_later(self._hass, delay, self._heartbeat)
+
+    def _cancel_heartbeat(self) -> None:
+        if self._heartbeat_unsub is not None:
+            self._heartbeat_unsub()
+            self._heartbeat_unsub = None
+
+    @callback
+    def _heartbeat(self, _now) -> None:
+        self._heartbeat_unsub = None
+        if not self._attr_available:
+            return
+        value = self._publish_gate.release(time.monotonic())
+        if value is not None:
+            self._attr_native_value = value
+            self._state = value
+            self.schedule_update_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._cancel_heartbeat()
+        await super().async_will_remove_from_hass()
 
     def _update_device_sw_version(self, protocol_version) -> None:
         """Push the decoded protocol version into the device registry.
@@ -215,6 +120,11 @@ class SolisDerivedSensor(RestoreSensor, SensorEntity):
         if device and device.sw_version != sw_version:
             dev_reg.async_update_device(device.id, sw_version=sw_version)
 
+    @property
+    def polled_registers(self) -> tuple[int, ...]:
+        """Registers this entity needs polled: the inputs of its formula."""
+        return self._node.inputs
+
     @property
     def device_info(self):
         """Return device info."""
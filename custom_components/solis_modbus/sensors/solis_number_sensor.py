@@ -2,10 +2,9 @@ import logging
 
 from homeassistant.components.number import NumberEntity, NumberMode, RestoreNumber
 from homeassistant.core import callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from custom_components.solis_modbus.const import CONTROLLER, REGISTER, SLAVE, VALUE
-from custom_components.solis_modbus.helpers import cache_get, is_correct_controller, register_update_signal
+from custom_components.solis_modbus.helpers import cache_get, is_correct_controller, subscribe_register_blocks
+from custom_components.solis_modbus.register_store import RegisterBlock
 from custom_components.solis_modbus.sensors.solis_base_sensor import SolisBaseSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -44,8 +43,6 @@ class SolisNumberEntity(RestoreNumber, NumberEntity):
         self._attr_native_unit_of_measurement = sensor.unit_of_measurement
         self._attr_available = not sensor.hidden and sensor.enabled
 
-        self._received_values = {}
-
         self._multiplier = sensor.multiplier
 
         # Unique ID based on all registers
@@ -66,27 +63,14 @@ class SolisNumberEntity(RestoreNumber, NumberEntity):
             self._attr_native_value = state.native_value
             # self.adjust_min_max_step(state.native_min_value, state.native_max_value, state.native_step)
 
-        for reg in set(self._register):
-            self.async_on_remove(
-                async_dispatcher_connect(
-                    self._hass,
-                    register_update_signal(self.base_sensor.controller, reg),
-                    self.handle_modbus_update,
-                )
-            )
+        self.async_on_remove(subscribe_register_blocks(self._hass, self.base_sensor.controller, self._register, self.handle_register_block))
 
         # Battery-current setpoints take their ceiling from a BMS mirror register that
         # this entity doesn't otherwise read; follow it so the advertised max refreshes
         # when the battery reports a new limit.
         mirror = getattr(self.base_sensor, "battery_current_mirror_register", None)
         if isinstance(mirror, int):
-            self.async_on_remove(
-                async_dispatcher_connect(
-                    self._hass,
-                    register_update_signal(self.base_sensor.controller, mirror),
-                    self.handle_max_mirror_update,
-                )
-            )
+            self.async_on_remove(subscribe_register_blocks(self._hass, self.base_sensor.controller, [mirror], self.handle_max_mirror_update))
 
         if not self.base_sensor.enabled:
             self._attr_available = False
@@ -102,9 +86,9 @@ class SolisNumberEntity(RestoreNumber, NumberEntity):
         return self.base_sensor.max_value
 
     @callback
-    def handle_max_mirror_update(self, data):
+    def handle_max_mirror_update(self, block: RegisterBlock):
         """The BMS reported a new current limit — re-publish the bounds."""
-        if not is_correct_controller(self.base_sensor.controller, str(data.get(CONTROLLER)), int(data.get(SLAVE))):
+        if not is_correct_controller(self.base_sensor.controller, block.host, block.slave):
             return
         self.schedule_update_ha_state()
 
@@ -126,37 +110,20 @@ class SolisNumberEntity(RestoreNumber, NumberEntity):
             self._attr_native_step = step_wanted
 
     @callback
-    def handle_modbus_update(self, data):
-        """Callback when register data is available (per-register dispatcher)."""
-        updated_register = int(data.get(REGISTER))
-        updated_controller = str(data.get(CONTROLLER))
-        updated_controller_slave = int(data.get(SLAVE))
-
-        if not is_correct_controller(self.base_sensor.controller, updated_controller, updated_controller_slave):
+    def handle_register_block(self, block: RegisterBlock):
+        """Callback when a block covering this entity's registers was read (or written)."""
+        if not is_correct_controller(self.base_sensor.controller, block.host, block.slave):
             return  # meant for a different sensor/inverter combo
 
         if not self.base_sensor.enabled:
             return
 
-        if updated_register in self._register:
-            updated_value = int(data.get(VALUE))
-
-            self._received_values[updated_register] = updated_value
-
-            # Wait until all registers have been received
-            if not all(reg in self._received_values for reg in self._register):
-                _LOGGER.debug(f"not all values received yet = {self._received_values}")
-                return
-
-            new_value = self.base_sensor.convert_value([updated_value])
+        new_value = self.base_sensor.value_from_block(block)
 
-            # Clear received values after update
-            self._received_values.clear()
-
-            # Update state if valid value exists
-            if new_value is not None:
-                self._attr_native_value = new_value
-                self.schedule_update_ha_state()
+        # Update state if valid value exists
+        if new_value is not None:
+            self._attr_native_value = new_value
+            self.schedule_update_ha_state()
 
     def set_native_value(self, value):
         """Update the current value."""
@@ -178,6 +145,12 @@ class SolisNumberEntity(RestoreNumber, NumberEntity):
         self._attr_native_value = value
         self.schedule_update_ha_state()
 
+    @property
+    def polled_registers(self) -> list[int]:
+        """Registers this entity needs polled, the BMS current mirror behind its maximum included."""
+        mirror = getattr(self.base_sensor, "battery_current_mirror_register", None)
+        return self._register if mirror is None else [*self._register, mirror]
+
     @property
     def device_info(self):
         """Return device info."""
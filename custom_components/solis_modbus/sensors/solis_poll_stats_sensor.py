@@ -0,0 +1,77 @@
+import logging
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+
+from custom_components.solis_modbus.data.enums import PollSpeed
+from custom_components.solis_modbus.helpers import unique_id_generator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Poll/link health read from the entry's DataRetrieval and controller stats.
+# Disabled by default: only worth enabling while tuning poll intervals.
+POLL_STATS_SENSORS = [
+    {
+        "name": "Modbus Fast Cycle Time p95",
+        "unique": "poll_stats_fast_cycle_p95",
+        "unit": UnitOfTime.MILLISECONDS,
+        "value": lambda runtime: runtime.data_retrieval.stats.cycle_summary(PollSpeed.FAST)["p95"],
+    },
+    {
+        "name": "Modbus Frame Latency p95",
+        "unique": "poll_stats_frame_latency_p95",
+        "unit": UnitOfTime.MILLISECONDS,
+        "value": lambda runtime: runtime.data_retrieval.stats.overall_frame_latency()["p95"],
+    },
+    {
+        "name": "Modbus Skipped Poll Cycles",
+        "unique": "poll_stats_skipped_cycles",
+        "unit": None,
+        "state_class": SensorStateClass.TOTAL_INCREASING,
+        "value": lambda runtime: sum(runtime.data_retrieval.stats.skipped_cycles.values()),
+    },
+    {
+        "name": "Modbus Failed Frames",
+        "unique": "poll_stats_failed_frames",
+        "unit": None,
+        "state_class": SensorStateClass.TOTAL_INCREASING,
+        "value": lambda runtime: runtime.data_retrieval.stats.failed_frames,
+    },
+    {
+        "name": "Modbus Write Queue Max Depth",
+        "unique": "poll_stats_write_queue_max_depth",
+        "unit": None,
+        "value": lambda runtime: runtime.controller.io_stats["write_queue_max_depth"],
+    },
+]
+
+
+class SolisPollStatsSensor(SensorEntity):
+    """Diagnostic sensor exposing one poll/link statistic (polled by HA, not pushed)."""
+
+    def __init__(self, config_entry: ConfigEntry, definition: dict):
+        self._config_entry = config_entry
+        self._value_fn = definition["value"]
+        controller = config_entry.runtime_data.controller
+
+        self._attr_name = definition["name"]
+        self._attr_has_entity_name = True
+        self._attr_unique_id = unique_id_generator(controller, definition["unique"])
+        self._attr_native_unit_of_measurement = definition.get("unit")
+        self._attr_state_class = definition.get("state_class", SensorStateClass.MEASUREMENT)
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+
+    async def async_update(self):
+        runtime = getattr(self._config_entry, "runtime_data", None)
+        # DataRetrieval is created after the platforms are set up.
+        if runtime is None or runtime.data_retrieval is None:
+            self._attr_native_value = None
+            return
+        self._attr_native_value = self._value_fn(runtime)
+
+    @property
+    def device_info(self):
+        """Return device info."""
+        return self._config_entry.runtime_data.controller.device_info
@@ -4,6 +4,7 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from custom_components.solis_modbus import ModbusController
+from custom_components.solis_modbus.const import RMW_MAX_RESTORED_AGE_SECONDS
 from custom_components.solis_modbus.helpers import cache_get, cache_save, get_bit_bool, set_bit, unique_id_generator
 
 _LOGGER = logging.getLogger(__name__)
@@ -82,6 +83,9 @@ class SolisSelectEntity(RestoreEntity, SelectEntity):
             if e["name"] == option:
                 if on_value is not None:
                     await self._modbus_controller.async_write_holding_register(self._register, on_value)
+                    if self._companion_writes:
+                        # The primary write has to latch before its companions.
+                        self._modbus_controller.queue_write_barrier()
                     await self._write_companions()
                     self._attr_current_option = option
                     self.async_write_ha_state()
@@ -89,6 +93,11 @@ class SolisSelectEntity(RestoreEntity, SelectEntity):
                 else:
                     await self.set_register_bit(on_value, bit_position, conflicts_with, requires)
 
+    @property
+    def polled_registers(self) -> list[int]:
+        """Registers this entity needs polled."""
+        return [self._register]
+
     @property
     def device_info(self):
         """Return device info."""
@@ -115,13 +124,13 @@ class SolisSelectEntity(RestoreEntity, SelectEntity):
     async def set_register_bit(self, on_value, bit_position, conflicts_with, requires):
         """Set or clear a specific bit in the Modbus register."""
         controller = self._modbus_controller
-        current_register_value: int = cache_get(self._hass, self._modbus_controller, self._register)
+        current_register_value: int = cache_get(self._hass, self._modbus_controller, self._register, max_restored_age=RMW_MAX_RESTORED_AGE_SECONDS)
 
         if current_register_value is None and bit_position is not None:
             # A read-modify-write from an empty cache (e.g. right after a reload,
             # before this register's group has been polled) would start from 0 and
             # clear every other bit in the register (issue #402). Read the live
-            # value from the inverter first.
+            # value from the inverter first. An old warm-start value counts as empty.
             registers = await controller.async_read_holding_register(self._register, 1)
             if not registers:
                 _LOGGER.warning(
@@ -1,13 +1,15 @@
 import logging
+import time
 from datetime import UTC, datetime, timedelta
 
 from homeassistant.components.sensor import RestoreSensor, SensorEntity
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
 
-from custom_components.solis_modbus.const import CONTROLLER, REGISTER, SLAVE, VALUE
 from custom_components.solis_modbus.data.enums import InverterType, PollSpeed
-from custom_components.solis_modbus.helpers import cache_get, is_correct_controller, register_update_signal
+from custom_components.solis_modbus.helpers import cache_get, is_correct_controller, subscribe_register_blocks
+from custom_components.solis_modbus.publish_policy import publish_gate_for
+from custom_components.solis_modbus.register_store import RegisterBlock
 from custom_components.solis_modbus.sensors.solis_base_sensor import SolisBaseSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -17,7 +19,7 @@ _WATCHDOG_TIMEOUT_MIN = 10
 class SolisSensor(RestoreSensor, SensorEntity):
     """Representation of a Modbus sensor."""
 
-    def __init__(self, hass: HomeAssistant, sensor: SolisBaseSensor):
+    def __init__(self, hass: HomeAssistant, sensor: SolisBaseSensor, deadband: bool = False):
         self._hass = hass
         self.base_sensor = sensor
 
@@ -41,8 +43,9 @@ class SolisSensor(RestoreSensor, SensorEntity):
 
         self.is_added_to_hass = False
         self._state = None
-        self._received_values = {}
         self.poll_speed = sensor.poll_speed
+        self._publish_gate = publish_gate_for(sensor) if deadband else None
+        self._heartbeat_unsub = None
 
         # Watchdog parameters
         self._last_update = datetime.now(UTC).astimezone()
@@ -69,62 +72,74 @@ class SolisSensor(RestoreSensor, SensorEntity):
             self._attr_available = False
         self.is_added_to_hass = True
 
-        for reg in set(self._register):
-            self.async_on_remove(
-                async_dispatcher_connect(
-                    self._hass,
-                    register_update_signal(self.base_sensor.controller, reg),
-                    self.handle_modbus_update,
-                )
-            )
+        self.async_on_remove(subscribe_register_blocks(self._hass, self.base_sensor.controller, self._register, self.handle_register_block))
 
     @callback
-    def handle_modbus_update(self, data):
-        """Callback when register data is available (per-register dispatcher)."""
-        updated_register = int(data.get(REGISTER))
-        updated_controller = str(data.get(CONTROLLER))
-        updated_controller_slave = int(data.get(SLAVE))
-
-        if not is_correct_controller(self.base_sensor.controller, updated_controller, updated_controller_slave):
+    def handle_register_block(self, block: RegisterBlock):
+        """Callback when a block covering one of this sensor's registers was read (or written)."""
+        if not is_correct_controller(self.base_sensor.controller, block.host, block.slave):
             return  # meant for a different sensor/inverter combo
 
         if not self.base_sensor.enabled:
             return
 
-        if updated_register in self._register:
-            # Causes issues with grid inverters going offline, and messing up energy dashboard
-            if self.base_sensor.controller.inverter_config.type == InverterType.GRID and 3014 == updated_register:
-                if cache_get(self.hass, self.base_sensor.controller, 3043) == 2:
-                    self._attr_native_value = 0
-                    self.schedule_update_ha_state()
-                    self._last_update = datetime.now(UTC).astimezone()
-                    return
-
-            updated_value = int(data.get(VALUE))
-            self._received_values[updated_register] = updated_value
-
-            # If we haven't received all registers yet, wait
-            if not all(reg in self._received_values for reg in self._register):
-                _LOGGER.debug("not all values received yet = %s", self._received_values)
+        # Causes issues with grid inverters going offline, and messing up energy dashboard
+        if 3014 in self._register and 3014 in block and self.base_sensor.controller.inverter_config.type == InverterType.GRID:
+            if cache_get(self._hass, self.base_sensor.controller, 3043) == 2:
+                self._attr_native_value = 0
+                self.schedule_update_ha_state()
+                self._last_update = datetime.now(UTC).astimezone()
                 return
 
-            values = [self._received_values[reg] for reg in self._register]
-            if None in values:
-                problematic_regs = {reg: self._received_values.get(reg) for reg in self._register if self._received_values.get(reg) is None}
-                if problematic_regs:
-                    _LOGGER.debug(f"⚠️ Problematic values received in registrars: {problematic_regs}, skipping update")
-                    return
-
-            new_value = self.base_sensor.convert_value(values)
-            # Clear received values after update
-            self._received_values.clear()
-
-            # Update state if valid value exists
-            if new_value is not None:
-                self._attr_native_value = new_value
-                self._attr_available = True
-                self._last_update = datetime.now(UTC).astimezone()
-                self.schedule_update_ha_state()
+        # A multi-register value read in one block is decoded from that single read.
+        new_value = self.base_sensor.value_from_block(block)
+
+        # Update state if valid value exists
+        if new_value is not None:
+            self._last_update = datetime.now(UTC).astimezone()
+            if not self._admit(new_value):
+                self._schedule_heartbeat()
+                return  # insignificant change; the watchdog still counts it as an update
+            self._cancel_heartbeat()
+            self._attr_native_value = new_value
+            self._attr_available = True
+            self.schedule_update_ha_state()
+
+    def _admit(self, new_value) -> bool:
+        """Whether the publish policy lets this value through (always, without one or after being unavailable)."""
+        gate = self._publish_gate
+        if gate is None:
+            return True
+        if not self._attr_available:
+            gate.reset()
+        return gate.admit(new_value, time.monotonic())
+
+    def _schedule_heartbeat(self) -> None:
+        """Publish the held-back value at its heartbeat even if no further value arrives."""
+        if self._heartbeat_unsub is not None:
+            return  # armed by an earlier held-back value; the deadline has not moved
+        delay = self._publish_gate.heartbeat_in(time.monotonic())
+        if delay is not None:
+            self._heartbeat_unsub = async_call_later(self._hass, delay, self._heartbeat)
+
+    def _cancel_heartbeat(self) -> None:
+        if self._heartbeat_unsub is not None:
+            self._heartbeat_unsub()
+            self._heartbeat_unsub = None
+
+    @callback
+    def _heartbeat(self, _now) -> None:
+        self._heartbeat_unsub = None
+        if not self._attr_available:
+            return  # the held-back value went stale with the entity
+        value = self._publish_gate.release(time.monotonic())
+        if value is not None:
+            self._attr_native_value = value
+            self.schedule_update_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._cancel_heartbeat()
+        await super().async_will_remove_from_hass()
 
     async def async_update(self):
         """Fallback-Check: If no update for more than _WATCHDOG_TIMEOUT_MIN minutes, set values to 0 or unavailable"""
@@ -135,6 +150,11 @@ class SolisSensor(RestoreSensor, SensorEntity):
             self._attr_available = False  # Set attribute unavailable (if desired)
             self.schedule_update_ha_state()
 
+    @property
+    def polled_registers(self) -> list[int]:
+        """Registers this entity needs polled (grid inverters zero 3014 while 3043 reports them offline)."""
+        return [*self._register, 3043] if 3014 in self._register else self._register
+
     @property
     def device_info(self):
         """Return device info."""
@@ -0,0 +1,181 @@
+"""Declarative spike filters for noisy registers.
+
+Some inverters briefly report readings that are not real: battery SOC pinned to
+0 or 100 for a poll, wrap-around values like 65526 W on the backup load, or a
+grid/PV power far beyond anything the installation can carry (see
+https://github.com/Pho3niX90/solis_modbus/issues/138). An entity definition can
+declare how its readings are checked with a ``spike_filter`` entry::
+
+    "spike_filter": {"suspect_values": [0, 100]}                   # SOC edges
+    "spike_filter": {"max": 64999, "max_rated": 2, "max_floor": 10000}
+    "spike_filter": {"max_step": 5000, "confirmations": 2, "median_of": 3}
+
+Checks run on the entity's decoded value (its unit, signed where it is signed):
+
+- ``suspect_values``: values only believed once confirmed.
+- ``max``: a magnitude above this is implausible.
+- ``max_rated`` / ``max_floor``: a magnitude above ``max_rated`` times the
+  inverter rating (in the entity's unit), but never below ``max_floor``, is
+  implausible.
+- ``max_step``: a change larger than this from the last accepted value is
+  suspect.
+- ``confirmations`` (default 3): consecutive suspect reads before one is
+  accepted. Until then the previous registers are kept.
+- ``median_of``: publish the median of the last k accepted reads.
+
+Rules are compiled into an index by register when the poll groups change, so a
+block without filtered entities costs one range lookup and registers without a
+rule never enter the filter path.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CONFIRMATIONS = 3
+
+
+@dataclass(frozen=True, slots=True)
+class SpikeRule:
+    """The checks one entity's readings go through (see the module docstring for the definition keys)."""
+
+    suspect_values: frozenset = frozenset()
+    max_value: float | None = None
+    max_rated: float | None = None
+    max_floor: float = 0
+    max_step: float | None = None
+    confirmations: int = DEFAULT_CONFIRMATIONS
+    median_of: int = 1
+
+    @classmethod
+    def from_definition(cls, spec: dict) -> SpikeRule:
+        return cls(
+            suspect_values=frozenset(spec.get("suspect_values", ())),
+            max_value=spec.get("max"),
+            max_rated=spec.get("max_rated"),
+            max_floor=spec.get("max_floor", 0),
+            max_step=spec.get("max_step"),
+            confirmations=max(1, int(spec.get("confirmations", DEFAULT_CONFIRMATIONS))),
+            median_of=max(1, int(spec.get("median_of", 1))),
+        )
+
+    def plausible_max(self, rating: float | None) -> float | None:
+        """The largest believable magnitude, given the inverter rating in the entity's unit (None when unknown)."""
+        bounds = [bound for bound in (self.max_value,) if bound is not None]
+        if self.max_rated is not None:
+            bounds.append(max(self.max_floor, self.max_rated * rating) if rating else self.max_floor)
+        return min(bounds) if bounds else None
+
+
+@dataclass(eq=False, slots=True)
+class EntityFilter:
+    """A rule bound to one entity's registers, with its confirmation counter and median window."""
+
+    sensor: Any  # SolisBaseSensor
+    rule: SpikeRule
+    registers: tuple[int, ...]
+    suspect_count: int = 0
+    held: int = 0
+    window: deque = field(default_factory=deque)
+
+    def _rating(self) -> float | None:
+        return self.sensor._inverter_rating_max() if self.rule.max_rated is not None else None
+
+    def _suspect(self, value, previous) -> str | None:
+        rule = self.rule
+        if value in rule.suspect_values:
+            return "suspect value"
+        limit = rule.plausible_max(self._rating())
+        if limit is not None and abs(value) > limit:
+            return f"outside ±{limit}"
+        if rule.max_step is not None and previous is not None and abs(value - previous) > rule.max_step:
+            return f"jump from {previous}"
+        return None
+
+    def apply(self, raw: list[int], previous_raw: list | None) -> list:
+        """The raw registers to keep for this read: ``raw``, the previous registers while a spike is held, or the median read."""
+        value = self.sensor.convert_value(raw)
+        previous = self.sensor.convert_value(previous_raw) if previous_raw is not None else None
+        reason = self._suspect(value, previous) if value is not None else None
+        if reason is None:
+            self.suspect_count = 0
+        else:
+            self.suspect_count += 1
+            if self.suspect_count < self.rule.confirmations and previous is not None:
+                self.held += 1
+                _LOGGER.debug(
+                    "Ignoring short spike %s (%s) for %s; retaining previous value %s (counter=%s)",
+                    value,
+                    reason,
+                    self.sensor.name,
+                    previous,
+                    self.suspect_count,
+                )
+                return previous_raw
+            _LOGGER.debug("Accepting persistent value %s (%s) for %s after %s reads", value, reason, self.sensor.name, self.suspect_count)
+            self.suspect_count = 0
+        if self.rule.median_of == 1:
+            return raw
+        self.window.append((value, list(raw)))
+        while len(self.window) > self.rule.median_of:
+            self.window.popleft()
+        ordered = sorted(self.window, key=lambda item: item[0])
+        return ordered[(len(ordered) - 1) // 2][1]
+
+
+class SpikeFilters:
+    """The spike filters of one controller's polled entities, indexed by first register."""
+
+    def __init__(self):
+        self._groups = None
+        self._starts: list[int] = []
+        self._filters: dict[int, EntityFilter] = {}
+
+    def refresh(self, groups: Iterable) -> None:
+        """Re-index when the poll groups changed (split after a failed read, ONCE groups dropped); counters carry over."""
+        if groups is self._groups:
+            return
+        self._groups = groups
+        previous = {id(entity_filter.sensor): entity_filter for entity_filter in self._filters.values()}
+        filters: dict[int, EntityFilter] = {}
+        for group in groups:
+            for sensor in getattr(group, "sensors", ()):
+                rule = getattr(sensor, "spike_filter", None)
+                if not isinstance(rule, SpikeRule):
+                    continue
+                registers = tuple(sensor.registrars)
+                filters[registers[0]] = previous.get(id(sensor)) or EntityFilter(sensor, rule, registers)
+        self._filters = filters
+        self._starts = sorted(filters)
+
+    def filter_block(self, start: int, values: list[int], previous: Callable[[int], Any]) -> list[int]:
+        """``values`` read from ``start`` with the filtered entities' spikes held back. ``previous`` gives a register's stored value."""
+        low = bisect.bisect_left(self._starts, start)
+        high = bisect.bisect_left(self._starts, start + len(values))
+        if low == high:
+            return values
+        values = list(values)
+        for first in self._starts[low:high]:
+            entity_filter = self._filters[first]
+            offset = first - start
+            width = len(entity_filter.registers)
+            if offset + width > len(values):
+                continue  # entity cut by a split block; filtered once it is read whole again
+            raw = values[offset : offset + width]
+            previous_raw = [previous(register) for register in entity_filter.registers]
+            kept = entity_filter.apply(raw, None if None in previous_raw else previous_raw)
+            values[offset : offset + width] = kept
+        return values
+
+    def __contains__(self, register: int) -> bool:
+        return register in self._filters
+
+    def as_dict(self) -> dict:
+        return {entity_filter.sensor.name: entity_filter.held for entity_filter in self._filters.values() if entity_filter.held}
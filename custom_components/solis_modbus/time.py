@@ -1,22 +1,21 @@
 import logging
-from datetime import UTC, datetime, time
+from datetime import time
 
-from homeassistant.components.sensor import RestoreSensor, SensorDeviceClass
+from homeassistant.components.sensor import RestoreSensor
 from homeassistant.components.time import TimeEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from custom_components.solis_modbus import ModbusController
-from custom_components.solis_modbus.const import CONTROLLER, REGISTER, SLAVE, VALUE
 from custom_components.solis_modbus.helpers import (
-    cache_get,
     get_controller_from_entry,
+    get_register_store,
     is_correct_controller,
     is_essential_only,
-    register_update_signal,
+    subscribe_register_blocks,
     unique_id_generator,
 )
+from custom_components.solis_modbus.register_store import RegisterBlock
 from custom_components.solis_modbus.sensor_data.time_sensors import get_time_sensors
 
 _LOGGER = logging.getLogger(__name__)
@@ -65,8 +64,6 @@ class SolisTimeEntity(RestoreSensor, TimeEntity):
         self._attr_device_class = entity_definition.get("device_class", None)
         self._attr_available = True
 
-        self._received_values = {}
-
     async def async_added_to_hass(self) -> None:
         """Called when entity is added to HA."""
         await super().async_added_to_hass()
@@ -74,64 +71,38 @@ class SolisTimeEntity(RestoreSensor, TimeEntity):
         if state:
             self._attr_native_value = state.native_value
 
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self._hass,
-                register_update_signal(self._modbus_controller, self._register),
-                self.handle_modbus_update,
-            )
-        )
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self._hass,
-                register_update_signal(self._modbus_controller, self._register + 1),
-                self.handle_modbus_update,
-            )
-        )
+        self.async_on_remove(subscribe_register_blocks(self._hass, self._modbus_controller, [self._register, self._register + 1], self.handle_register_block))
 
     @callback
-    def handle_modbus_update(self, data):
-        """Callback when register data is available (per-register dispatcher)."""
-        updated_register = int(data.get(REGISTER))
-        updated_controller = str(data.get(CONTROLLER))
-        updated_controller_slave = int(data.get(SLAVE))
-
-        if not is_correct_controller(self._modbus_controller, updated_controller, updated_controller_slave):
+    def handle_register_block(self, block: RegisterBlock):
+        """Callback when a block covering the hour or minute register was read (or written)."""
+        if not is_correct_controller(self._modbus_controller, block.host, block.slave):
             return  # meant for a different sensor/inverter combo
 
-        if updated_register in (self._register, self._register + 1):
-            value = data.get(VALUE)
-            if self._attr_device_class == SensorDeviceClass.TIMESTAMP:
-                if isinstance(value, datetime):
-                    updated_value = value
-                else:
-                    updated_value = datetime.now(UTC)
-            elif value is None:
-                return  # nothing usable to decode; int(None) would raise in the dispatcher
+        # Hour and minute are read together; whichever is outside this block comes from the store.
+        hour, minute = get_register_store(self._hass, self._modbus_controller, create=True).values_for((self._register, self._register + 1), block)
+        _LOGGER.debug(f"Time update received, regs = {self._register}:{self._register + 1}, values = {hour}:{minute}")
+
+        if hour is not None and minute is not None:
+            hour, minute = int(hour), int(minute)
+
+            if 0 <= minute <= 59 and 0 <= hour <= 23:
+                _LOGGER.debug(f"✅ Time updated to {hour}:{minute}, regs = {self._register}:{self._register + 1}")
+                self._attr_native_value = time(hour=hour, minute=minute)
+                self._attr_available = True
             else:
-                updated_value = int(value)
-            _LOGGER.debug(f"Sensor update received, register = {updated_register}, value = {updated_value}")
-            self._received_values[updated_register] = updated_value
-
-            if updated_value is not None:
-                hour = cache_get(self._hass, self._modbus_controller, self._register)
-                minute = cache_get(self._hass, self._modbus_controller, self._register + 1)
-
-                if hour is not None and minute is not None:
-                    hour, minute = int(hour), int(minute)
-
-                    if 0 <= minute <= 59 and 0 <= hour <= 23:
-                        _LOGGER.debug(f"✅ Time updated to {hour}:{minute}, regs = {self._register}:{self._register + 1}")
-                        self._attr_native_value = time(hour=hour, minute=minute)
-                        self._attr_available = True
-                    else:
-                        self._attr_available = False
-                        _LOGGER.debug(f"⚠️ Time disabled due to invalid values {hour}:{minute}, regs = {self._register}:{self._register + 1}")
-                else:
-                    self._attr_available = False
-                    _LOGGER.debug(f"⚠️ Time disabled because hour or minute is None, regs = {self._register}:{self._register + 1}")
-
-                self.schedule_update_ha_state()
+                self._attr_available = False
+                _LOGGER.debug(f"⚠️ Time disabled due to invalid values {hour}:{minute}, regs = {self._register}:{self._register + 1}")
+        else:
+            self._attr_available = False
+            _LOGGER.debug(f"⚠️ Time disabled because hour or minute is None, regs = {self._register}:{self._register + 1}")
+
+        self.schedule_update_ha_state()
+
+    @property
+    def polled_registers(self) -> list[int]:
+        """Registers this entity needs polled: hour and minute."""
+        return [self._register, self._register + 1]
 
     @property
     def device_info(self):
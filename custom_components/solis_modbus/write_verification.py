@@ -0,0 +1,69 @@
+"""Read back just-written holding registers to confirm what the inverter kept.
+
+A write updates the register cache from the write echo, but firmware can clamp
+or ignore a setpoint; without verification the real value only shows up with
+the next SLOW poll of the holding group. With the ``verify_writes`` option on,
+the write queue remembers the values it wrote and, once a write burst has
+settled, reads back each contiguous run of written registers in one frame and
+publishes what the inverter reports. A register that reads back different from
+what was written fires ``EVENT_WRITE_MISMATCH``.
+"""
+
+from __future__ import annotations
+
+from .read_planner import MAX_READ_REGISTERS
+
+# Wait this long after the write queue ran dry before reading back, so writes
+# of the same burst (and the firmware applying them) land in one verification.
+VERIFY_SETTLE_SECONDS = 0.5
+
+
+class WriteVerifier:
+    """The written values of one controller still waiting to be read back."""
+
+    def __init__(self):
+        self._expected: dict[int, int] = {}
+        self.verified = 0
+        self.mismatches = 0
+        self.failed_reads = 0
+
+    def expect(self, start_register: int, values: list[int]) -> None:
+        """Remember values written from ``start_register``; a later write to a register replaces its expectation."""
+        for offset, value in enumerate(values):
+            self._expected[int(start_register) + offset] = int(value)
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._expected)
+
+    def blocks(self) -> list[tuple[int, int]]:
+        """(start, count) of the fewest reads covering the pending registers: one per contiguous run."""
+        blocks: list[list[int]] = []
+        for register in sorted(self._expected):
+            if blocks and register == blocks[-1][0] + blocks[-1][1] and blocks[-1][1] < MAX_READ_REGISTERS:
+                blocks[-1][1] += 1
+            else:
+                blocks.append([register, 1])
+        return [(start, count) for start, count in blocks]
+
+    def check(self, start_register: int, values: list[int]) -> list[tuple[int, int, int]]:
+        """Settle the expectations a read-back covers. Returns (register, written, read) for each mismatch."""
+        mismatches = []
+        for offset, value in enumerate(values):
+            written = self._expected.pop(start_register + offset, None)
+            if written is None:
+                continue
+            self.verified += 1
+            if int(value) != written:
+                mismatches.append((start_register + offset, written, int(value)))
+        self.mismatches += len(mismatches)
+        return mismatches
+
+    def discard(self, start_register: int, count: int) -> None:
+        """Give up on a block whose read-back failed (the next poll of its group refreshes it)."""
+        self.failed_reads += 1
+        for register in range(start_register, start_register + count):
+            self._expected.pop(register, None)
+
+    def as_dict(self) -> dict:
+        return {"verified": self.verified, "mismatches": self.mismatches, "failed_reads": self.failed_reads, "pending": len(self._expected)}
@@ -16,15 +16,8 @@ sys.path.insert(0, str(ROOT))
 
 from custom_components.solis_modbus.data.enums import InverterFeature, InverterType  # noqa: E402
 from custom_components.solis_modbus.data.solis_config import InverterConfig, InverterOptions  # noqa: E402
-from custom_components.solis_modbus.sensor_data.hybrid_sensors import (  # noqa: E402
-    hybrid_sensors,
-    hybrid_sensors_derived,
-)
+from custom_components.solis_modbus.definition_registry import load_definitions  # noqa: E402
 from custom_components.solis_modbus.sensor_data.select_sensors import get_select_sensors  # noqa: E402
-from custom_components.solis_modbus.sensor_data.string_sensors import (  # noqa: E402
-    string_sensors,
-    string_sensors_derived,
-)
 from custom_components.solis_modbus.sensor_data.switch_sensors import get_switch_sensors  # noqa: E402
 from custom_components.solis_modbus.sensor_data.time_sensors import get_time_sensors  # noqa: E402
 
@@ -226,6 +219,10 @@ def main() -> None:
 
     hybrid_cfg = hybrid_config_all_features()
     string_cfg = string_config()
+    hybrid = load_definitions("hybrid")
+    string = load_definitions("string")
+    hybrid_sensors, hybrid_sensors_derived = hybrid.groups, hybrid.derived
+    string_sensors, string_sensors_derived = string.groups, string.derived
 
     hybrid_entities = list(iter_sensor_entities(hybrid_sensors))
     string_entities = list(iter_sensor_entities(string_sensors))
@@ -0,0 +1,244 @@
+"""End-to-end poll benchmark against the offline inverter simulator.
+
+Drives a real ModbusController + DataRetrieval (read planner, recovery, spike
+filter, register store, block decode and publish) against ``SimulatedInverter``
+and reports, per poll cycle: frames on the link, wall-clock cycle duration,
+event-loop CPU time, entity callbacks, and (with ``--trace-alloc``) allocations.
+
+Every non-reserve sensor gets a listener that decodes its value the way its
+entity would, so callback counts and loop time include the entity side.
+
+    python tests/benchmark_poll.py --inverter hybrid --cycles 20 --latency 0.05 --jitter 0.01
+    python tests/benchmark_poll.py --inverter string --drop-rate 0.02 --timeout 0.2 --hole 3100
+
+Runs entirely offline; no Home Assistant instance or inverter is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from simulator import REGISTER_MAPS, LinkProfile, SimulatedInverter  # noqa: E402
+
+from custom_components.solis_modbus.client_manager import LinkPacer, ModbusClientManager  # noqa: E402
+from custom_components.solis_modbus.const import DOMAIN, VALUES  # noqa: E402
+from custom_components.solis_modbus.data.enums import PollSpeed  # noqa: E402
+from custom_components.solis_modbus.data.solis_config import InverterConfig, InverterOptions, InverterType  # noqa: E402
+from custom_components.solis_modbus.data_retrieval import DataRetrieval  # noqa: E402
+from custom_components.solis_modbus.helpers import subscribe_register_blocks  # noqa: E402
+from custom_components.solis_modbus.modbus_controller import ModbusController  # noqa: E402
+from custom_components.solis_modbus.sensors.solis_base_sensor import SolisSensorGroup  # noqa: E402
+
+SPEEDS = {
+    "fast": (PollSpeed.FAST,),
+    "normal": (PollSpeed.NORMAL, PollSpeed.ONCE),
+    "slow": (PollSpeed.SLOW,),
+    "all": (PollSpeed.FAST, PollSpeed.NORMAL, PollSpeed.SLOW, PollSpeed.ONCE),
+}
+
+
+class _BenchBus:
+    def async_listen_once(self, event_type, listener):
+        return lambda: None
+
+
+class _BenchConfigEntries:
+    def async_entries(self, domain=None):
+        return []
+
+
+class BenchHass:
+    """The slice of HomeAssistant the poll path touches, for running it outside HA."""
+
+    is_running = False
+
+    def __init__(self):
+        self.data = {DOMAIN: {VALUES: {}}}
+        self.bus = _BenchBus()
+        self.config_entries = _BenchConfigEntries()
+
+    def async_add_executor_job(self, target, *args):
+        return asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+
+@dataclass
+class CycleReport:
+    frames: int
+    registers: int
+    duration_s: float
+    loop_cpu_s: float
+    callbacks: int
+    dropped: int
+    desynced: int
+    exceptions: int
+    alloc_blocks: int | None = None
+    alloc_peak_bytes: int | None = None
+
+
+class PollBenchmark:
+    """One simulated inverter on its own link, polled by the integration's real poll path."""
+
+    _instances = 0
+
+    def __init__(self, inverter: str = "hybrid", profile: LinkProfile | None = None, *, inter_frame_ms: float = 0.0, slave: int = 1):
+        PollBenchmark._instances += 1
+        self.hass = BenchHass()
+        self.simulator = SimulatedInverter.for_inverter(inverter, profile)
+        inverter_type = InverterType.HYBRID if inverter == "hybrid" else InverterType.STRING
+        options = InverterOptions(pv=True, generator=True, battery=True, hv_battery=False, v2=True, ac_coupling=False)
+        config = InverterConfig(model="SIMULATED", wattage=[10000], phases=3, type=inverter_type, options=options)
+
+        self.controller = ModbusController(
+            hass=self.hass,
+            inverter_config=config,
+            host=f"simulator-{PollBenchmark._instances}",
+            device_id=slave,
+        )
+        self.use_client(self.simulator)
+        # Fixed pacing, so runs compare the poll path rather than what the pacer learned.
+        manager = ModbusClientManager.get_instance()
+        manager._clients[self.controller.connection_id]["pacer"] = LinkPacer(initial_ms=inter_frame_ms, min_ms=inter_frame_ms, max_ms=max(inter_frame_ms, 1.0))
+
+        features = config.features
+        self.controller._sensor_groups = [
+            SolisSensorGroup(hass=self.hass, definition=group, controller=self.controller)
+            for group in REGISTER_MAPS[inverter]
+            if not group.get("feature_requirement") or any(feature in features for feature in group["feature_requirement"])
+        ]
+        self.retrieval = DataRetrieval(self.hass, self.controller)
+        self.callbacks = 0
+        self._unsubscribe = [self._subscribe(sensor) for group in self.controller.sensor_groups for sensor in group.sensors if sensor.name != "reserve"]
+
+    def use_client(self, client) -> None:
+        """Put ``client`` on the controller's link in place of a pymodbus client."""
+        self.controller.client = client
+        ModbusClientManager.get_instance()._clients[self.controller.connection_id]["client"] = client
+
+    def _subscribe(self, sensor):
+        def _entity(block) -> None:
+            self.callbacks += 1
+            sensor.value_from_block(block)
+
+        return subscribe_register_blocks(self.hass, self.controller, sensor.registrars, _entity)
+
+    async def run_cycle(self, speeds=SPEEDS["all"], *, trace_alloc: bool = False) -> CycleReport:
+        """Move the simulated values, then poll every group of ``speeds`` once."""
+        self.simulator.tick()
+        self.simulator.counters.reset()
+        self.callbacks = 0
+        groups = [group for group in self.controller.sensor_groups if group.poll_speed in speeds]
+        # What the connection watchdog does after a dropped frame closed the client.
+        await self.controller.connect()
+
+        if trace_alloc:
+            tracemalloc.start()
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+        cpu_started, started = time.thread_time(), time.perf_counter()
+        await self.retrieval.get_modbus_updates(groups, PollSpeed.NORMAL)
+        duration, loop_cpu = time.perf_counter() - started, time.thread_time() - cpu_started
+        alloc_blocks = alloc_peak = None
+        if trace_alloc:
+            after = tracemalloc.take_snapshot()
+            alloc_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            alloc_blocks = sum(stat.count_diff for stat in after.compare_to(before, "lineno") if stat.count_diff > 0)
+
+        counters = self.simulator.counters
+        return CycleReport(
+            frames=counters.frames,
+            registers=counters.registers,
+            duration_s=duration,
+            loop_cpu_s=loop_cpu,
+            callbacks=self.callbacks,
+            dropped=counters.dropped,
+            desynced=counters.desynced,
+            exceptions=counters.exceptions,
+            alloc_blocks=alloc_blocks,
+            alloc_peak_bytes=alloc_peak,
+        )
+
+    async def start(self) -> None:
+        await self.controller.connect()
+
+    def close(self) -> None:
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        ModbusClientManager.get_instance().release_client(self.controller.connection_id)
+
+
+def summarize(reports: list[CycleReport]) -> dict:
+    """Median/max of each metric; the first cycle (ONCE groups, cold store) is reported apart."""
+    steady = reports[1:] or reports
+    summary = {"first_cycle": asdict(reports[0]), "cycles": len(reports)}
+    for metric in ("frames", "registers", "duration_s", "loop_cpu_s", "callbacks", "alloc_blocks", "alloc_peak_bytes"):
+        values = [getattr(report, metric) for report in steady if getattr(report, metric) is not None]
+        if values:
+            summary[metric] = {"median": statistics.median(values), "max": max(values)}
+    for metric in ("dropped", "desynced", "exceptions"):
+        summary[metric] = sum(getattr(report, metric) for report in reports)
+    return summary
+
+
+async def run(args: argparse.Namespace) -> dict:
+    profile = LinkProfile(
+        latency_s=args.latency,
+        jitter_s=args.jitter,
+        drop_rate=args.drop_rate,
+        desync_rate=args.desync_rate,
+        holes=frozenset(args.hole),
+        change_ratio=args.change_ratio,
+        timeout_s=args.timeout,
+        seed=args.seed,
+    )
+    bench = PollBenchmark(args.inverter, profile, inter_frame_ms=args.inter_frame_ms)
+    if args.capture:
+        bench.controller.start_frame_capture(args.capture)
+    try:
+        await bench.start()
+        reports = [await bench.run_cycle(SPEEDS[args.speed], trace_alloc=args.trace_alloc) for _ in range(args.cycles)]
+    finally:
+        await bench.controller.async_stop_frame_capture()
+        bench.close()
+    summary = summarize(reports)
+    stats = bench.retrieval.stats.as_dict()
+    summary["poll_stats"] = {key: stats[key] for key in ("failed_frames", "retries", "bisection_probes", "dispatched_registers", "suppressed_registers")}
+    return summary
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inverter", choices=sorted(REGISTER_MAPS), default="hybrid")
+    parser.add_argument("--speed", choices=sorted(SPEEDS), default="all")
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per frame")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- seconds per frame")
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--desync-rate", type=float, default=0.0)
+    parser.add_argument("--hole", type=int, action="append", default=[], help="register answering exception 2 (repeatable)")
+    parser.add_argument("--change-ratio", type=float, default=0.1, help="share of registers changing per cycle")
+    parser.add_argument("--timeout", type=float, default=5.0, help="client timeout for dropped frames")
+    parser.add_argument("--inter-frame-ms", type=float, default=0.0)
+    parser.add_argument("--trace-alloc", action="store_true", help="count allocations per cycle (slow)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--capture", help="record the run's Modbus frames to this NDJSON file (replay with replay_capture.py)")
+    parser.add_argument("--log-level", default="CRITICAL", help="integration log level (read errors log at ERROR)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=args.log_level)
+    print(json.dumps(asyncio.run(run(args)), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
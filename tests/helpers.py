@@ -0,0 +1,25 @@
+"""Fakes shared by the poll-planning, scheduling and retrieval tests."""
+
+from unittest.mock import MagicMock
+
+from custom_components.solis_modbus.data.enums import PollSpeed
+
+
+def mock_group(start: int, count: int = 2, poll_speed: PollSpeed = PollSpeed.FAST):
+    """A sensor group stand-in covering ``count`` registers from ``start``, without sensors."""
+    g = MagicMock()
+    g.start_register = start
+    g.registrar_count = count
+    g.poll_speed = poll_speed
+    g.sensors = []
+    return g
+
+
+class Clock:
+    """A monotonic clock the test moves by setting ``now``."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
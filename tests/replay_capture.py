@@ -0,0 +1,96 @@
+"""Replay a Modbus frame capture through the integration's real poll path.
+
+A capture comes from the ``solis_modbus.solis_capture_frames`` service (or
+``benchmark_poll.py --capture``). ``ReplayClient`` stands in for the link and
+answers each request with the captured answer to that same request, so the
+read planner, recovery, spike filter and decoders see exactly what they saw
+on the user's system, including exception responses, timeouts and latency.
+
+    python tests/replay_capture.py solis_modbus_capture_192_168_1_50_1.ndjson --inverter hybrid
+    python tests/replay_capture.py capture.ndjson --speed 10 --log-level DEBUG
+
+Poll cycles run until the capture is used up or a cycle replays nothing (the
+integration no longer asks what the capture holds). Runs entirely offline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmark_poll import PollBenchmark  # noqa: E402
+from simulator import REGISTER_MAPS  # noqa: E402
+
+from custom_components.solis_modbus.data.enums import PollSpeed  # noqa: E402
+from custom_components.solis_modbus.frame_capture import ReplayClient, load_capture  # noqa: E402
+from custom_components.solis_modbus.helpers import get_register_store  # noqa: E402
+
+
+async def replay(path: str, inverter: str = "hybrid", speed: float = 0.0, max_cycles: int = 1000) -> tuple[PollBenchmark, ReplayClient, dict]:
+    """Poll ``inverter``'s sensor groups against the capture at ``path``. The caller closes the returned bench."""
+    frames = load_capture(path)
+    slave = frames[0].slave if frames else 1
+    bench = PollBenchmark(inverter, slave=slave)
+    client = ReplayClient(frames, speed)
+    bench.use_client(client)
+    await bench.start()
+
+    durations, callbacks = [], []
+    while client.remaining and len(durations) < max_cycles:
+        replayed, bench.callbacks = client.replayed, 0
+        started = time.perf_counter()
+        await bench.retrieval.get_modbus_updates(bench.controller.sensor_groups, PollSpeed.NORMAL)
+        durations.append(time.perf_counter() - started)
+        callbacks.append(bench.callbacks)
+        if client.replayed == replayed:
+            break
+
+    stats = bench.retrieval.stats.as_dict()
+    summary = {
+        "frames": len(frames),
+        "replayed": client.replayed,
+        "unmatched": client.unmatched,
+        "remaining": client.remaining,
+        "cycles": len(durations),
+        "duration_s": {"median": statistics.median(durations), "max": max(durations)} if durations else None,
+        "callbacks": sum(callbacks),
+        "poll_stats": {key: stats[key] for key in ("failed_frames", "retries", "bisection_probes", "dispatched_registers", "suppressed_registers")},
+    }
+    return bench, client, summary
+
+
+async def run(args: argparse.Namespace) -> dict:
+    bench, _client, summary = await replay(args.path, args.inverter, args.speed, args.cycles)
+    try:
+        if args.registers:
+            store = get_register_store(bench.hass, bench.controller)
+            summary["registers"] = dict(sorted(store.items())) if store is not None else {}
+    finally:
+        bench.close()
+    return summary
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="capture file (rotated .1, .2 ... files next to it are included)")
+    parser.add_argument("--inverter", choices=sorted(REGISTER_MAPS), default="hybrid", help="register map the capture was made with")
+    parser.add_argument("--speed", type=float, default=0.0, help="replay speed: 1 = captured latency, 10 = ten times faster, 0 = no waiting")
+    parser.add_argument("--cycles", type=int, default=1000, help="stop after this many poll cycles")
+    parser.add_argument("--registers", action="store_true", help="include the final register values")
+    parser.add_argument("--log-level", default="CRITICAL", help="integration log level (read errors log at ERROR)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=args.log_level)
+    print(json.dumps(asyncio.run(run(args)), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Offline stand-in for a Solis inverter behind a Modbus link.
+
+``SimulatedInverter`` answers the same client calls ModbusController makes on a
+pymodbus ``AsyncModbusTcpClient`` (read input/holding registers, write single
+and multiple registers, connect/close), with register values seeded from the
+integration's own register maps. A ``LinkProfile`` shapes the link: per-frame
+latency and jitter, dropped frames (answered by a pymodbus I/O error after the
+client timeout), exception-2 holes, and transaction-ID desync, where a frame is
+answered with the payload meant for the previous request, as S2-WL sticks do
+when hurried.
+
+Used by tests/benchmark_poll.py; nothing here opens a socket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from pymodbus.exceptions import ModbusIOException
+from pymodbus.pdu import ExceptionResponse
+from pymodbus.pdu.register_message import (
+    ReadHoldingRegistersResponse,
+    ReadInputRegistersResponse,
+    WriteMultipleRegistersResponse,
+    WriteSingleRegisterResponse,
+)
+
+from custom_components.solis_modbus.sensor_data.hybrid_sensors import hybrid_sensors
+from custom_components.solis_modbus.sensor_data.string_sensors import string_sensors
+
+REGISTER_MAPS = {
+    "hybrid": hybrid_sensors,
+    "string": string_sensors,
+}
+
+_FC_READ_HOLDING = 3
+_FC_READ_INPUT = 4
+_ILLEGAL_DATA_ADDRESS = 2
+
+
+@dataclass
+class LinkProfile:
+    """How the simulated link behaves. Rates are per frame, 0.0-1.0."""
+
+    latency_s: float = 0.0
+    jitter_s: float = 0.0
+    drop_rate: float = 0.0
+    desync_rate: float = 0.0
+    # Registers that answer exception 2 (illegal data address) for any frame covering them.
+    holes: frozenset[int] = field(default_factory=frozenset)
+    # Share of mapped registers whose value moves between poll cycles (see SimulatedInverter.tick).
+    change_ratio: float = 0.1
+    # What the client waits before giving up on a dropped frame (the integration uses 5 s).
+    timeout_s: float = 5.0
+    seed: int = 0
+
+
+@dataclass
+class LinkCounters:
+    frames: int = 0
+    registers: int = 0
+    dropped: int = 0
+    desynced: int = 0
+    exceptions: int = 0
+    writes: int = 0
+
+    def reset(self) -> None:
+        self.frames = self.registers = self.dropped = self.desynced = self.exceptions = self.writes = 0
+
+
+def mapped_registers(definitions: Iterable[dict]) -> list[int]:
+    """Every register an entity of the register map reads, in address order."""
+    return sorted({int(register) for group in definitions for entity in group.get("entities", []) for register in entity.get("register", [])})
+
+
+class SimulatedInverter:
+    """Pymodbus client stand-in serving one register map for one or more slaves."""
+
+    def __init__(self, definitions: Iterable[dict], profile: LinkProfile | None = None):
+        self.profile = profile or LinkProfile()
+        self.counters = LinkCounters()
+        self._random = random.Random(self.profile.seed)
+        self._mapped = mapped_registers(definitions)
+        self.registers: dict[int, int] = {register: self._random.randint(0, 5000) for register in self._mapped}
+        self._previous_answer: list[int] | None = None
+        self.connected = False
+
+    @classmethod
+    def for_inverter(cls, inverter: str, profile: LinkProfile | None = None) -> SimulatedInverter:
+        """A simulator seeded from the ``"hybrid"`` or ``"string"`` register map."""
+        return cls(REGISTER_MAPS[inverter], profile)
+
+    def tick(self) -> int:
+        """Move ``change_ratio`` of the mapped registers to new values, like a live inverter between polls. Returns how many moved."""
+        moved = self._random.sample(self._mapped, round(len(self._mapped) * self.profile.change_ratio))
+        for register in moved:
+            self.registers[register] = (self.registers[register] + self._random.randint(1, 50)) & 0xFFFF
+        return len(moved)
+
+    async def connect(self) -> bool:
+        self.connected = True
+        return True
+
+    def close(self) -> None:
+        self.connected = False
+
+    async def read_input_registers(self, address: int, count: int = 1, device_id: int = 1, **kwargs):
+        return await self._read(_FC_READ_INPUT, ReadInputRegistersResponse, address, count, device_id)
+
+    async def read_holding_registers(self, address: int, count: int = 1, device_id: int = 1, **kwargs):
+        return await self._read(_FC_READ_HOLDING, ReadHoldingRegistersResponse, address, count, device_id)
+
+    async def write_register(self, address: int, value: int, device_id: int = 1, **kwargs):
+        await self._frame()
+        self.counters.writes += 1
+        self.registers[address] = value
+        return WriteSingleRegisterResponse(address=address, registers=[value], dev_id=device_id)
+
+    async def write_registers(self, address: int, values: list[int], device_id: int = 1, **kwargs):
+        await self._frame()
+        self.counters.writes += 1
+        for offset, value in enumerate(values):
+            self.registers[address + offset] = value
+        return WriteMultipleRegistersResponse(address=address, count=len(values), dev_id=device_id)
+
+    async def _frame(self) -> None:
+        """One request/response round trip: latency plus jitter, or a timeout for a dropped frame."""
+        self.counters.frames += 1
+        profile = self.profile
+        if profile.drop_rate and self._random.random() < profile.drop_rate:
+            self.counters.dropped += 1
+            await asyncio.sleep(profile.timeout_s)
+            raise ModbusIOException("No response received after 1 retries")
+        delay = profile.latency_s + (self._random.uniform(-profile.jitter_s, profile.jitter_s) if profile.jitter_s else 0.0)
+        # Always yield, like a real transport, so concurrent pollers interleave.
+        await asyncio.sleep(max(0.0, delay))
+
+    async def _read(self, function_code: int, response_type, address: int, count: int, device_id: int):
+        await self._frame()
+        if any(address <= hole < address + count for hole in self.profile.holes):
+            self.counters.exceptions += 1
+            return ExceptionResponse(function_code, _ILLEGAL_DATA_ADDRESS)
+
+        get = self.registers.get
+        answer = [get(register, 0) for register in range(address, address + count)]
+        if self.profile.desync_rate and self._previous_answer is not None and self._random.random() < self.profile.desync_rate:
+            self.counters.desynced += 1
+            answer, self._previous_answer = self._previous_answer, answer
+        else:
+            self._previous_answer = answer
+        self.counters.registers += len(answer)
+        return response_type(registers=list(answer), dev_id=device_id)
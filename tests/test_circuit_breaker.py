@@ -0,0 +1,120 @@
+"""Circuit breakers: groups that keep failing are skipped with exponential backoff."""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from helpers import mock_group
+
+from custom_components.solis_modbus.circuit_breaker import BREAKER_BASE_BACKOFF, BREAKER_FAILURE_THRESHOLD, BREAKER_MAX_BACKOFF, BreakerState, CircuitBreakers
+from custom_components.solis_modbus.const import DOMAIN, VALUES
+from custom_components.solis_modbus.data.enums import PollSpeed
+from custom_components.solis_modbus.data_retrieval import DataRetrieval
+
+
+class TestCircuitBreakers(unittest.TestCase):
+    def setUp(self):
+        self.breakers = CircuitBreakers(clock=lambda: 0.0)
+        self.bad, self.good = mock_group(33000, 10), mock_group(33100, 10)
+
+    def _fail(self, times, now=0.0):
+        for _ in range(times):
+            self.breakers.record_failure(self.bad, now)
+
+    def test_opens_after_threshold_and_half_opens_after_backoff(self):
+        self._fail(BREAKER_FAILURE_THRESHOLD - 1)
+        self.assertEqual(BreakerState.CLOSED, self.breakers.state(self.bad, 0.0))
+        self._fail(1)
+        self.assertEqual(([self.good], []), self.breakers.partition([self.bad, self.good], 1.0))
+        self.assertEqual(([self.good], [self.bad]), self.breakers.partition([self.bad, self.good], BREAKER_BASE_BACKOFF))
+        self.assertEqual(
+            {"skipped_reads": 1, "groups": {"33000-33009": {"state": "half_open", "failures": 3, "retry_in_s": None}}},
+            self.breakers.as_dict(BREAKER_BASE_BACKOFF),
+        )
+
+    def test_failed_trial_doubles_the_backoff_up_to_the_cap(self):
+        self._fail(BREAKER_FAILURE_THRESHOLD)
+        now = 0.0
+        for expected in (2 * BREAKER_BASE_BACKOFF, 4 * BREAKER_BASE_BACKOFF):
+            now += self.breakers._breakers[(33000, 10)].backoff
+            self.assertEqual(BreakerState.HALF_OPEN, self.breakers.state(self.bad, now))
+            self._fail(1, now)
+            self.assertEqual(expected, self.breakers._breakers[(33000, 10)].backoff)
+        for _ in range(10):
+            now += BREAKER_MAX_BACKOFF
+            self.breakers.state(self.bad, now)
+            self._fail(1, now)
+        self.assertEqual(BREAKER_MAX_BACKOFF, self.breakers._breakers[(33000, 10)].backoff)
+
+    def test_success_closes_and_forgets_the_failures(self):
+        self._fail(BREAKER_FAILURE_THRESHOLD)
+        self.breakers.state(self.bad, BREAKER_BASE_BACKOFF)
+        self.breakers.record_success(self.bad)
+        self.assertEqual(BreakerState.CLOSED, self.breakers.state(self.bad, BREAKER_BASE_BACKOFF))
+        self._fail(BREAKER_FAILURE_THRESHOLD - 1)
+        self.assertEqual(BreakerState.CLOSED, self.breakers.state(self.bad, BREAKER_BASE_BACKOFF))
+
+    def test_unanswered_failures_count_only_when_the_cycle_reached_the_inverter(self):
+        for _ in range(BREAKER_FAILURE_THRESHOLD):
+            self.breakers.begin_cycle()
+            self._fail(1)
+            self.breakers.end_cycle()
+        self.assertEqual(BreakerState.CLOSED, self.breakers.state(self.bad))
+        self.assertEqual({}, self.breakers.as_dict()["groups"])
+
+        for _ in range(BREAKER_FAILURE_THRESHOLD):
+            self.breakers.begin_cycle()
+            self._fail(1)
+            self.breakers.record_success(self.good)
+            self.breakers.end_cycle()
+        self.assertEqual(BreakerState.OPEN, self.breakers.state(self.bad))
+
+
+class TestDataRetrievalSkipsFailingGroups(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.hass = MagicMock()
+        self.hass.is_running = False
+        self.hass.data = {DOMAIN: {VALUES: {}}}
+        self.controller = MagicMock()
+        self.controller.host = "192.168.1.1"
+        self.controller.slave = 1
+        self.controller.enabled = True
+        self.controller.connected = MagicMock(return_value=True)
+        self.dr = DataRetrieval(self.hass, self.controller, max_read_gap=0)
+        self.now = 0.0
+        self.dr.breakers._clock = lambda: self.now
+        self.dr._apply_register_read_to_cache = MagicMock(side_effect=lambda group, values, removal: self.dr.breakers.record_success(group))
+
+    async def test_timing_out_group_is_left_out_until_its_trial_read(self):
+        bad, good = mock_group(100, 2), mock_group(200, 2)
+        self.controller.sensor_groups = [bad, good]
+        read = AsyncMock(side_effect=lambda start, count: (None, None) if start == 100 else ([1] * count, None))
+        self.controller.async_read_input_registers_with_exception = read
+
+        for _ in range(BREAKER_FAILURE_THRESHOLD + 2):
+            await self.dr.get_modbus_updates([bad, good], PollSpeed.FAST)
+        self.assertEqual(BREAKER_FAILURE_THRESHOLD, sum(1 for call in read.await_args_list if call.args[0] == 100))
+
+        self.now = BREAKER_BASE_BACKOFF
+        read.side_effect = lambda start, count: ([1] * count, None)
+        await self.dr.get_modbus_updates([bad, good], PollSpeed.FAST)
+        self.assertEqual(BreakerState.CLOSED, self.dr.breakers.state(bad))
+        self.assertEqual(BREAKER_FAILURE_THRESHOLD + 1, sum(1 for call in read.await_args_list if call.args[0] == 100))
+
+    async def test_link_drop_opens_no_breaker(self):
+        groups = [mock_group(100, 2), mock_group(200, 2), mock_group(300, 2)]
+        self.controller.sensor_groups = groups
+        link = {"up": True}
+        self.controller.connected = MagicMock(side_effect=lambda: link["up"])
+
+        async def dropped_read(start, count):
+            # The first frame times out and closes the socket; the later ones cannot reconnect.
+            link["up"] = False
+            return None, None
+
+        read = self.controller.async_read_input_registers_with_exception = AsyncMock(side_effect=dropped_read)
+        for _ in range(BREAKER_FAILURE_THRESHOLD + 2):
+            link["up"] = True
+            await self.dr.get_modbus_updates(groups, PollSpeed.FAST)
+
+        self.assertEqual(3 * (BREAKER_FAILURE_THRESHOLD + 2), read.await_count)
+        self.assertEqual({"skipped_reads": 0, "groups": {}}, self.dr.breakers.as_dict())
@@ -1,8 +1,19 @@
+import asyncio
 import unittest
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import MagicMock, patch
 
-from custom_components.solis_modbus.client_manager import ModbusClientManager
+from custom_components.solis_modbus.client_manager import (
+    INTER_FRAME_INITIAL_MS,
+    INTER_FRAME_MIN_MS,
+    REQUEST_TIMEOUT_INITIAL_S,
+    LinkPacer,
+    LinkTimeout,
+    ModbusClientManager,
+    PriorityLinkLock,
+    current_link_priority,
+)
+from custom_components.solis_modbus.data.enums import LinkPriority
 
 
 class TestModbusClientManager(unittest.TestCase):
@@ -91,6 +102,166 @@ class TestModbusClientManagerInterFrame(IsolatedAsyncioTestCase):
         await self.manager.inter_frame_wait("1.2.3.4:502", is_write=False)
         self.assertGreater(self.manager.get_last_modbus_request("1.2.3.4:502"), 0.0)
 
+    @patch("custom_components.solis_modbus.client_manager.AsyncModbusTcpClient")
+    async def test_failure_backs_off_only_that_link(self, mock_client_cls):
+        mock_client_cls.return_value = MagicMock()
+        self.manager.get_tcp_client("1.2.3.4", 502)
+        self.manager.get_tcp_client("5.6.7.8", 502)
+
+        self.manager.record_frame_failure("1.2.3.4:502", "ModbusIOException")
+
+        flaky = self.manager.get_link_stats("1.2.3.4:502")
+        wired = self.manager.get_link_stats("5.6.7.8:502")
+        self.assertEqual(INTER_FRAME_INITIAL_MS * 2, flaky["read_delay_ms"])
+        self.assertEqual("ModbusIOException", flaky["last_failure"])
+        self.assertEqual(INTER_FRAME_INITIAL_MS, wired["read_delay_ms"])
+        self.assertIsNone(self.manager.get_link_stats("9.9.9.9:502"))
+
+    async def test_each_request_gets_the_links_timeout(self):
+        # A real (unconnected) client: pymodbus waits on the transport's copy of the params.
+        comm_params = self.manager.get_tcp_client("1.2.3.4", 502).ctx.comm_params
+        self.manager.configure_request_timeout("1.2.3.4:502", 0.2, 8.0)
+        for _ in range(20):
+            self.manager.record_frame_success("1.2.3.4:502", 0.02)
+
+        await self.manager.inter_frame_wait("1.2.3.4:502")
+        self.assertEqual(0.2, comm_params.timeout_connect)
+        await self.manager.inter_frame_wait("1.2.3.4:502", is_write=True)
+        self.assertEqual(8.0, comm_params.timeout_connect)
+
+        self.manager.record_frame_failure("1.2.3.4:502", "exception response 6")
+        self.assertEqual(0, self.manager.get_link_stats("1.2.3.4:502")["request_timeout"]["losses"])
+        self.manager.record_frame_failure("1.2.3.4:502", "ModbusIOException", lost=True)
+        await self.manager.inter_frame_wait("1.2.3.4:502")
+        self.assertEqual(0.4, comm_params.timeout_connect)
+
+        self.manager.apply_connect_timeout("1.2.3.4:502")
+        self.assertEqual(8.0, comm_params.timeout_connect)
+
+
+class TestLinkPacer(unittest.TestCase):
+    def test_writes_wait_twice_the_read_gap(self):
+        pacer = LinkPacer()
+        self.assertEqual(50.0, pacer.read_delay_ms)
+        self.assertEqual(100.0, pacer.write_delay_ms)
+
+    def test_stable_successes_shrink_towards_the_floor(self):
+        pacer = LinkPacer()
+        for _ in range(2000):
+            pacer.record_success(0.03)
+        self.assertEqual(INTER_FRAME_MIN_MS, pacer.read_delay_ms)
+
+    def test_jittery_latency_does_not_shrink(self):
+        pacer = LinkPacer()
+        for i in range(200):
+            pacer.record_success(0.02 if i % 2 else 0.4)
+        self.assertEqual(INTER_FRAME_INITIAL_MS, pacer.read_delay_ms)
+
+    def test_failure_doubles_gap_and_raises_floor(self):
+        pacer = LinkPacer()
+        pacer.record_failure("exception response 6")
+        self.assertEqual(100.0, pacer.read_delay_ms)
+        self.assertEqual(75.0, pacer.floor_ms)
+
+        # Clean reads cannot take the gap below the learned floor...
+        for _ in range(400):
+            pacer.record_success(0.03)
+        self.assertEqual(75.0, pacer.read_delay_ms)
+
+        # ...until a long clean run lets the floor decay.
+        for _ in range(2000):
+            pacer.record_success(0.03)
+        self.assertLess(pacer.floor_ms, 75.0)
+        self.assertLess(pacer.read_delay_ms, 75.0)
+
+    def test_backoff_is_capped_at_the_ceiling(self):
+        pacer = LinkPacer(max_ms=400)
+        for _ in range(10):
+            pacer.record_failure("TimeoutError")
+        self.assertEqual(400.0, pacer.read_delay_ms)
+        self.assertEqual(400.0, pacer.write_delay_ms)
+        self.assertEqual(10, pacer.as_dict()["failures"])
+
+
+class TestLinkTimeout(unittest.TestCase):
+    def test_waits_the_historical_timeout_until_the_first_answer(self):
+        self.assertEqual(REQUEST_TIMEOUT_INITIAL_S, LinkTimeout(0.3, 10).timeout_s)
+        self.assertEqual(2.0, LinkTimeout(0.3, 2).timeout_s)
+
+    def test_follows_smoothed_rtt_and_its_variation(self):
+        timeout = LinkTimeout(0.01, 10)
+        timeout.record_rtt(0.1)
+        self.assertAlmostEqual(0.3, timeout.timeout_s)  # srtt + 4 * srtt / 2
+        for _ in range(100):
+            timeout.record_rtt(0.1)
+        self.assertAlmostEqual(0.1, timeout.timeout_s, places=3)
+        for i in range(100):
+            timeout.record_rtt(0.05 if i % 2 else 0.45)
+        self.assertGreater(timeout.timeout_s, 0.9, "jitter widens the margin")
+
+    def test_loss_doubles_within_floor_and_ceiling(self):
+        timeout = LinkTimeout(0.3, 1.0)
+        timeout.record_rtt(0.02)
+        self.assertEqual(0.3, timeout.timeout_s)
+        timeout.record_loss()
+        timeout.record_loss()
+        self.assertEqual(1.0, timeout.timeout_s)
+        timeout.record_rtt(0.02)
+        self.assertEqual(0.3, timeout.timeout_s)
+        self.assertEqual({"losses": 2, "samples": 2}, {k: timeout.as_dict()[k] for k in ("losses", "samples")})
+
+
+class TestPriorityLinkLock(IsolatedAsyncioTestCase):
+    async def _contend(self, lock, order, name, priority):
+        async with lock.priority(priority):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    async def test_waiters_are_served_by_priority(self):
+        lock = PriorityLinkLock()
+        order = []
+        await lock.acquire(LinkPriority.SLOW)
+        tasks = [
+            asyncio.create_task(self._contend(lock, order, "slow", LinkPriority.SLOW)),
+            asyncio.create_task(self._contend(lock, order, "fast", LinkPriority.FAST)),
+            asyncio.create_task(self._contend(lock, order, "write", LinkPriority.WRITE)),
+            asyncio.create_task(self._contend(lock, order, "normal", LinkPriority.NORMAL)),
+        ]
+        await asyncio.sleep(0)
+        lock.release()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(["write", "fast", "normal", "slow"], order)
+        self.assertFalse(lock.locked())
+        self.assertEqual(2, lock.wait_stats()["SLOW"]["count"])
+
+    async def test_bare_async_with_uses_the_task_priority(self):
+        lock = PriorityLinkLock()
+        order = []
+
+        async def poll(name, priority):
+            current_link_priority.set(priority)
+            async with lock:
+                order.append(name)
+
+        await lock.acquire(LinkPriority.WRITE)
+        tasks = [asyncio.create_task(poll("slow", LinkPriority.SLOW)), asyncio.create_task(poll("fast", LinkPriority.FAST))]
+        await asyncio.sleep(0)
+        lock.release()
+        await asyncio.gather(*tasks)
+        self.assertEqual(["fast", "slow"], order)
+
+    async def test_cancelled_waiter_does_not_hold_the_link(self):
+        lock = PriorityLinkLock()
+        await lock.acquire()
+        waiter = asyncio.create_task(lock.acquire(LinkPriority.WRITE))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        lock.release()
+        self.assertFalse(lock.locked())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -5,6 +6,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from custom_components.solis_modbus.const import DOMAIN, VALUES
 from custom_components.solis_modbus.data.enums import PollSpeed
 from custom_components.solis_modbus.data_retrieval import DataRetrieval
+from custom_components.solis_modbus.helpers import get_register_store
+from custom_components.solis_modbus.sensor_data.hybrid_sensors import hybrid_sensors
 from custom_components.solis_modbus.sensors.solis_base_sensor import SolisSensorGroup
 
 
@@ -99,8 +102,9 @@ class TestDataRetrieval(unittest.TestCase):
         # Verify check_connection was called
         self.data_retrieval.check_connection.assert_called_once()
 
-        # Verify time interval tracking was set up
-        self.assertEqual(3, self.mock_track_time.call_count)
+        # Verify time interval tracking was set up (the poll tick belongs to the link coordinator)
+        self.assertEqual(1, self.mock_track_time.call_count)
+        self.controller.link_coordinator.register.assert_called_once_with(self.hass, self.data_retrieval)
 
         # Verify controller's process_write_queue was started
         self.hass.create_task.assert_called_once_with(self.controller.process_write_queue())
@@ -208,24 +212,39 @@ class TestDataRetrieval(unittest.TestCase):
         self.controller.async_read_input_registers_with_exception.assert_called_once()
 
     def test_spike_filtering(self):
-        """Test spike filtering logic."""
-        # Non-target register
-        self.assertEqual(50, self.data_retrieval.spike_filtering(12345, 50))
-
-        # Target register 33139
+        """A Battery SOC reading pinned to 0 is held back until its definition's spike_filter rule confirms it."""
         reg = 33139
-
-        # Initial non-spike
-        self.assertEqual(50, self.data_retrieval.spike_filtering(reg, 50))
-
-        # Spike check: value 0 should be ignored initially
-        with patch("custom_components.solis_modbus.data_retrieval.cache_get", return_value=50):
-            # 1st spike
-            self.assertEqual(50, self.data_retrieval.spike_filtering(reg, 0))
-            # 2nd spike
-            self.assertEqual(50, self.data_retrieval.spike_filtering(reg, 0))
-            # 3rd spike (accepted)
-            self.assertEqual(0, self.data_retrieval.spike_filtering(reg, 0))
+        definition = next(group for group in hybrid_sensors if group["register_start"] == 33132)
+        soc = next(entity for entity in definition["entities"] if entity["register"] == [str(reg)])
+        group = SolisSensorGroup(self.hass, {"register_start": reg, "entities": [soc]}, self.controller)
+        self.controller.sensor_groups = [group]
+        store = get_register_store(self.hass, self.controller, create=True)
+
+        with patch("custom_components.solis_modbus.data_retrieval.publish_register_block"):
+            # Initial non-spike, then two held-back spikes; the third in a row is accepted.
+            for value, cached in ((50, 50), (0, 50), (0, 50), (0, 0)):
+                self.data_retrieval._apply_register_read_to_cache(group, [value], [])
+                self.assertEqual(cached, store.get(reg))
+
+    def test_adaptive_cadence_follows_reads_and_operating_state(self):
+        """Unchanged reads stretch a group; a status change wakes every group; a write wakes its group."""
+        definition = next(group for group in hybrid_sensors if group["register_start"] == 33070)
+        status_group = SolisSensorGroup(self.hass, definition, self.controller)
+        self.controller.sensor_groups = [status_group, self.slow_group]
+        self.data_retrieval.scheduler = scheduler = MagicMock(adaptive=True)
+        values = [0] * status_group.registrar_count
+
+        self.data_retrieval._apply_register_read_to_cache(status_group, values, [])
+        self.data_retrieval._apply_register_read_to_cache(status_group, values, [])
+        scheduler.record_read.assert_called_with(status_group, False)
+
+        status = 33095 - status_group.start_register
+        self.data_retrieval._apply_register_read_to_cache(status_group, values[:status] + [3] + values[status + 1 :], [])
+        scheduler.record_read.assert_called_with(status_group, True)
+        scheduler.wake.assert_called_once_with()
+
+        self.data_retrieval._refresh_requested(range(3005, 3006))
+        scheduler.wake.assert_called_with([self.slow_group])
 
     async def test_concurrency_lock(self):
         """Test that get_modbus_updates respects concurrency."""
@@ -310,3 +329,87 @@ async def test_link_is_stale_thresholds():
     assert retrieval._link_is_stale() is False
     controller.last_modbus_success = datetime.now(UTC) - timedelta(seconds=130)
     assert retrieval._link_is_stale() is True
+
+
+def _make_dispatch_fixture():
+    hass = MagicMock()
+    hass.is_running = False
+    hass.data = {DOMAIN: {VALUES: {}}}
+    controller = MagicMock()
+    controller.host = "192.168.1.100"
+    controller.slave = 1
+    controller.device_id = 1
+    controller.poll_speed = {PollSpeed.FAST: 5, PollSpeed.NORMAL: 15, PollSpeed.SLOW: 30}
+    retrieval = DataRetrieval(hass, controller)
+    group = MagicMock()
+    group.start_register = 33000
+    group.poll_speed = PollSpeed.FAST
+    u32 = MagicMock()
+    u32.registrars = [33001, 33002]
+    group.sensors = [u32]
+    return retrieval, group
+
+
+def _published(publish):
+    return [list(c.args[4]) for c in publish.call_args_list]
+
+
+async def test_unchanged_registers_are_not_dispatched():
+    retrieval, group = _make_dispatch_fixture()
+
+    with patch("custom_components.solis_modbus.data_retrieval.publish_register_block") as publish:
+        retrieval._apply_register_read_to_cache(group, [1, 2, 3, 4], [])
+        assert _published(publish) == [[33000, 33001, 33002, 33003]]
+        assert list(publish.call_args.args[3]) == [1, 2, 3, 4]
+
+        publish.reset_mock()
+        retrieval._apply_register_read_to_cache(group, [1, 2, 3, 4], [])
+        publish.assert_not_called()
+
+        # The whole block goes out once; only listeners of changed registers are woken.
+        retrieval._apply_register_read_to_cache(group, [1, 2, 9, 5], [])
+        assert _published(publish) == [[33002, 33003]]
+        assert list(publish.call_args.args[3]) == [1, 2, 9, 5]
+
+    assert retrieval.stats.dispatched_registers == 6
+    assert retrieval.stats.suppressed_registers == 6
+
+
+async def test_unchanged_registers_are_refreshed_periodically():
+    retrieval, group = _make_dispatch_fixture()
+
+    with (
+        patch("custom_components.solis_modbus.data_retrieval.time.monotonic", side_effect=[1000.0, 1100.0, 1300.0]),
+        patch("custom_components.solis_modbus.data_retrieval.publish_register_block") as publish,
+    ):
+        for _ in range(3):
+            retrieval._apply_register_read_to_cache(group, [1, 2, 3, 4], [])
+
+    assert _published(publish) == [[33000, 33001, 33002, 33003]] * 2
+
+
+async def test_overlapping_cycles_of_one_entry_take_turns():
+    """A full update and a scheduler tick with different group sets must not read at the same time."""
+    retrieval, _group = _make_dispatch_fixture()
+    controller = retrieval.controller
+    controller.enabled = True
+    controller.connected = MagicMock(return_value=True)
+    in_flight, seen = [0], []
+
+    async def read(start, count):
+        in_flight[0] += 1
+        seen.append(in_flight[0])
+        await asyncio.sleep(0)
+        in_flight[0] -= 1
+        return [0] * count, None
+
+    controller.async_read_input_registers_with_exception = read
+    retrieval._apply_register_read_to_cache = MagicMock()
+    groups = []
+    for start, speed in ((1000, PollSpeed.FAST), (2000, PollSpeed.NORMAL)):
+        group = MagicMock(start_register=start, registrar_count=2, poll_speed=speed, sensors=[])
+        groups.append(group)
+
+    await asyncio.gather(retrieval.get_modbus_updates(groups, PollSpeed.NORMAL), retrieval.get_modbus_updates(groups[:1], PollSpeed.FAST))
+
+    assert seen == [1, 1, 1]
@@ -0,0 +1,100 @@
+"""Per-sensor decoders resolved once, and the one-pass group block decode."""
+
+import unittest
+from unittest.mock import MagicMock
+
+from custom_components.solis_modbus.data.enums import DataType, PollSpeed
+from custom_components.solis_modbus.decoders import resolve_decoder
+from custom_components.solis_modbus.register_store import RegisterBlock
+from custom_components.solis_modbus.sensors.solis_base_sensor import SolisBaseSensor, SolisSensorGroup
+
+
+class MockController:
+    def __init__(self):
+        class MockConfig:
+            model = "TEST"
+            features = []
+            wattage_chosen = 5000
+
+        self.inverter_config = MockConfig()
+        self.connected = lambda: True
+
+
+def _sensor(controller, registrars, data_type=None, multiplier=1, name="Test Sensor"):
+    return SolisBaseSensor(
+        hass=None,
+        controller=controller,
+        unique_id=f"test_{registrars[0]}",
+        name=name,
+        registrars=registrars,
+        write_register=None,
+        multiplier=multiplier,
+        data_type=data_type,
+    )
+
+
+class TestResolveDecoder(unittest.TestCase):
+    def test_word_types(self):
+        self.assertEqual(65535, resolve_decoder(1, None, 1)([65535]))
+        self.assertEqual(-1, resolve_decoder(1, DataType.S16.value, 1)([65535]))
+        self.assertEqual(-65536, resolve_decoder(2, None, 1)([0xFFFF, 0x0000]))
+        self.assertEqual(4294901760, resolve_decoder(2, DataType.U32.value, 1)([0xFFFF, 0x0000]))
+        self.assertEqual(65535, resolve_decoder(2, DataType.U32_LE.value, 1)([0xFFFF, 0x0000]))
+        self.assertEqual(-65536, resolve_decoder(2, DataType.S32_LE.value, 1)([0x0000, 0xFFFF]))
+
+    def test_scaling(self):
+        self.assertAlmostEqual(-0.1, resolve_decoder(1, DataType.S16.value, 0.1)([65535]))
+        self.assertEqual(7, resolve_decoder(1, None, 0)([7]))
+
+    def test_serial_number(self):
+        words = [0x4142, 0x4344] + [0] * 14
+        self.assertEqual("ABCD", resolve_decoder(16, None, 1)(words))
+
+
+class TestSensorDecoder(unittest.TestCase):
+    def test_decoder_follows_multiplier_changes(self):
+        sensor = _sensor(MockController(), [33093], DataType.S16.value)
+        self.assertEqual(-10, sensor._convert_raw_value([65526]))
+        sensor.multiplier = 0.1
+        self.assertAlmostEqual(-1.0, sensor._convert_raw_value([65526]))
+        self.assertIsNone(sensor._convert_raw_value([None]))
+
+    def test_value_from_block_prefers_group_decode(self):
+        sensor = _sensor(MockController(), [33093])
+        block = RegisterBlock(33093, (5,), "1.2.3.4", 1, decoded={sensor: 42})
+        self.assertEqual(42, sensor.value_from_block(block))
+
+
+class TestBlockDecoder(unittest.TestCase):
+    def test_group_decode_matches_per_sensor_decode(self):
+        controller = MagicMock()
+        controller.inverter_config.model = "TEST"
+        controller.inverter_config.features = []
+        group = SolisSensorGroup(
+            hass=None,
+            controller=controller,
+            definition={
+                "poll_speed": PollSpeed.FAST,
+                "entities": [
+                    {"name": "Power", "unique": "p", "register": ["33049", "33050"], "multiplier": 0.1},
+                    {"name": "reserve", "register": ["33051"]},
+                    {"name": "Temp", "unique": "t", "register": ["33052"], "data_type": "S16"},
+                    {"name": "Total", "unique": "e", "register": ["33053", "33054"], "data_type": "U32"},
+                ],
+            },
+        )
+        values = [0xFFFF, 0xFFF6, 1, 65526, 0x8000, 0x0000]
+
+        decoded = group.decode(values)
+
+        self.assertEqual(3, len(decoded))
+        for sensor in group.sensors:
+            if sensor.name != "reserve":
+                offset = sensor.registrars[0] - group.start_register
+                self.assertEqual(sensor._convert_raw_value(values[offset : offset + len(sensor.registrars)]), decoded[sensor])
+        self.assertEqual(2147483648, decoded[group.sensors[3]])
+
+    def test_short_read_skips_uncovered_sensors(self):
+        controller = MockController()
+        group = SolisSensorGroup.from_sensors([_sensor(controller, [100]), _sensor(controller, [101, 102])], PollSpeed.NORMAL)
+        self.assertEqual([7], list(group.decode([7, 1]).values()))
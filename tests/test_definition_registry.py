@@ -0,0 +1,108 @@
+"""Indexed sensor definitions: lookups match a full walk of the definition lists, and the disk cache."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from custom_components.solis_modbus import definition_registry
+from custom_components.solis_modbus.const import POLL_PROFILE_ESSENTIAL, POLL_PROFILE_EXTREME, POLL_PROFILE_FULL
+from custom_components.solis_modbus.data.enums import InverterFeature, InverterType
+from custom_components.solis_modbus.definition_registry import SensorDefinitions, get_definitions, load_definitions, register_map_for
+from custom_components.solis_modbus.helpers import group_in_poll_profile
+from custom_components.solis_modbus.sensor_data.hybrid_sensors import hybrid_sensors, hybrid_sensors_derived
+
+
+def _walk(groups, features, profile, include_battery):
+    """What setup used to do: filter every group by feature requirement and poll profile."""
+    return [
+        group
+        for group in groups
+        if (not group.get("feature_requirement") or any(feature in features for feature in group["feature_requirement"]))
+        and group_in_poll_profile(group, profile, include_battery)
+    ]
+
+
+class TestSensorDefinitions(unittest.TestCase):
+    def setUp(self):
+        self.definitions = SensorDefinitions.compile("hybrid", hybrid_sensors, hybrid_sensors_derived)
+
+    def test_groups_for_matches_walking_every_group(self):
+        feature_sets = [set(), {InverterFeature.BATTERY}, set(InverterFeature)]
+        for features in feature_sets:
+            for profile in (POLL_PROFILE_FULL, POLL_PROFILE_ESSENTIAL, POLL_PROFILE_EXTREME):
+                for include_battery in (False, True):
+                    with self.subTest(features=features, profile=profile, include_battery=include_battery):
+                        self.assertEqual(
+                            _walk(hybrid_sensors, features, profile, include_battery),
+                            self.definitions.groups_for(features, profile, include_battery),
+                        )
+
+    def test_missing_feature_groups_complement_the_supported_ones(self):
+        features = {InverterFeature.PV}
+        supported = self.definitions.groups_for(features)
+        missing = self.definitions.groups_missing_features(features)
+        self.assertEqual(len(hybrid_sensors), len(supported) + len(missing))
+        self.assertTrue(all(group.get("feature_requirement") for group in missing))
+
+    def test_lookups_by_register_and_unique_key(self):
+        group = self.definitions.group_for_register(33000)
+        self.assertEqual(33000, group["register_start"])
+        self.assertEqual("Model No", self.definitions.by_unique["solis_modbus_inverter_model_no"]["name"])
+        derived = hybrid_sensors_derived[0]
+        self.assertIs(derived, self.definitions.by_unique[derived["unique"]])
+        self.assertIsNone(self.definitions.group_for_register(1))
+
+    def test_register_map_per_inverter_type(self):
+        self.assertEqual("string", register_map_for(InverterType.GRID))
+        self.assertEqual("hybrid", register_map_for(InverterType.WAVESHARE))
+        self.assertIs(get_definitions(InverterType.HYBRID), get_definitions(InverterType.ENERGY))
+
+
+class TestDefinitionCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.groups = [{"register_start": 3000, "entities": [{"name": "A", "unique": "a", "register": ["3000"]}]}]
+        self.derived = [{"name": "B", "unique": "b", "register": ["3000"]}]
+        self.key = (1, "source")
+
+        saved = dict(definition_registry._loaded)
+        self.addCleanup(lambda: (definition_registry._loaded.clear(), definition_registry._loaded.update(saved)))
+        definition_registry._loaded.clear()
+        self.cache_file = Path(tmp.name) / "defs.pickle"
+        self.import_definitions = self._patch("_import_definitions", side_effect=lambda _map: (self.groups, self.derived))
+        self._patch("_source_key", side_effect=lambda _map: self.key)
+        self._patch("cache_path", return_value=self.cache_file)
+
+    def _patch(self, target, **kwargs):
+        patcher = patch.object(definition_registry, target, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def _reload(self):
+        definition_registry._loaded.clear()
+        return load_definitions("string")
+
+    def test_second_start_loads_from_the_cache_without_importing(self):
+        first = load_definitions("string")
+        self.assertIs(first, load_definitions("string"), "loaded once per process")
+        self.assertTrue(self.cache_file.exists())
+
+        second = self._reload()
+
+        self.assertEqual(1, self.import_definitions.call_count)
+        self.assertEqual(first.groups, second.groups)
+        self.assertEqual(["a"], second.unique_keys)
+        self.assertEqual({3000}, second.known_registers)
+
+    def test_edited_source_invalidates_the_cache(self):
+        load_definitions("string")
+        self.key = (1, "edited")
+        self._reload()
+        self.assertEqual(2, self.import_definitions.call_count)
+
+    def test_unreadable_cache_falls_back_to_the_module(self):
+        self.cache_file.write_bytes(b"not a pickle")
+        self.assertEqual(["a"], self._reload().unique_keys)
+        self.assertEqual(1, self.import_definitions.call_count)
@@ -0,0 +1,132 @@
+"""Derived value graph: formulas per definition, and each affected node evaluated once per poll cycle."""
+
+import unittest
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+from custom_components.solis_modbus.const import DOMAIN, VALUES
+from custom_components.solis_modbus.derived_engine import compile_derived, evaluate_derived, get_derived_engine, remove_derived_engine
+from custom_components.solis_modbus.helpers import get_register_store, notify_register_update
+from custom_components.solis_modbus.register_store import RegisterBlock
+
+
+def _controller(host="1.2.3.4", slave=1):
+    controller = MagicMock()
+    controller.host = host
+    controller.slave = slave
+    controller.device_id = slave
+    controller.connection_id = host
+    return controller
+
+
+def _sensor(controller, registrars, multiplier=1, **attrs):
+    sensor = MagicMock()
+    sensor.controller = controller
+    sensor.name = f"Derived {registrars}"
+    sensor.registrars = registrars
+    sensor.multiplier = multiplier
+    sensor.convert_value.side_effect = lambda values: (values[0] << 16) + values[1]
+    for name, value in attrs.items():
+        setattr(sensor, name, value)
+    return sensor
+
+
+class _EngineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.hass = MagicMock()
+        self.hass.data = {DOMAIN: {VALUES: {}}}
+        self.controller = _controller()
+        self.store = get_register_store(self.hass, self.controller, create=True)
+
+    def publish(self, start, *values):
+        for offset, value in enumerate(values):
+            self.store.set(start + offset, value)
+        self.store.publish(RegisterBlock(start, values, self.controller.host, self.controller.slave))
+
+    def value(self, sensor):
+        return evaluate_derived(self.hass, compile_derived(sensor))
+
+
+class TestDerivedFormulas(_EngineTestCase):
+    def test_dc_power_and_net_grid_energy(self):
+        self.publish(33049, 200, 10)
+        self.publish(33171, 50, 0, 0, 0, 20)
+        self.assertEqual(2000, self.value(_sensor(self.controller, [33049, 33050])))
+        self.assertEqual(3.0, self.value(_sensor(self.controller, [33175, 33171], multiplier=0.1)))
+
+    def test_battery_power_follows_the_direction_register(self):
+        self.publish(33135, 1)
+        self.publish(33149, 0, 25)
+        self.assertEqual(250, self.value(_sensor(self.controller, [33149, 33150, 33135, 1])))
+        self.assertEqual(0, self.value(_sensor(self.controller, [33149, 33150, 33135, 0])))
+        self.assertEqual(250, self.value(_sensor(self.controller, [33149, 33150, 33135])))
+        self.publish(33135, 0)
+        self.assertEqual(-250, self.value(_sensor(self.controller, [33149, 33150, 33135])))
+
+    def test_power_factor_status_and_negated_value(self):
+        self.publish(33079, 0, 3, 0, 4)
+        self.publish(33095, 3)
+        self.publish(33263, 7, 8)
+        self.assertEqual(0.6, self.value(_sensor(self.controller, [33079, 33080, 33081, 33082])))
+        self.assertEqual("Generating", self.value(_sensor(self.controller, [33095], get_value=3)))
+        self.assertEqual(-12, self.value(_sensor(self.controller, [33263, 33264], get_value=12)))
+
+    def test_nothing_until_every_input_is_known(self):
+        self.publish(33049, 200)
+        self.assertIsNone(self.value(_sensor(self.controller, [33049, 33050])))
+
+    def test_flags_are_not_inputs(self):
+        self.assertEqual((33149, 33150, 33135), compile_derived(_sensor(self.controller, [33149, 33150, 33135, 1])).inputs)
+        self.assertEqual("value", compile_derived(_sensor(self.controller, [33000])).kind)
+
+
+class TestDerivedEngine(_EngineTestCase):
+    def setUp(self):
+        super().setUp()
+        self.engine = get_derived_engine(self.hass, self.controller, create=True)
+        self.power, self.grid = [], []
+        self.unsubscribe_power = self.engine.subscribe(compile_derived(_sensor(self.controller, [33049, 33050])), self.power.append)
+        self.engine.subscribe(compile_derived(_sensor(self.controller, [33175, 33171])), self.grid.append)
+
+    def test_a_cycle_evaluates_each_affected_node_once(self):
+        self.engine.begin_cycle()
+        self.publish(33049, 200)
+        self.publish(33050, 10)
+        self.publish(33049, 210, 10)
+        self.assertEqual([], self.power, "nothing is evaluated mid-cycle")
+        self.engine.end_cycle()
+
+        self.assertEqual([2100], self.power)
+        self.assertEqual(1, self.engine.evaluations)
+        self.assertEqual([], self.grid, "a node whose inputs did not change is not evaluated")
+
+    def test_blocks_outside_a_cycle_are_evaluated_on_the_next_loop_iteration(self):
+        self.publish(33049, 200, 10)
+        self.publish(33049, 200, 20)
+        self.hass.loop.call_soon.assert_called_once_with(self.engine.flush)
+        self.engine.flush()
+        self.assertEqual([4000], self.power)
+
+    def test_unsubscribing_the_last_listener_drops_the_node(self):
+        self.assertEqual(2, self.engine.nodes)
+        self.unsubscribe_power()
+        self.assertEqual(1, self.engine.nodes)
+        self.assertEqual(0, self.store.publish(RegisterBlock(33049, (1, 2), self.controller.host, self.controller.slave)))
+
+    def test_engines_are_per_slave(self):
+        self.assertIs(self.engine, get_derived_engine(self.hass, self.controller))
+        self.assertIsNone(get_derived_engine(self.hass, _controller(slave=2)))
+
+    def test_unload_drops_the_engine_and_its_store_listeners(self):
+        remove_derived_engine(self.hass, self.controller)
+        self.assertIsNone(get_derived_engine(self.hass, self.controller))
+        self.assertEqual(0, self.store.publish(RegisterBlock(33049, (1, 2), self.controller.host, self.controller.slave)))
+        remove_derived_engine(self.hass, self.controller)  # already gone: no-op
+
+    def test_last_modbus_success_follows_the_virtual_register(self):
+        ticks = []
+        self.engine.subscribe(compile_derived(_sensor(self.controller, [90006])), ticks.append)
+        self.controller.last_modbus_success = datetime(2026, 1, 1, tzinfo=UTC)
+        notify_register_update(self.hass, self.controller, 90006, self.controller.last_modbus_success)
+        self.engine.flush()
+        self.assertEqual([self.controller.last_modbus_success], ticks)
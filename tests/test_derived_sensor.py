@@ -3,10 +3,30 @@ from unittest.mock import MagicMock, patch
 import pytest
 from homeassistant.core import HomeAssistant
 
-from custom_components.solis_modbus.const import CONTROLLER, REGISTER, SLAVE, VALUE
+from custom_components.solis_modbus.derived_engine import get_derived_engine
+from custom_components.solis_modbus.helpers import cache_save, get_register_store
+from custom_components.solis_modbus.register_store import RegisterBlock
 from custom_components.solis_modbus.sensors.solis_derived_sensor import SolisDerivedSensor
 
 
+def _derived(hass, base_sensor):
+    """A derived sensor subscribed to its controller's engine, as async_added_to_hass does."""
+    sensor = SolisDerivedSensor(hass, base_sensor)
+    get_derived_engine(hass, base_sensor.controller, create=True).subscribe(sensor._node, sensor._apply_value)
+    return sensor
+
+
+def _publish(hass, controller, start, *values):
+    """Cache and publish one read block, then let the engine evaluate what it changed."""
+    store = get_register_store(hass, controller, create=True)
+    for offset, value in enumerate(values):
+        store.set(start + offset, value)
+    store.publish(RegisterBlock(start, values, controller.host, controller.slave))
+    engine = get_derived_engine(hass, controller)
+    if engine is not None:
+        engine.flush()
+
+
 @pytest.fixture
 def mock_controller():
     controller = MagicMock()
@@ -14,6 +34,7 @@ def mock_controller():
     controller.slave = 1
     controller.model = "TestModel"
     controller.device_id = 1
+    controller.connection_id = "1.2.3.4:502"
     return controller
 
 
@@ -33,30 +54,23 @@ def mock_base_sensor(mock_controller):
 
 
 def test_derived_sensor_status(hass: HomeAssistant, mock_base_sensor):
-    sensor = SolisDerivedSensor(hass, mock_base_sensor)
+    sensor = _derived(hass, mock_base_sensor)
 
     # Simulate status update (33095)
     # 3 = "Generating"
     mock_base_sensor.get_value = 3
-    event_data = {REGISTER: 33095, VALUE: 3, CONTROLLER: "1.2.3.4", SLAVE: 1}
-
     with patch.object(sensor, "schedule_update_ha_state"):
-        sensor.handle_modbus_update(event_data)
+        _publish(hass, mock_base_sensor.controller, 33095, 3)
 
     assert sensor.native_value == "Generating"
 
 
 def test_derived_sensor_dc_power(hass: HomeAssistant, mock_base_sensor):
     mock_base_sensor.registrars = [33049, 33050]  # Voltage, Current
-    sensor = SolisDerivedSensor(hass, mock_base_sensor)
-
-    # Prime first value
-    sensor._received_values[33049] = 200
-
-    event_data = {REGISTER: 33050, VALUE: 10, CONTROLLER: "1.2.3.4", SLAVE: 1}
+    sensor = _derived(hass, mock_base_sensor)
 
     with patch.object(sensor, "schedule_update_ha_state"):
-        sensor.handle_modbus_update(event_data)
+        _publish(hass, mock_base_sensor.controller, 33049, 200, 10)
 
     assert sensor.native_value == 2000
 
@@ -65,43 +79,43 @@ def test_derived_sensor_string_dc_power(hass: HomeAssistant, mock_base_sensor):
     """String inverter DC power: raw V and A each scaled ×0.1, product in watts."""
     mock_base_sensor.registrars = [3021, 3022]
     mock_base_sensor.multiplier = 0.1
-    sensor = SolisDerivedSensor(hass, mock_base_sensor)
-
-    sensor._received_values[3021] = 400  # 40.0 V
-
-    event_data = {REGISTER: 3022, VALUE: 50, CONTROLLER: "1.2.3.4", SLAVE: 1}
+    sensor = _derived(hass, mock_base_sensor)
 
     with patch.object(sensor, "schedule_update_ha_state"):
-        sensor.handle_modbus_update(event_data)
+        _publish(hass, mock_base_sensor.controller, 3021, 400, 50)  # 40.0 V, 5.0 A
 
     assert sensor.native_value == 200  # 40 * 5 W * 0.1
 
 
 def test_derived_sensor_wrong_controller(hass: HomeAssistant, mock_base_sensor):
-    sensor = SolisDerivedSensor(hass, mock_base_sensor)
-
-    event_data = {
-        REGISTER: 33095,
-        VALUE: 3,
-        CONTROLLER: "9.9.9.9",  # Wrong IP
-        SLAVE: 1,
-    }
+    sensor = _derived(hass, mock_base_sensor)
+    other = MagicMock(host="9.9.9.9", slave=1, device_id=1, connection_id="9.9.9.9:502")
 
     with patch.object(sensor, "schedule_update_ha_state"):
-        sensor.handle_modbus_update(event_data)
+        _publish(hass, other, 33095, 3)  # Wrong IP
 
     assert sensor.native_value is None
 
 
 def test_derived_sensor_incomplete_data(hass: HomeAssistant, mock_base_sensor):
     mock_base_sensor.registrars = [33049, 33050]
-    sensor = SolisDerivedSensor(hass, mock_base_sensor)
+    sensor = _derived(hass, mock_base_sensor)
+
+    # Only one value read, the other has never been read either
+    with patch.object(sensor, "schedule_update_ha_state") as update:
+        _publish(hass, mock_base_sensor.controller, 33050, 10)
+
+    assert sensor.native_value is None
+    update.assert_not_called()
 
-    # Only send one value, missing the other
-    event_data = {REGISTER: 33050, VALUE: 10, CONTROLLER: "1.2.3.4", SLAVE: 1}
+
+def test_derived_sensor_unchanged_source_comes_from_cache(hass: HomeAssistant, mock_base_sensor):
+    """Sources outside the published block (other groups, unchanged registers) come from the store."""
+    mock_base_sensor.registrars = [33049, 33050]
+    cache_save(hass, mock_base_sensor.controller, 33049, 200)
+    sensor = _derived(hass, mock_base_sensor)
 
     with patch.object(sensor, "schedule_update_ha_state"):
-        sensor.handle_modbus_update(event_data)
+        _publish(hass, mock_base_sensor.controller, 33050, 10)
 
-    assert sensor.native_value is None
-    assert sensor._received_values[33050] == 10
+    assert sensor.native_value == 2000
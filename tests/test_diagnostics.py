@@ -8,6 +8,7 @@ import pytest
 from custom_components.solis_modbus.const import DOMAIN, VALUES
 from custom_components.solis_modbus.data.enums import InverterType, PollSpeed
 from custom_components.solis_modbus.diagnostics import async_get_config_entry_diagnostics
+from custom_components.solis_modbus.register_store import RegisterStore
 from custom_components.solis_modbus.runtime import SolisRuntimeData
 
 
@@ -23,6 +24,7 @@ def make_controller():
     controller.last_modbus_success = datetime(2026, 7, 1, 12, 0, 0, tzinfo=UTC)
     controller.poll_speed = {PollSpeed.FAST: 10, PollSpeed.NORMAL: 15, PollSpeed.SLOW: 30}
     controller.sw_version = "N/A"
+    controller.link_stats = {"read_delay_ms": 42.5, "floor_ms": 10.0, "failures": 0}
     controller.inverter_config.model = "S6-EH1P"
     controller.inverter_config.type = InverterType.HYBRID
     controller.inverter_config.phases = 1
@@ -53,13 +55,17 @@ def make_entry(controller):
 @pytest.fixture
 def hass_with_cache():
     hass = MagicMock()
+    ours, other_slave, other_link = RegisterStore(), RegisterStore(), RegisterStore()
+    ours.set(33000, 12549)
+    ours.set(33005, 21323)  # ours but a serial register -> excluded
+    other_slave.set(33000, 999)
+    other_link.set(33000, 888)
     hass.data = {
         DOMAIN: {
             VALUES: {
-                "1.2.3.4:502|1|33000": 12549,  # ours
-                "1.2.3.4:502|1|33005": 21323,  # ours but a serial register -> excluded
-                "1.2.3.4:502|2|33000": 999,  # other slave -> excluded
-                "5.6.7.8:502|1|33000": 888,  # other link -> excluded
+                ("1.2.3.4:502", 1): ours,
+                ("1.2.3.4:502", 2): other_slave,
+                ("5.6.7.8:502", 1): other_link,
             }
         }
     }
@@ -83,9 +89,12 @@ async def test_diagnostics_structure_and_redaction(hass_with_cache):
 
     # Structure
     assert diag["controller"]["poll_speed"] == {"FAST": 10, "NORMAL": 15, "SLOW": 30}
+    assert diag["controller"]["link_pacing"]["read_delay_ms"] == 42.5
     assert diag["inverter_config"]["model"] == "S6-EH1P"
     assert diag["sensor_groups"][0]["start_register"] == 33000
     assert diag["entity_counts"] == {"sensor": 2}
+    # Not polling yet: no DataRetrieval, so no poll stats
+    assert diag["poll_stats"] is None
 
 
 async def test_diagnostics_without_runtime_data():
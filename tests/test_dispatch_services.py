@@ -73,6 +73,8 @@ async def test_dispatch_grid_import_sequence(hass: HomeAssistant, controller):
         (44105, [3, 0xFFFF, 0xFDA8, 2, 0, 100, 0, 0]),
     ]
     assert single_writes(controller) == []
+    # The blocks are adjacent: a barrier keeps the write queue from merging them.
+    controller.queue_write_barrier.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,106 @@
+"""Raw frame capture (NDJSON, rotated by size) and replaying a capture through the poll path."""
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from benchmark_poll import PollBenchmark
+from pymodbus.pdu import ExceptionResponse
+from replay_capture import replay
+from simulator import LinkProfile
+
+from custom_components.solis_modbus.frame_capture import CapturedFrame, FrameCapture, ReplayClient, capture_files, load_capture
+from custom_components.solis_modbus.helpers import get_register_store
+from custom_components.solis_modbus.modbus_pipeline import FC_READ_INPUT
+
+
+class TestFrameCapture(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "capture.ndjson"
+
+    def test_frames_round_trip_through_the_file(self):
+        capture = FrameCapture(self.path)
+        capture.record(1, FC_READ_INPUT, 33000, 2, time.perf_counter(), registers=[1, 2])
+        capture.record(1, FC_READ_INPUT, 33095, 1, time.perf_counter(), exception_code=2)
+        capture.record(1, FC_READ_INPUT, 33100, 1, time.perf_counter(), error="TimeoutError()")
+        capture.write(capture.take(force=True))
+
+        header = json.loads(self.path.read_text().splitlines()[0])
+        self.assertEqual("solis_modbus_capture", header["format"])
+        frames = load_capture(self.path)
+        self.assertEqual([[1, 2], None, None], [frame.registers for frame in frames])
+        self.assertEqual(2, frames[1].exception_code)
+        self.assertEqual("TimeoutError()", frames[2].error)
+
+    def test_lines_are_only_handed_out_in_batches_and_one_write_at_a_time(self):
+        capture = FrameCapture(self.path)
+        capture.record(1, FC_READ_INPUT, 33000, 1, time.perf_counter(), registers=[1])
+        self.assertIsNone(capture.take())
+        lines = capture.take(force=True)
+        capture.record(1, FC_READ_INPUT, 33000, 1, time.perf_counter(), registers=[2])
+        self.assertIsNone(capture.take(), "a write is still running")
+        capture.write(lines)
+        self.assertEqual(1, len(capture.take(force=True)))
+
+    def test_file_rotates_by_size_and_load_reads_oldest_first(self):
+        capture = FrameCapture(self.path, max_bytes=1024, backups=2)
+        for value in range(60):
+            capture.record(1, FC_READ_INPUT, 33000, 1, time.perf_counter(), registers=[value])
+            capture.write(capture.take(force=True))
+
+        self.assertEqual(["capture.ndjson.2", "capture.ndjson.1", "capture.ndjson"], [file.name for file in capture_files(self.path)])
+        self.assertTrue(all(file.stat().st_size <= 1024 for file in capture_files(self.path)))
+        values = [frame.registers[0] for frame in load_capture(self.path)]
+        self.assertEqual(values, sorted(values))
+        self.assertEqual(59, values[-1])
+        self.assertGreater(values[0], 0, "the oldest frames were rotated out")
+
+
+class TestReplayClient(unittest.IsolatedAsyncioTestCase):
+    async def test_answers_are_matched_per_request(self):
+        client = ReplayClient(
+            [
+                CapturedFrame(0.0, 1, FC_READ_INPUT, 33000, 1, registers=[5]),
+                CapturedFrame(0.1, 1, FC_READ_INPUT, 33095, 1, exception_code=2),
+                CapturedFrame(0.2, 1, FC_READ_INPUT, 33000, 1, registers=[6]),
+            ],
+            speed=0,
+        )
+
+        self.assertEqual([5], (await client.read_input_registers(33000, count=1, device_id=1)).registers)
+        failed = await client.read_input_registers(33095, count=1, device_id=1)
+        self.assertIsInstance(failed, ExceptionResponse)
+        self.assertEqual(2, failed.exception_code)
+        self.assertEqual([6], (await client.read_input_registers(33000, count=1, device_id=1)).registers)
+        with self.assertRaises(Exception):
+            await client.read_input_registers(33000, count=1, device_id=1)
+        self.assertEqual((3, 1, 0), (client.replayed, client.unmatched, client.remaining))
+
+
+class TestCaptureReplay(unittest.IsolatedAsyncioTestCase):
+    async def test_replayed_capture_reproduces_the_polled_values(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = Path(tmp.name) / "capture.ndjson"
+
+        live = PollBenchmark("hybrid", LinkProfile(holes=frozenset({33095}), seed=1))
+        self.addCleanup(live.close)
+        live.controller.start_frame_capture(path)
+        await live.start()
+        for _ in range(3):
+            await live.run_cycle()
+        capture = await live.controller.async_stop_frame_capture()
+        self.assertIsNone(live.controller.capture)
+
+        bench, client, summary = await replay(path, "hybrid")
+        self.addCleanup(bench.close)
+
+        self.assertEqual(capture.frames, summary["frames"])
+        self.assertEqual(0, summary["remaining"])
+        self.assertEqual(0, summary["unmatched"])
+        self.assertEqual(3, summary["cycles"])
+        self.assertEqual(dict(get_register_store(live.hass, live.controller).items()), dict(get_register_store(bench.hass, bench.controller).items()))
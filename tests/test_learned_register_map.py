@@ -0,0 +1,119 @@
+"""Registers learned by recovery are persisted per serial and re-applied after a restart."""
+
+import unittest
+from functools import partial
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+from custom_components.solis_modbus.const import DOMAIN, VALUES
+from custom_components.solis_modbus.data.enums import InverterType, PollSpeed
+from custom_components.solis_modbus.data_retrieval import DataRetrieval
+from custom_components.solis_modbus.learned_register_map import LearnedRegisterMap, firmware_register
+from custom_components.solis_modbus.modbus_controller import ModbusController
+from custom_components.solis_modbus.sensors.solis_base_sensor import SolisSensorGroup
+
+FIRMWARE = [0x1234, 0x5678]
+
+
+def _mock_sensor(registrars: list[int], name: str):
+    m = MagicMock()
+    m.registrars = registrars
+    m.name = name
+    m.enabled = True
+    return m
+
+
+class TestLearnedRegisterMap(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        patcher = patch("custom_components.solis_modbus.learned_register_map.Store")
+        self.store = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.store.async_load = AsyncMock(return_value=None)
+        self.store.async_remove = AsyncMock()
+
+        self.hass = MagicMock()
+        self.hass.is_running = False
+        self.hass.data = {DOMAIN: {VALUES: {}}}
+        self.controller = MagicMock()
+        self.controller.host = "192.168.1.1"
+        self.controller.slave = 1
+        self.controller.device_id = 1
+        self.controller.connected = MagicMock(return_value=True)
+        self.controller.inverter_config.type = InverterType.HYBRID
+        self.controller._async_read_input_register_raw_detailed = AsyncMock(return_value=(FIRMWARE, None))
+        self.controller.replace_sensor_group = partial(ModbusController.replace_sensor_group, self.controller)
+
+        self.status, self.other = _mock_sensor([33095], "Status"), _mock_sensor([33096], "Other")
+        self.group = SolisSensorGroup.from_sensors([self.status, self.other], PollSpeed.NORMAL)
+        self.controller._sensor_groups = [self.group]
+        type(self.controller).sensor_groups = PropertyMock(side_effect=lambda: self.controller._sensor_groups)
+
+        self.learned = LearnedRegisterMap(self.hass, "SERIAL1", "S6-EH3P")
+        self.dr = DataRetrieval(self.hass, self.controller, learned_map=self.learned)
+
+    def _saved(self) -> dict:
+        return self.store.async_delay_save.call_args.args[0]()
+
+    async def test_stored_map_is_reapplied_before_polling(self):
+        self.store.async_load.return_value = {
+            "fingerprint": {"model": "S6-EH3P", "firmware": FIRMWARE},
+            "bad_registers": [33095],
+            "unreadable_registers": [33095, 33110],
+            "groups": [[33096, 1]],
+        }
+
+        with patch("custom_components.solis_modbus.data_retrieval.mark_platform_entities_unavailable_for_base_sensors"):
+            await self.dr._restore_learned_register_map()
+
+        self.controller._async_read_input_register_raw_detailed.assert_awaited_once_with(33001, 2, quiet=True)
+        self.assertFalse(self.status.enabled)
+        self.assertEqual([[33096, 1]], [[g.start_register, g.registrar_count] for g in self.controller._sensor_groups])
+        self.assertEqual(frozenset({33095, 33110}), self.dr.read_planner.unreadable_registers)
+
+    async def test_firmware_update_discards_the_stored_map(self):
+        self.store.async_load.return_value = {
+            "fingerprint": {"model": "S6-EH3P", "firmware": [1, 1]},
+            "bad_registers": [33095],
+        }
+
+        await self.dr._restore_learned_register_map()
+
+        self.store.async_remove.assert_awaited_once()
+        self.assertTrue(self.status.enabled)
+        self.assertEqual([self.group], self.controller._sensor_groups)
+
+    async def test_unknown_firmware_applies_nothing(self):
+        self.controller._async_read_input_register_raw_detailed.return_value = (None, None)
+        self.store.async_load.return_value = {"fingerprint": {"model": "S6-EH3P", "firmware": FIRMWARE}, "bad_registers": [33095]}
+
+        await self.dr._restore_learned_register_map()
+
+        self.store.async_remove.assert_not_awaited()
+        self.assertTrue(self.status.enabled)
+
+    async def test_recovered_register_is_saved_with_the_group_layout(self):
+        self.learned.firmware = FIRMWARE
+
+        async def read_blk(start, count, is_holding):
+            return ([1] * count, None) if 33095 not in range(start, start + count) else (None, 2)
+
+        self.controller._async_read_input_register_raw_detailed = AsyncMock(
+            side_effect=lambda start, count, quiet=False: (None, 2) if 33095 in range(start, start + count) else ([1] * count, None)
+        )
+        with (
+            patch.object(self.dr, "_read_register_block_with_exception", new=AsyncMock(side_effect=read_blk)),
+            patch("custom_components.solis_modbus.data_retrieval.mark_platform_entities_unavailable_for_base_sensors"),
+        ):
+            await self.dr._recover_sensor_group_after_modbus_failure(self.group, 33095, 2, False, [])
+
+        saved = self._saved()
+        self.assertEqual({"model": "S6-EH3P", "firmware": FIRMWARE}, saved["fingerprint"])
+        self.assertEqual([33095], saved["bad_registers"])
+        self.assertEqual([[33096, 1]], saved["groups"])
+
+    def test_nothing_is_saved_without_a_firmware_fingerprint(self):
+        self.learned.remember(bad=[33095])
+        self.store.async_delay_save.assert_not_called()
+
+    def test_string_inverters_fingerprint_their_own_registers(self):
+        self.assertEqual(3000, firmware_register(InverterType.STRING))
+        self.assertEqual(33001, firmware_register(InverterType.HYBRID))
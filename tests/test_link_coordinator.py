@@ -0,0 +1,129 @@
+"""The link-level poll coordinator that ticks every slave sharing one Modbus connection."""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from helpers import Clock, mock_group
+
+from custom_components.solis_modbus.const import DOMAIN, VALUES
+from custom_components.solis_modbus.data.enums import PollSpeed
+from custom_components.solis_modbus.data_retrieval import DataRetrieval
+from custom_components.solis_modbus.link_coordinator import LinkPollCoordinator
+from custom_components.solis_modbus.poll_scheduler import PollScheduler
+
+INTERVALS = {PollSpeed.FAST: 5, PollSpeed.NORMAL: 15, PollSpeed.SLOW: 30}
+
+
+class TestLinkPollCoordinator(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.hass = MagicMock()
+        self.hass.is_running = False
+        self.hass.data = {DOMAIN: {VALUES: {}}}
+        self.clock = Clock()
+        self.coordinator = LinkPollCoordinator("1.2.3.4:502")
+        self.calls = []
+        patcher = patch("custom_components.solis_modbus.link_coordinator.async_track_time_interval")
+        self.mock_track_time = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _member(self, slave: int, groups: list) -> DataRetrieval:
+        controller = MagicMock()
+        controller.host = "1.2.3.4"
+        controller.slave = slave
+        controller.enabled = True
+        controller.poll_speed = INTERVALS
+        controller.sensor_groups = groups
+        member = DataRetrieval(self.hass, controller, max_read_gap=0)
+        member.scheduler = PollScheduler(INTERVALS, clock=self.clock)
+
+        async def record(groups, speed):
+            self.calls.append((slave, [g.start_register for g in groups], speed))
+            return True
+
+        member.get_modbus_updates = AsyncMock(side_effect=record)
+        return member
+
+    async def test_one_tick_timer_per_link(self):
+        first = self.coordinator.register(self.hass, self._member(1, []))
+        second = self.coordinator.register(self.hass, self._member(2, []))
+        self.assertEqual(1, self.mock_track_time.call_count)
+
+        first()
+        self.mock_track_time.return_value.assert_not_called()
+        second()
+        self.mock_track_time.return_value.assert_called_once()
+        self.assertEqual([], self.coordinator.members)
+
+    async def test_background_groups_wait_for_idle_gap(self):
+        member = self._member(1, [mock_group(100, poll_speed=PollSpeed.FAST), mock_group(43000, poll_speed=PollSpeed.SLOW)])
+        self.coordinator.register(self.hass, member)
+
+        await self.coordinator.tick()
+        # FAST goes first, SLOW fits in the 5s gap before the next FAST deadline.
+        self.assertEqual([(1, [100], PollSpeed.FAST), (1, [43000], PollSpeed.SLOW)], self.calls)
+
+    async def test_background_groups_skip_a_tight_gap_until_starving(self):
+        member = self._member(1, [mock_group(100, poll_speed=PollSpeed.FAST), mock_group(200, poll_speed=PollSpeed.NORMAL)])
+        self.coordinator.register(self.hass, member)
+        member.stats.record_frame(200, 10.0, ok=True)
+
+        await self.coordinator.tick()
+        self.assertEqual([(1, [100], PollSpeed.FAST)], self.calls)
+        self.assertEqual({"1": 1}, self.coordinator.as_dict()["deferred_groups"])
+
+        self.clock.now += 15
+        self.calls.clear()
+        await self.coordinator.tick()
+        self.assertEqual([(1, [100], PollSpeed.FAST), (1, [200], PollSpeed.NORMAL)], self.calls)
+
+    async def test_groups_of_a_skipped_cycle_stay_due(self):
+        member = self._member(1, [mock_group(100, poll_speed=PollSpeed.FAST), mock_group(43000, poll_speed=PollSpeed.SLOW)])
+        self.coordinator.register(self.hass, member)
+        member.get_modbus_updates.side_effect = None
+        member.get_modbus_updates.return_value = False  # e.g. disconnected
+
+        await self.coordinator.tick()
+        fast, background = member.scheduler.due()
+        self.assertEqual([100], [g.start_register for g in fast])
+        self.assertEqual([43000], [g.start_register for g in background])
+
+    async def test_fast_groups_of_every_slave_go_first_and_rotate(self):
+        for slave in (1, 2, 3):
+            self.coordinator.register(
+                self.hass, self._member(slave, [mock_group(100, poll_speed=PollSpeed.FAST), mock_group(43000, poll_speed=PollSpeed.SLOW)])
+            )
+
+        await self.coordinator.tick()
+        self.assertEqual([1, 2, 3], [slave for slave, _, speed in self.calls if speed == PollSpeed.FAST])
+        self.assertEqual([PollSpeed.FAST] * 3 + [PollSpeed.SLOW] * 3, [speed for _, _, speed in self.calls])
+
+        self.clock.now += 5
+        self.calls.clear()
+        await self.coordinator.tick()
+        self.assertEqual([2, 3, 1], [slave for slave, _, _ in self.calls])
+
+    async def test_background_groups_are_ordered_by_deadline_across_slaves(self):
+        late = self._member(1, [mock_group(43000, poll_speed=PollSpeed.SLOW)])
+        early = self._member(2, [mock_group(43000, poll_speed=PollSpeed.SLOW)])
+        self.coordinator.register(self.hass, late)
+        self.coordinator.register(self.hass, early)
+        early.scheduler.sync(early.controller.sensor_groups, now=990.0)
+        # Only one ~0.2s frame fits before slave 1's next FAST deadline.
+        late.controller.sensor_groups.append(mock_group(100, poll_speed=PollSpeed.FAST))
+        late.scheduler.sync(late.controller.sensor_groups, now=995.3)
+
+        await self.coordinator.tick()
+        self.assertEqual([(1, [100], PollSpeed.FAST), (2, [43000], PollSpeed.SLOW)], self.calls)
+
+    async def test_overloaded_link_is_flagged_on_every_slave(self):
+        members = [self._member(slave, [mock_group(start, poll_speed=PollSpeed.FAST) for start in range(0, 500, 100)]) for slave in (1, 2)]
+        for member in members:
+            self.coordinator.register(self.hass, member)
+        members[0].stats.record_frame(0, 1.0, ok=True)
+
+        await self.coordinator.tick()
+
+        # 2 slaves x 5 frames every 5s = 2 frames/s against a 1 frame/s link.
+        for member in members:
+            self.assertTrue(member.scheduler.overloaded)
+            self.assertEqual(2.0, member.scheduler.demand_frames_per_s)
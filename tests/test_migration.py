@@ -1,5 +1,5 @@
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.const import CONF_HOST, CONF_PORT
@@ -24,6 +24,7 @@ def _apply_version_updates(entry):
 class TestMigration:
     def setup_method(self):
         self.hass = MagicMock()
+        self.hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
         self.entry = MagicMock()
         self.entry.version = 1
         self.entry.domain = DOMAIN
@@ -122,6 +123,7 @@ def _broken_uid(serial: str, with_data_type: bool) -> str:
 class TestDictUniqueIdMigration:
     def setup_method(self):
         self.hass = MagicMock()
+        self.hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
         self.entry = MagicMock()
         self.entry.version = 3
         self.entry.entry_id = "entry-dict-1"
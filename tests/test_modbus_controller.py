@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from datetime import datetime
 from unittest import IsolatedAsyncioTestCase
@@ -12,7 +13,7 @@ from custom_components.solis_modbus.const import (
     DEFAULT_STOPBITS,
 )
 from custom_components.solis_modbus.data.enums import PollSpeed
-from custom_components.solis_modbus.modbus_controller import ModbusController
+from custom_components.solis_modbus.modbus_controller import WRITE_BARRIER, ModbusController, coalesce_write_requests
 
 
 class TestModbusControllerTCP(IsolatedAsyncioTestCase):
@@ -165,6 +166,34 @@ class TestModbusControllerTCP(IsolatedAsyncioTestCase):
 
         self.controller.write_queue.put.assert_called_once_with((100, [42, 43], True))
 
+    async def test_process_write_queue_batches_pending_writes(self):
+        """A burst of queued writes goes out as coalesced frames."""
+        self.mock_client.connected = True
+        ok = MagicMock()
+        ok.isError.return_value = False
+        ok.registers = [7]
+        self.mock_client.write_register = AsyncMock(return_value=ok)
+        self.mock_client.write_registers = AsyncMock(return_value=ok)
+
+        with (
+            patch("custom_components.solis_modbus.modbus_controller.cache_save"),
+            patch("custom_components.solis_modbus.modbus_controller.get_register_store"),
+            patch("custom_components.solis_modbus.modbus_controller.notify_register_update"),
+            patch("custom_components.solis_modbus.modbus_controller.publish_register_block"),
+        ):
+            await self.controller.async_write_holding_register(43011, 10)
+            await self.controller.async_write_holding_register(43011, 20)
+            await self.controller.async_write_holding_register(43012, 30)
+            self.controller.queue_write_barrier()
+            await self.controller.async_write_holding_register(43110, 5)
+
+            task = asyncio.create_task(self.controller.process_write_queue())
+            await asyncio.wait_for(self.controller.write_queue.join(), timeout=2)
+            task.cancel()
+
+        self.mock_client.write_registers.assert_awaited_once_with(address=43011, values=[20, 30], device_id=1)
+        self.mock_client.write_register.assert_awaited_once_with(address=43110, value=5, device_id=1)
+
     def test_poll_speed(self):
         """Test the poll_speed property."""
         expected = {PollSpeed.FAST: 5, PollSpeed.NORMAL: 15, PollSpeed.SLOW: 30}
@@ -540,5 +569,33 @@ class TestModbusControllerProperties(unittest.TestCase):
         self.mock_manager.release_client.assert_called_once_with(self.controller.connection_id)
 
 
+class TestCoalesceWriteRequests(unittest.TestCase):
+    def test_last_write_to_a_register_wins(self):
+        frames = coalesce_write_requests([(43011, 10, False), (43011, 20, False)])
+        self.assertEqual([(43011, [20], False)], frames)
+
+    def test_contiguous_registers_merge_into_fc16(self):
+        frames = coalesce_write_requests([(43012, 2, False), (43011, 1, False), (43013, [3, 4], True)])
+        self.assertEqual([(43011, [1, 2, 3, 4], True)], frames)
+
+    def test_frames_keep_first_queued_order(self):
+        frames = coalesce_write_requests([(44105, 1, False), (44108, 1, False), (44100, 0, False)])
+        self.assertEqual([(44105, [1], False), (44108, [1], False), (44100, [0], False)], frames)
+
+    def test_single_register_block_stays_fc16(self):
+        self.assertEqual([(43000, [5], True)], coalesce_write_requests([(43000, [5], True)]))
+
+    def test_barrier_prevents_merging_and_reordering(self):
+        frames = coalesce_write_requests([(43135, 1, False), WRITE_BARRIER, (43136, 150, False), (43135, 0, False)])
+        self.assertEqual([(43135, [1], False), (43135, [0, 150], True)], frames)
+
+    def test_long_runs_split_at_pdu_limit(self):
+        frames = coalesce_write_requests([(0, list(range(130)), True)])
+        self.assertEqual([(0, 123), (123, 7)], [(start, len(values)) for start, values, _ in frames])
+
+    def test_only_barriers_produce_no_frames(self):
+        self.assertEqual([], coalesce_write_requests([WRITE_BARRIER, WRITE_BARRIER]))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,126 @@
+"""Pipelined Modbus TCP reads against a local gateway stand-in, and the serial fallback."""
+
+import asyncio
+import struct
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.solis_modbus.const import DOMAIN, VALUES
+from custom_components.solis_modbus.data.enums import PollSpeed
+from custom_components.solis_modbus.data_retrieval import DataRetrieval
+from custom_components.solis_modbus.modbus_pipeline import FC_READ_INPUT, ModbusTcpPipeline, PipelineFallbackError
+from custom_components.solis_modbus.read_planner import ReadFrame
+from custom_components.solis_modbus.sensors.solis_base_sensor import SolisSensorGroup
+
+
+class _Gateway:
+    """Answers FC03/FC04 with register = address + offset, once ``batch`` requests are queued (optionally in reverse)."""
+
+    def __init__(self, batch: int = 1, reverse: bool = False, exception_at: int | None = None):
+        self.batch = batch
+        self.reverse = reverse
+        self.exception_at = exception_at
+        self.server = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    def _answer(self, request: bytes) -> bytes:
+        tid, _proto, _length, unit, fc, address, count = struct.unpack(">HHHBBHH", request)
+        if address == self.exception_at:
+            pdu = bytes([fc | 0x80, 2])
+        else:
+            pdu = bytes([fc, count * 2]) + struct.pack(f">{count}H", *range(address, address + count))
+        return struct.pack(">HHHB", tid, 0, len(pdu) + 1, unit) + pdu
+
+    async def _serve(self, reader, writer):
+        try:
+            while True:
+                queued = [await reader.readexactly(12) for _ in range(self.batch)]
+                for request in reversed(queued) if self.reverse else queued:
+                    writer.write(self._answer(request))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+
+class TestModbusTcpPipeline(unittest.IsolatedAsyncioTestCase):
+    async def _pipeline(self, gateway: _Gateway, window: int = 4) -> ModbusTcpPipeline:
+        port = await gateway.start()
+        self.addAsyncCleanup(gateway.stop)
+        pipeline = ModbusTcpPipeline("127.0.0.1", port, window, timeout=2)
+        self.addAsyncCleanup(self._close, pipeline)
+        return pipeline
+
+    async def _close(self, pipeline: ModbusTcpPipeline) -> None:
+        pipeline.close()
+
+    async def test_requests_are_in_flight_together_and_matched_by_transaction_id(self):
+        # The gateway only answers once three requests are outstanding: a serial client would hang.
+        pipeline = await self._pipeline(_Gateway(batch=3))
+
+        results = await asyncio.gather(*(pipeline.read(FC_READ_INPUT, address, 2, 1) for address in (33000, 33100, 33200)))
+
+        self.assertEqual([([33000, 33001], None), ([33100, 33101], None), ([33200, 33201], None)], results)
+        self.assertEqual(3, pipeline.max_in_flight)
+        self.assertTrue(pipeline.active)
+
+    async def test_exception_response_is_returned_as_its_code(self):
+        pipeline = await self._pipeline(_Gateway(exception_at=33095))
+        self.assertEqual((None, 2), await pipeline.read(FC_READ_INPUT, 33095, 1, 1))
+
+    async def test_out_of_order_answers_switch_to_serial(self):
+        pipeline = await self._pipeline(_Gateway(batch=2, reverse=True))
+
+        results = await asyncio.gather(*(pipeline.read(FC_READ_INPUT, address, 1, 1) for address in (33000, 33100)), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, PipelineFallbackError) for result in results))
+        self.assertFalse(pipeline.active)
+        self.assertIn("out of order", pipeline.fallback_reason)
+        with self.assertRaises(PipelineFallbackError):
+            await pipeline.read(FC_READ_INPUT, 33000, 1, 1)
+
+    async def test_refused_connection_switches_to_serial(self):
+        gateway = _Gateway()
+        port = await gateway.start()
+        await gateway.stop()
+        pipeline = ModbusTcpPipeline("127.0.0.1", port, 4, timeout=1)
+
+        with self.assertRaises(PipelineFallbackError):
+            await pipeline.read(FC_READ_INPUT, 33000, 1, 1)
+        self.assertFalse(pipeline.active)
+
+
+class TestPipelinedPollCycle(unittest.IsolatedAsyncioTestCase):
+    async def test_failed_pipelined_frame_is_read_again_serially(self):
+        hass = MagicMock()
+        hass.is_running = False
+        hass.data = {DOMAIN: {VALUES: {}}}
+        controller = MagicMock()
+        controller.host, controller.slave, controller.device_id = "192.168.1.1", 1, 1
+        controller.enabled = True
+        controller.connected = MagicMock(return_value=True)
+        controller.poll_speed = {PollSpeed.FAST: 5, PollSpeed.NORMAL: 15, PollSpeed.SLOW: 30}
+        controller.pipeline = MagicMock(spec=ModbusTcpPipeline, active=True)
+        # The frame at 33500 is dropped in the pipeline (e.g. by a fallback while in flight).
+        controller.async_read_registers_pipelined = AsyncMock(side_effect=lambda start, count, _holding: (([7] * count) if start == 33000 else None, None))
+        controller.async_read_input_registers_with_exception = AsyncMock(return_value=([8], None))
+        retrieval = DataRetrieval(hass, controller)
+
+        first, second = MagicMock(spec=SolisSensorGroup), MagicMock(spec=SolisSensorGroup)
+        for group, start in ((first, 33000), (second, 33500)):
+            group.start_register, group.registrar_count, group.poll_speed, group.is_holding = start, 1, PollSpeed.NORMAL, False
+            group.sensors = []
+        retrieval.read_planner.plan = MagicMock(return_value=[ReadFrame(33000, 1, False, [first]), ReadFrame(33500, 1, False, [second])])
+
+        await retrieval.get_modbus_updates([first, second], PollSpeed.NORMAL)
+
+        self.assertEqual(2, controller.async_read_registers_pipelined.await_count)
+        controller.async_read_input_registers_with_exception.assert_awaited_once_with(33500, 1)
+        self.assertEqual(7, hass.data[DOMAIN][VALUES][("192.168.1.1", 1)].get(33000))
+        self.assertEqual(8, hass.data[DOMAIN][VALUES][("192.168.1.1", 1)].get(33500))
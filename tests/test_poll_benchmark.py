@@ -0,0 +1,52 @@
+"""Full poll cycles against the offline inverter simulator (tests/simulator.py)."""
+
+import unittest
+
+from benchmark_poll import SPEEDS, PollBenchmark, summarize
+from simulator import LinkProfile
+
+
+class TestPollBenchmark(unittest.IsolatedAsyncioTestCase):
+    async def _bench(self, inverter="hybrid", **profile) -> PollBenchmark:
+        bench = PollBenchmark(inverter, LinkProfile(**profile))
+        self.addCleanup(bench.close)
+        await bench.start()
+        return bench
+
+    async def test_clean_link_reads_each_planned_frame_once(self):
+        bench = await self._bench(change_ratio=0.0)
+        planned = len(bench.retrieval.read_planner.plan(bench.controller.sensor_groups))
+
+        first = await bench.run_cycle()
+        self.assertEqual(planned, first.frames)
+        self.assertGreater(first.callbacks, 0)
+        self.assertEqual(0, first.exceptions)
+
+        # Nothing moved on the inverter: the frames still go out, but no entity is woken.
+        dispatched = bench.retrieval.stats.dispatched_registers
+        second = await bench.run_cycle(SPEEDS["fast"])
+        self.assertGreater(second.frames, 0)
+        self.assertEqual(0, second.callbacks)
+        self.assertEqual(dispatched, bench.retrieval.stats.dispatched_registers)
+
+    async def test_hole_is_learned_after_the_first_cycle(self):
+        bench = await self._bench(holes=frozenset({33095}))
+
+        first = await bench.run_cycle()
+        second = await bench.run_cycle()
+
+        self.assertGreater(first.exceptions, 0)
+        self.assertEqual(0, second.exceptions)
+        self.assertLess(second.frames, first.frames)
+
+    async def test_lossy_link_completes_every_cycle(self):
+        bench = await self._bench("string", drop_rate=0.1, desync_rate=0.1, timeout_s=0.001, jitter_s=0.001, latency_s=0.001, seed=3)
+
+        reports = [await bench.run_cycle(trace_alloc=index == 0) for index in range(5)]
+        summary = summarize(reports)
+
+        self.assertEqual(5, summary["cycles"])
+        self.assertGreater(summary["dropped"], 0)
+        self.assertGreater(summary["desynced"], 0)
+        self.assertIsNotNone(reports[0].alloc_blocks)
+        self.assertEqual(5, bench.retrieval.stats.as_dict()["cycles"]["NORMAL"]["completed"])
@@ -0,0 +1,125 @@
+"""Deadline-based poll scheduling."""
+
+import unittest
+
+from helpers import Clock, mock_group
+
+from custom_components.solis_modbus.data.enums import PollSpeed
+from custom_components.solis_modbus.poll_scheduler import PollScheduler
+
+INTERVALS = {PollSpeed.FAST: 5, PollSpeed.NORMAL: 15, PollSpeed.SLOW: 30}
+
+
+class TestPollScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.scheduler = PollScheduler(INTERVALS, clock=self.clock)
+
+    def test_fast_groups_share_one_deadline(self):
+        a, b = mock_group(100, poll_speed=PollSpeed.FAST), mock_group(200, poll_speed=PollSpeed.FAST)
+        self.scheduler.sync([a, b])
+        fast, background = self.scheduler.due()
+        self.assertEqual([a, b], fast)
+        self.assertEqual([], background)
+
+        self.scheduler.mark_polled(fast)
+        self.assertEqual(([], []), self.scheduler.due())
+        self.assertEqual(5.0, self.scheduler.seconds_until_next_fast())
+
+    def test_slow_groups_are_staggered_in_register_order_slots(self):
+        groups = [mock_group(start, poll_speed=PollSpeed.SLOW) for start in (600, 100, 200, 300, 400, 500)]
+        self.scheduler.sync(groups)
+
+        # 30s SLOW / 5s FAST = 6 slots, one group each, in register order.
+        due_order = []
+        for _ in range(6):
+            _, background = self.scheduler.due()
+            due_order.extend(g.start_register for g in background)
+            self.scheduler.mark_polled(background)
+            self.clock.now += 5
+        self.assertEqual([100, 200, 300, 400, 500, 600], due_order)
+
+    def test_late_poll_keeps_phase_and_drops_missed_slots(self):
+        group = mock_group(100, poll_speed=PollSpeed.NORMAL)
+        self.scheduler.sync([group])
+        self.clock.now += 40  # missed two NORMAL slots
+        self.assertTrue(self.scheduler.is_starving(group))
+
+        self.scheduler.mark_polled([group])
+        self.clock.now = 1044.9
+        self.assertEqual([], self.scheduler.due()[1])
+        self.clock.now = 1045.0
+        self.assertEqual([group], self.scheduler.due()[1])
+
+    def test_removed_groups_are_forgotten(self):
+        once = mock_group(100, poll_speed=PollSpeed.ONCE)
+        self.scheduler.sync([once])
+        self.assertEqual([once], self.scheduler.due()[1])
+        self.scheduler.sync([])
+        self.assertEqual(0, self.scheduler.as_dict()["groups"])
+
+    def test_capacity_overload_is_reported_once(self):
+        self.assertFalse(self.scheduler.update_capacity(2.0, frame_seconds=0.25))
+        self.assertTrue(self.scheduler.update_capacity(4.0, frame_seconds=0.25))
+        self.assertFalse(self.scheduler.update_capacity(5.0, frame_seconds=0.25))
+        self.assertTrue(self.scheduler.as_dict()["overloaded"])
+        self.assertEqual(4.0, self.scheduler.as_dict()["capacity_frames_per_s"])
+
+
+class TestAdaptiveCadence(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        self.scheduler = PollScheduler(INTERVALS, clock=self.clock, adaptive=True)
+        self.meter, self.totals = mock_group(100, poll_speed=PollSpeed.FAST), mock_group(200, poll_speed=PollSpeed.FAST)
+        self.scheduler.sync([self.meter, self.totals])
+
+    def poll(self, quiet_groups=()):
+        """One FAST tick: read what is due, the groups in ``quiet_groups`` unchanged."""
+        fast, _ = self.scheduler.due()
+        for group in fast:
+            self.scheduler.record_read(group, group not in quiet_groups)
+        self.scheduler.mark_polled(fast)
+        self.clock.now += 5
+        return fast
+
+    def test_quiet_groups_are_stretched_in_phase_up_to_the_ceiling(self):
+        for _ in range(3):
+            self.assertEqual([self.meter, self.totals], self.poll([self.totals]))
+        self.assertEqual(2, self.scheduler.stretch(self.totals))
+        self.assertEqual([self.meter], self.poll([self.totals]))
+        self.assertEqual([self.meter, self.totals], self.poll([self.totals]), "read again with the meter, one FAST slot later")
+
+        for _ in range(200):
+            self.poll([self.totals])
+        self.assertEqual(32, self.scheduler.stretch(self.totals), "5 s x 64 would pass the 300 s ceiling")
+        self.assertEqual(1, self.scheduler.stretch(self.meter))
+        self.assertEqual(1, self.scheduler.as_dict()["stretched_groups"])
+
+    def test_a_change_or_wake_restores_the_base_cadence(self):
+        for _ in range(12):
+            self.poll([self.totals])
+        self.assertGreater(self.scheduler.stretch(self.totals), 1)
+        self.scheduler.wake([self.totals])
+        self.assertEqual(1, self.scheduler.stretch(self.totals))
+        self.assertIn(self.totals, self.poll())
+
+        for _ in range(3):
+            self.poll([self.totals])
+        self.scheduler.record_read(self.totals, True)
+        self.assertEqual(1, self.scheduler.stretch(self.totals))
+
+    def test_slow_groups_woken_are_due_now(self):
+        settings = mock_group(43000, poll_speed=PollSpeed.SLOW)
+        self.scheduler.sync([self.meter, self.totals, settings])
+        self.scheduler.mark_polled([settings])
+        self.assertNotIn(settings, self.scheduler.due()[1])
+        self.scheduler.wake()
+        self.assertEqual([settings], self.scheduler.due()[1])
+
+    def test_static_cadence_ignores_reads(self):
+        scheduler = PollScheduler(INTERVALS, clock=self.clock)
+        scheduler.sync([self.totals])
+        for _ in range(6):
+            scheduler.record_read(self.totals, False)
+        self.assertEqual(1, scheduler.stretch(self.totals))
+        self.assertIsNone(scheduler.as_dict()["stretched_groups"])
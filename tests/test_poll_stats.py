@@ -0,0 +1,122 @@
+"""Rolling poll/link statistics and the diagnostic sensors that expose them."""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from helpers import mock_group
+
+from custom_components.solis_modbus.const import DOMAIN, VALUES
+from custom_components.solis_modbus.data.enums import PollSpeed
+from custom_components.solis_modbus.data_retrieval import DataRetrieval
+from custom_components.solis_modbus.poll_stats import PollStats, RollingStat
+from custom_components.solis_modbus.sensors.solis_poll_stats_sensor import POLL_STATS_SENSORS, SolisPollStatsSensor
+
+
+class TestRollingStat(unittest.TestCase):
+    def test_summary_percentiles(self):
+        stat = RollingStat()
+        for value in range(1, 101):
+            stat.add(value / 1000)
+        summary = stat.summary(scale=1000)
+        self.assertEqual(100, summary["count"])
+        self.assertEqual(50.5, summary["p50"])
+        self.assertEqual(95.0, summary["p95"])
+        self.assertEqual(100.0, summary["max"])
+
+    def test_window_is_bounded_but_count_is_not(self):
+        stat = RollingStat(window=3)
+        for value in (10, 10, 1, 1, 1):
+            stat.add(value)
+        self.assertEqual({"count": 5, "p50": 1.0, "p95": 1.0, "max": 1.0}, stat.summary())
+
+    def test_empty_summary(self):
+        self.assertEqual({"count": 0, "p50": None, "p95": None, "max": None}, RollingStat().summary())
+
+
+class TestPollStats(unittest.TestCase):
+    def test_as_dict_reports_cycles_and_frames(self):
+        stats = PollStats()
+        stats.record_frame(33000, 0.05, ok=True)
+        stats.record_frame(33100, 0.15, ok=False)
+        stats.record_cycle(PollSpeed.FAST, 0.2, frames=2)
+        stats.record_skipped_cycle(PollSpeed.FAST)
+
+        out = stats.as_dict()
+        self.assertEqual(1, out["cycles"]["FAST"]["completed"])
+        self.assertEqual(1, out["cycles"]["FAST"]["skipped"])
+        self.assertEqual(2, out["cycles"]["FAST"]["frames"]["max"])
+        self.assertEqual(150.0, out["frame_latency_ms"]["max"])
+        self.assertEqual(["33000", "33100"], list(out["frame_latency_by_block_ms"]))
+        self.assertEqual(1, out["failed_frames"])
+
+
+class TestDataRetrievalRecordsStats(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.hass = MagicMock()
+        self.hass.is_running = False
+        self.hass.data = {DOMAIN: {VALUES: {}}}
+        self.controller = MagicMock()
+        self.controller.host = "192.168.1.1"
+        self.controller.slave = 1
+        self.controller.enabled = True
+        self.controller.connected = MagicMock(return_value=True)
+        self.dr = DataRetrieval(self.hass, self.controller, max_read_gap=0)
+
+    async def test_cycle_frames_and_latency_are_recorded(self):
+        groups = [mock_group(100, 2), mock_group(200, 2)]
+        self.controller.sensor_groups = groups
+        self.controller.async_read_input_registers_with_exception = AsyncMock(return_value=([1, 2], None))
+        self.dr._apply_register_read_to_cache = MagicMock()
+
+        await self.dr.get_modbus_updates(groups, PollSpeed.FAST)
+
+        self.assertEqual(1, self.dr.stats.cycles[PollSpeed.FAST])
+        self.assertEqual([2.0], self.dr.stats.frames_per_cycle[PollSpeed.FAST].samples)
+        self.assertEqual({100, 200}, set(self.dr.stats.frame_latency))
+
+    async def test_reentrant_cycle_is_counted_as_skipped(self):
+        groups = [mock_group(100, 2)]
+        self.dr.poll_updating[PollSpeed.FAST][frozenset({100})] = True
+
+        await self.dr.get_modbus_updates(groups, PollSpeed.FAST)
+
+        self.assertEqual(1, self.dr.stats.skipped_cycles[PollSpeed.FAST])
+
+
+class TestPollStatsSensor(unittest.IsolatedAsyncioTestCase):
+    def _entry(self, data_retrieval=None):
+        controller = MagicMock()
+        controller.device_serial_number = "SN1"
+        controller.io_stats = {"write_queue_max_depth": 4}
+        entry = MagicMock()
+        entry.runtime_data.controller = controller
+        entry.runtime_data.data_retrieval = data_retrieval
+        return entry
+
+    def _definition(self, unique):
+        return next(d for d in POLL_STATS_SENSORS if d["unique"] == unique)
+
+    async def test_sensor_is_disabled_diagnostic(self):
+        sensor = SolisPollStatsSensor(self._entry(), self._definition("poll_stats_failed_frames"))
+        self.assertFalse(sensor._attr_entity_registry_enabled_default)
+        self.assertIn("poll_stats_failed_frames", sensor._attr_unique_id)
+
+    async def test_value_is_none_until_polling_starts(self):
+        sensor = SolisPollStatsSensor(self._entry(), self._definition("poll_stats_failed_frames"))
+        await sensor.async_update()
+        self.assertIsNone(sensor._attr_native_value)
+
+    async def test_values_come_from_live_stats(self):
+        data_retrieval = MagicMock()
+        data_retrieval.stats = PollStats()
+        data_retrieval.stats.record_skipped_cycle(PollSpeed.SLOW)
+        data_retrieval.stats.record_skipped_cycle(PollSpeed.FAST)
+        entry = self._entry(data_retrieval)
+
+        skipped = SolisPollStatsSensor(entry, self._definition("poll_stats_skipped_cycles"))
+        depth = SolisPollStatsSensor(entry, self._definition("poll_stats_write_queue_max_depth"))
+        await skipped.async_update()
+        await depth.async_update()
+
+        self.assertEqual(2, skipped._attr_native_value)
+        self.assertEqual(4, depth._attr_native_value)
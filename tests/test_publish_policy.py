@@ -0,0 +1,163 @@
+"""Publish policies: which new values are worth a state write."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from custom_components.solis_modbus.data.enums import Category
+from custom_components.solis_modbus.publish_policy import (
+    CUMULATIVE_STATE_CLASSES,
+    DEVICE_CLASS_POLICIES,
+    IMMEDIATE,
+    PublishGate,
+    PublishPolicy,
+    publish_gate_for,
+    resolve_policy,
+)
+from custom_components.solis_modbus.register_store import RegisterBlock
+from custom_components.solis_modbus.sensors.solis_base_sensor import SolisSensorGroup
+from custom_components.solis_modbus.sensors.solis_derived_sensor import SolisDerivedSensor
+from custom_components.solis_modbus.sensors.solis_sensor import SolisSensor
+
+
+def _base_sensor(hass=None, controller=None, **entity):
+    controller = controller or MagicMock()
+    definition = {"register_start": 33057, "entities": [{"name": "Power", "unique": "power", "register": ["33057"], "multiplier": 0, **entity}]}
+    return SolisSensorGroup(hass or MagicMock(), definition, controller).sensors[0]
+
+
+class TestResolvePolicy(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.dict(DEVICE_CLASS_POLICIES, {"power": {"absolute": 10, "relative": 0.01, "max_silence": 60}})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_device_class_category_and_definition_layer(self):
+        power = resolve_policy(_base_sensor(device_class="power", state_class="measurement"))
+        self.assertEqual(PublishPolicy(absolute=10, relative=0.01, max_silence=60), power)
+
+        internal = resolve_policy(_base_sensor(device_class="power", category=Category.DEVICE_INTERNAL_DATA))
+        self.assertEqual(PublishPolicy(absolute=10, relative=0.01, min_interval=60, max_silence=600), internal)
+
+        override = resolve_policy(_base_sensor(device_class="power", publish={"absolute": 50, "unknown": 1}))
+        self.assertEqual(50, override.absolute)
+
+    def test_cumulative_counters_have_no_deadband(self):
+        energy = _base_sensor(device_class="power", state_class=CUMULATIVE_STATE_CLASSES[-1], publish={"min_interval": 30})
+        self.assertEqual(PublishPolicy(min_interval=30, max_silence=60), resolve_policy(energy))
+
+    def test_sensors_without_a_policy_get_no_gate(self):
+        self.assertEqual(IMMEDIATE, resolve_policy(_base_sensor()))
+        self.assertIsNone(publish_gate_for(_base_sensor()))
+
+
+class TestPublishGate(unittest.TestCase):
+    def test_deadband_and_heartbeat(self):
+        gate = PublishGate(PublishPolicy(absolute=10, relative=0.01, max_silence=60))
+        self.assertTrue(gate.admit(2000, 0))
+        self.assertFalse(gate.admit(2015, 5), "within 1% of 2000")
+        self.assertTrue(gate.admit(2030, 10))
+        self.assertFalse(gate.admit(2031, 20))
+        self.assertTrue(gate.admit(2031, 70), "heartbeat after 60 s of silence")
+        self.assertEqual(2, gate.suppressed)
+
+    def test_min_interval_and_non_numeric_values(self):
+        gate = PublishGate(PublishPolicy(min_interval=30))
+        self.assertTrue(gate.admit("Generating", 0))
+        self.assertFalse(gate.admit("Standby", 10))
+        self.assertFalse(gate.admit("Standby", 29))
+        self.assertTrue(gate.admit("Standby", 31))
+        self.assertFalse(gate.admit("Standby", 100), "unchanged and no heartbeat")
+        gate.reset()
+        self.assertTrue(gate.admit("Standby", 101))
+
+    def test_held_back_value_is_released_at_its_heartbeat(self):
+        gate = PublishGate(PublishPolicy(absolute=10, max_silence=60))
+        self.assertTrue(gate.admit(2000, 0))
+        self.assertIsNone(gate.heartbeat_in(5), "nothing held back")
+        self.assertFalse(gate.admit(2005, 5))
+        self.assertEqual(55, gate.heartbeat_in(5))
+        self.assertEqual(2005, gate.release(60))
+        self.assertIsNone(gate.heartbeat_in(61))
+        self.assertIsNone(gate.release(61))
+
+
+class TestSensorHeartbeat(unittest.TestCase):
+    """A value held back by the deadband is published at the heartbeat even when the readings stop changing."""
+
+    def setUp(self):
+        controller = MagicMock()
+        controller.host, controller.device_id = "192.168.1.1", 1
+        controller.poll_speed = {}
+        with patch.dict(DEVICE_CLASS_POLICIES, {"power": {"absolute": 10, "max_silence": 60}}):
+            self.base = _base_sensor(controller=controller, device_class="power")
+            self.entity = SolisSensor(MagicMock(), self.base, deadband=True)
+        self.entity.schedule_update_ha_state = MagicMock()
+        self.now = 0.0
+        patchers = (
+            patch("custom_components.solis_modbus.sensors.solis_sensor.async_call_later"),
+            patch("custom_components.solis_modbus.sensors.solis_sensor.time", monotonic=lambda: self.now),
+        )
+        self.later, _ = (patcher.start() for patcher in patchers)
+        for patcher in patchers:
+            self.addCleanup(patcher.stop)
+
+    def _read(self, value):
+        self.entity.handle_register_block(RegisterBlock(33057, (value,), "192.168.1.1", 1, decoded={self.base: value}))
+
+    def test_suppressed_value_is_published_by_the_timer(self):
+        self._read(2000)
+        self.now = 5.0
+        self._read(2005)
+        self.now = 20.0
+        self._read(2005)
+        self.assertEqual(2000, self.entity._attr_native_value)
+        self.later.assert_called_once()
+        self.assertEqual(55, self.later.call_args.args[1])
+
+        self.now = 60.0
+        self.later.call_args.args[2](None)
+        self.assertEqual(2005, self.entity._attr_native_value)
+        self.assertEqual(2, self.entity.schedule_update_ha_state.call_count)
+
+    def test_published_value_cancels_the_timer(self):
+        self._read(2000)
+        self._read(2005)
+        self._read(2100)
+        self.later.return_value.assert_called_once()
+        self.assertIsNone(self.entity._heartbeat_unsub)
+
+
+class TestDerivedSensorHeartbeat(unittest.TestCase):
+    """Derived values held back by the deadband get the same heartbeat as read ones."""
+
+    def setUp(self):
+        with patch.dict(DEVICE_CLASS_POLICIES, {"power": {"absolute": 10, "max_silence": 60}}):
+            self.entity = SolisDerivedSensor(MagicMock(), _base_sensor(device_class="power"), deadband=True)
+        self.entity.schedule_update_ha_state = MagicMock()
+        self.now = 0.0
+        patchers = (
+            patch("custom_components.solis_modbus.sensors.solis_derived_sensor.async_call_later"),
+            patch("custom_components.solis_modbus.sensors.solis_derived_sensor.time", monotonic=lambda: self.now),
+        )
+        self.later, _ = (patcher.start() for patcher in patchers)
+        for patcher in patchers:
+            self.addCleanup(patcher.stop)
+
+    def test_suppressed_value_is_published_by_the_timer(self):
+        self.entity._apply_value(2000)
+        self.now = 5.0
+        self.entity._apply_value(2005)
+        self.assertEqual(2000, self.entity._attr_native_value)
+        self.assertEqual(55, self.later.call_args.args[1])
+
+        self.now = 60.0
+        self.later.call_args.args[2](None)
+        self.assertEqual(2005, self.entity._attr_native_value)
+        self.assertEqual(2, self.entity.schedule_update_ha_state.call_count)
+
+    def test_published_value_cancels_the_timer(self):
+        self.entity._apply_value(2000)
+        self.entity._apply_value(2005)
+        self.entity._apply_value(2100)
+        self.later.return_value.assert_called_once()
+        self.assertIsNone(self.entity._heartbeat_unsub)
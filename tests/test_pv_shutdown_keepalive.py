@@ -23,7 +23,7 @@ def make_entity(cache=None):
 
 
 def cache_get_side_effect(cache):
-    return lambda hass, controller, register: cache.get(register)
+    return lambda hass, controller, register, **kwargs: cache.get(register)
 
 
 def test_pv_shutdown_definition_has_keep_alive():
@@ -0,0 +1,134 @@
+"""Tests for read coalescing: frame planning and merged-frame reads in DataRetrieval."""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from helpers import mock_group
+
+from custom_components.solis_modbus.const import DOMAIN, NUMBER_ENTITIES, SENSOR_ENTITIES, VALUES
+from custom_components.solis_modbus.data.enums import PollSpeed
+from custom_components.solis_modbus.data_retrieval import DataRetrieval
+from custom_components.solis_modbus.read_planner import MAX_READ_REGISTERS, ReadPlanner
+
+
+def _spans(frames):
+    return [(f.start, f.count) for f in frames]
+
+
+class TestReadPlanner(unittest.TestCase):
+    def test_adjacent_groups_merge_with_zero_gap(self):
+        planner = ReadPlanner(max_gap=0)
+        frames = planner.plan([mock_group(100, 5), mock_group(105, 3)])
+        self.assertEqual([(100, 8)], _spans(frames))
+        self.assertEqual(2, len(frames[0].groups))
+
+    def test_gap_within_limit_is_bridged(self):
+        planner = ReadPlanner(max_gap=5)
+        frames = planner.plan([mock_group(110, 2), mock_group(100, 5)])
+        self.assertEqual([(100, 12)], _spans(frames))
+        self.assertEqual([105, 106, 107, 108, 109], frames[0].gap_registers())
+
+    def test_gap_above_limit_splits(self):
+        planner = ReadPlanner(max_gap=3)
+        frames = planner.plan([mock_group(100, 5), mock_group(110, 2)])
+        self.assertEqual([(100, 5), (110, 2)], _spans(frames))
+
+    def test_never_merges_across_poll_speed_or_register_type(self):
+        planner = ReadPlanner(max_gap=50)
+        frames = planner.plan(
+            [
+                mock_group(33000, 10, PollSpeed.FAST),
+                mock_group(33010, 10, PollSpeed.SLOW),
+                mock_group(39995, 5, PollSpeed.FAST),
+                mock_group(40000, 5, PollSpeed.FAST),
+            ]
+        )
+        self.assertEqual([(33000, 10), (33010, 10), (39995, 5), (40000, 5)], _spans(frames))
+        self.assertFalse(frames[2].is_holding)
+        self.assertTrue(frames[3].is_holding)
+
+    def test_respects_pdu_limit(self):
+        planner = ReadPlanner(max_gap=10)
+        frames = planner.plan([mock_group(0, 100), mock_group(100, 30)])
+        self.assertEqual([(0, 100), (100, 30)], _spans(frames))
+        self.assertTrue(all(f.count <= MAX_READ_REGISTERS for f in frames))
+
+    def test_does_not_bridge_unreadable_gap(self):
+        planner = ReadPlanner(max_gap=10)
+        planner.mark_unreadable(107)
+        frames = planner.plan([mock_group(100, 5), mock_group(110, 2)])
+        self.assertEqual([(100, 5), (110, 2)], _spans(frames))
+
+    def test_group_with_unreadable_register_is_planned_alone(self):
+        planner = ReadPlanner(max_gap=10)
+        planner.mark_unreadable(106)
+        frames = planner.plan([mock_group(100, 5), mock_group(105, 3), mock_group(108, 2)])
+        self.assertEqual([(100, 5), (105, 3), (108, 2)], _spans(frames))
+
+    def test_mark_unreadable_reports_new_knowledge(self):
+        planner = ReadPlanner()
+        self.assertTrue(planner.mark_unreadable(5, 6))
+        self.assertFalse(planner.mark_unreadable(6))
+        self.assertEqual(frozenset({5, 6}), planner.unreadable_registers)
+
+    def test_values_are_sliced_per_group(self):
+        planner = ReadPlanner(max_gap=2)
+        a, b = mock_group(100, 2), mock_group(104, 2)
+        frame = planner.plan([a, b])[0]
+        values = [1, 2, 0, 0, 5, 6]
+        self.assertEqual([1, 2], frame.values_for(a, values))
+        self.assertEqual([5, 6], frame.values_for(b, values))
+
+
+class TestMergedFrameReads(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.hass = MagicMock()
+        self.hass.is_running = False
+        self.hass.data = {DOMAIN: {VALUES: {}, SENSOR_ENTITIES: [], NUMBER_ENTITIES: []}}
+        self.controller = MagicMock()
+        self.controller.host = "192.168.1.1"
+        self.controller.slave = 1
+        self.controller.enabled = True
+        self.controller.connected = MagicMock(return_value=True)
+        self.dr = DataRetrieval(self.hass, self.controller, max_read_gap=5)
+
+    async def test_merged_groups_are_read_in_one_frame(self):
+        a, b = mock_group(100, 2), mock_group(104, 2)
+        self.controller.sensor_groups = [a, b]
+        read = AsyncMock(return_value=([1, 2, 0, 0, 5, 6], None))
+        applied = []
+
+        with (
+            patch.object(self.dr, "_read_register_block_with_exception", new=read),
+            patch.object(self.dr, "_apply_register_read_to_cache", side_effect=lambda g, v, m: applied.append((g, v))),
+        ):
+            await self.dr.get_modbus_updates([a, b], PollSpeed.FAST)
+
+        read.assert_awaited_once_with(100, 6, False)
+        self.assertEqual([(a, [1, 2]), (b, [5, 6])], applied)
+
+    async def test_rejected_gap_is_learned_and_replanned(self):
+        a, b = mock_group(100, 2), mock_group(104, 2)
+        self.controller.sensor_groups = [a, b]
+
+        async def read_blk(start, count, is_holding):
+            if start <= 103 < start + count:
+                return None, 2
+            return [start] * count, None
+
+        async def detailed(start, count, quiet=False):
+            return await read_blk(start, count, False)
+
+        self.controller._async_read_input_register_raw_detailed = AsyncMock(side_effect=detailed)
+        applied = []
+
+        with (
+            patch.object(self.dr, "_read_register_block_with_exception", new=AsyncMock(side_effect=read_blk)),
+            patch.object(self.dr, "_apply_register_read_to_cache", side_effect=lambda g, v, m: applied.append((g, v))),
+        ):
+            await self.dr.get_modbus_updates([a, b], PollSpeed.FAST)
+            self.assertIn(103, self.dr.read_planner.unreadable_registers)
+            self.assertEqual([(a, [100, 100]), (b, [104, 104])], applied)
+
+            # Next cycle plans around the learned register straight away.
+            self.assertEqual([(100, 2), (104, 2)], _spans(self.dr.read_planner.plan([a, b])))
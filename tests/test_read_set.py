@@ -0,0 +1,93 @@
+"""Read set: poll groups trimmed to the registers of enabled entities."""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from custom_components.solis_modbus.data.enums import PollSpeed
+from custom_components.solis_modbus.modbus_controller import ModbusController
+from custom_components.solis_modbus.read_set import ReadSet, enabled_entity_registers
+from custom_components.solis_modbus.sensors.solis_base_sensor import SolisSensorGroup
+
+
+def _group(start, count, poll_speed=PollSpeed.NORMAL):
+    entities = [{"name": f"Register {reg}", "unique": f"reg_{reg}", "register": [str(reg)], "multiplier": 0} for reg in range(start, start + count)]
+    definition = {"register_start": start, "poll_speed": poll_speed, "entities": entities}
+    return SolisSensorGroup(MagicMock(), definition, MagicMock())
+
+
+def _layout(groups):
+    return [[group.start_register, group.registrar_count] for group in groups]
+
+
+class TestReadSet(unittest.TestCase):
+    def setUp(self):
+        self.read_set = ReadSet()
+        self.groups = [_group(33000, 10), _group(43000, 4)]
+
+    def test_everything_is_polled_until_a_read_set_is_known(self):
+        self.assertIs(self.groups, self.read_set.apply(self.groups))
+        self.assertEqual({"registers": None, "trimmed_groups": 0}, self.read_set.as_dict())
+
+    def test_unused_edges_are_trimmed_and_holes_split(self):
+        self.assertTrue(self.read_set.update({33002, 33003, 33007}))
+        groups = self.read_set.apply(self.groups)
+        self.assertEqual([[33002, 2], [33007, 1], [43000, 4]], _layout(groups))
+        self.assertIs(self.groups[1], groups[2], "holding registers are always read whole")
+        self.assertIs(self.groups[0], self.read_set.source_of(groups[0]))
+        self.assertEqual({"registers": 3, "trimmed_groups": 1}, self.read_set.as_dict())
+
+    def test_pieces_keep_their_identity_across_replans(self):
+        self.read_set.update({33002, 33003, 33007})
+        first = self.read_set.apply(self.groups)
+        self.assertIs(first, self.read_set.apply(self.groups))
+        self.assertFalse(self.read_set.update({33007, 33003, 33002}))
+        self.read_set.update({33002, 33003})
+        self.assertIs(first[0], self.read_set.apply(self.groups)[0])
+
+    def test_a_fully_used_group_is_not_rebuilt(self):
+        self.read_set.update(range(33000, 33010))
+        self.assertEqual(self.groups, self.read_set.apply(self.groups))
+
+
+class TestControllerWithReadSet(unittest.TestCase):
+    def setUp(self):
+        self.configured, self.once = _group(33000, 10), _group(35000, 2, PollSpeed.ONCE)
+        self.controller = object.__new__(ModbusController)
+        self.controller._sensor_groups = [self.configured, self.once]
+        self.controller.read_set = ReadSet()
+        self.controller.host, self.controller.device_id = "h", 1
+        self.controller.read_set.update({33001, 33002, 33003, 35000})
+
+    def test_splitting_a_piece_resplits_its_configured_group(self):
+        piece = self.controller.sensor_groups[0]
+        self.assertEqual([33001, 3], _layout([piece])[0])
+        piece.sensors[1].enabled = False
+        self.controller.replace_sensor_group(piece, [])
+        self.assertEqual([[33000, 2], [33003, 7], [35000, 2]], _layout(self.controller._sensor_groups))
+        self.assertEqual([[33001, 1], [33003, 1], [35000, 1]], _layout(self.controller.sensor_groups))
+
+    def test_removing_a_piece_removes_its_configured_group(self):
+        self.controller.remove_sensor_groups([self.controller.sensor_groups[-1]])
+        self.assertEqual([self.configured], self.controller._sensor_groups)
+
+
+class TestEnabledEntityRegisters(unittest.TestCase):
+    def test_disabled_entities_do_not_count(self):
+        enabled = SimpleNamespace(unique_id="on", polled_registers=[33000, 33001])
+        disabled = SimpleNamespace(unique_id="off", polled_registers=[33010])
+        unregistered = SimpleNamespace(unique_id="new", polled_registers=(33020,))
+        controller = MagicMock()
+        entry = SimpleNamespace(runtime_data=SimpleNamespace(controller=controller, entities={"sensor": [enabled, disabled], "switch": [unregistered]}))
+
+        registry = MagicMock()
+        registry.async_get_entity_id.side_effect = lambda domain, platform, unique_id: None if unique_id == "new" else f"{domain}.{unique_id}"
+        registry.async_get.side_effect = lambda entity_id: SimpleNamespace(disabled=entity_id == "sensor.off")
+        with (
+            patch("custom_components.solis_modbus.read_set.er.async_get", return_value=registry),
+            patch("custom_components.solis_modbus.read_set.firmware_register", return_value=33001),
+        ):
+            self.assertEqual({33000, 33001, 33002, 33020}, enabled_entity_registers(MagicMock(), entry))
+
+    def test_nothing_known_before_the_entities_are_set_up(self):
+        self.assertIsNone(enabled_entity_registers(MagicMock(), SimpleNamespace(runtime_data=SimpleNamespace(entities={}))))
@@ -0,0 +1,147 @@
+"""Warm-start snapshot of the register cache: restore, debounced save, and stale read-modify-write values."""
+
+import time
+import unittest
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.solis_modbus.const import DOMAIN, RMW_MAX_RESTORED_AGE_SECONDS, VALUES
+from custom_components.solis_modbus.data.enums import PollSpeed
+from custom_components.solis_modbus.data_retrieval import DataRetrieval
+from custom_components.solis_modbus.helpers import cache_get, cache_save, get_register_store
+from custom_components.solis_modbus.register_snapshot import MAX_RESTORED_AGE_SECONDS, RegisterSnapshot
+from custom_components.solis_modbus.register_store import RegisterStore
+
+
+def _controller():
+    controller = MagicMock()
+    controller.host = "192.168.1.1"
+    controller.slave = 1
+    controller.device_id = 1
+    return controller
+
+
+class TestRestoredValues(unittest.TestCase):
+    def test_restore_never_overrides_a_live_value(self):
+        store = RegisterStore()
+        store.set(43110, 35)
+        self.assertFalse(store.restore(43110, 1, time.time() - 60))
+        self.assertTrue(store.restore(43111, 2, time.time() - 60))
+        self.assertEqual(35, store.get(43110))
+        self.assertFalse(store.is_restored(43110))
+        self.assertTrue(store.is_restored(43111))
+
+    def test_live_read_replaces_the_restored_value(self):
+        store = RegisterStore()
+        store.restore(43111, 2, time.time() - 60)
+        store.set_block(43110, [35, 3])
+        self.assertFalse(store.is_restored(43111))
+        self.assertAlmostEqual(time.time(), store.read_at(43111), delta=5)
+
+    def test_old_restored_value_is_not_used_for_read_modify_write(self):
+        hass, controller = MagicMock(), _controller()
+        hass.data = {DOMAIN: {VALUES: {}}}
+        store = get_register_store(hass, controller, create=True)
+        store.restore(43110, 35, time.time() - RMW_MAX_RESTORED_AGE_SECONDS - 60)
+        store.restore(43111, 1, time.time() - 60)
+
+        self.assertEqual(35, cache_get(hass, controller, 43110))
+        self.assertIsNone(cache_get(hass, controller, 43110, max_restored_age=RMW_MAX_RESTORED_AGE_SECONDS))
+        self.assertEqual(1, cache_get(hass, controller, 43111, max_restored_age=RMW_MAX_RESTORED_AGE_SECONDS))
+
+        cache_save(hass, controller, 43110, 33)
+        self.assertEqual(33, cache_get(hass, controller, 43110, max_restored_age=RMW_MAX_RESTORED_AGE_SECONDS))
+
+
+class TestRegisterSnapshot(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        patcher = patch("custom_components.solis_modbus.register_snapshot.Store")
+        self.store = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.store.async_load = AsyncMock(return_value=None)
+
+        self.hass = MagicMock()
+        self.hass.data = {DOMAIN: {VALUES: {}}}
+        self.controller = _controller()
+        self.snapshot = RegisterSnapshot(self.hass, self.controller, "SERIAL1")
+
+    async def test_restore_skips_values_past_the_max_age(self):
+        now = time.time()
+        self.store.async_load.return_value = {
+            "saved_at": now,
+            "registers": {"43110": [35, now - 120], "33001": [1, now - MAX_RESTORED_AGE_SECONDS - 1]},
+        }
+
+        self.assertEqual(1, await self.snapshot.async_restore())
+        self.assertEqual(35, cache_get(self.hass, self.controller, 43110))
+        self.assertIsNone(cache_get(self.hass, self.controller, 33001))
+
+    async def test_saved_values_keep_their_read_time(self):
+        self.store.async_load.return_value = {"registers": {"43110": [35, 1000.0]}}
+        await self.snapshot.async_restore(max_age=float("inf"))
+        cache_save(self.hass, self.controller, 33001, 7)
+        cache_save(self.hass, self.controller, 33002, datetime.now(UTC))  # not JSON: left out
+
+        self.snapshot.schedule_save()
+        registers = self.store.async_delay_save.call_args.args[0]()["registers"]
+
+        self.assertEqual([35, 1000.0], registers["43110"])
+        self.assertEqual(7, registers["33001"][0])
+        self.assertNotIn("33002", registers)
+
+    def test_saves_are_debounced_across_polls(self):
+        for _ in range(5):
+            self.snapshot.schedule_save()
+        self.store.async_delay_save.assert_called_once()
+
+
+class TestWarmStartPoll(unittest.IsolatedAsyncioTestCase):
+    def _retrieval(self):
+        hass = MagicMock()
+        hass.is_running = False
+        controller = _controller()
+        controller.poll_speed = {PollSpeed.FAST: 5, PollSpeed.NORMAL: 15, PollSpeed.SLOW: 30}
+        controller.last_modbus_success = None
+        controller.connected = MagicMock(return_value=True)
+        controller.enabled = True
+        return hass, DataRetrieval(hass, controller, snapshot=MagicMock(restored=12))
+
+    async def test_first_poll_runs_in_the_background_after_a_warm_start(self):
+        hass, retrieval = self._retrieval()
+
+        with (
+            patch.object(retrieval, "modbus_update_all", new=MagicMock()) as update_all,
+            patch("custom_components.solis_modbus.data_retrieval.notify_register_update"),
+        ):
+            await retrieval.check_connection()
+
+        hass.async_create_task.assert_called_once_with(update_all.return_value)
+        self.assertIs(hass.async_create_task.return_value, retrieval._revalidate_task)
+        self.assertFalse(retrieval.first_poll)
+
+    async def test_scheduler_waits_for_the_revalidation(self):
+        _hass, retrieval = self._retrieval()
+        retrieval._revalidate_task = MagicMock()
+        retrieval._revalidate_task.done.return_value = False
+        retrieval.get_modbus_updates = AsyncMock()
+
+        await retrieval.poll_due_fast()
+        self.assertEqual([], retrieval.due_background_groups())
+        retrieval.get_modbus_updates.assert_not_awaited()
+
+    async def test_failed_learned_map_restore_is_retried(self):
+        hass, retrieval = self._retrieval()
+
+        with (
+            patch.object(retrieval, "_restore_learned_register_map", new=AsyncMock(side_effect=[OSError("store"), None])) as restore,
+            patch.object(retrieval, "modbus_update_all", new=MagicMock()),
+            patch("custom_components.solis_modbus.data_retrieval.notify_register_update"),
+        ):
+            await retrieval.check_connection()
+            self.assertTrue(retrieval.first_poll)
+            hass.async_create_task.assert_not_called()
+            await retrieval.check_connection()
+
+        self.assertEqual(2, restore.await_count)
+        self.assertFalse(retrieval.first_poll)
+        hass.async_create_task.assert_called_once()
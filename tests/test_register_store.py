@@ -0,0 +1,90 @@
+"""Per link+slave register store behind cache_save/cache_get."""
+
+import unittest
+from unittest.mock import MagicMock
+
+from custom_components.solis_modbus.const import DOMAIN, VALUES
+from custom_components.solis_modbus.helpers import cache_get, cache_save, get_register_store
+from custom_components.solis_modbus.register_store import RegisterBlock, RegisterStore
+
+
+def _controller(connection_id: str, slave: int):
+    controller = MagicMock()
+    controller.connection_id = connection_id
+    controller.device_id = slave
+    return controller
+
+
+class TestRegisterStore(unittest.TestCase):
+    def test_block_round_trip(self):
+        store = RegisterStore()
+        store.set_block(33000, [1, 2, 3])
+        store.set(33010, 9)
+        self.assertEqual([1, 2, 3, None], store.get_block(33000, 4))
+        self.assertEqual([(33000, 1), (33001, 2), (33002, 3), (33010, 9)], list(store.items()))
+        self.assertIn(33001, store)
+        self.assertEqual(4, len(store))
+
+    def test_values_for_prefers_the_block(self):
+        store = RegisterStore()
+        store.set_block(33049, [1, 2])
+        block = RegisterBlock(33050, (20, 30), "1.2.3.4", 1)
+        self.assertEqual([1, 20, 30, None], store.values_for([33049, 33050, 33051, 33052], block))
+        self.assertEqual([1, 2], store.values_for([33049, 33050]))
+
+    def test_listener_is_called_once_per_block(self):
+        store = RegisterStore()
+        u32, single = MagicMock(), MagicMock()
+        store.subscribe([33049, 33050], u32)
+        store.subscribe([33060], single)
+        block = RegisterBlock(33049, tuple(range(12)), "1.2.3.4", 1)
+
+        self.assertEqual(2, store.publish(block))
+        u32.assert_called_once_with(block)
+        single.assert_called_once_with(block)
+
+    def test_publish_only_to_changed_registers(self):
+        store = RegisterStore()
+        first, second = MagicMock(), MagicMock()
+        store.subscribe([33049], first)
+        store.subscribe([33050], second)
+
+        self.assertEqual(1, store.publish(RegisterBlock(33049, (1, 2), "1.2.3.4", 1), registers=[33050]))
+        first.assert_not_called()
+        second.assert_called_once()
+
+    def test_unsubscribe_and_failing_listener(self):
+        store = RegisterStore()
+        failing, other = MagicMock(side_effect=ValueError), MagicMock()
+        unsubscribe = store.subscribe([33049], failing)
+        store.subscribe([33049], other)
+        block = RegisterBlock(33049, (1,), "1.2.3.4", 1)
+
+        with self.assertLogs("custom_components.solis_modbus.register_store", level="ERROR"):
+            store.publish(block)
+        other.assert_called_once_with(block)
+
+        unsubscribe()
+        store.publish(block)
+        failing.assert_called_once()
+        self.assertEqual(2, other.call_count)
+
+
+class TestCacheHelpers(unittest.TestCase):
+    def setUp(self):
+        self.hass = MagicMock()
+        self.hass.data = {}
+
+    def test_cache_get_before_anything_is_cached(self):
+        self.assertIsNone(cache_get(self.hass, _controller("1.2.3.4:502", 1), 33000))
+        self.assertIsNone(get_register_store(self.hass, _controller("1.2.3.4:502", 1)))
+
+    def test_values_are_scoped_per_link_and_slave(self):
+        first, second, other_link = _controller("1.2.3.4:502", 1), _controller("1.2.3.4:502", 2), _controller("5.6.7.8:502", 1)
+        cache_save(self.hass, first, 33000, 11)
+        cache_save(self.hass, second, "33000", 22)
+
+        self.assertEqual(11, cache_get(self.hass, first, "33000"))
+        self.assertEqual(22, cache_get(self.hass, second, 33000))
+        self.assertIsNone(cache_get(self.hass, other_link, 33000))
+        self.assertEqual({("1.2.3.4:502", 1), ("1.2.3.4:502", 2)}, set(self.hass.data[DOMAIN][VALUES]))
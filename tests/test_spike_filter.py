@@ -0,0 +1,91 @@
+"""Declarative spike filters: rules from sensor definitions, indexed by register."""
+
+import unittest
+from unittest.mock import MagicMock
+
+from homeassistant.const import UnitOfPower
+
+from custom_components.solis_modbus.sensors.solis_base_sensor import SolisSensorGroup
+from custom_components.solis_modbus.spike_filter import SpikeFilters, SpikeRule
+
+
+def _controller(wattage=5000):
+    controller = MagicMock()
+    controller.inverter_config.wattage_chosen = wattage
+    controller.inverter_config.features = set()
+    return controller
+
+
+def _group(controller, start, spike_filter, registers=1, **entity):
+    definition = {
+        "register_start": start,
+        "entities": [
+            {
+                "name": f"Filtered {start}",
+                "unique": f"filtered_{start}",
+                "register": [str(start + offset) for offset in range(registers)],
+                "multiplier": 0,
+                "unit_of_measurement": UnitOfPower.WATT,
+                "spike_filter": spike_filter,
+                **entity,
+            },
+            {"name": "Unfiltered", "unique": f"unfiltered_{start}", "register": [str(start + registers)], "multiplier": 0},
+        ],
+    }
+    return SolisSensorGroup(MagicMock(), definition, controller)
+
+
+class TestSpikeFilters(unittest.TestCase):
+    def setUp(self):
+        self.controller = _controller()
+        self.stored: dict[int, int] = {}
+        self.filters = SpikeFilters()
+
+    def read(self, start, *values):
+        kept = self.filters.filter_block(start, list(values), self.stored.get)
+        self.stored.update(zip(range(start, start + len(kept)), kept, strict=True))
+        return kept
+
+    def test_rule_from_the_definition(self):
+        rule = SpikeRule.from_definition({"max": 64999, "max_rated": 2, "max_floor": 10000})
+        self.assertEqual(SpikeRule(max_value=64999, max_rated=2, max_floor=10000), rule)
+        self.assertEqual(10000, rule.plausible_max(None))
+        self.assertEqual(40000, rule.plausible_max(20000))
+        self.assertEqual(64999, rule.plausible_max(50000))
+
+    def test_outlier_against_the_rating_is_held_until_confirmed(self):
+        self.filters.refresh([_group(self.controller, 33148, {"max": 64999, "max_rated": 2, "max_floor": 10000})])
+        self.assertEqual([500, 7], self.read(33148, 500, 7))
+        self.assertEqual([500, 8], self.read(33148, 65526, 8), "wrap-around value held, its neighbour is not")
+        self.assertEqual([500, 8], self.read(33148, 12000, 8))
+        self.assertEqual([12000, 8], self.read(33148, 12000, 8), "accepted on the third consecutive read")
+
+    def test_two_register_values_are_filtered_as_one(self):
+        self.filters.refresh([_group(self.controller, 33130, {"max_rated": 4, "max_floor": 30000}, registers=2)])
+        self.assertEqual([0, 1500, 3], self.read(33130, 0, 1500, 3))
+        self.assertEqual([0, 1500, 4], self.read(33130, 0x7FFF, 0xFFFF, 4))
+        self.assertEqual([0xFFFF, 0xF000, 4], self.read(33130, 0xFFFF, 0xF000, 4), "signed -4096 W is plausible")
+
+    def test_step_limit_and_median(self):
+        self.filters.refresh([_group(self.controller, 3004, {"max_step": 1000, "confirmations": 2, "median_of": 3})])
+        self.assertEqual([100, 0], self.read(3004, 100, 0))
+        self.assertEqual([100, 0], self.read(3004, 5000, 0), "a jump is held once")
+        self.assertEqual([100, 0], self.read(3004, 5000, 0), "median of 100 and 5000 is the lower")
+        self.assertEqual([300, 0], self.read(3004, 300, 0), "median of 100, 5000, 300")
+
+    def test_blocks_without_filtered_entities_pass_through(self):
+        self.filters.refresh([_group(self.controller, 33139, {"suspect_values": [0, 100]})])
+        values = [0, 0]
+        self.assertIs(values, self.filters.filter_block(33100, values, self.stored.get))
+        self.assertIn(33139, self.filters)
+        self.assertNotIn(33140, self.filters)
+
+    def test_counters_survive_a_regroup(self):
+        group = _group(self.controller, 33139, {"suspect_values": [0, 100]})
+        self.filters.refresh([group])
+        self.read(33139, 50, 1)
+        self.read(33139, 0, 1)
+        self.read(33139, 0, 1)
+        self.filters.refresh([SolisSensorGroup.from_sensors(group.sensors, group.poll_speed)])
+        self.assertEqual([0, 1], self.read(33139, 0, 1))
+        self.assertEqual({"Filtered 33139": 2}, self.filters.as_dict())
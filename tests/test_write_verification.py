@@ -0,0 +1,79 @@
+"""Read-after-write verification: written holding registers read back once a burst settled."""
+
+import asyncio
+import unittest
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.solis_modbus.const import CONN_TYPE_TCP, EVENT_WRITE_MISMATCH
+from custom_components.solis_modbus.modbus_controller import ModbusController
+from custom_components.solis_modbus.write_verification import WriteVerifier
+
+
+class TestWriteVerifier(unittest.TestCase):
+    def test_one_read_per_contiguous_run_of_written_registers(self):
+        verifier = WriteVerifier()
+        verifier.expect(43011, [10, 20])
+        verifier.expect(43013, [30])
+        verifier.expect(43110, [5])
+        self.assertEqual([(43011, 3), (43110, 1)], verifier.blocks())
+
+    def test_read_back_settles_expectations_and_reports_mismatches(self):
+        verifier = WriteVerifier()
+        verifier.expect(43011, [10, 20])
+        verifier.expect(43011, [15])
+        self.assertEqual([(43012, 20, 18)], verifier.check(43010, [0, 15, 18]))
+        self.assertFalse(verifier.pending)
+        verifier.expect(43110, [5])
+        verifier.discard(43110, 1)
+        self.assertEqual({"verified": 2, "mismatches": 1, "failed_reads": 1, "pending": 0}, verifier.as_dict())
+
+
+class TestControllerVerifiesWrites(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.hass = MagicMock()
+        manager_patcher = patch("custom_components.solis_modbus.modbus_controller.ModbusClientManager")
+        manager = manager_patcher.start().get_instance.return_value
+        self.addCleanup(manager_patcher.stop)
+        manager.inter_frame_wait = AsyncMock()
+        self.client = manager.get_tcp_client.return_value
+        self.client.connected = True
+        lock = manager.get_client_lock.return_value
+        lock.__aenter__ = AsyncMock(return_value=None)
+        lock.__aexit__ = AsyncMock(return_value=None)
+
+        self.controller = ModbusController(
+            hass=self.hass, connection_type=CONN_TYPE_TCP, host="192.168.1.100", inverter_config=MagicMock(), device_id=1, verify_writes=True
+        )
+        ok = MagicMock()
+        ok.isError.return_value = False
+        ok.registers = [0]
+        self.client.write_register = AsyncMock(return_value=ok)
+        self.client.write_registers = AsyncMock(return_value=ok)
+        read = MagicMock()
+        read.isError.return_value = False
+        read.registers = [20, 25]  # firmware clamped 43012
+        self.client.read_holding_registers = AsyncMock(return_value=read)
+
+    async def test_burst_is_read_back_once_and_a_clamped_value_fires_an_event(self):
+        with (
+            patch("custom_components.solis_modbus.modbus_controller.VERIFY_SETTLE_SECONDS", 0),
+            patch("custom_components.solis_modbus.modbus_controller.cache_save"),
+            patch("custom_components.solis_modbus.modbus_controller.notify_register_update"),
+            patch("custom_components.solis_modbus.modbus_controller.get_register_store"),
+            patch("custom_components.solis_modbus.modbus_controller.publish_register_block") as publish,
+        ):
+            await self.controller.async_write_holding_register(43011, 20)
+            await self.controller.async_write_holding_register(43012, 30)
+            task = asyncio.create_task(self.controller.process_write_queue())
+            for _ in range(20):
+                if not self.controller.write_verifier.pending and self.client.read_holding_registers.await_count:
+                    break
+                await asyncio.sleep(0)
+            task.cancel()
+
+        self.client.read_holding_registers.assert_awaited_once_with(address=43011, count=2, device_id=1)
+        publish.assert_called_with(self.hass, self.controller, 43011, [20, 25])
+        self.hass.bus.async_fire.assert_called_once_with(
+            EVENT_WRITE_MISMATCH, {"host": "192.168.1.100", "slave": 1, "register": 43012, "written": 30, "read": 25}
+        )